@@ -0,0 +1,268 @@
+"""Benchmark of the Quotecast parse pipeline.
+
+For each payload and each stage it reports the latency percentiles of one
+tick, the number of allocated blocks and the peak memory of one tick.
+
+Usage :
+    python benchmarks/quotecast/bench_ticker_parse.py
+    python benchmarks/quotecast/bench_ticker_parse.py --output result.json
+    python benchmarks/quotecast/bench_ticker_parse.py --baseline result.json
+
+With `--baseline`, the script exits with code 1 if the p50 of a stage is
+slower than the baseline by more than `--threshold`.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable
+
+from degiro_connector.quotecast.models.ticker import Ticker
+from degiro_connector.quotecast.tools.ticker_to_df import TickerToDF
+from degiro_connector.quotecast.tools.ticker_to_metric_list import TickerToMetricList
+
+from payloads import build_scenario_map, load_scenario_map
+
+REQUEST_DURATION = timedelta(milliseconds=5)
+
+
+def build_ticker(json_text: str) -> Ticker:
+    return Ticker(json_text=json_text, request_duration=REQUEST_DURATION)
+
+
+def build_stage_map(
+    registration_ticker: Ticker,
+    data_ticker: Ticker,
+) -> dict[str, Callable[[], Callable[[], object]]]:
+    """Each stage returns the function to measure, with its state ready."""
+
+    def ticker_to_metric_list_parse():
+        ticker_to_metric_list = TickerToMetricList()
+        ticker_to_metric_list.parse(ticker=registration_ticker)
+        return lambda: ticker_to_metric_list.parse(ticker=data_ticker)
+
+    def ticker_to_metric_list_parse_columns():
+        ticker_to_metric_list = TickerToMetricList()
+        ticker_to_metric_list.parse_columns(ticker=registration_ticker)
+        return lambda: ticker_to_metric_list.parse_columns(ticker=data_ticker)
+
+    def ticker_to_df_update():
+        ticker_to_df = TickerToDF()
+        ticker_to_df.update(ticker=registration_ticker)
+        return lambda: ticker_to_df.update(ticker=data_ticker)
+
+    def ticker_to_df_parse():
+        ticker_to_df = TickerToDF()
+        ticker_to_df.update(ticker=registration_ticker)
+        return lambda: ticker_to_df.parse(ticker=data_ticker)
+
+    def ticker_state_build_df():
+        ticker_to_df = TickerToDF()
+        ticker_to_df.update(ticker=registration_ticker)
+        metric_columns = ticker_to_df.update(ticker=data_ticker)
+        ticker_state = ticker_to_df.ticker_state
+
+        # THE TICK MAKES ITS COLUMNS DIRTY : OTHERWISE ONLY THE CACHE IS MEASURED
+        def apply_and_build_df():
+            if metric_columns is not None:
+                ticker_state.update_columns(
+                    metric_columns=metric_columns,
+                    ticker=data_ticker,
+                )
+            return ticker_state.build_df()
+
+        return apply_and_build_df
+
+    def ticker_to_df_build_df():
+        ticker_to_metric_list = TickerToMetricList()
+        ticker_to_metric_list.parse(ticker=registration_ticker)
+        # THE PIVOT REQUIRES A SINGLE VALUE PER PRODUCT/METRIC
+        metric_map = {
+            (metric.product_id, metric.metric_type): metric
+            for metric in ticker_to_metric_list.parse(ticker=data_ticker)
+        }
+        metric_list = list(metric_map.values())
+        return lambda: TickerToDF.build_df(metric_list=metric_list)
+
+    return {
+        "ticker_to_metric_list.parse": ticker_to_metric_list_parse,
+        "ticker_to_metric_list.parse_columns": ticker_to_metric_list_parse_columns,
+        "ticker_to_df.update": ticker_to_df_update,
+        "ticker_to_df.parse": ticker_to_df_parse,
+        "ticker_state.build_df": ticker_state_build_df,
+        "ticker_to_df.build_df": ticker_to_df_build_df,
+    }
+
+
+def percentile(sorted_list: list[int], rank: float) -> int:
+    index = min(len(sorted_list) - 1, int(rank * len(sorted_list)))
+
+    return sorted_list[index]
+
+
+def measure_latency(function: Callable[[], object], iterations: int) -> dict:
+    duration_list = []
+    perf_counter_ns = time.perf_counter_ns
+
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(iterations):
+            start_ns = perf_counter_ns()
+            function()
+            duration_list.append(perf_counter_ns() - start_ns)
+    finally:
+        gc.enable()
+
+    duration_list.sort()
+
+    return {
+        "p50_us": percentile(duration_list, 0.50) / 1_000,
+        "p90_us": percentile(duration_list, 0.90) / 1_000,
+        "p99_us": percentile(duration_list, 0.99) / 1_000,
+        "max_us": duration_list[-1] / 1_000,
+    }
+
+
+def measure_memory(function: Callable[[], object]) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        current_before, _ = tracemalloc.get_traced_memory()
+        result = function()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    del result
+    block_count = sum(
+        stat.count_diff
+        for stat in after.compare_to(before, "lineno")
+        if stat.count_diff > 0
+    )
+
+    return {
+        "allocated_blocks": block_count,
+        "peak_kib": (peak - current_before) / 1_024,
+    }
+
+
+def run(
+    scenario_map: dict[str, tuple[str, str]],
+    iterations: int,
+    stage_filter: str | None = None,
+) -> dict[str, dict[str, dict]]:
+    result_map: dict[str, dict[str, dict]] = {}
+
+    for scenario, (registration_payload, data_payload) in scenario_map.items():
+        registration_ticker = build_ticker(registration_payload)
+        data_ticker = build_ticker(data_payload)
+        stage_map = build_stage_map(
+            registration_ticker=registration_ticker,
+            data_ticker=data_ticker,
+        )
+
+        for stage, prepare in stage_map.items():
+            if stage_filter and stage_filter not in stage:
+                continue
+
+            function = prepare()
+            for _ in range(min(10, iterations)):  # WARMUP
+                function()
+
+            result = measure_latency(function=function, iterations=iterations)
+            result.update(measure_memory(function=prepare()))
+            result["payload_kib"] = len(data_payload) / 1_024
+            result_map.setdefault(scenario, {})[stage] = result
+
+    return result_map
+
+
+def print_result_map(result_map: dict[str, dict[str, dict]]):
+    header = (
+        f"{'scenario':<16} {'stage':<36} {'p50_us':>10} {'p90_us':>10} "
+        f"{'p99_us':>10} {'max_us':>10} {'blocks':>9} {'peak_kib':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+
+    for scenario, stage_map in result_map.items():
+        for stage, result in stage_map.items():
+            print(
+                f"{scenario:<16} {stage:<36} {result['p50_us']:>10.1f} "
+                f"{result['p90_us']:>10.1f} {result['p99_us']:>10.1f} "
+                f"{result['max_us']:>10.1f} {result['allocated_blocks']:>9} "
+                f"{result['peak_kib']:>10.1f}"
+            )
+
+
+def compare(
+    result_map: dict[str, dict[str, dict]],
+    baseline_map: dict[str, dict[str, dict]],
+    threshold: float,
+) -> list[str]:
+    """List the stages whose p50 regressed by more than `threshold`."""
+
+    regression_list = []
+
+    for scenario, stage_map in result_map.items():
+        for stage, result in stage_map.items():
+            baseline = baseline_map.get(scenario, {}).get(stage)
+            if baseline is None or baseline["p50_us"] <= 0:
+                continue
+            ratio = result["p50_us"] / baseline["p50_us"]
+            if ratio > threshold:
+                regression_list.append(f"{scenario} {stage} : x{ratio:.2f}")
+
+    return regression_list
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--stage", default=None, help="Only run the matching stages.")
+    parser.add_argument("--payload-dir", type=Path, default=None)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--baseline", type=Path, default=None)
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args()
+
+    if args.payload_dir:
+        scenario_map = load_scenario_map(path=args.payload_dir)
+    else:
+        scenario_map = build_scenario_map()
+
+    result_map = run(
+        scenario_map=scenario_map,
+        iterations=args.iterations,
+        stage_filter=args.stage,
+    )
+    print_result_map(result_map=result_map)
+
+    if args.output:
+        args.output.write_text(json.dumps(result_map, indent=2))
+
+    if args.baseline:
+        regression_list = compare(
+            result_map=result_map,
+            baseline_map=json.loads(args.baseline.read_text()),
+            threshold=args.threshold,
+        )
+        for regression in regression_list:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regression_list:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""Quotecast payloads used by the benchmarks.
+
+The synthetic payloads are generated with a fixed seed : two runs of the
+benchmarks parse exactly the same bytes.
+
+Recorded payloads can be added as JSON files : each file contains the
+list of raw responses of one session, the first one being the
+registration burst.
+"""
+
+import json
+import random
+from pathlib import Path
+
+DEFAULT_METRIC_LIST = ["LastPrice", "LastVolume", "BidPrice", "AskPrice", "LastDate"]
+DEPTH_METRIC_LIST = [
+    f"{side}{level}{field}"
+    for side in ("A", "B")
+    for field in ("Price", "Volume", "Orders")
+    for level in range(1, 11)
+]
+
+
+def build_registration_list(
+    product_count: int,
+    metric_list: list[str],
+) -> list[dict]:
+    return [
+        {
+            "m": "a_req",
+            "v": [f"{360000000 + product}.{metric}", product * len(metric_list) + index],
+        }
+        for product in range(product_count)
+        for index, metric in enumerate(metric_list)
+    ]
+
+
+def build_update_list(
+    registration_list: list[dict],
+    update_count: int,
+    seed: int = 0,
+) -> list[dict]:
+    generator = random.Random(seed)
+    update_list = []
+
+    for _ in range(update_count):
+        metric_name, reference = generator.choice(registration_list)["v"]
+        if metric_name.endswith("LastDate"):
+            update_list.append({"m": "us", "v": [reference, "2024-01-15"]})
+        elif metric_name.endswith("Volume") or metric_name.endswith("Orders"):
+            update_list.append({"m": "un", "v": [reference, generator.randint(1, 10_000)]})
+        else:
+            update_list.append({"m": "un", "v": [reference, round(generator.uniform(1, 500), 4)]})
+
+    return update_list
+
+
+def dumps(message_list: list[dict]) -> str:
+    return json.dumps(message_list, separators=(",", ":"))
+
+
+def build_scenario_map() -> dict[str, tuple[str, str]]:
+    """Synthetic scenarios : {name: (registration_payload, data_payload)}."""
+
+    scenario_map = {}
+
+    registration_list = build_registration_list(
+        product_count=2_000,
+        metric_list=DEFAULT_METRIC_LIST,
+    )
+    scenario_map["heartbeat"] = (dumps(registration_list), '[{"m":"h"}]')
+
+    for update_count in (10, 1_000, 10_000):
+        scenario_map[f"updates_{update_count}"] = (
+            dumps(registration_list),
+            dumps(build_update_list(registration_list, update_count=update_count)),
+        )
+
+    depth_registration_list = build_registration_list(
+        product_count=100,
+        metric_list=DEPTH_METRIC_LIST,
+    )
+    scenario_map["depth_burst"] = (
+        dumps(depth_registration_list),
+        dumps(
+            build_update_list(
+                depth_registration_list,
+                update_count=len(depth_registration_list),
+            )
+        ),
+    )
+
+    return scenario_map
+
+
+def load_scenario_map(path: Path) -> dict[str, tuple[str, str]]:
+    """Recorded scenarios : one per JSON file and per data payload."""
+
+    scenario_map = {}
+
+    for file in sorted(path.glob("*.json")):
+        payload_list = json.loads(file.read_text())
+        registration_payload = dumps(payload_list[0])
+        for index, payload in enumerate(payload_list[1:], start=1):
+            scenario_map[f"{file.stem}_{index}"] = (registration_payload, dumps(payload))
+
+    return scenario_map
@@ -0,0 +1,48 @@
+import json
+import logging
+
+from degiro_connector.quotecast.tools.quotecast_stream import QuotecastStream
+from degiro_connector.quotecast.tools.ticker_state import TickerState
+
+logging.basicConfig(level=logging.INFO)
+
+with open("config/config.json") as config_file:
+    config_dict = json.load(config_file)
+
+user_token = config_dict.get("user_token")  # HERE GOES YOUR USER_TOKEN
+
+stream = QuotecastStream(user_token=user_token)
+stream.subscribe(
+    request_map={
+        "360015751": [
+            "LastDate",
+            "LastTime",
+            "LastPrice",
+            "LastVolume",
+        ],
+        "AAPL.BATS,E": [
+            "LastDate",
+            "LastTime",
+            "LastPrice",
+            "LastVolume",
+        ],
+    },
+)
+
+# THE SESSION IS RENEWED AND THE SUBSCRIPTIONS REPLAYED AUTOMATICALLY
+stream.start()
+ticker_state = TickerState()
+
+try:
+    for ticker_update in stream:
+        for metric in ticker_update.metric_list:
+            ticker_state.set_value(
+                product_id=metric.product_id,
+                metric_name=metric.metric_type.value,
+                value=metric.value,
+            )
+        print(ticker_state.build_df())
+except KeyboardInterrupt:
+    print("KeyboardInterrupt")
+finally:
+    stream.stop()
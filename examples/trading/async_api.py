@@ -0,0 +1,38 @@
+import asyncio
+import logging
+
+from degiro_connector.trading.async_api import AsyncAPI
+from degiro_connector.trading.models.credentials import build_credentials
+
+logging.basicConfig(level=logging.INFO)
+
+credentials = build_credentials(
+    location="config/config.json",
+    # override={
+    #     "username": "TEXT_PLACEHOLDER",
+    #     "password": "TEXT_PLACEHOLDER",
+    #     "int_account": NUMBER_PLACEHOLDER,  # From `get_client_details`
+    #     # "totp_secret_key": "TEXT_PLACEHOLDER",  # For 2FA
+    # },
+)
+
+isin_list = ["NL0000235190", "FR0000131104", "US0378331005"]
+
+
+async def main():
+    async with AsyncAPI(credentials=credentials) as trading_api:
+        await trading_api.connect()
+
+        # FETCH DATA CONCURRENTLY
+        company_profile_list = await asyncio.gather(
+            *(
+                trading_api.get_company_profile(product_isin=isin, raw=True)
+                for isin in isin_list
+            )
+        )
+
+        for company_profile in company_profile_list:
+            print(company_profile)
+
+
+asyncio.run(main())
@@ -1,14 +1,21 @@
 import abc
 import logging
 import requests
+import time
+from datetime import timedelta
 from inspect import ismethod
 
 
+from degiro_connector.core.helpers.retry import RetryPolicy, retry_context
 from degiro_connector.core.models.model_connection import ModelConnection
 from degiro_connector.core.models.model_session import ModelSession
 
 
 class AbstractAction(abc.ABC):
+    # WHETHER OR NOT THE REQUESTS OF THE ACTION ARE SAFE TO SEND TWICE
+    # None : DECIDED BY THE HTTP METHOD, SEE `RetryPolicy.method_set`
+    IDEMPOTENT: bool | None = None
+
     # COMMENTING @final : FOR COMPATIBILITY WITH PYTHON 3.7
     # @final
     @staticmethod
@@ -20,6 +27,19 @@ class AbstractAction(abc.ABC):
     def build_session(headers: dict[str, str] | None = None) -> requests.Session:
         return ModelSession.build_session()
 
+    # @final
+    @staticmethod
+    def build_duration_ns(start_ns: int, response: requests.Response) -> int:
+        """Nanoseconds elapsed since `start_ns`, at least `response.elapsed`.
+
+        A response replayed by `ModelAsyncSession` is returned at once : its
+        round-trip is only known through `response.elapsed`.
+        """
+
+        elapsed_ns = response.elapsed // timedelta(microseconds=1) * 1000
+
+        return max(time.perf_counter_ns() - start_ns, elapsed_ns)
+
     # @final
     @property
     def credentials(self):
@@ -35,6 +55,17 @@ class AbstractAction(abc.ABC):
     def logger(self):
         return self._logger
 
+    # @final
+    @property
+    def retry_policy(self) -> RetryPolicy | None:
+        """Retry policy of this action, the one of the session if None."""
+
+        return self._retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, retry_policy: RetryPolicy | None):
+        self._retry_policy = retry_policy
+
     # @final
     @property
     def session_storage(self):
@@ -57,6 +88,7 @@ class AbstractAction(abc.ABC):
         self._credentials = credentials
         self._connection_storage = connection_storage
         self._logger = logger or logging.getLogger(self.__module__)
+        self._retry_policy = None
         self._session_storage = session_storage or ModelSession(
             hooks=self._connection_storage.build_hooks(),
             ssl_check=True,
@@ -66,7 +98,8 @@ class AbstractAction(abc.ABC):
 
     # @final
     def __call__(self, *args, **kwargs):
-        return self.call(*args, **kwargs)
+        with retry_context(retry_policy=self._retry_policy, idempotent=self.IDEMPOTENT):
+            return self.call(*args, **kwargs)
 
     def post_init(self, *args, **kwargs):
         pass
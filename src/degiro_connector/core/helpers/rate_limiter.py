@@ -0,0 +1,111 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """Token bucket shared by several threads.
+
+    Tokens are added at `rate` per second, up to `burst` tokens : after an
+    idle period, up to `burst` requests can be sent right away, then the
+    requests are spaced by `1 / rate` seconds.
+
+    Example :
+        rate_limiter = RateLimiter(rate=10.0, burst=5)
+        rate_limiter.acquire()
+        session.send(prepped)
+    """
+
+    __last_refill: float
+    __token_count: float
+
+    @property
+    def burst(self) -> int:
+        return self.__burst
+
+    @property
+    def rate(self) -> float:
+        return self.__rate
+
+    def refill(self, now: float):
+        elapsed = now - self.__last_refill
+        self.__last_refill = now
+        self.__token_count = min(
+            float(self.__burst),
+            self.__token_count + elapsed * self.__rate,
+        )
+
+    def get_delay(self, token_count: float = 1.0) -> float:
+        """Seconds before `token_count` tokens are available, without taking them."""
+
+        with self.__lock:
+            self.refill(now=time.monotonic())
+
+            if self.__token_count >= token_count:
+                return 0.0
+
+            return (token_count - self.__token_count) / self.__rate
+
+    def try_acquire(self, token_count: float = 1.0) -> float:
+        """Take tokens if available.
+
+        Returns:
+            float: 0 if the tokens were taken, otherwise seconds to wait.
+        """
+
+        with self.__lock:
+            self.refill(now=time.monotonic())
+
+            if self.__token_count >= token_count:
+                self.__token_count -= token_count
+                return 0.0
+
+            return (token_count - self.__token_count) / self.__rate
+
+    def acquire(self, token_count: float = 1.0, timeout: float | None = None) -> bool:
+        """Wait for tokens.
+
+        Args:
+            token_count (float, optional):
+                Number of tokens to take.
+                Defaults to 1.0.
+            timeout (float, optional):
+                Maximum waiting time in seconds, no limit if None.
+                Defaults to None.
+        Returns:
+            bool: Whether or not the tokens were taken.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            delay = self.try_acquire(token_count=token_count)
+
+            if delay == 0.0:
+                return True
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                delay = min(delay, remaining)
+
+            time.sleep(delay)
+
+    def __init__(self, rate: float, burst: int | None = None):
+        """
+        Args:
+            rate (float):
+                Tokens added per second.
+            burst (int, optional):
+                Size of the bucket, `max(1, rate)` if None.
+                Defaults to None.
+        """
+
+        if rate <= 0:
+            raise AttributeError("`rate` must be greater than 0.")
+
+        self.__rate = rate
+        self.__burst = burst if burst is not None else max(1, int(rate))
+        self.__lock = threading.Lock()
+        self.__token_count = float(self.__burst)
+        self.__last_refill = time.monotonic()
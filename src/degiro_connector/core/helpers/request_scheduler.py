@@ -0,0 +1,292 @@
+import itertools
+import logging
+import threading
+import time
+from typing import Any
+
+import requests
+from pydantic import BaseModel, Field
+
+from degiro_connector.core.constants import urls
+from degiro_connector.core.helpers.rate_limiter import RateLimiter
+from degiro_connector.core.helpers.retry import RetryingSession, RetryPolicy
+
+
+class RequestBudget(BaseModel):
+    """Token bucket of a group of endpoints, see `RateLimiter`."""
+
+    rate: float
+    burst: int | None = Field(default=None)
+    priority: int = Field(default=0)  # LOWER IS SERVED FIRST
+
+
+class GroupStats(BaseModel):
+    """Snapshot of the requests of a group handled by a `RequestScheduler`."""
+
+    request_count: int = Field(default=0)
+    waited_count: int = Field(default=0)
+    wait_total: float = Field(default=0.0)
+    wait_max: float = Field(default=0.0)
+    queue_length: int = Field(default=0)
+    queue_max: int = Field(default=0)
+
+
+class RequestScheduler:
+    """Throttle the requests of all the actions sharing a session.
+
+    Each URL belongs to a group of endpoints, from the constants of
+    `degiro_connector.core.constants.urls`. Each group has its own token bucket
+    and all the requests also share a global bucket.
+
+    When the global bucket runs dry, the waiting requests are served by
+    priority : the orders go before the updates, which go before the product
+    search, the reports and the news.
+
+    The groups are resolved at call time : `override_urls` is honoured.
+
+    Example :
+        request_scheduler = RequestScheduler(
+            budget_map={"news": RequestBudget(rate=0.5, burst=1, priority=4)},
+        )
+        trading_api = TradingAPI(
+            credentials=credentials,
+            request_scheduler=request_scheduler,
+        )
+        trading_api.connect()
+        request_scheduler.build_stats()
+    """
+
+    DEFAULT_GROUP = "other"
+    GROUP_MAP = {
+        "company_data": [
+            "AGENDA",
+            "COMPANY_PROFILE",
+            "COMPANY_RATIOS",
+            "ESTIMATES_SUMMARIES",
+            "FINANCIAL_STATEMENTS",
+        ],
+        "login": ["CONFIG", "LOGIN", "LOGOUT"],
+        "news": ["LATEST_NEWS", "NEWS_BY_COMPANY", "TOP_NEWS_PREVIEW"],
+        "orders": ["ORDER_CHECK", "ORDER_CONFIRM", "ORDER_DELETE", "ORDER_UPDATE"],
+        "product_search": [
+            "FUTURES_UNDERLYINGS",
+            "OPTIONS_UNDERLYINGS",
+            "PRODUCT_SEARCH_BONDS",
+            "PRODUCT_SEARCH_DICTIONARY",
+            "PRODUCT_SEARCH_ETFS",
+            "PRODUCT_SEARCH_FUNDS",
+            "PRODUCT_SEARCH_FUTURES",
+            "PRODUCT_SEARCH_LEVERAGEDS",
+            "PRODUCT_SEARCH_LOOKUP",
+            "PRODUCT_SEARCH_OPTIONS",
+            "PRODUCT_SEARCH_STOCKS",
+            "PRODUCT_SEARCH_WARRANTS",
+            "PRODUCTS_INFO",
+        ],
+        "reports": [
+            "ACCOUNT_OVERVIEW",
+            "CASH_ACCOUNT_REPORT",
+            "ORDERS_HISTORY",
+            "POSITION_REPORT",
+            "SECURITIES_LENDING_REPORT_DATE",
+            "SECURITIES_LENDING_REPORTING_SNAPSHOT",
+            "TRANSACTIONS_HISTORY",
+            "UPCOMING_PAYMENTS",
+        ],
+        "update": ["ACCOUNT_INFO", "UPDATE"],
+    }
+    DEFAULT_BUDGET_MAP = {
+        "company_data": RequestBudget(rate=5.0, burst=5, priority=3),
+        "login": RequestBudget(rate=1.0, burst=3, priority=0),
+        "news": RequestBudget(rate=2.0, burst=4, priority=4),
+        "orders": RequestBudget(rate=10.0, burst=10, priority=0),
+        "other": RequestBudget(rate=5.0, burst=5, priority=2),
+        "product_search": RequestBudget(rate=10.0, burst=10, priority=2),
+        "reports": RequestBudget(rate=2.0, burst=4, priority=3),
+        "update": RequestBudget(rate=5.0, burst=5, priority=1),
+    }
+    DEFAULT_GLOBAL_BUDGET = RequestBudget(rate=20.0, burst=20)
+
+    @classmethod
+    def build_prefix_list(cls) -> list[tuple[str, str]]:
+        """Current URL of each grouped constant, longest first."""
+
+        prefix_list = [
+            (getattr(urls, name), group)
+            for group, name_list in cls.GROUP_MAP.items()
+            for name in name_list
+        ]
+        prefix_list.sort(key=lambda pair: len(pair[0]), reverse=True)
+
+        return prefix_list
+
+    @classmethod
+    def get_group(cls, url: str) -> str:
+        url = url.split("?", 1)[0].split(";", 1)[0]
+
+        for prefix, group in cls.build_prefix_list():
+            if url == prefix or url.startswith(prefix + "/"):
+                return group
+
+        return cls.DEFAULT_GROUP
+
+    @property
+    def budget_map(self) -> dict[str, RequestBudget]:
+        return dict(self.__budget_map)
+
+    def get_limiter(self, group: str) -> RateLimiter:
+        limiter = self.__limiter_map.get(group)
+
+        if limiter is None:
+            limiter = self.__limiter_map[self.DEFAULT_GROUP]
+
+        return limiter
+
+    def get_priority(self, group: str) -> int:
+        budget = self.__budget_map.get(group) or self.__budget_map[self.DEFAULT_GROUP]
+
+        return budget.priority
+
+    def get_delay(self, ticket: tuple[int, int, str]) -> float:
+        """Seconds before the request of `ticket` can be sent, 0 if now.
+
+        The lock must be held by the caller.
+        """
+
+        group = ticket[2]
+        delay = self.get_limiter(group=group).get_delay()
+
+        if self.__global_limiter is not None:
+            delay = max(delay, self.__global_limiter.get_delay())
+
+        if delay > 0:
+            return delay
+
+        # A BETTER TICKET, READY TO GO, HAS TO BE SERVED FIRST
+        for other_ticket in self.__waiting_list:
+            if (
+                other_ticket < ticket
+                and self.get_limiter(group=other_ticket[2]).get_delay() == 0
+            ):
+                return self.__yield_delay
+
+        return 0.0
+
+    def acquire(self, url: str) -> float:
+        """Wait until a request to `url` can be sent.
+
+        Returns:
+            float: Waiting time in seconds.
+        """
+
+        group = self.get_group(url=url)
+        ticket = (self.get_priority(group=group), next(self.__counter), group)
+        start = time.monotonic()
+
+        with self.__condition:
+            stats = self.__stats_map.setdefault(group, GroupStats())
+            self.__waiting_list.append(ticket)
+            stats.queue_length += 1
+            stats.queue_max = max(stats.queue_max, stats.queue_length)
+
+            try:
+                while True:
+                    delay = self.get_delay(ticket=ticket)
+                    if delay == 0.0:
+                        self.get_limiter(group=group).try_acquire()
+                        if self.__global_limiter is not None:
+                            self.__global_limiter.try_acquire()
+                        break
+                    self.__condition.notify_all()
+                    self.__condition.wait(timeout=delay)
+            finally:
+                self.__waiting_list.remove(ticket)
+                stats.queue_length -= 1
+                self.__condition.notify_all()
+
+            waited = time.monotonic() - start
+            stats.request_count += 1
+            if waited >= self.__yield_delay:
+                stats.waited_count += 1
+            stats.wait_total += waited
+            stats.wait_max = max(stats.wait_max, waited)
+
+        if waited >= 1.0:
+            self.__logger.debug("acquire: group=%s waited=%.2f", group, waited)
+
+        return waited
+
+    def build_stats(self) -> dict[str, GroupStats]:
+        with self.__lock:
+            return {
+                group: stats.model_copy()
+                for group, stats in self.__stats_map.items()
+            }
+
+    def __init__(
+        self,
+        budget_map: dict[str, RequestBudget] | None = None,
+        global_budget: RequestBudget | None = DEFAULT_GLOBAL_BUDGET,
+        logger: logging.Logger | None = None,
+    ):
+        """
+        Args:
+            budget_map (dict[str, RequestBudget], optional):
+                Budgets overriding the ones of `DEFAULT_BUDGET_MAP`.
+                Defaults to None.
+            global_budget (RequestBudget | None, optional):
+                Budget shared by all the groups, no global limit if None.
+                Defaults to DEFAULT_GLOBAL_BUDGET.
+            logger (logging.Logger, optional):
+                This object will be generated if None.
+                Defaults to None.
+        """
+
+        self.__budget_map = {**self.DEFAULT_BUDGET_MAP, **(budget_map or {})}
+        self.__logger = logger or logging.getLogger(self.__module__)
+
+        self.__limiter_map = {
+            group: RateLimiter(rate=budget.rate, burst=budget.burst)
+            for group, budget in self.__budget_map.items()
+        }
+        self.__global_limiter = (
+            None
+            if global_budget is None
+            else RateLimiter(rate=global_budget.rate, burst=global_budget.burst)
+        )
+
+        self.__lock = threading.Lock()
+        self.__condition = threading.Condition(self.__lock)
+        self.__counter = itertools.count()
+        self.__waiting_list: list[tuple[int, int, str]] = []
+        self.__stats_map: dict[str, GroupStats] = {}
+        self.__yield_delay = 0.005
+
+
+class ScheduledSession(RetryingSession):
+    """"requests.Session" sending its requests through a `RequestScheduler`.
+
+    Each attempt of a retried request waits for its own token.
+    """
+
+    @property
+    def request_scheduler(self) -> RequestScheduler:
+        return self.__request_scheduler
+
+    def send_attempt(
+        self,
+        request: requests.PreparedRequest,
+        **kwargs: Any,
+    ) -> requests.Response:
+        self.__request_scheduler.acquire(url=request.url or "")
+
+        return super().send_attempt(request, **kwargs)
+
+    def __init__(
+        self,
+        request_scheduler: RequestScheduler,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        super().__init__(retry_policy=retry_policy)
+
+        self.__request_scheduler = request_scheduler
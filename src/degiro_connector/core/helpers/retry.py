@@ -0,0 +1,406 @@
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import Any, Iterator
+
+import requests
+
+
+class RetryPolicy:
+    """When and how long to wait before sending a failed request again.
+
+    Transient failures are retried :
+        * connection errors and timeouts,
+        * HTTP status listed in `status_list` (429 and 5xx by default).
+
+    The delay grows exponentially, with "full jitter" : a random duration
+    between 0 and `min(max_delay, base_delay * 2 ** attempt)`. A
+    "Retry-After" header, when present, is honoured instead.
+
+    Only the idempotent requests are retried : by default the ones whose HTTP
+    method is in `method_set`, so an order sent with POST is never sent twice.
+
+    Example :
+        retry_policy = RetryPolicy(max_attempts=5)
+        for attempt in range(retry_policy.max_attempts):
+            try:
+                return fetch()
+            except Exception as e:
+                if not retry_policy.should_retry(error=e, attempt=attempt):
+                    raise
+                time.sleep(retry_policy.compute_delay(attempt=attempt, error=e))
+    """
+
+    STATUS_LIST = (429, 500, 502, 503, 504)
+    IDEMPOTENT_METHOD_SET = frozenset({"DELETE", "GET", "HEAD", "OPTIONS", "PUT"})
+
+    @staticmethod
+    def parse_retry_after(response: requests.Response | None) -> float | None:
+        if response is None:
+            return None
+
+        retry_after = response.headers.get("Retry-After")
+
+        if not retry_after:
+            return None
+
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    @property
+    def deadline(self) -> float | None:
+        return self.__deadline
+
+    @property
+    def max_attempts(self) -> int:
+        return self.__max_attempts
+
+    @property
+    def method_set(self) -> frozenset[str]:
+        return self.__method_set
+
+    @property
+    def status_list(self) -> tuple[int, ...]:
+        return self.__status_list
+
+    def is_transient(self, error: BaseException) -> bool:
+        if isinstance(error, requests.HTTPError):
+            response = error.response
+            return response is not None and response.status_code in self.__status_list
+
+        return isinstance(
+            error,
+            (requests.ConnectionError, requests.Timeout, ConnectionError, TimeoutError),
+        )
+
+    def is_idempotent(self, method: str | None) -> bool:
+        return (method or "").upper() in self.__method_set
+
+    def should_retry(
+        self,
+        error: BaseException,
+        attempt: int,
+        elapsed: float = 0.0,
+    ) -> bool:
+        """
+        Args:
+            error (BaseException):
+                Failure of the attempt.
+            attempt (int):
+                Index of the failed attempt, starting at 0.
+            elapsed (float, optional):
+                Seconds since the first attempt, including the next delay.
+                Defaults to 0.0.
+        Returns:
+            bool: Whether or not another attempt should be made.
+        """
+
+        if self.__deadline is not None and elapsed > self.__deadline:
+            return False
+
+        return attempt + 1 < self.__max_attempts and self.is_transient(error=error)
+
+    def compute_delay(
+        self,
+        attempt: int,
+        error: BaseException | None = None,
+        response: requests.Response | None = None,
+    ) -> float:
+        if response is None and isinstance(error, requests.HTTPError):
+            response = error.response
+
+        retry_after = self.parse_retry_after(response=response)
+        if retry_after is not None:
+            return min(retry_after, self.__max_delay)
+
+        ceiling = min(self.__max_delay, self.__base_delay * 2**attempt)
+
+        return self.__random.uniform(0, ceiling)
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        status_list: tuple[int, ...] | None = None,
+        seed: int | None = None,
+        deadline: float | None = None,
+        method_set: set[str] | frozenset[str] | None = None,
+    ):
+        """
+        Args:
+            max_attempts (int, optional):
+                Total number of attempts, including the first one.
+                Defaults to 3.
+            base_delay (float, optional):
+                Ceiling of the first delay, in seconds.
+                Defaults to 0.5.
+            max_delay (float, optional):
+                Ceiling of all the delays, in seconds.
+                Defaults to 30.0.
+            status_list (tuple[int, ...], optional):
+                HTTP status to retry, `STATUS_LIST` if None.
+                Defaults to None.
+            seed (int, optional):
+                Seed of the jitter.
+                Defaults to None.
+            deadline (float, optional):
+                Maximum time spent on all the attempts, in seconds, no limit
+                if None.
+                Defaults to None.
+            method_set (set[str], optional):
+                HTTP methods considered idempotent, `IDEMPOTENT_METHOD_SET`
+                if None.
+                Defaults to None.
+        """
+
+        if max_attempts < 1:
+            raise AttributeError("`max_attempts` must be greater than 0.")
+
+        self.__max_attempts = max_attempts
+        self.__base_delay = base_delay
+        self.__max_delay = max_delay
+        self.__status_list = status_list if status_list is not None else self.STATUS_LIST
+        self.__random = random.Random(seed)
+        self.__deadline = deadline
+        self.__method_set = frozenset(
+            method.upper() for method in (method_set or self.IDEMPOTENT_METHOD_SET)
+        )
+
+
+class RequestTrace:
+    """Outcome of the requests sent by a `RetryingSession` inside a
+    `retry_context`.
+
+    Unlike the counters of `ModelConnection`, a trace only sees the requests
+    of its own block, on its own thread : the requests of a nested
+    `retry_context` are recorded in the enclosing traces too.
+    """
+
+    @property
+    def error(self) -> BaseException | None:
+        """Exception raised by the last request, None if it got a response."""
+
+        return self.__error
+
+    @property
+    def request_count(self) -> int:
+        return self.__request_count
+
+    @property
+    def response(self) -> requests.Response | None:
+        """Last response received, None if the last request failed."""
+
+        return self.__response
+
+    @property
+    def unauthorized(self) -> bool:
+        """Whether or not a request was answered with the status 401."""
+
+        return self.__unauthorized
+
+    def record(
+        self,
+        response: requests.Response | None = None,
+        error: BaseException | None = None,
+    ):
+        request_trace: RequestTrace | None = self
+
+        while request_trace is not None:
+            request_trace.__request_count += 1
+            request_trace.__response = response
+            request_trace.__error = error
+            if response is not None and response.status_code == 401:
+                request_trace.__unauthorized = True
+            request_trace = request_trace.__parent
+
+    def __init__(self, parent: "RequestTrace | None" = None):
+        """
+        Args:
+            parent (RequestTrace, optional):
+                Trace of the enclosing block, also receiving the records.
+                Defaults to None.
+        """
+
+        self.__parent = parent
+        self.__error: BaseException | None = None
+        self.__request_count = 0
+        self.__response: requests.Response | None = None
+        self.__unauthorized = False
+
+
+# (retry_policy, idempotent, request_trace) OF THE ACTION BEING CALLED
+RETRY_CONTEXT: ContextVar[
+    tuple[RetryPolicy | None, bool | None, RequestTrace] | None
+] = ContextVar(
+    "retry_context",
+    default=None,
+)
+
+
+@contextmanager
+def retry_context(
+    retry_policy: RetryPolicy | None = None,
+    idempotent: bool | None = None,
+) -> Iterator[RequestTrace]:
+    """Retry settings of the requests sent inside the block, see `RetryingSession`.
+
+    Example :
+        with retry_context() as request_trace:
+            trading_api.get_update(request_list=request_list)
+
+        if request_trace.unauthorized:
+            trading_api.connect()
+
+    Args:
+        retry_policy (RetryPolicy, optional):
+            Policy of these requests, the one of the session if None.
+            Defaults to None.
+        idempotent (bool, optional):
+            Whether or not these requests are safe to send twice, decided by
+            their HTTP method if None.
+            Defaults to None.
+    Returns:
+        Iterator[RequestTrace]: Outcome of the requests of the block.
+    """
+
+    context = RETRY_CONTEXT.get()
+    request_trace = RequestTrace(parent=None if context is None else context[2])
+    token = RETRY_CONTEXT.set((retry_policy, idempotent, request_trace))
+
+    try:
+        yield request_trace
+    finally:
+        RETRY_CONTEXT.reset(token)
+
+
+class RetryingSession(requests.Session):
+    """"requests.Session" sending the idempotent requests again after a
+    transient failure.
+
+    The policy comes from the enclosing `retry_context`, otherwise from
+    `retry_policy`. Without policy, each request is sent once.
+
+    When the retries are exhausted, the last response is returned, or the
+    last exception raised : the callers see the same outcome as without retry.
+    This outcome is recorded in the `RequestTrace` of the enclosing
+    `retry_context`.
+    """
+
+    @property
+    def retry_policy(self) -> RetryPolicy | None:
+        return self.__retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, retry_policy: RetryPolicy | None):
+        self.__retry_policy = retry_policy
+
+    def send_attempt(
+        self,
+        request: requests.PreparedRequest,
+        **kwargs: Any,
+    ) -> requests.Response:
+        return super().send(request, **kwargs)
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        **kwargs: Any,
+    ) -> requests.Response:
+        context = RETRY_CONTEXT.get()
+
+        if context is None:
+            return self.send_retrying(request, **kwargs)
+
+        retry_policy, idempotent, request_trace = context
+
+        try:
+            response = self.send_retrying(
+                request,
+                retry_policy=retry_policy,
+                idempotent=idempotent,
+                **kwargs,
+            )
+        except Exception as e:
+            request_trace.record(error=e)
+            raise
+
+        request_trace.record(response=response)
+
+        return response
+
+    def send_retrying(
+        self,
+        request: requests.PreparedRequest,
+        retry_policy: RetryPolicy | None = None,
+        idempotent: bool | None = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        retry_policy = retry_policy or self.__retry_policy
+
+        if retry_policy is None:
+            return self.send_attempt(request, **kwargs)
+
+        if idempotent is None:
+            idempotent = retry_policy.is_idempotent(method=request.method)
+
+        if not idempotent:
+            return self.send_attempt(request, **kwargs)
+
+        start = time.monotonic()
+        attempt = 0
+
+        while True:
+            response = None
+
+            try:
+                response = self.send_attempt(request, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error: BaseException = e
+            else:
+                if response.status_code not in retry_policy.status_list:
+                    return response
+                error = requests.HTTPError(response=response)
+
+            delay = retry_policy.compute_delay(
+                attempt=attempt,
+                error=error,
+                response=response,
+            )
+            if not retry_policy.should_retry(
+                error=error,
+                attempt=attempt,
+                elapsed=time.monotonic() - start + delay,
+            ):
+                if response is None:
+                    raise error
+                return response
+
+            self.__logger.info(
+                "send:retry: %s %s attempt=%s delay=%.2f error=%s",
+                request.method,
+                (request.url or "").split("?", 1)[0].split(";", 1)[0],
+                attempt,
+                delay,
+                error,
+            )
+            if response is not None:
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def __init__(self, retry_policy: RetryPolicy | None = None):
+        super().__init__()
+
+        self.__logger = logging.getLogger(self.__module__)
+        self.__retry_policy = retry_policy
@@ -0,0 +1,156 @@
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+
+@contextmanager
+def file_lock(
+    path: str | Path,
+    timeout: float | None = None,
+    poll_interval: float = 0.05,
+) -> Iterator[None]:
+    """Exclusive lock shared by the processes and the threads of a host.
+
+    Args:
+        path (str | Path):
+            Lock file, created if missing.
+        timeout (float, optional):
+            Maximum waiting time in seconds, no limit if None.
+            Defaults to None.
+        poll_interval (float, optional):
+            Delay between two attempts, in seconds.
+            Defaults to 0.05.
+    Raises:
+        TimeoutError: The lock was not acquired before the timeout.
+    """
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    try:
+        while True:
+            try:
+                if sys.platform == "win32":
+                    msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except OSError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(f"Lock not acquired : {path}")
+                time.sleep(poll_interval)
+
+        try:
+            yield
+        finally:
+            if sys.platform == "win32":
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+class FileSessionStore:
+    """Share the `session_id` of an account between the processes of a host.
+
+    The sessions are stored in a JSON file, readable by its owner only. The
+    login is done under a lock file : while a process logs in, the others
+    wait and then reuse its `session_id`.
+
+    Example :
+        session_store = FileSessionStore(path="~/.degiro/sessions.json")
+        connection_storage = ModelConnection(
+            timeout=TradingAPI.TRADING_TIMEOUT,
+            session_store=session_store,
+        )
+        trading_api = TradingAPI(
+            credentials=credentials,
+            connection_storage=connection_storage,
+        )
+        trading_api.connect()
+    """
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @property
+    def lock_path(self) -> Path:
+        return self.__path.with_name(self.__path.name + ".lock")
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        with file_lock(path=self.lock_path, timeout=self.__lock_timeout):
+            yield
+
+    def read(self) -> dict[str, dict]:
+        try:
+            return json.loads(self.__path.read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def write(self, record_map: dict[str, dict]):
+        path = self.__path
+        tmp_path = path.with_name(path.name + ".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as file:
+            json.dump(record_map, file)
+        tmp_path.replace(path)
+
+    @staticmethod
+    def build_key(username: str, int_account: int | None = None) -> str:
+        return f"{username}:{int_account or ''}"
+
+    def load(self, key: str, max_age: float | None = None) -> dict | None:
+        """Stored record, None if missing or older than `max_age` seconds.
+
+        Returns:
+            dict | None:
+                {"session_id": str, "updated": float}, with `updated` the
+                `time.time` of the login.
+        """
+
+        record = self.read().get(key)
+
+        if record is None:
+            return None
+
+        if max_age is not None and time.time() - record["updated"] > max_age:
+            return None
+
+        return record
+
+    def save(self, key: str, session_id: str):
+        record_map = self.read()
+        record_map[key] = {"session_id": session_id, "updated": time.time()}
+        self.write(record_map=record_map)
+
+    def delete(self, key: str):
+        record_map = self.read()
+        if record_map.pop(key, None) is not None:
+            self.write(record_map=record_map)
+
+    def __init__(self, path: str | Path, lock_timeout: float | None = 60.0):
+        """
+        Args:
+            path (str | Path):
+                JSON file of the sessions, its folder is created if missing.
+            lock_timeout (float, optional):
+                Maximum waiting time for the lock, in seconds.
+                Defaults to 60.0.
+        """
+
+        self.__path = Path(path).expanduser()
+        self.__path.parent.mkdir(parents=True, exist_ok=True)
+        self.__lock_timeout = lock_timeout
@@ -0,0 +1,122 @@
+import threading
+import time
+from typing import Any, Callable, Hashable
+
+
+class Flight:
+    """One call, awaited by the callers which joined it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.error: BaseException | None = None
+        self.result: Any = None
+        self.completed: float = 0.0
+        self.generation: Hashable = None
+
+
+class SingleFlight:
+    """Run a function once for all the concurrent callers of the same key.
+
+    The first caller runs the function, the others wait for it and receive
+    the same result, or the same exception.
+
+    A result is also returned to the callers arriving less than
+    `reuse_window` seconds after it, as long as `get_generation` still
+    returns the value it had when the call completed.
+
+    Example :
+        single_flight = SingleFlight(reuse_window=1.0)
+        session_id = single_flight.do(key="login", function=login)
+    """
+
+    @property
+    def in_flight_count(self) -> int:
+        with self.__lock:
+            return sum(
+                not flight.done.is_set() for flight in self.__flight_map.values()
+            )
+
+    @property
+    def reuse_window(self) -> float:
+        return self.__reuse_window
+
+    def is_reusable(self, flight: Flight, generation: Hashable) -> bool:
+        if not flight.done.is_set():
+            return True
+
+        return (
+            flight.error is None
+            and time.monotonic() - flight.completed <= self.__reuse_window
+            and flight.generation == generation
+        )
+
+    def do(
+        self,
+        key: Hashable,
+        function: Callable[[], Any],
+        get_generation: Callable[[], Hashable] | None = None,
+    ) -> Any:
+        """Run `function`, unless a call of the same `key` is in flight or
+        was completed recently.
+
+        Args:
+            key (Hashable):
+                Identifier of the callers sharing a call.
+            function (Callable[[], Any]):
+                Function to call.
+            get_generation (Callable[[], Hashable], optional):
+                State of the caller, a completed call is only reused while it
+                is unchanged.
+                Defaults to None.
+
+        Returns:
+            Any: Result of `function`.
+        """
+
+        generation = None if get_generation is None else get_generation()
+
+        with self.__lock:
+            flight = self.__flight_map.get(key)
+            is_leader = flight is None or not self.is_reusable(
+                flight=flight,
+                generation=generation,
+            )
+            if flight is None or is_leader:
+                # NEW CALL, REPLACING AN OUTDATED ONE
+                flight = Flight()
+                self.__flight_map[key] = flight
+
+        if not is_leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = function()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            flight.generation = None if get_generation is None else get_generation()
+            flight.completed = time.monotonic()
+            with self.__lock:
+                if flight.error is not None or self.__reuse_window <= 0:
+                    del self.__flight_map[key]
+            flight.done.set()
+
+        return flight.result
+
+    def __init__(self, reuse_window: float = 0.0):
+        """Shares the calls of a same key.
+
+        Args:
+            reuse_window (float, optional):
+                Number of seconds during which a completed result is returned
+                to the new callers.
+                Defaults to 0.0.
+        """
+
+        self.__lock = threading.Lock()
+        self.__flight_map: dict[Hashable, Flight] = {}
+        self.__reuse_window = reuse_window
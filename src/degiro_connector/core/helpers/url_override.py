@@ -0,0 +1,59 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from degiro_connector.core.constants import urls
+
+HOST_MAP = {
+    "https://charting.vwdservices.com": "/charting",
+    "https://degiro.quotecast.vwdservices.com": "/quotecast",
+    "https://trader.degiro.nl": "/trader",
+}
+
+
+def build_url_map(base_url: str) -> dict[str, str]:
+    """Build the URL constants pointing to `base_url` instead of Degiro's hosts.
+
+    Example :
+        build_url_map("http://127.0.0.1:8080")["QUOTECAST"]
+        # "http://127.0.0.1:8080/quotecast/CORS"
+    """
+
+    base_url = base_url.rstrip("/")
+    url_map = {}
+
+    for name, value in vars(urls).items():
+        if not name.isupper() or not isinstance(value, str):
+            continue
+        for host, prefix in HOST_MAP.items():
+            if value.startswith(host):
+                url_map[name] = base_url + prefix + value[len(host) :]
+                break
+
+    return url_map
+
+
+@contextmanager
+def override_urls(base_url: str) -> Iterator[dict[str, str]]:
+    """Repoint the constants of `degiro_connector.core.constants.urls`.
+
+    The actions read these constants at call time, so every request sent
+    inside the block reaches `base_url`.
+
+    The constants are global : the override applies to all the threads.
+
+    Example :
+        with override_urls(base_url="http://127.0.0.1:8080"):
+            trading_api.connect()
+    """
+
+    url_map = build_url_map(base_url=base_url)
+    original_map = {name: getattr(urls, name) for name in url_map}
+
+    for name, value in url_map.items():
+        setattr(urls, name, value)
+
+    try:
+        yield url_map
+    finally:
+        for name, value in original_map.items():
+            setattr(urls, name, value)
@@ -0,0 +1,432 @@
+import asyncio
+import contextvars
+import logging
+import time
+from datetime import timedelta
+from typing import Any, Callable
+
+import httpx
+import requests
+from requests.hooks import dispatch_hook
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+import degiro_connector.core.constants.headers as default_headers
+from degiro_connector.core.helpers.request_scheduler import RequestScheduler
+from degiro_connector.core.helpers.retry import RETRY_CONTEXT, RetryPolicy
+
+
+class RequestCaptured(BaseException):
+    """Interrupt an action right before it reaches the network.
+
+    It inherits from `BaseException` so the `except Exception` blocks of the
+    actions let it through.
+
+    It carries the keyword arguments of `requests.Session.send`, like the
+    `timeout`, and the `retry_context` of the action.
+    """
+
+    def __init__(
+        self,
+        request: requests.PreparedRequest,
+        send_kwargs: dict | None = None,
+    ):
+        super().__init__(request.url)
+        self.request = request
+        self.send_kwargs = send_kwargs or {}
+        self.context = RETRY_CONTEXT.get()
+
+
+class ReplaySession(requests.Session):
+    """`requests.Session` which never touches the network.
+
+    The "n-th" call to `send` returns the "n-th" response fetched by the event
+    loop. When no response is left, the prepared request is captured so the
+    event loop can fetch it.
+    """
+
+    def __init__(
+        self,
+        response_list: list[requests.Response | Exception],
+        headers: dict | None = None,
+        hooks: dict | None = None,
+    ):
+        super().__init__()
+
+        if isinstance(headers, dict):
+            self.headers.update(headers)
+        else:
+            self.headers.update(default_headers.HEADERS)
+
+        if isinstance(hooks, dict):
+            self.hooks.update(hooks)
+
+        self.__response_list = response_list
+        self.__index = 0
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if self.__index >= len(self.__response_list):
+            raise RequestCaptured(request=request, send_kwargs=kwargs)
+
+        response = self.__response_list[self.__index]
+        self.__index += 1
+        context = RETRY_CONTEXT.get()
+
+        if isinstance(response, Exception):
+            if context is not None:
+                context[2].record(error=response)
+            raise response
+
+        response.request = request
+        response = dispatch_hook("response", request.hooks, response, **kwargs)
+
+        if context is not None:
+            context[2].record(response=response)
+
+        return response
+
+
+class ModelAsyncSession:
+    """Handle one `httpx.AsyncClient` connection pool shared by all coroutines.
+
+    The actions are synchronous : they prepare a request, send it and parse the
+    response. This object runs an action until it tries to send its request,
+    fetches the response on the event loop, then runs the action again with the
+    response already available. The parsing logic of the actions is reused
+    untouched, only the network part becomes asynchronous.
+
+    * Each run of the action happens in a worker thread, so the parsing does
+    not block the event loop. No thread is used while waiting for the network.
+    * An action sending N requests is run N + 1 times : the steps before a
+    request are repeated, they must not have side effects.
+    * The `timeout` and `allow_redirects` given to `requests.Session.send` are
+    honoured. The other arguments, like `verify` or `proxies`, are settings of
+    the `httpx.AsyncClient`.
+    * The `RequestScheduler` and the `RetryPolicy` of a `ModelSession` do not
+    apply here : give them to this object instead. The `retry_context` of the
+    actions is honoured, so the orders are still never sent twice.
+    """
+
+    # SECONDS, SAME ORDER OF MAGNITUDE AS A SLOW RESPONSE OF THE API
+    DEFAULT_TIMEOUT = 30.0
+
+    @staticmethod
+    def build_timeout(timeout: Any) -> httpx.Timeout | None:
+        """Convert a `timeout` of "requests" : seconds or (connect, read)."""
+
+        if timeout is None:
+            return None
+
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+
+        return httpx.Timeout(timeout)
+
+    @staticmethod
+    def build_client(
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        timeout: float | None = DEFAULT_TIMEOUT,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> httpx.AsyncClient:
+        """Setup a "httpx.AsyncClient" object.
+        Args:
+            max_connections (int, optional):
+                Maximum number of concurrent connections.
+                Defaults to 100.
+            max_keepalive_connections (int, optional):
+                Maximum number of idle connections kept alive.
+                Defaults to 20.
+            keepalive_expiry (float, optional):
+                Seconds before an idle connection is closed.
+                Defaults to 5.0.
+            timeout (float, optional):
+                Timeout of a request in seconds, None means no timeout.
+                Defaults to DEFAULT_TIMEOUT.
+            transport (httpx.AsyncBaseTransport, optional):
+                Custom transport, useful to mock the network.
+                Defaults to None.
+
+        Returns:
+            httpx.AsyncClient:
+                Client owning the connection pool.
+        """
+
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+
+        return httpx.AsyncClient(
+            limits=limits,
+            timeout=timeout,
+            transport=transport,
+        )
+
+    @staticmethod
+    def build_response(
+        request: requests.PreparedRequest,
+        httpx_response: httpx.Response,
+        duration_ns: int = 0,
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = httpx_response.status_code
+        response.headers = CaseInsensitiveDict(httpx_response.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = httpx_response.reason_phrase
+        response.url = str(httpx_response.url)
+        response.elapsed = timedelta(microseconds=duration_ns // 1000)
+        response.request = request
+        response._content = httpx_response.content
+
+        return response
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self.__client
+
+    @property
+    def session(self) -> requests.Session:
+        session = self.__session_var.get()
+
+        if session is None:
+            raise RuntimeError(
+                "Actions must be awaited through `ModelAsyncSession.run`."
+            )
+
+        return session
+
+    async def send_attempt(
+        self,
+        request: requests.PreparedRequest,
+        send_kwargs: dict | None = None,
+    ) -> requests.Response | Exception:
+        """Fetch a prepared request on the event loop.
+
+        Transport failures are returned instead of raised : they will be raised
+        inside the action, so it handles them like in synchronous mode.
+        """
+
+        send_kwargs = send_kwargs or {}
+        request_kwargs: dict[str, Any] = {}
+
+        if "timeout" in send_kwargs:
+            request_kwargs["timeout"] = self.build_timeout(send_kwargs["timeout"])
+        if "allow_redirects" in send_kwargs:
+            request_kwargs["follow_redirects"] = send_kwargs["allow_redirects"]
+
+        request_scheduler = self.__request_scheduler
+        if request_scheduler is not None:
+            await asyncio.to_thread(request_scheduler.acquire, request.url or "")
+
+        start_ns = time.perf_counter_ns()
+
+        try:
+            httpx_response = await self.__client.request(
+                method=request.method or "GET",
+                url=request.url or "",
+                headers=dict(request.headers),
+                content=request.body,
+                **request_kwargs,
+            )
+        except httpx.TimeoutException as e:
+            return requests.Timeout(e, request=request)
+        except httpx.TransportError as e:
+            return requests.ConnectionError(e, request=request)
+
+        return self.build_response(
+            request=request,
+            httpx_response=httpx_response,
+            duration_ns=time.perf_counter_ns() - start_ns,
+        )
+
+    async def send(
+        self,
+        request: requests.PreparedRequest,
+        send_kwargs: dict | None = None,
+        retry_policy: RetryPolicy | None = None,
+        idempotent: bool | None = None,
+    ) -> requests.Response | Exception:
+        """Fetch a prepared request, retried like in `RetryingSession`."""
+
+        retry_policy = retry_policy or self.__retry_policy
+
+        if retry_policy is not None and idempotent is None:
+            idempotent = retry_policy.is_idempotent(method=request.method)
+
+        start = time.monotonic()
+        attempt = 0
+
+        while True:
+            result = await self.send_attempt(request=request, send_kwargs=send_kwargs)
+
+            if retry_policy is None or not idempotent:
+                return result
+
+            if isinstance(result, Exception):
+                response = None
+                error: BaseException = result
+            elif result.status_code in retry_policy.status_list:
+                response = result
+                error = requests.HTTPError(response=result)
+            else:
+                return result
+
+            delay = retry_policy.compute_delay(
+                attempt=attempt,
+                error=error,
+                response=response,
+            )
+            if not retry_policy.should_retry(
+                error=error,
+                attempt=attempt,
+                elapsed=time.monotonic() - start + delay,
+            ):
+                return result
+
+            self.__logger.info(
+                "send:retry: %s attempt=%s delay=%.2f error=%s",
+                request.method,
+                attempt,
+                delay,
+                error,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def run_once(
+        self,
+        response_list: list[requests.Response | Exception],
+        function: Callable[..., Any],
+        *args,
+        **kwargs,
+    ) -> Any:
+        """Run the action with the responses fetched so far.
+
+        Raises:
+            RequestCaptured: The action needs another response.
+        """
+
+        session = ReplaySession(
+            response_list=response_list,
+            headers=self.__headers,
+            hooks=self.__hooks,
+        )
+        token = self.__session_var.set(session)
+
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.__session_var.reset(token)
+            session.close()
+
+    async def run(self, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a synchronous action, fetching its requests asynchronously."""
+
+        response_list: list[requests.Response | Exception] = []
+
+        while True:
+            try:
+                return await asyncio.to_thread(
+                    self.run_once,
+                    response_list,
+                    function,
+                    *args,
+                    **kwargs,
+                )
+            except RequestCaptured as e:
+                request = e.request
+                send_kwargs = e.send_kwargs
+                retry_policy, idempotent, _request_trace = e.context or (
+                    None,
+                    None,
+                    None,
+                )
+
+            self.__logger.debug("run:fetching: %s %s", request.method, request.url)
+            response_list.append(
+                await self.send(
+                    request=request,
+                    send_kwargs=send_kwargs,
+                    retry_policy=retry_policy,
+                    idempotent=idempotent,
+                )
+            )
+
+    async def aclose(self):
+        await self.__client.aclose()
+
+    def __init__(
+        self,
+        headers: dict | None = None,
+        hooks: dict | None = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        timeout: float | None = DEFAULT_TIMEOUT,
+        transport: httpx.AsyncBaseTransport | None = None,
+        request_scheduler: RequestScheduler | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        """
+        Args:
+            headers (dict, optional):
+                Headers of the requests, the default ones if None.
+                Defaults to None.
+            hooks (dict, optional):
+                Hooks of the requests, like the ones of `ModelConnection`.
+                Defaults to None.
+            max_connections (int, optional):
+                See `build_client`.
+                Defaults to 100.
+            max_keepalive_connections (int, optional):
+                See `build_client`.
+                Defaults to 20.
+            keepalive_expiry (float, optional):
+                See `build_client`.
+                Defaults to 5.0.
+            timeout (float, optional):
+                See `build_client`.
+                Defaults to DEFAULT_TIMEOUT.
+            transport (httpx.AsyncBaseTransport, optional):
+                See `build_client`.
+                Defaults to None.
+            request_scheduler (RequestScheduler, optional):
+                Throttles the requests, not used if None.
+                Defaults to None.
+            retry_policy (RetryPolicy, optional):
+                Retries the idempotent requests, not used if None.
+                Defaults to None.
+        """
+
+        self.__logger = logging.getLogger(self.__module__)
+        self.__session_var: contextvars.ContextVar[requests.Session | None] = (
+            contextvars.ContextVar(f"session_{id(self)}", default=None)
+        )
+
+        if isinstance(headers, dict):
+            headers = dict(headers)
+
+        if isinstance(hooks, dict):
+            hooks = dict(hooks)
+
+        self.__headers = headers
+        self.__hooks = hooks
+        self.__request_scheduler = request_scheduler
+        self.__retry_policy = retry_policy
+        self.__client = self.build_client(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            timeout=timeout,
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "ModelAsyncSession":
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
@@ -15,6 +15,29 @@ class ModelConnection:
     def timeout(self) -> int:
         return self.__timeout
 
+    @property
+    def last_success(self) -> float:
+        """`time.monotonic` of the last response with status 200, 0 if none."""
+
+        return self.__last_success
+
+    @last_success.setter  # type: ignore
+    @synchronized
+    def last_success(self, last_success: float):
+        self.__last_success = last_success
+
+    @property
+    def session_store(self):
+        """Store sharing the `session_id` between processes, None if disabled."""
+
+        return self.__session_store
+
+    @property
+    def unauthorized_count(self) -> int:
+        """Number of responses with status 401."""
+
+        return self.__unauthorized_count
+
     @property  # type: ignore
     @synchronized
     def session_id(self) -> str:
@@ -40,11 +63,14 @@ class ModelConnection:
     def __init__(
         self,
         timeout: int,  # quotecast : 15s / trading: 1800s
+        session_store=None,  # FileSessionStore
     ):
         self.__timeout = timeout
+        self.__session_store = session_store
 
         self.__connected = Event()
         self.__last_success = 0
+        self.__unauthorized_count = 0
         self.__logger = logging.getLogger(self.__module__)
         self.__session_id = ""
 
@@ -64,6 +90,8 @@ class ModelConnection:
 
         if self.__last_success < timestamp and status_code == 200:
             self.__last_success = timestamp
+        elif status_code == 401:
+            self.__unauthorized_count += 1
 
     def build_hooks(self):
         return {"response": [self.response_hook]}
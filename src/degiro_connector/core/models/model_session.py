@@ -1,18 +1,289 @@
 import logging
 import threading
+import time
+from typing import Hashable
 
 import requests
+from pydantic import BaseModel, Field
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3 import PoolManager
 
 import degiro_connector.core.constants.headers as default_headers
+from degiro_connector.core.helpers.request_scheduler import (
+    RequestScheduler,
+    ScheduledSession,
+)
+from degiro_connector.core.helpers.retry import RetryingSession, RetryPolicy
+
+
+class PoolStats(BaseModel):
+    """Snapshot of the connections handled by a `PooledAdapter`."""
+
+    pool_count: int = Field(default=0)
+    connection_count: int = Field(default=0)
+    idle_connection_count: int = Field(default=0)
+    request_count: int = Field(default=0)
+    evicted_pool_count: int = Field(default=0)
+
+
+class TrackedPoolManager(PoolManager):
+    """"urllib3.PoolManager" recording when each of its pools was last used."""
+
+    @property
+    def last_used_map(self) -> dict[Hashable, float]:
+        """`time.monotonic` of the last use of each pool, by pool key."""
+
+        return self.__last_used_map
+
+    def connection_from_pool_key(self, pool_key, request_context):
+        pool = super().connection_from_pool_key(
+            pool_key=pool_key,
+            request_context=request_context,
+        )
+        self.__last_used_map[pool_key] = time.monotonic()
+
+        return pool
+
+    def __init__(self, *args, **kwargs):
+        self.__last_used_map: dict[Hashable, float] = {}
+
+        super().__init__(*args, **kwargs)
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter meant to be shared by the sessions of several threads.
+
+    The underlying "urllib3.PoolManager" is threadsafe : mounting the same
+    adapter on each thread's "requests.Session" lets all the threads reuse the
+    same keep-alive connections, instead of doing one TLS handshake per thread.
+
+    The pools of the hosts which have not been used for `idle_timeout` seconds
+    are closed during the next request, unless they still have requests in
+    flight.
+
+    `ModelSession` mounts a `PooledAdapterLease` on each session : closing a
+    session only releases its lease, the pools are closed with the last lease.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        idle_timeout: float = 60.0,
+        **kwargs,
+    ):
+        """
+        Args:
+            pool_connections (int, optional):
+                Number of hosts for which a pool is kept.
+                Defaults to 10.
+            pool_maxsize (int, optional):
+                Maximum number of connections kept per host.
+                Defaults to 10.
+            pool_block (bool, optional):
+                Whether or not to wait for a free connection once
+                `pool_maxsize` connections are in use.
+                Defaults to False.
+            idle_timeout (float, optional):
+                Seconds after which an unused pool is closed.
+                Defaults to 60.0.
+        """
+
+        self.__idle_timeout = idle_timeout
+        self.__last_eviction = time.monotonic()
+        self.__evicted_pool_count = 0
+        self.__lease_count = 0
+        self.__lock = threading.Lock()
+
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            **kwargs,
+        )
+
+    @property
+    def idle_timeout(self) -> float:
+        return self.__idle_timeout
+
+    @property
+    def lease_count(self) -> int:
+        """Number of sessions using this adapter and not closed yet."""
+
+        return self.__lease_count
+
+    def lease(self) -> "PooledAdapterLease":
+        """Handle to mount on one "requests.Session" instead of this adapter."""
+
+        with self.__lock:
+            self.__lease_count += 1
+
+        return PooledAdapterLease(adapter=self)
+
+    def release(self):
+        """Give back a lease, the pools are closed with the last one."""
+
+        with self.__lock:
+            self.__lease_count -= 1
+            is_last = self.__lease_count == 0
+
+        if is_last:
+            self.close()
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        self.evict_idle()
+
+        with self.__lock:
+            pool = super().get_connection_with_tls_context(
+                request=request,
+                verify=verify,
+                proxies=proxies,
+                cert=cert,
+            )
+
+        return pool
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        super().init_poolmanager(
+            connections=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs,
+        )
+        self.poolmanager = TrackedPoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs,
+        )
+
+    @staticmethod
+    def count_checked_out(pool) -> int:
+        """Number of connections of `pool` used by requests in flight."""
+
+        if pool.pool is None:
+            return 0
+
+        return pool.pool.maxsize - pool.pool.qsize()
+
+    def evict_idle(self, force: bool = False) -> int:
+        """Close the pools which have been idle for more than `idle_timeout`.
+        Args:
+            force (bool, optional):
+                Run the eviction even if it already ran recently.
+                Defaults to False.
+        Returns:
+            int: Number of closed pools.
+        """
+
+        now = time.monotonic()
+        idle_timeout = self.__idle_timeout
+
+        if not force and now - self.__last_eviction < idle_timeout / 2:
+            return 0
+
+        evicted_count = 0
+        with self.__lock:
+            self.__last_eviction = now
+            pools = self.poolmanager.pools
+            last_used_map = self.poolmanager.last_used_map
+            pool_key_set = pools.keys()
+
+            # POOLS ALREADY DISCARDED BY THE "urllib3.PoolManager"
+            for pool_key in set(last_used_map).difference(pool_key_set):
+                del last_used_map[pool_key]
+
+            for pool_key in pool_key_set:
+                pool = pools.get(pool_key)
+                if pool is None:
+                    continue
+                # A POOL WITH REQUESTS IN FLIGHT IS NOT IDLE
+                if self.count_checked_out(pool=pool) > 0:
+                    continue
+                last_used = last_used_map.get(pool_key, now)
+                if now - last_used > idle_timeout:
+                    # The container closes the pool when it is removed.
+                    pools.pop(pool_key, None)
+                    last_used_map.pop(pool_key, None)
+                    evicted_count += 1
+            self.__evicted_pool_count += evicted_count
+
+        return evicted_count
+
+    def build_stats(self) -> PoolStats:
+        pool_stats = PoolStats(evicted_pool_count=self.__evicted_pool_count)
+
+        with self.__lock:
+            pools = self.poolmanager.pools
+            for pool_key in pools.keys():
+                pool = pools.get(pool_key)
+                if pool is None:
+                    continue
+                pool_stats.pool_count += 1
+                pool_stats.connection_count += pool.num_connections
+                pool_stats.request_count += pool.num_requests
+                if pool.pool is not None:
+                    pool_stats.idle_connection_count += sum(
+                        1 for conn in list(pool.pool.queue) if conn is not None
+                    )
+
+        return pool_stats
+
+
+class PooledAdapterLease(BaseAdapter):
+    """Handle of a `PooledAdapter` mounted on one "requests.Session".
+
+    The requests are sent by the shared adapter. `close` releases the lease
+    once, even though the session calls it for each of its mounts.
+    """
+
+    @property
+    def adapter(self) -> PooledAdapter:
+        return self.__adapter
+
+    def send(self, request, *args, **kwargs) -> requests.Response:
+        return self.__adapter.send(request, *args, **kwargs)
+
+    def close(self):
+        with self.__lock:
+            is_closed = self.__closed
+            self.__closed = True
+
+        if not is_closed:
+            self.__adapter.release()
+
+    def __init__(self, adapter: PooledAdapter):
+        super().__init__()
+
+        self.__adapter = adapter
+        self.__closed = False
+        self.__lock = threading.Lock()
 
 
 class ModelSession:
-    """Handle the Requests Session objects in a threadsafe manner."""
+    """Handle the Requests Session objects in a threadsafe manner.
+
+    Each thread gets its own "requests.Session".
+
+    If an `adapter` is provided, it is mounted on all these sessions : with a
+    `PooledAdapter` the threads share one bounded connection pool, which is
+    closed with the last session.
+
+    If a `request_scheduler` is provided, all these sessions send their
+    requests through it : the threads share the same rate limits.
+
+    If a `retry_policy` is provided, the idempotent requests are retried after
+    a transient failure, see `RetryingSession`.
+    """
 
     @staticmethod
     def build_session(
         headers: dict | None = None,
         hooks: dict | None = None,
+        adapter: HTTPAdapter | None = None,
+        request_scheduler: RequestScheduler | None = None,
+        retry_policy: RetryPolicy | None = None,
     ) -> requests.Session:
         """Setup a "requests.Session" object.
         Args:
@@ -22,13 +293,30 @@ class ModelSession:
             hooks (dict, optional):
                 Hooks for the Session.
                 Defaults to None.
+            adapter (HTTPAdapter, optional):
+                Adapter mounted for "http://" and "https://".
+                Defaults to None.
+            request_scheduler (RequestScheduler, optional):
+                Scheduler throttling the requests of the Session.
+                Defaults to None.
+            retry_policy (RetryPolicy, optional):
+                Default retry policy of the Session.
+                Defaults to None.
 
         Returns:
             requests.Session:
                 Session object with the right headers and hooks.
         """
 
-        session = requests.Session()
+        session: requests.Session
+
+        if isinstance(request_scheduler, RequestScheduler):
+            session = ScheduledSession(
+                request_scheduler=request_scheduler,
+                retry_policy=retry_policy,
+            )
+        else:
+            session = RetryingSession(retry_policy=retry_policy)
 
         if isinstance(headers, dict):
             session.headers.update(headers)
@@ -38,8 +326,39 @@ class ModelSession:
         if isinstance(hooks, dict):
             session.hooks.update(hooks)
 
+        mounted_adapter: BaseAdapter | None = adapter
+
+        # CLOSING THIS SESSION MUST NOT CLOSE THE POOLS OF THE OTHER SESSIONS
+        if isinstance(adapter, PooledAdapter):
+            mounted_adapter = adapter.lease()
+
+        if isinstance(mounted_adapter, BaseAdapter):
+            session.mount("https://", mounted_adapter)
+            session.mount("http://", mounted_adapter)
+
         return session
 
+    @property
+    def adapter(self) -> HTTPAdapter | None:
+        return self.__adapter
+
+    @property
+    def request_scheduler(self) -> RequestScheduler | None:
+        return self.__request_scheduler
+
+    @property
+    def retry_policy(self) -> RetryPolicy | None:
+        return self.__retry_policy
+
+    @property
+    def pool_stats(self) -> PoolStats | None:
+        adapter = self.__adapter
+
+        if isinstance(adapter, PooledAdapter):
+            return adapter.build_stats()
+
+        return None
+
     @property
     def session(self) -> requests.Session:
         self.__logger.debug("session:getter: %s", threading.current_thread().name)
@@ -48,6 +367,9 @@ class ModelSession:
             self.__local_storage.session = self.build_session(
                 headers=self.__headers,
                 hooks=self.__hooks,
+                adapter=self.__adapter,
+                request_scheduler=self.__request_scheduler,
+                retry_policy=self.__retry_policy,
             )
 
         return self.__local_storage.session
@@ -66,12 +388,18 @@ class ModelSession:
         self.__local_storage.session = self.build_session(
             headers=headers,
             hooks=hooks,
+            adapter=self.__adapter,
+            request_scheduler=self.__request_scheduler,
+            retry_policy=self.__retry_policy,
         )
 
     def __init__(
         self,
         headers: dict | None = None,
         hooks: dict | None = None,
+        adapter: HTTPAdapter | None = None,
+        request_scheduler: RequestScheduler | None = None,
+        retry_policy: RetryPolicy | None = None,
     ):
         self.__logger = logging.getLogger(self.__module__)
         self.__local_storage = threading.local()
@@ -82,5 +410,8 @@ class ModelSession:
         if isinstance(hooks, dict):
             hooks = dict(hooks)
 
+        self.__adapter = adapter
+        self.__request_scheduler = request_scheduler
+        self.__retry_policy = retry_policy
         self.__headers = headers
         self.__hooks = hooks
@@ -59,3 +59,16 @@ class Chart(BaseModel):
     resolution: str
     series: list[Series] = Field(default_factory=list)
     start: str
+
+
+class ChartCacheEntry(BaseModel):
+    """Metadata stored next to the cached data of a series."""
+
+    # START OF THE PERIOD COVERED BY THE DATA, NONE IF UNKNOWN
+    covered_start: datetime | None = Field(default=None)
+    expires: datetime
+    last_timestamp: datetime | None = Field(default=None)
+    resolution: Interval
+    series_id: str
+    tz: str
+    updated: datetime
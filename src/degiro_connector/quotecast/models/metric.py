@@ -1,3 +1,4 @@
+from array import array
 from enum import Enum
 
 from pydantic import BaseModel
@@ -89,3 +90,58 @@ class Metric(BaseModel):
     metric_type: MetricType
     product_id: str
     value: str | float
+
+
+class MetricColumns:
+    """Metrics of one ticker stored as parallel arrays.
+
+    The `i-th` metric is made of :
+        * reference_list[i] : reference number in Degiro's Quotecast API.
+        * slot_list[i] : index in `product_id_table` and `metric_name_table`.
+        * numeric_list[i] : value of a numeric message, `nan` otherwise.
+        * text_list[i] : value of a text message, `None` otherwise.
+
+    The tables are shared with the `TickerToMetricList` which built this
+    object : they are not copied.
+    """
+
+    reference_list: array
+    slot_list: array
+    numeric_list: array
+    text_list: list[str | None]
+    product_id_table: list[str]
+    metric_name_table: list[str]
+
+    def __init__(self, product_id_table, metric_name_table):
+        self.reference_list = array("q")
+        self.slot_list = array("q")
+        self.numeric_list = array("d")
+        self.text_list = []
+        self.product_id_table = product_id_table
+        self.metric_name_table = metric_name_table
+
+    def __len__(self) -> int:
+        return len(self.slot_list)
+
+    def __repr__(self) -> str:
+        return f"`MetricColumns`:`{len(self)}`"
+
+    def to_metric_list(self) -> list[Metric]:
+        product_id_table = self.product_id_table
+        metric_name_table = self.metric_name_table
+        metric_list = []
+
+        for slot, numeric, text in zip(
+            self.slot_list,
+            self.numeric_list,
+            self.text_list,
+        ):
+            metric_list.append(
+                Metric(
+                    product_id=product_id_table[slot],
+                    metric_type=MetricType(metric_name_table[slot]),
+                    value=numeric if text is None else text,
+                )
+            )
+
+        return metric_list
@@ -3,7 +3,7 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
-from degiro_connector.quotecast.models.metric import MetricType
+from degiro_connector.quotecast.models.metric import Metric, MetricType
 
 
 class Ticker(BaseModel):
@@ -17,3 +17,23 @@ class Ticker(BaseModel):
 class TickerRequest(BaseModel):
     request_type: Literal["subscription", "unsubscription"]
     request_map: dict[str, list[MetricType]] | dict[str, list[str]]
+
+
+class TickerUpdate(BaseModel):
+    """Metrics parsed from one response of Degiro's Quotecast API."""
+
+    metric_list: list[Metric]
+    response_datetime: datetime
+    request_duration: timedelta
+    session_id: str
+
+
+class TickerSnapshot(BaseModel):
+    """State required to resume a Quotecast session without re-registering."""
+
+    session_id: str
+    # {reference: [product_id, metric_type]}
+    reference_map: dict[int, list[str]] = Field(default_factory=dict)
+    # {product_id: [metric_type]}
+    request_map: dict[str, list[str]] = Field(default_factory=dict)
+    snapshot_datetime: datetime = Field(default_factory=datetime.now)
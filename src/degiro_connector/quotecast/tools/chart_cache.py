@@ -0,0 +1,368 @@
+import hashlib
+import logging
+import re
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import polars as pl
+from isodate import ISO8601Error, parse_duration
+
+from degiro_connector.quotecast.models.chart import (
+    ChartCacheEntry,
+    ChartRequest,
+    Interval,
+)
+from degiro_connector.quotecast.tools.chart_fetcher import (
+    ChartFetcher,
+    ChartPaginator,
+    SeriesFormatter,
+)
+
+
+class ChartCache:
+    """Persistent cache of chart's series, on top of a `ChartFetcher`.
+
+    Each series is stored per resolution and timezone in two files :
+        * "<key>.arrow" : the DataFrame, in Arrow IPC format.
+        * "<key>.json" : a `ChartCacheEntry`, with the `expires` of the series.
+
+    For each series of a request :
+        * fresh : the series is read from the disk, without network.
+        * expired : only the window after its last timestamp is fetched, then
+        appended to the cached data.
+        * missing : the series is fetched for the whole requested period.
+
+    The start of the period covered by a series is stored with it : a request
+    reaching further in the past fetches the series again for its whole
+    period.
+
+    Example :
+        chart_cache = ChartCache(path="chart_cache", chart_fetcher=chart_fetcher)
+        df_map = chart_cache.get_chart_df_map(chart_request=chart_request)
+    """
+
+    DATA_SUFFIX = ".arrow"
+    METADATA_SUFFIX = ".json"
+
+    @staticmethod
+    def build_key(series_id: str, resolution: Interval, tz: str) -> str:
+        """Readable and unique file name for a series."""
+
+        readable = re.sub(r"[^A-Za-z0-9]+", "_", series_id).strip("_")
+        digest = hashlib.sha1(
+            f"{series_id}|{resolution.value}|{tz}".encode()
+        ).hexdigest()[:12]
+
+        return f"{readable}_{resolution.value}_{digest}"
+
+    @staticmethod
+    def build_now(tz: str) -> datetime:
+        """Current time in `tz`, naive like the timestamps of the series."""
+
+        return datetime.now(ZoneInfo(tz)).replace(tzinfo=None)
+
+    @classmethod
+    def build_start(cls, chart_request: ChartRequest) -> datetime | None:
+        """Start of the period requested by `chart_request`."""
+
+        now = cls.build_now(tz=chart_request.tz)
+
+        if chart_request.period == Interval.YTD:
+            return datetime(now.year, 1, 1)
+
+        try:
+            return now - parse_duration(chart_request.period.value)
+        except (ISO8601Error, OverflowError, ValueError):
+            return None
+
+    @classmethod
+    def is_fresh(cls, chart_cache_entry: ChartCacheEntry) -> bool:
+        expires = chart_cache_entry.expires
+
+        if expires.tzinfo is None:
+            now = cls.build_now(tz=chart_cache_entry.tz)
+        else:
+            now = datetime.now(expires.tzinfo)
+
+        return now < expires
+
+    @staticmethod
+    def is_covered(
+        chart_cache_entry: ChartCacheEntry,
+        start: datetime | None,
+    ) -> bool:
+        """Whether the cached series reaches back to `start`."""
+
+        if SeriesFormatter.build_columns(series_id=chart_cache_entry.series_id) is None:
+            return True
+
+        covered_start = chart_cache_entry.covered_start
+
+        if covered_start is None:
+            return False
+
+        return start is None or covered_start <= start
+
+    @property
+    def chart_fetcher(self) -> ChartFetcher:
+        return self.__chart_fetcher
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @property
+    def fetch_count(self) -> int:
+        """Number of requests sent to the API."""
+
+        return self.__fetch_count
+
+    def build_path(self, key: str, suffix: str) -> Path:
+        return self.__path / (key + suffix)
+
+    def read(
+        self,
+        series_id: str,
+        resolution: Interval,
+        tz: str,
+    ) -> tuple[ChartCacheEntry, pl.DataFrame] | None:
+        key = self.build_key(series_id=series_id, resolution=resolution, tz=tz)
+        metadata_path = self.build_path(key=key, suffix=self.METADATA_SUFFIX)
+        data_path = self.build_path(key=key, suffix=self.DATA_SUFFIX)
+
+        if not metadata_path.exists() or not data_path.exists():
+            return None
+
+        try:
+            chart_cache_entry = ChartCacheEntry.model_validate_json(
+                metadata_path.read_bytes()
+            )
+            # READ IN MEMORY : A MAPPED FILE COULD NOT BE REPLACED ON WINDOWS
+            df = pl.read_ipc(data_path.read_bytes())
+        except Exception as e:
+            # A CORRUPTED ENTRY IS FETCHED AGAIN
+            self.__logger.warning("read: %s : %s", series_id, e)
+            return None
+
+        return chart_cache_entry, df
+
+    def write(self, chart_cache_entry: ChartCacheEntry, df: pl.DataFrame):
+        """Write an entry atomically : the data first, then its metadata."""
+
+        key = self.build_key(
+            series_id=chart_cache_entry.series_id,
+            resolution=chart_cache_entry.resolution,
+            tz=chart_cache_entry.tz,
+        )
+        data_path = self.build_path(key=key, suffix=self.DATA_SUFFIX)
+        metadata_path = self.build_path(key=key, suffix=self.METADATA_SUFFIX)
+
+        tmp_path = data_path.with_name(data_path.name + ".tmp")
+        df.write_ipc(tmp_path)
+        tmp_path.replace(data_path)
+
+        tmp_path = metadata_path.with_name(metadata_path.name + ".tmp")
+        tmp_path.write_text(chart_cache_entry.model_dump_json())
+        tmp_path.replace(metadata_path)
+
+    def clear(self):
+        for suffix in (self.DATA_SUFFIX, self.METADATA_SUFFIX):
+            for path in self.__path.glob("*" + suffix):
+                path.unlink(missing_ok=True)
+
+    def fetch(
+        self,
+        chart_request: ChartRequest,
+        series_list: list[str],
+        start: datetime | None = None,
+    ) -> tuple[dict, dict[str, pl.DataFrame]]:
+        """Fetches some series of `chart_request`, from `start` if provided."""
+
+        chart_request = chart_request.model_copy(
+            deep=True,
+            update={"series": series_list},
+        )
+
+        if start is not None:
+            end = self.build_now(tz=chart_request.tz)
+            (chart_request,) = ChartPaginator.build_chart_request_list(
+                chart_request=chart_request,
+                window_list=[(start, max(start, end))],
+            )
+
+        self.__fetch_count += 1
+        body = self.__chart_fetcher.fetch_chart_body(chart_request=chart_request)
+
+        return SeriesFormatter.parse_chart(body=body)
+
+    def update(
+        self,
+        chart_request: ChartRequest,
+        chart_map: dict,
+        df_map: dict[str, pl.DataFrame],
+        cached_map: dict[str, tuple[ChartCacheEntry, pl.DataFrame]],
+        start: datetime | None = None,
+    ) -> dict[str, pl.DataFrame]:
+        """Append the fetched series to the cached ones and store them.
+
+        Args:
+            start (datetime, optional):
+                Start of the period fetched for the series missing from
+                `cached_map`, the first timestamp is used if None.
+                Defaults to None.
+        """
+
+        expires_map = {
+            series_map["id"]: series_map["expires"]
+            for series_map in chart_map.get("series", [])
+        }
+        updated_map = {}
+
+        for series_id, df in df_map.items():
+            columns = SeriesFormatter.build_columns(series_id=series_id)
+            is_timeseries = columns is not None
+            covered_start = start
+            last_timestamp = None
+
+            if series_id in cached_map and is_timeseries:
+                cached_entry, cached_df = cached_map[series_id]
+                covered_start = cached_entry.covered_start
+                df = ChartPaginator.merge_df_list(df_list=[cached_df, df])
+
+            if is_timeseries and df.height > 0:
+                timestamp = pl.col(df.columns[0])
+                first_timestamp, last_timestamp = df.select(
+                    timestamp.min().alias("first"),
+                    timestamp.max().alias("last"),
+                ).row(0)
+                covered_start = covered_start or first_timestamp
+
+            chart_cache_entry = ChartCacheEntry(
+                covered_start=covered_start,
+                expires=expires_map[series_id],
+                last_timestamp=last_timestamp,
+                resolution=chart_request.resolution,
+                series_id=series_id,
+                tz=chart_request.tz,
+                updated=datetime.now(),
+            )
+            self.write(chart_cache_entry=chart_cache_entry, df=df)
+            updated_map[series_id] = df
+
+        return updated_map
+
+    def get_chart_df_map(
+        self,
+        chart_request: ChartRequest,
+    ) -> dict[str, pl.DataFrame] | None:
+        """Same as `ChartFetcher.get_chart_df_map`, through the cache.
+
+        Args:
+            chart_request (ChartRequest):
+                See `ChartFetcher.get_chart`.
+                The requests with an `override` bypass the cache.
+        Returns:
+            dict[str, pl.DataFrame]: One DataFrame per series id.
+        """
+
+        if chart_request.override:
+            return self.__chart_fetcher.get_chart_df_map(chart_request=chart_request)
+
+        start = self.build_start(chart_request=chart_request)
+        cached_map = {}
+        expired_list = []
+        missing_list = []
+
+        for series_id in chart_request.series:
+            cached = self.read(
+                series_id=series_id,
+                resolution=chart_request.resolution,
+                tz=chart_request.tz,
+            )
+            if cached is None:
+                missing_list.append(series_id)
+                continue
+
+            cached_map[series_id] = cached
+            chart_cache_entry, _df = cached
+            if not self.is_covered(
+                chart_cache_entry=chart_cache_entry,
+                start=start,
+            ):
+                missing_list.append(series_id)
+            elif not self.is_fresh(chart_cache_entry=chart_cache_entry):
+                if chart_cache_entry.last_timestamp is None:
+                    missing_list.append(series_id)
+                else:
+                    expired_list.append(series_id)
+
+        df_map = {series_id: df for series_id, (_entry, df) in cached_map.items()}
+
+        try:
+            if expired_list:
+                last_timestamp_list = [
+                    cached_map[series_id][0].last_timestamp
+                    for series_id in expired_list
+                ]
+                chart_map, fetched_map = self.fetch(
+                    chart_request=chart_request,
+                    series_list=expired_list,
+                    start=min(filter(None, last_timestamp_list)),
+                )
+                df_map.update(
+                    self.update(
+                        chart_request=chart_request,
+                        chart_map=chart_map,
+                        df_map=fetched_map,
+                        cached_map=cached_map,
+                    )
+                )
+
+            if missing_list:
+                chart_map, fetched_map = self.fetch(
+                    chart_request=chart_request,
+                    series_list=missing_list,
+                )
+                df_map.update(
+                    self.update(
+                        chart_request=chart_request,
+                        chart_map=chart_map,
+                        df_map=fetched_map,
+                        cached_map={},
+                        start=start,
+                    )
+                )
+        except Exception as e:
+            self.__logger.fatal(e)
+            return None
+
+        for series_id, df in df_map.items():
+            columns = SeriesFormatter.build_columns(series_id=series_id)
+            if start is not None and columns is not None:
+                df_map[series_id] = df.filter(pl.col(df.columns[0]) >= start)
+
+        return df_map
+
+    def __init__(
+        self,
+        path: str | Path,
+        chart_fetcher: ChartFetcher,
+        logger: logging.Logger | None = None,
+    ):
+        """
+        Args:
+            path (str | Path):
+                Folder of the cache, created if missing.
+            chart_fetcher (ChartFetcher):
+                Used to fetch the missing and expired series.
+            logger (logging.Logger, optional):
+                This object will be generated if None.
+                Defaults to None.
+        """
+
+        self.__path = Path(path)
+        self.__path.mkdir(parents=True, exist_ok=True)
+        self.__chart_fetcher = chart_fetcher
+        self.__logger = logger or logging.getLogger(self.__module__)
+        self.__fetch_count = 0
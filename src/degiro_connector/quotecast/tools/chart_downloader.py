@@ -0,0 +1,267 @@
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Iterable, Iterator
+from urllib.parse import urlsplit
+
+from degiro_connector.core.constants import urls
+from degiro_connector.core.helpers.rate_limiter import RateLimiter
+from degiro_connector.core.helpers.retry import RetryPolicy
+from degiro_connector.core.models.model_connection import ModelConnection
+from degiro_connector.core.models.model_session import ModelSession, PooledAdapter
+from degiro_connector.quotecast.models.chart import Chart, ChartRequest
+from degiro_connector.quotecast.tools.chart_fetcher import ChartFetcher
+
+
+class ChartDownloader:
+    """Download many charts concurrently.
+
+    The requests run on a pool of `max_workers` threads. Each host is limited
+    to `rate` requests per second and the transient failures are retried
+    according to a `RetryPolicy`.
+
+    The results are yielded as soon as they are available, in completion
+    order : `(chart_request, chart)` or `(chart_request, exception)`.
+
+    Example :
+        chart_downloader = ChartDownloader(user_token=user_token, max_workers=16)
+        chart_request_list = ChartDownloader.build_chart_request_list(
+            chart_request=chart_request,
+            product_list=["issueid:360148977", "vwdkey:AAPL.BATS,E"],
+            series_type_list=["ohlc", "volume"],
+        )
+
+        for chart_request, result in chart_downloader.iter_chart(chart_request_list):
+            if isinstance(result, Exception):
+                print("FAILED", chart_request.series, result)
+            else:
+                print(result.series[0].id)
+    """
+
+    @staticmethod
+    def build_chart_request_list(
+        chart_request: ChartRequest,
+        product_list: list[str],
+        series_type_list: list[str] | None = None,
+    ) -> list[ChartRequest]:
+        """Build one `ChartRequest` per product, from a template.
+
+        Args:
+            chart_request (ChartRequest):
+                Template, its `series` are replaced.
+            product_list (list[str]):
+                Products like "issueid:360148977" or "vwdkey:AAPL.BATS,E".
+            series_type_list (list[str], optional):
+                Prefixes like "ohlc", "price" or "volume".
+                If None, the series are the products themselves.
+                Defaults to None.
+        Returns:
+            list[ChartRequest]: One request per product.
+        """
+
+        chart_request_list = []
+
+        for index, product in enumerate(product_list):
+            if series_type_list:
+                series = [f"{series_type}:{product}" for series_type in series_type_list]
+            else:
+                series = [product]
+
+            chart_request_list.append(
+                chart_request.model_copy(
+                    deep=True,
+                    update={"requestid": str(index), "series": series},
+                )
+            )
+
+        return chart_request_list
+
+    @property
+    def chart_fetcher(self) -> ChartFetcher:
+        return self.__chart_fetcher
+
+    @property
+    def max_workers(self) -> int:
+        return self.__max_workers
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self.__retry_policy
+
+    def get_rate_limiter(self, url: str) -> RateLimiter:
+        host = urlsplit(url).netloc
+
+        with self.__lock:
+            rate_limiter = self.__rate_limiter_map.get(host)
+            if rate_limiter is None:
+                rate_limiter = RateLimiter(rate=self.__rate, burst=self.__burst)
+                self.__rate_limiter_map[host] = rate_limiter
+
+        return rate_limiter
+
+    def download(self, chart_request: ChartRequest) -> Chart:
+        """Fetch one chart, retrying the transient failures.
+
+        Raises:
+            Exception: Last failure, once the retries are exhausted.
+        """
+
+        retry_policy = self.__retry_policy
+        start = time.monotonic()
+        attempt = 0
+
+        while True:
+            self.get_rate_limiter(url=urls.CHART).acquire()
+
+            try:
+                chart = self.__chart_fetcher.fetch_chart(chart_request=chart_request)
+            except Exception as e:
+                delay = retry_policy.compute_delay(attempt=attempt, error=e)
+                if not retry_policy.should_retry(
+                    error=e,
+                    attempt=attempt,
+                    elapsed=time.monotonic() - start + delay,
+                ):
+                    raise
+                self.__logger.info(
+                    "download:retry: %s attempt=%s delay=%.2f error=%s",
+                    chart_request.series,
+                    attempt,
+                    delay,
+                    e,
+                )
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            if not isinstance(chart, Chart):
+                raise ValueError(f"Not a chart : {type(chart)}")
+
+            return chart
+
+    def iter_chart(
+        self,
+        chart_request_list: Iterable[ChartRequest],
+    ) -> Iterator[tuple[ChartRequest, Chart | Exception]]:
+        """Download the charts, yielding them in completion order.
+
+        At most `2 * max_workers` requests are queued at once : stopping the
+        iteration early does not leave thousands of pending downloads.
+        """
+
+        chart_request_iterator = iter(chart_request_list)
+        future_map: dict[Future, ChartRequest] = {}
+        executor = self.__executor
+        max_pending = 2 * self.__max_workers
+
+        def submit_next() -> bool:
+            chart_request = next(chart_request_iterator, None)
+            if chart_request is None:
+                return False
+            future_map[executor.submit(self.download, chart_request)] = chart_request
+            return True
+
+        try:
+            while len(future_map) < max_pending and submit_next():
+                pass
+
+            while future_map:
+                done_set, _ = wait(future_map, return_when=FIRST_COMPLETED)
+                for future in done_set:
+                    chart_request = future_map.pop(future)
+                    error = future.exception()
+                    result: Chart | Exception
+                    if isinstance(error, Exception):
+                        result = error
+                    else:
+                        result = future.result()
+                    yield chart_request, result
+                    submit_next()
+        finally:
+            for future in future_map:
+                future.cancel()
+
+    def download_all(
+        self,
+        chart_request_list: Iterable[ChartRequest],
+    ) -> list[tuple[ChartRequest, Chart | Exception]]:
+        return list(self.iter_chart(chart_request_list=chart_request_list))
+
+    def close(self):
+        self.__executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "ChartDownloader":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __init__(
+        self,
+        user_token: int | None = None,
+        chart_fetcher: ChartFetcher | None = None,
+        logger: logging.Logger | None = None,
+        max_workers: int = 8,
+        rate: float = 20.0,
+        burst: int | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        """
+        Args:
+            user_token (int, optional):
+                User identifier in Degiro's API, used if `chart_fetcher` is None.
+                Defaults to None.
+            chart_fetcher (ChartFetcher, optional):
+                This object will be generated if None, with a connection pool
+                sized for `max_workers`.
+                Defaults to None.
+            logger (logging.Logger, optional):
+                This object will be generated if None.
+                Defaults to None.
+            max_workers (int, optional):
+                Number of concurrent downloads.
+                Defaults to 8.
+            rate (float, optional):
+                Maximum number of requests per second and per host.
+                Defaults to 20.0.
+            burst (int, optional):
+                Number of requests which can be sent at once, see `RateLimiter`.
+                Defaults to None.
+            retry_policy (RetryPolicy, optional):
+                This object will be generated if None.
+                Defaults to None.
+        """
+
+        if chart_fetcher is None:
+            if user_token is None:
+                raise AttributeError("`user_token` or `chart_fetcher` is required.")
+            connection_storage = ModelConnection(
+                timeout=ChartFetcher.CHART_TIMEOUT,
+            )
+            chart_fetcher = ChartFetcher(
+                user_token=user_token,
+                connection_storage=connection_storage,
+                logger=logger,
+                session_storage=ModelSession(
+                    hooks=connection_storage.build_hooks(),
+                    adapter=PooledAdapter(
+                        pool_connections=2,
+                        pool_maxsize=max_workers,
+                    ),
+                ),
+            )
+
+        self.__chart_fetcher = chart_fetcher
+        self.__logger = logger or logging.getLogger(self.__module__)
+        self.__max_workers = max_workers
+        self.__rate = rate
+        self.__burst = burst
+        self.__retry_policy = retry_policy or RetryPolicy()
+
+        self.__lock = threading.Lock()
+        self.__rate_limiter_map: dict[str, RateLimiter] = {}
+        self.__executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=self.__class__.__name__,
+        )
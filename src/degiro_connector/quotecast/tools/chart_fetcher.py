@@ -1,23 +1,116 @@
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any
 
 import json
+import orjson
 import polars as pl
 import requests
-from isodate import parse_duration
+from isodate import Duration, parse_duration
 
 from degiro_connector.core.constants import urls
-from degiro_connector.quotecast.models.chart import Chart, ChartRequest, Series
+from degiro_connector.quotecast.models.chart import (
+    Chart,
+    ChartRequest,
+    Interval,
+    Series,
+)
 from degiro_connector.core.models.model_connection import ModelConnection
 from degiro_connector.core.models.model_session import ModelSession
 
 
 class SeriesFormatter:
+    DATA_START = b'"data":[['
+
+    # ROWS OF NUMBERS, LIKE : 0,1.5],[1,null
+    NUMBER = rb"(?:-?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?|null)"
+    ROW = NUMBER + rb"(?:," + NUMBER + rb")*"
+    DATA_PATTERN = re.compile(ROW + rb"(?:\],\[" + ROW + rb")*")
+
     @staticmethod
     def is_timeseries(series: Series) -> bool:
         return series.type in ["time", "ohlc"]
 
+    @staticmethod
+    def build_columns(series_id: str) -> list[str] | None:
+        if series_id.startswith("price"):
+            return ["timestamp", "price"]
+        elif series_id.startswith("volume"):
+            return ["timestamp", "volume"]
+        elif series_id.startswith("ohlc"):
+            return ["timestamp", "open", "high", "low", "close"]
+        else:
+            return None
+
+    @staticmethod
+    def build_schema(columns: list[str]) -> dict[str, type[pl.DataType]]:
+        """First column is an offset, the others are measurements."""
+
+        return {
+            column: (pl.Int64 if index == 0 else pl.Float64)
+            for index, column in enumerate(columns)
+        }
+
+    @classmethod
+    def split_data(cls, body: bytes) -> tuple[bytes, list[bytes]]:
+        """Cut the timeseries arrays out of a JSON chart.
+
+        Each array is replaced by its index in the returned list :
+            `"data":[[0,1.5],[1,1.6]]` => `"data":0` and `b"0,1.5],[1,1.6"`
+
+        Only the arrays of rows of numbers are cut, in the compact layout of
+        the API : anything else raises, so the caller can parse the whole
+        body instead.
+
+        Args:
+            body (bytes):
+                JSON chart, without the JSONP callback.
+        Raises:
+            AttributeError:
+                An array is not made of rows of numbers.
+        Returns:
+            tuple[bytes, list[bytes]]:
+                JSON chart without the arrays and the content of the arrays.
+        """
+
+        chunk_list = []
+        data_list: list[bytes] = []
+        data_start = cls.DATA_START
+        position = 0
+
+        while True:
+            start = body.find(data_start, position)
+            if start == -1:
+                break
+            # TIMESERIES ONLY CONTAIN NUMBERS : THE FIRST "]]" ENDS THE ARRAY
+            end = body.find(b"]]", start)
+            if end == -1:
+                raise AttributeError("Unterminated `data` array.")
+            if cls.DATA_PATTERN.fullmatch(body, start + len(data_start), end) is None:
+                raise AttributeError("Unexpected `data` array.")
+            chunk_list.append(body[position : start + len(b'"data":')])
+            chunk_list.append(str(len(data_list)).encode())
+            data_list.append(body[start + len(data_start) : end])
+            position = end + 2
+
+        chunk_list.append(body[position:])
+
+        return b"".join(chunk_list), data_list
+
+    @classmethod
+    def read_data(cls, data: bytes, columns: list[str]) -> pl.DataFrame:
+        """Load the content of a timeseries array into typed columns."""
+
+        return pl.read_csv(
+            data.replace(b"],[", b"\n"),
+            has_header=False,
+            new_columns=columns,
+            null_values="null",
+            schema_overrides=cls.build_schema(columns=columns),
+        )
+
     @staticmethod
     def parse_date_and_resolution(times: str) -> tuple[datetime, timedelta]:
         """Extract the interval of a timeserie.
@@ -47,7 +140,22 @@ class SeriesFormatter:
         start: datetime,
         resolution: timedelta,
     ):
-        df = df.with_columns((pl.col(column) * resolution).cast(pl.Duration) + start)
+        if isinstance(resolution, Duration):
+            # CALENDAR RESOLUTION, LIKE "P1M" : NOT A FIXED NUMBER OF SECONDS
+            month_count = int(resolution.years * 12 + resolution.months)
+            timestamp = pl.lit(start).dt.offset_by(
+                pl.format("{}mo", pl.col(column) * month_count)
+            )
+            # THE REMAINDER, LIKE THE DAYS OF "P1M15D", HAS A FIXED LENGTH
+            if resolution.tdelta:
+                timestamp = timestamp + (pl.col(column) * resolution.tdelta).cast(
+                    pl.Duration
+                )
+            df = df.with_columns(timestamp.alias(column))
+        else:
+            df = df.with_columns(
+                (pl.col(column) * resolution).cast(pl.Duration) + start
+            )
 
         return df
 
@@ -66,21 +174,12 @@ class SeriesFormatter:
         if series.times is None or series.type not in ["time", "ohlc"]:
             raise AttributeError("The attributes `times` is empty.")
 
-        if columns:
-            pass
-        elif series.id.startswith("price"):
-            columns = ["timestamp", "price"]
-        elif series.id.startswith("volume"):
-            columns = ["timestamp", "volume"]
-        elif series.id.startswith("ohlc"):
-            columns = ["timestamp", "open", "high", "low", "close"]
-        else:
-            columns = None
+        columns = columns or cls.build_columns(series_id=series.id)
 
         df = pl.DataFrame(
             data=series.data,
             orient="row",
-            schema=columns,
+            schema=cls.build_schema(columns=columns) if columns else None,
         )
         start, resolution = cls.parse_date_and_resolution(times=series.times)
         column = df.columns[0]
@@ -106,8 +205,250 @@ class SeriesFormatter:
 
         return df
 
+    @classmethod
+    def format_chart(cls, body: bytes) -> dict[str, pl.DataFrame]:
+        """Fast version of `Chart.model_validate` followed by `format_series`.
+
+        The timeseries never become Python objects : their arrays are parsed
+        straight into typed columns and their timestamps are computed with a
+        single vectorized operation.
+
+        Args:
+            body (bytes):
+                JSON chart, without the JSONP callback.
+        Returns:
+            dict[str, pl.DataFrame]:
+                One DataFrame per series id.
+        """
+
+        _chart_map, df_map = cls.parse_chart(body=body)
+
+        return df_map
+
+    @classmethod
+    def load_chart(cls, body: bytes) -> tuple[dict, list[bytes]]:
+        """Load the metadata of a chart, with the fast path of `split_data`.
+
+        Falls back on a regular JSON parsing if the body has an unexpected
+        layout.
+
+        Returns:
+            tuple[dict, list[bytes]]:
+                Chart, where a `data` may be an index in the list of arrays.
+        """
+
+        try:
+            metadata, data_list = cls.split_data(body=body)
+            chart_map = orjson.loads(metadata)  # pylint: disable=no-member
+        except (AttributeError, orjson.JSONDecodeError):  # pylint: disable=no-member
+            return orjson.loads(body), []  # pylint: disable=no-member
+
+        # EACH ARRAY MUST BE THE `data` OF A SERIES, NOT A NESTED FIELD
+        index_list = [
+            series_map.get("data")
+            for series_map in chart_map.get("series", [])
+            if isinstance(series_map.get("data"), int)
+        ]
+        if sorted(index_list) != list(range(len(data_list))):
+            return orjson.loads(body), []  # pylint: disable=no-member
+
+        return chart_map, data_list
+
+    @classmethod
+    def parse_chart(cls, body: bytes) -> tuple[dict, dict[str, pl.DataFrame]]:
+        """Same as `format_chart`, but also returns the chart's metadata.
+
+        Returns:
+            tuple[dict, dict[str, pl.DataFrame]]:
+                Chart without the `data` of its series, like the `expires`
+                of each series, and one DataFrame per series id.
+        """
+
+        chart_map, data_list = cls.load_chart(body=body)
+        df_map = {}
+
+        for series_map in chart_map.get("series", []):
+            series_id = series_map["id"]
+            data = series_map.pop("data", None)
+
+            if series_map.get("type") not in ["time", "ohlc"]:
+                if isinstance(data, int):
+                    data = orjson.loads(b"[[" + data_list[data] + b"]]")
+                df_map[series_id] = pl.DataFrame(data)
+                continue
+
+            columns = cls.build_columns(series_id=series_id)
+            if columns is None:
+                raise AttributeError(f"Unknown timeseries : {series_id}")
+
+            if isinstance(data, int):
+                df = cls.read_data(data=data_list[data], columns=columns)
+            else:
+                df = pl.DataFrame(
+                    data=data,
+                    orient="row",
+                    schema=cls.build_schema(columns=columns),
+                )
+
+            start, resolution = cls.parse_date_and_resolution(
+                times=series_map["times"],
+            )
+            df_map[series_id] = cls.format_timestamp(
+                df=df,
+                column=columns[0],
+                start=start,
+                resolution=resolution,
+            )
+
+        return chart_map, df_map
+
+
+class ChartPaginator:
+    """Split a long range of chart's data into windows the API accepts."""
+
+    # LONGEST PERIOD WHICH CAN BE REQUESTED FOR EACH RESOLUTION
+    # THE API DOES NOT DOCUMENT ITS LIMITS : THESE VALUES MIRROR THE PAIRS OF
+    # PERIOD AND RESOLUTION REQUESTED BY THE CHARTS OF DEGIRO'S WEB PLATFORM,
+    # LIKE P1D WITH PT1M, P1W WITH PT5M, P1M WITH PT1H OR P1Y WITH P1D.
+    # `max_window` OVERRIDES THEM.
+    MAX_WINDOW_MAP = {
+        Interval.PT15S: timedelta(days=1),
+        Interval.PT30S: timedelta(days=1),
+        Interval.PT1M: timedelta(days=1),
+        Interval.PT5M: timedelta(weeks=1),
+        Interval.PT15M: timedelta(weeks=1),
+        Interval.PT30M: timedelta(weeks=1),
+        Interval.PT60M: timedelta(days=31),
+        Interval.PT1H: timedelta(days=31),
+        Interval.P1D: timedelta(days=366),
+    }
+
+    @classmethod
+    def build_window_list(
+        cls,
+        start: datetime,
+        end: datetime,
+        resolution: Interval,
+        max_window: timedelta | None = None,
+    ) -> list[tuple[datetime, datetime]]:
+        """Split `[start, end)` into contiguous windows.
+
+        Args:
+            start (datetime):
+                Start of the range, included.
+            end (datetime):
+                End of the range, excluded.
+            resolution (Interval):
+                Resolution of the requested series.
+            max_window (timedelta, optional):
+                Longest window, from `MAX_WINDOW_MAP` if None.
+                Resolutions missing from the map are never split.
+                Defaults to None.
+        Raises:
+            AttributeError:
+                If the range is empty.
+        Returns:
+            list[tuple[datetime, datetime]]: Start and end of each window.
+        """
+
+        if end <= start:
+            raise AttributeError("`end` must be after `start`.")
+
+        max_window = max_window or cls.MAX_WINDOW_MAP.get(resolution)
+
+        if max_window is None:
+            return [(start, end)]
+
+        window_list = []
+        window_start = start
+
+        while window_start < end:
+            window_end = min(window_start + max_window, end)
+            window_list.append((window_start, window_end))
+            window_start = window_end
+
+        return window_list
+
+    @staticmethod
+    def build_chart_request_list(
+        chart_request: ChartRequest,
+        window_list: list[tuple[datetime, datetime]],
+    ) -> list[ChartRequest]:
+        chart_request_list = []
+
+        for start, end in window_list:
+            override = dict(chart_request.override)
+            override.pop("period", None)
+            override["start"] = start.isoformat(timespec="seconds")
+            override["end"] = end.isoformat(timespec="seconds")
+            chart_request_list.append(
+                chart_request.model_copy(deep=True, update={"override": override})
+            )
+
+        return chart_request_list
+
+    @staticmethod
+    def merge_df_list(
+        df_list: list[pl.DataFrame],
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> pl.DataFrame:
+        """Stitch the windows of a timeseries.
+
+        The points shared by two windows are kept once, with the value of the
+        latest window, and the points outside of `[start, end)` are dropped.
+        """
+
+        df = pl.concat([df for df in df_list if df.height > 0] or df_list[:1])
+        column = df.columns[0]
+
+        if start is not None:
+            df = df.filter(pl.col(column) >= start)
+        if end is not None:
+            df = df.filter(pl.col(column) < end)
+
+        return df.unique(subset=column, keep="last", maintain_order=True).sort(
+            column
+        )
+
+    @classmethod
+    def merge_df_map_list(
+        cls,
+        df_map_list: list[dict[str, pl.DataFrame]],
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> dict[str, pl.DataFrame]:
+        """Stitch the windows of each series.
+
+        Non-timeseries, like the product's metadata, are taken from the
+        latest window.
+        """
+
+        df_list_map: dict[str, list[pl.DataFrame]] = {}
+
+        for df_map in df_map_list:
+            for series_id, df in df_map.items():
+                df_list_map.setdefault(series_id, []).append(df)
+
+        merged_df_map = {}
+
+        for series_id, df_list in df_list_map.items():
+            if SeriesFormatter.build_columns(series_id=series_id) is None:
+                merged_df_map[series_id] = df_list[-1]
+            else:
+                merged_df_map[series_id] = cls.merge_df_list(
+                    df_list=df_list,
+                    start=start,
+                    end=end,
+                )
+
+        return merged_df_map
+
 
 class ChartFetcher:
+    # SECONDS WITHOUT SUCCESSFUL REQUEST BEFORE THE CONNECTION IS EXPIRED
+    CHART_TIMEOUT = 600
+
     @staticmethod
     def build_logger() -> logging.Logger:
         return logging.getLogger(__name__)
@@ -138,23 +479,63 @@ class ChartFetcher:
         user_token: int,
     ) -> dict[str, Any]:
         chart_request.user_token = chart_request.user_token or user_token
+        override = chart_request.override
         params = chart_request.model_dump(
             by_alias=True,
             exclude={"override"},
             exclude_none=True,
             mode="json",
         )
-        params.update(chart_request.override)
+
+        # AN EXPLICIT RANGE REPLACES THE PERIOD
+        if "start" in override and "end" in override:
+            params.pop("period", None)
+
+        params.update(override)
 
         return params
 
+    def fetch_chart(
+        self,
+        chart_request: ChartRequest,
+        raw: bool = False,
+        session: requests.Session | None = None,
+        user_token: int | None = None,
+    ) -> Chart | dict:
+        """Same as `get_chart`, but the errors are raised instead of logged.
+
+        Raises:
+            requests.HTTPError: The API answered with an error status.
+            requests.RequestException: The request failed.
+            ValueError: The response is not a valid chart.
+        """
+
+        session = session or self.session_storage.session
+        url = urls.CHART
+        params = self.build_params(
+            chart_request=chart_request,
+            user_token=user_token or self.__user_token,
+        )
+
+        http_request = requests.Request(method="GET", url=url, params=params)
+        prepped = session.prepare_request(http_request)
+
+        response = session.send(prepped)
+        response.raise_for_status()
+        response_map = json.loads(response.text[len(chart_request.callback) + 1 : -1])
+
+        if raw is True:
+            return response_map
+
+        return Chart.model_validate(obj=response_map)
+
     def get_chart(
         self,
         chart_request: ChartRequest,
         logger: logging.Logger | None = None,
         raw: bool = False,
         session: requests.Session | None = None,
-    ) -> Chart | None:
+    ) -> Chart | dict | None:
         """Fetches chart's data.
         Args:
             request (ChartRequest):
@@ -195,7 +576,9 @@ class ChartFetcher:
                 This object will be generated if None.
                 Defaults to None.
         Returns:
-            Chart: Data of the chart.
+            Chart | dict | None:
+                Data of the chart, the raw response if `raw` is True, None if
+                the request failed.
         """
 
         session = self.session_storage.session
@@ -207,28 +590,160 @@ class ChartFetcher:
         if session is None:
             session = self.build_session()
 
+        try:
+            return self.fetch_chart(
+                chart_request=chart_request,
+                raw=raw,
+                session=session,
+                user_token=user_token,
+            )
+        except requests.HTTPError as e:
+            logger.fatal(e)
+            if isinstance(e.response, requests.Response):
+                logger.fatal(e.response.text)
+            return None
+        except Exception as e:
+            logger.fatal(e)
+            return None
+
+    def fetch_chart_body(
+        self,
+        chart_request: ChartRequest,
+        session: requests.Session | None = None,
+    ) -> bytes:
+        """Fetches the JSON chart, without the JSONP callback.
+
+        Raises:
+            requests.HTTPError: The API answered with an error status.
+            requests.RequestException: The request failed.
+        """
+
+        session = session or self.session_storage.session
         url = urls.CHART
         params = self.build_params(
             chart_request=chart_request,
-            user_token=user_token,
+            user_token=self.__user_token,
         )
 
         http_request = requests.Request(method="GET", url=url, params=params)
         prepped = session.prepare_request(http_request)
 
+        response = session.send(prepped)
+        response.raise_for_status()
+
+        return response.content[len(chart_request.callback) + 1 : -1]
+
+    def fetch_chart_df_map(
+        self,
+        chart_request: ChartRequest,
+        session: requests.Session | None = None,
+    ) -> dict[str, pl.DataFrame]:
+        """Same as `get_chart_df_map`, but the errors are raised instead of logged.
+
+        Raises:
+            requests.HTTPError: The API answered with an error status.
+            requests.RequestException: The request failed.
+            ValueError: The response is not a valid chart.
+        """
+
+        body = self.fetch_chart_body(chart_request=chart_request, session=session)
+
+        return SeriesFormatter.format_chart(body=body)
+
+    def get_chart_df_map(
+        self,
+        chart_request: ChartRequest,
+    ) -> dict[str, pl.DataFrame] | None:
+        """Fetches chart's data, formatted with `SeriesFormatter.format_chart`.
+
+        Faster than `get_chart` followed by `SeriesFormatter.format_series`
+        for long timeseries.
+        Args:
+            chart_request (ChartRequest):
+                See `get_chart`.
+        Returns:
+            dict[str, pl.DataFrame]: One DataFrame per series id.
+        """
+
+        logger = self.logger
+
         try:
-            response = session.send(prepped)
-            response.raise_for_status()
-            response_map = json.loads(
-                response.text[len(chart_request.callback) + 1 : -1]
+            return self.fetch_chart_df_map(chart_request=chart_request)
+        except requests.HTTPError as e:
+            logger.fatal(e)
+            if isinstance(e.response, requests.Response):
+                logger.fatal(e.response.text)
+            return None
+        except Exception as e:
+            logger.fatal(e)
+            return None
+
+    def get_chart_history(
+        self,
+        chart_request: ChartRequest,
+        start: datetime,
+        end: datetime,
+        max_window: timedelta | None = None,
+        max_workers: int = 4,
+    ) -> dict[str, pl.DataFrame] | None:
+        """Fetches a long range of chart's data, one window at a time.
+
+        The API limits the period which can be requested for a resolution.
+        The range is split into windows of at most `max_window`, which are
+        fetched in parallel and stitched into one DataFrame per series.
+
+        Example :
+            chart_request = ChartRequest(
+                culture="fr-FR",
+                period=Interval.P1D,
+                requestid="1",
+                resolution=Interval.PT1M,
+                series=["ohlc:issueid:360148977"],
+                tz="Europe/Paris",
+            )
+            df_map = chart_fetcher.get_chart_history(
+                chart_request=chart_request,
+                start=datetime(2023, 1, 1),
+                end=datetime(2024, 1, 1),
             )
 
-            if raw is True:
-                chart = response_map
-            else:
-                chart = Chart.model_validate(obj=response_map)
+        Args:
+            chart_request (ChartRequest):
+                Template of the windows, see `get_chart`.
+                Its `period` is replaced by the `start` and `end` of each window.
+            start (datetime):
+                Start of the range, included.
+            end (datetime):
+                End of the range, excluded.
+            max_window (timedelta, optional):
+                Longest period per request, from `ChartPaginator.MAX_WINDOW_MAP`
+                if None.
+                Defaults to None.
+            max_workers (int, optional):
+                Number of windows fetched at the same time.
+                Defaults to 4.
+        Returns:
+            dict[str, pl.DataFrame]: One DataFrame per series id.
+        """
+
+        logger = self.logger
 
-            return chart
+        window_list = ChartPaginator.build_window_list(
+            start=start,
+            end=end,
+            resolution=chart_request.resolution,
+            max_window=max_window,
+        )
+        chart_request_list = ChartPaginator.build_chart_request_list(
+            chart_request=chart_request,
+            window_list=window_list,
+        )
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                df_map_list = list(
+                    executor.map(self.fetch_chart_df_map, chart_request_list)
+                )
         except requests.HTTPError as e:
             logger.fatal(e)
             if isinstance(e.response, requests.Response):
@@ -238,6 +753,12 @@ class ChartFetcher:
             logger.fatal(e)
             return None
 
+        return ChartPaginator.merge_df_map_list(
+            df_map_list=df_map_list,
+            start=start,
+            end=end,
+        )
+
     def __init__(
         self,
         user_token: int,
@@ -246,7 +767,9 @@ class ChartFetcher:
         session_storage: ModelSession | None = None,
     ):
         self.__user_token = user_token
-        self.__connection_storage = connection_storage or ModelConnection(timeout=600)
+        self.__connection_storage = connection_storage or ModelConnection(
+            timeout=self.CHART_TIMEOUT,
+        )
         self.__logger = logger or logging.getLogger(self.__module__)
         self._session_storage = session_storage or ModelSession(
             hooks=self.__connection_storage.build_hooks(),
@@ -0,0 +1,264 @@
+import math
+from array import array
+from typing import Iterator, Literal
+
+from degiro_connector.quotecast.models.metric import Metric, MetricColumns
+
+Side = Literal["ask", "bid"]
+
+
+class OrderBook:
+    """Level-2 order book of one product, built from Quotecast depth metrics.
+
+    The book is a fixed-size array of floats :
+        * 2 sides : "ask" (A1..A10) and "bid" (B1..B10),
+        * 3 fields : price, volume and orders,
+        * 10 levels per side.
+
+    A missing value is `nan`. Updates write the cells in place and all the
+    queries only read a bounded number of cells.
+
+    Example :
+        order_book.set_value(metric_name="B1Price", value=10.5)
+        order_book.best_bid  # (10.5, nan)
+    """
+
+    DEPTH = 10
+    SIDE_LIST: tuple[Side, Side] = ("ask", "bid")
+    FIELD_LIST = ("Price", "Volume", "Orders")
+
+    @classmethod
+    def build_index(cls, side: Side, field: str, level: int) -> int:
+        return (
+            cls.SIDE_LIST.index(side) * len(cls.FIELD_LIST) * cls.DEPTH
+            + cls.FIELD_LIST.index(field) * cls.DEPTH
+            + level
+            - 1
+        )
+
+    @classmethod
+    def build_index_map(cls) -> dict[str, int]:
+        """Map each depth metric name to its cell : {"A1Price": 0, ...}"""
+
+        return {
+            f"{prefix}{level}{field}": cls.build_index(
+                side=side,
+                field=field,
+                level=level,
+            )
+            for side, prefix in zip(cls.SIDE_LIST, ("A", "B"))
+            for field in cls.FIELD_LIST
+            for level in range(1, cls.DEPTH + 1)
+        }
+
+    @property
+    def product_id(self) -> str:
+        return self.__product_id
+
+    @property
+    def cell_list(self) -> array:
+        return self.__cell_list
+
+    @property
+    def update_count(self) -> int:
+        return self.__update_count
+
+    def set_value(self, metric_name: str, value: float | str) -> bool:
+        """Write one depth metric.
+
+        Returns:
+            bool: Whether or not `metric_name` is a depth metric.
+        """
+
+        index = INDEX_MAP.get(metric_name)
+
+        if index is None:
+            return False
+
+        try:
+            self.__cell_list[index] = float(value)
+        except (TypeError, ValueError):
+            self.__cell_list[index] = math.nan
+
+        # CUMULATIVE VOLUMES ARE RECOMPUTED ON THE NEXT READ
+        self.__dirty_list[index // (len(self.FIELD_LIST) * self.DEPTH)] = True
+        self.__update_count += 1
+
+        return True
+
+    def get_level(self, side: Side, level: int) -> tuple[float, float, float]:
+        """Price, volume and orders of a level, from 1 (best) to 10."""
+
+        if not 1 <= level <= self.DEPTH:
+            raise AttributeError(f"`level` must be between 1 and {self.DEPTH}.")
+
+        cell_list = self.__cell_list
+        index = self.build_index(side=side, field="Price", level=level)
+
+        return (
+            cell_list[index],
+            cell_list[index + self.DEPTH],
+            cell_list[index + 2 * self.DEPTH],
+        )
+
+    def get_price_list(self, side: Side) -> list[float]:
+        index = self.build_index(side=side, field="Price", level=1)
+
+        return self.__cell_list[index : index + self.DEPTH].tolist()
+
+    def get_volume_list(self, side: Side) -> list[float]:
+        index = self.build_index(side=side, field="Volume", level=1)
+
+        return self.__cell_list[index : index + self.DEPTH].tolist()
+
+    @property
+    def best_ask(self) -> tuple[float, float]:
+        """Price and volume of the first ask level."""
+
+        cell_list = self.__cell_list
+
+        return cell_list[ASK_PRICE], cell_list[ASK_PRICE + self.DEPTH]
+
+    @property
+    def best_bid(self) -> tuple[float, float]:
+        """Price and volume of the first bid level."""
+
+        cell_list = self.__cell_list
+
+        return cell_list[BID_PRICE], cell_list[BID_PRICE + self.DEPTH]
+
+    @property
+    def spread(self) -> float:
+        """Best ask minus best bid, `nan` if one side is empty."""
+
+        return self.__cell_list[ASK_PRICE] - self.__cell_list[BID_PRICE]
+
+    @property
+    def mid(self) -> float:
+        """Middle of the best ask and the best bid, `nan` if one side is empty."""
+
+        return (self.__cell_list[ASK_PRICE] + self.__cell_list[BID_PRICE]) / 2
+
+    def cumulative_volume(self, side: Side, level: int) -> float:
+        """Sum of the volumes from the first level to `level` included.
+
+        Missing volumes count as 0.
+        """
+
+        if not 1 <= level <= self.DEPTH:
+            raise AttributeError(f"`level` must be between 1 and {self.DEPTH}.")
+
+        side_index = self.SIDE_LIST.index(side)
+        cumulative_list = self.__cumulative_list
+
+        if self.__dirty_list[side_index]:
+            index = self.build_index(side=side, field="Volume", level=1)
+            offset = side_index * self.DEPTH
+            total = 0.0
+            for level_index, volume in enumerate(
+                self.__cell_list[index : index + self.DEPTH]
+            ):
+                if not math.isnan(volume):
+                    total += volume
+                cumulative_list[offset + level_index] = total
+            self.__dirty_list[side_index] = False
+
+        return cumulative_list[side_index * self.DEPTH + level - 1]
+
+    def clear(self):
+        cell_list = self.__cell_list
+
+        for index in range(len(cell_list)):
+            cell_list[index] = math.nan
+
+        self.__dirty_list = [True] * len(self.SIDE_LIST)
+
+    def __repr__(self) -> str:
+        return f"`OrderBook`:`{self.__product_id}`:`{self.best_bid}`:`{self.best_ask}`"
+
+    def __init__(self, product_id: str):
+        size = len(self.SIDE_LIST) * len(self.FIELD_LIST) * self.DEPTH
+
+        self.__product_id = product_id
+        self.__cell_list = array("d", [math.nan]) * size
+        self.__cumulative_list = array("d", [0.0]) * (len(self.SIDE_LIST) * self.DEPTH)
+        self.__dirty_list = [True] * len(self.SIDE_LIST)
+        self.__update_count = 0
+
+
+INDEX_MAP = OrderBook.build_index_map()
+ASK_PRICE = INDEX_MAP["A1Price"]
+BID_PRICE = INDEX_MAP["B1Price"]
+
+
+class OrderBookMap:
+    """One `OrderBook` per product, fed with the output of `TickerToMetricList`.
+
+    Example :
+        order_book_map = OrderBookMap()
+        metric_columns = ticker_to_metric_list.parse_columns(ticker=ticker)
+        order_book_map.update_columns(metric_columns=metric_columns)
+        order_book_map["360015751"].spread
+    """
+
+    def get(self, product_id: str) -> OrderBook | None:
+        return self.__order_book_map.get(product_id)
+
+    def get_or_create(self, product_id: str) -> OrderBook:
+        order_book = self.__order_book_map.get(product_id)
+
+        if order_book is None:
+            order_book = OrderBook(product_id=product_id)
+            self.__order_book_map[product_id] = order_book
+
+        return order_book
+
+    def update(self, metric_list: list[Metric]) -> set[str]:
+        """Apply the depth metrics, ignoring the others.
+
+        Returns:
+            set[str]: Products whose book changed.
+        """
+
+        updated_set = set()
+
+        for metric in metric_list:
+            metric_name = metric.metric_type.value
+            if metric_name in INDEX_MAP:
+                order_book = self.get_or_create(product_id=metric.product_id)
+                order_book.set_value(metric_name=metric_name, value=metric.value)
+                updated_set.add(metric.product_id)
+
+        return updated_set
+
+    def update_columns(self, metric_columns: MetricColumns) -> set[str]:
+        """Same as `update`, without building any `Metric` object."""
+
+        product_id_table = metric_columns.product_id_table
+        metric_name_table = metric_columns.metric_name_table
+        updated_set = set()
+
+        for slot, numeric in zip(metric_columns.slot_list, metric_columns.numeric_list):
+            metric_name = metric_name_table[slot]
+            if metric_name in INDEX_MAP:
+                product_id = product_id_table[slot]
+                order_book = self.get_or_create(product_id=product_id)
+                order_book.set_value(metric_name=metric_name, value=numeric)
+                updated_set.add(product_id)
+
+        return updated_set
+
+    def __contains__(self, product_id: str) -> bool:
+        return product_id in self.__order_book_map
+
+    def __getitem__(self, product_id: str) -> OrderBook:
+        return self.__order_book_map[product_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__order_book_map)
+
+    def __len__(self) -> int:
+        return len(self.__order_book_map)
+
+    def __init__(self):
+        self.__order_book_map: dict[str, OrderBook] = {}
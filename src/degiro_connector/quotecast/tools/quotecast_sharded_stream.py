@@ -0,0 +1,235 @@
+import logging
+import threading
+from queue import Empty, Queue
+from typing import Iterator
+
+from degiro_connector.quotecast.models.metric import MetricType
+from degiro_connector.quotecast.models.ticker import TickerUpdate
+from degiro_connector.quotecast.tools.quotecast_stream import QuotecastStream
+
+
+class QuotecastShardedStream:
+    """Spread the subscriptions across several Quotecast sessions.
+
+    A single `session_id` serializes all the updates through one long-polling
+    response at a time. This object runs `shard_count` `QuotecastStream`, each
+    one with its own `session_id`, its own reference map and its own thread.
+
+    A product always stays on the same shard : new products go to the shard
+    with the fewest subscribed metrics.
+
+    All the shards write in the same queue, so the consumers read a single
+    feed ordered by reception time.
+
+    Example :
+        stream = QuotecastShardedStream(user_token=user_token, shard_count=8)
+        stream.subscribe(request_map=ticker_request.request_map)
+        stream.start()
+
+        for ticker_update in stream:
+            print(ticker_update.metric_list)
+    """
+
+    @property
+    def queue(self) -> Queue:
+        return self.__queue
+
+    @property
+    def running(self) -> bool:
+        return any(stream.running for stream in self.__stream_list)
+
+    @property
+    def shard_map(self) -> dict[str, int]:
+        with self.__lock:
+            return dict(self.__shard_map)
+
+    @property
+    def stream_list(self) -> list[QuotecastStream]:
+        return self.__stream_list
+
+    @property
+    def request_map(self) -> dict[str, list[str]]:
+        request_map: dict[str, list[str]] = {}
+
+        for stream in self.__stream_list:
+            request_map.update(stream.request_map)
+
+        return request_map
+
+    @staticmethod
+    def count_metric(request_map: dict[str, list[str]]) -> int:
+        return sum(len(metric_list) for metric_list in request_map.values())
+
+    def assign_shard(self, product_id: str, metric_count: int) -> int:
+        shard = self.__shard_map.get(product_id)
+
+        if shard is None:
+            load_list = self.__load_list
+            shard = load_list.index(min(load_list))
+            self.__shard_map[product_id] = shard
+            # PROVISIONAL LOAD, CORRECTED ONCE THE SHARD IS UPDATED
+            load_list[shard] += metric_count
+
+        return shard
+
+    def refresh_load(self, shard: int) -> dict[str, list[str]]:
+        request_map = self.__stream_list[shard].request_map
+
+        with self.__lock:
+            self.__load_list[shard] = self.count_metric(request_map=request_map)
+
+        return request_map
+
+    def split_request_map(
+        self,
+        request_map: dict[str, list[MetricType]] | dict[str, list[str]],
+    ) -> list[dict[str, list[str]]]:
+        """Split a `request_map` into one `request_map` per shard."""
+
+        request_map_list: list[dict[str, list[str]]] = [
+            {} for _ in self.__stream_list
+        ]
+
+        with self.__lock:
+            for product_id, metric_list in QuotecastStream.build_request_map(
+                request_map=request_map
+            ).items():
+                shard = self.assign_shard(
+                    product_id=product_id,
+                    metric_count=len(metric_list),
+                )
+                request_map_list[shard][product_id] = metric_list
+
+        return request_map_list
+
+    def subscribe(
+        self,
+        request_map: dict[str, list[MetricType]] | dict[str, list[str]],
+    ) -> bool:
+        """Add metrics to the subscriptions of the relevant shards.
+
+        Returns:
+            bool: Whether or not all the shards reached the API.
+        """
+
+        result = True
+        request_map_list = self.split_request_map(request_map=request_map)
+
+        for shard, shard_request_map in enumerate(request_map_list):
+            if shard_request_map:
+                stream = self.__stream_list[shard]
+                result = stream.subscribe(request_map=shard_request_map) and result
+                self.refresh_load(shard=shard)
+
+        return result
+
+    def unsubscribe(
+        self,
+        request_map: dict[str, list[MetricType]] | dict[str, list[str]],
+    ) -> bool:
+        """Remove metrics from the subscriptions of the relevant shards.
+
+        Returns:
+            bool: Whether or not all the shards reached the API.
+        """
+
+        result = True
+        request_map = QuotecastStream.build_request_map(request_map=request_map)
+
+        for shard, stream in enumerate(self.__stream_list):
+            with self.__lock:
+                shard_request_map = {
+                    product_id: metric_list
+                    for product_id, metric_list in request_map.items()
+                    if self.__shard_map.get(product_id) == shard
+                }
+
+            if not shard_request_map:
+                continue
+
+            result = stream.unsubscribe(request_map=shard_request_map) and result
+            remaining_request_map = self.refresh_load(shard=shard)
+
+            with self.__lock:
+                for product_id in shard_request_map:
+                    if product_id not in remaining_request_map:
+                        self.__shard_map.pop(product_id, None)
+
+        return result
+
+    def start(self):
+        for stream in self.__stream_list:
+            stream.start()
+
+    def stop(self, timeout: float | None = None):
+        # SIGNAL ALL THE SHARDS FIRST, THEY ALL FINISH THEIR CURRENT POLL
+        stop_thread_list = [
+            threading.Thread(target=stream.stop, kwargs={"timeout": timeout})
+            for stream in self.__stream_list
+        ]
+
+        for thread in stop_thread_list:
+            thread.start()
+
+        for thread in stop_thread_list:
+            thread.join()
+
+    def get(self, timeout: float | None = None) -> TickerUpdate:
+        """Wait for the next update, from any shard.
+
+        Raises:
+            queue.Empty: No update received before the timeout.
+        """
+
+        return self.__queue.get(timeout=timeout)
+
+    def __iter__(self) -> Iterator[TickerUpdate]:
+        while self.running or not self.__queue.empty():
+            try:
+                yield self.__queue.get(timeout=0.5)
+            except Empty:
+                continue
+
+    def __init__(
+        self,
+        user_token: int,
+        shard_count: int = 4,
+        logger: logging.Logger | None = None,
+        queue_maxsize: int = 1000,
+        retry_delay: float = 1.0,
+    ):
+        """
+        Args:
+            user_token (int):
+                User identifier in Degiro's API.
+            shard_count (int, optional):
+                Number of Quotecast sessions polled in parallel.
+                Defaults to 4.
+            logger (logging.Logger, optional):
+                This object will be generated if None.
+                Defaults to None.
+            queue_maxsize (int, optional):
+                Size of the queue shared by all the shards.
+                Defaults to 1000.
+            retry_delay (float, optional):
+                Initial delay between two failed renewals, in seconds.
+                Defaults to 1.0.
+        """
+
+        if shard_count < 1:
+            raise AttributeError("`shard_count` must be greater than 0.")
+
+        self.__logger = logger or logging.getLogger(self.__module__)
+        self.__queue: Queue = Queue(maxsize=queue_maxsize)
+        self.__lock = threading.Lock()
+        self.__load_list = [0] * shard_count
+        self.__shard_map: dict[str, int] = {}
+        self.__stream_list = [
+            QuotecastStream(
+                user_token=user_token,
+                logger=self.__logger,
+                queue=self.__queue,
+                retry_delay=retry_delay,
+            )
+            for _ in range(shard_count)
+        ]
@@ -0,0 +1,503 @@
+import logging
+import threading
+from datetime import datetime
+from queue import Empty, Full, Queue
+from typing import Iterator
+
+from degiro_connector.core.models.model_connection import ModelConnection
+from degiro_connector.core.models.model_session import ModelSession
+from degiro_connector.quotecast.models.metric import MetricType
+from degiro_connector.quotecast.models.ticker import (
+    TickerRequest,
+    TickerSnapshot,
+    TickerUpdate,
+)
+from degiro_connector.quotecast.tools.subscription_manager import SubscriptionManager
+from degiro_connector.quotecast.tools.ticker_fetcher import TickerFetcher
+from degiro_connector.quotecast.tools.ticker_to_metric_list import TickerToMetricList
+
+
+class QuotecastStream:
+    """Consume Degiro's Quotecast data-stream on a dedicated thread.
+
+    The stream owns the long-polling loop :
+        * it requests a `session_id` when needed,
+        * it replays the current subscriptions on each new `session_id`,
+        * it renews the `session_id` when the API answers `[{"m":"sr"}]`, when
+        a request fails or when the `ModelConnection` timeout expires.
+
+    A renewal is sent right away : the stream only waits, with an exponential
+    backoff, when a renewal fails or when a new `session_id` fails before its
+    first response.
+
+    Each response is parsed into a `TickerUpdate` and put in a bounded queue.
+    When the queue is full the polling thread waits for the consumers :
+    nothing is dropped.
+
+    Example :
+        stream = QuotecastStream(user_token=user_token)
+        stream.subscribe(request_map={"360015751": ["LastPrice", "LastVolume"]})
+        stream.start()
+
+        for ticker_update in stream:
+            print(ticker_update.metric_list)
+    """
+
+    QUOTECAST_TIMEOUT = 15
+
+    # {product_id: {metric_name: None}} : dicts keep the subscription order
+    __request_map: dict[str, dict[str, None]]
+    __seed_reference_map: dict[int, list[str]] | None
+    __thread: threading.Thread | None
+
+    @staticmethod
+    def build_request_map(
+        request_map: dict[str, list[MetricType]] | dict[str, list[str]],
+    ) -> dict[str, list[str]]:
+        return {
+            product_id: [
+                (metric.value if isinstance(metric, MetricType) else metric)
+                for metric in metric_list
+            ]
+            for product_id, metric_list in request_map.items()
+        }
+
+    @property
+    def connection_storage(self) -> ModelConnection:
+        return self.__connection_storage
+
+    @property
+    def logger(self) -> logging.Logger:
+        return self.__logger
+
+    @property
+    def queue(self) -> Queue:
+        return self.__queue
+
+    @property
+    def renewal_count(self) -> int:
+        return self.__renewal_count
+
+    @property
+    def request_map(self) -> dict[str, list[str]]:
+        with self.__lock:
+            return {
+                product_id: list(metric_set)
+                for product_id, metric_set in self.__request_map.items()
+            }
+
+    @property
+    def session_storage(self) -> ModelSession:
+        return self.__session_storage
+
+    @property
+    def ticker_to_metric_list(self) -> TickerToMetricList:
+        return self.__ticker_to_metric_list
+
+    @property
+    def running(self) -> bool:
+        thread = self.__thread
+
+        return thread is not None and thread.is_alive()
+
+    def send_request(self, ticker_request: TickerRequest, session_id: str) -> bool:
+        if not ticker_request.request_map:
+            return True
+
+        result = TickerFetcher.subscribe(
+            ticker_request=ticker_request,
+            session_id=session_id,
+            session=self.__session_storage.session,
+            logger=self.__logger,
+        )
+
+        return result is True
+
+    def subscribe(
+        self,
+        request_map: dict[str, list[MetricType]] | dict[str, list[str]],
+    ) -> bool:
+        """Add metrics to the subscriptions.
+
+        The metrics are sent right away if a `session_id` is available,
+        otherwise they will be sent with the next `session_id`.
+
+        Returns:
+            bool: Whether or not the subscription reached the API.
+        """
+
+        new_request_map: dict[str, list[str]] = {}
+
+        with self.__lock:
+            for product_id, metric_list in self.build_request_map(request_map).items():
+                metric_set = self.__request_map.setdefault(product_id, {})
+                for metric in metric_list:
+                    if metric not in metric_set:
+                        metric_set[metric] = None
+                        new_request_map.setdefault(product_id, []).append(metric)
+
+            return self.__send_if_connected(
+                ticker_request=TickerRequest(
+                    request_type="subscription",
+                    request_map=new_request_map,
+                )
+            )
+
+    def unsubscribe(
+        self,
+        request_map: dict[str, list[MetricType]] | dict[str, list[str]],
+    ) -> bool:
+        """Remove metrics from the subscriptions.
+
+        Returns:
+            bool: Whether or not the unsubscription reached the API.
+        """
+
+        old_request_map: dict[str, list[str]] = {}
+
+        with self.__lock:
+            for product_id, metric_list in self.build_request_map(request_map).items():
+                metric_set = self.__request_map.get(product_id, {})
+                for metric in metric_list:
+                    if metric in metric_set:
+                        del metric_set[metric]
+                        old_request_map.setdefault(product_id, []).append(metric)
+                if not metric_set:
+                    self.__request_map.pop(product_id, None)
+
+            return self.__send_if_connected(
+                ticker_request=TickerRequest(
+                    request_type="unsubscription",
+                    request_map=old_request_map,
+                )
+            )
+
+    def set_request_map(
+        self,
+        request_map: dict[str, list[MetricType]] | dict[str, list[str]],
+    ) -> bool:
+        """Replace the subscriptions, only sending the difference.
+
+        Returns:
+            bool: Whether or not the changes reached the API.
+        """
+
+        with self.__lock:
+            subscription, unsubscription = SubscriptionManager.build_diff(
+                current_map=SubscriptionManager.build_metric_set_map(
+                    request_map=self.request_map
+                ),
+                target_map=SubscriptionManager.build_metric_set_map(
+                    request_map=request_map
+                ),
+            )
+
+            unsubscribed = self.unsubscribe(request_map=unsubscription.request_map)
+            subscribed = self.subscribe(request_map=subscription.request_map)
+
+        return unsubscribed and subscribed
+
+    def build_snapshot(self) -> TickerSnapshot:
+        """Capture what is needed to resume the stream in another process."""
+
+        with self.__lock:
+            try:
+                session_id = self.__connection_storage.session_id
+            except (ConnectionError, TimeoutError):
+                session_id = ""
+
+            return TickerSnapshot(
+                session_id=session_id,
+                reference_map=dict(self.__ticker_to_metric_list.reference_map),
+                request_map=self.request_map,
+            )
+
+    def load_snapshot(self, ticker_snapshot: TickerSnapshot):
+        """Restore the subscriptions and the references of a previous process.
+
+        If the `session_id` is recent enough, polling resumes on it and no
+        registration round-trip is needed.
+
+        Otherwise the references are used to decode the first response of the
+        next `session_id`, then validated against its registration burst.
+        """
+
+        age = (datetime.now() - ticker_snapshot.snapshot_datetime).total_seconds()
+
+        with self.__lock:
+            self.__request_map = {
+                product_id: dict.fromkeys(metric_list)
+                for product_id, metric_list in ticker_snapshot.request_map.items()
+            }
+            self.__seed_reference_map = ticker_snapshot.reference_map
+
+            if ticker_snapshot.session_id and age < self.QUOTECAST_TIMEOUT:
+                ticker_to_metric_list = TickerToMetricList(
+                    reference_map=ticker_snapshot.reference_map,
+                )
+                # SAME `session_id` : THE API KEPT THESE REFERENCES
+                ticker_to_metric_list.unconfirmed_set.clear()
+                self.__ticker_to_metric_list = ticker_to_metric_list
+                self.__connection_storage.session_id = ticker_snapshot.session_id
+            else:
+                self.__connection_storage.session_id = ""
+
+    def renew_session(self) -> bool:
+        """Request a new `session_id` and replay all the subscriptions.
+
+        Returns:
+            bool: Whether or not the renewal succeeded.
+        """
+
+        logger = self.__logger
+        connection_storage = self.__connection_storage
+
+        with self.__lock:
+            connection_storage.session_id = ""
+            session_id = TickerFetcher.get_session_id(
+                user_token=self.__user_token,
+                session=self.__session_storage.session,
+                logger=logger,
+            )
+
+            if not session_id:
+                return False
+
+            # REFERENCES ARE SPECIFIC TO A `session_id`
+            seed_reference_map = self.__seed_reference_map
+            self.__seed_reference_map = None
+            self.__ticker_to_metric_list = TickerToMetricList(
+                reference_map=seed_reference_map,
+            )
+            connection_storage.session_id = session_id
+            self.__renewal_count += 1
+
+            replayed = self.send_request(
+                ticker_request=TickerRequest(
+                    request_type="subscription",
+                    request_map=self.request_map,
+                ),
+                session_id=session_id,
+            )
+
+            if not replayed:
+                connection_storage.session_id = ""
+                return False
+
+            logger.info("renew_session:session_id: %s", session_id)
+
+        return True
+
+    def fetch(self) -> TickerUpdate | None:
+        """Poll the data-stream once, renewing the `session_id` if needed.
+
+        Returns:
+            TickerUpdate | None:
+                Parsed update or None if nothing was received.
+        """
+
+        connection_storage = self.__connection_storage
+
+        try:
+            session_id = connection_storage.session_id
+        except (ConnectionError, TimeoutError):
+            if not self.renew_session():
+                return None
+            session_id = connection_storage.session_id
+
+        ticker = TickerFetcher.fetch_ticker(
+            session_id=session_id,
+            session=self.__session_storage.session,
+            logger=self.__logger,
+        )
+
+        if ticker is None:
+            # "sr" MESSAGE OR FAILED REQUEST : A NEW `session_id` IS REQUIRED
+            connection_storage.session_id = ""
+            return None
+
+        ticker_to_metric_list = self.__ticker_to_metric_list
+        metric_list = ticker_to_metric_list.parse(ticker=ticker)
+
+        # THE FIRST REGISTRATION BURST CONFIRMS OR REPLACES THE RESTORED REFERENCES
+        if ticker_to_metric_list.unconfirmed_set and '"a_req"' in ticker.json_text:
+            dropped_count = ticker_to_metric_list.validate()
+            self.__logger.info(
+                "fetch:snapshot: dropped=%s mismatch=%s",
+                dropped_count,
+                ticker_to_metric_list.mismatch_count,
+            )
+
+        return TickerUpdate.model_construct(
+            metric_list=metric_list,
+            response_datetime=ticker.response_datetime,
+            request_duration=ticker.request_duration,
+            session_id=session_id,
+        )
+
+    def put(self, ticker_update: TickerUpdate) -> bool:
+        """Put an update in the queue, waiting while the queue is full."""
+
+        stop_event = self.__stop_event
+        queue = self.__queue
+
+        while not stop_event.is_set():
+            try:
+                queue.put(ticker_update, timeout=0.5)
+                return True
+            except Full:
+                continue
+
+        return False
+
+    def run(self):
+        logger = self.__logger
+        connected = self.__connection_storage.connected
+        stop_event = self.__stop_event
+        retry_delay = self.__retry_delay
+        # WHETHER THE CURRENT `session_id` ANSWERED AT LEAST ONCE
+        polled = True
+
+        while not stop_event.is_set():
+            try:
+                if not connected.is_set():
+                    if not polled:
+                        if stop_event.wait(retry_delay):
+                            break
+                        retry_delay = min(retry_delay * 2, self.__max_retry_delay)
+                    polled = False
+                    if not self.renew_session():
+                        continue
+                ticker_update = self.fetch()
+            except Exception as e:
+                logger.fatal(e)
+                ticker_update = None
+                self.__connection_storage.session_id = ""
+
+            if ticker_update is None:
+                continue
+
+            polled = True
+            retry_delay = self.__retry_delay
+
+            if ticker_update.metric_list:
+                self.put(ticker_update=ticker_update)
+
+    def start(self):
+        if self.running:
+            return
+
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(
+            target=self.run,
+            name=self.__class__.__name__,
+            daemon=True,
+        )
+        self.__thread.start()
+
+    def stop(self, timeout: float | None = None):
+        """Stop the polling thread.
+
+        The thread finishes its current long-polling request before stopping.
+        """
+
+        self.__stop_event.set()
+        thread = self.__thread
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+
+    def get(self, timeout: float | None = None) -> TickerUpdate:
+        """Wait for the next update.
+
+        Raises:
+            queue.Empty: No update received before the timeout.
+        """
+
+        return self.__queue.get(timeout=timeout)
+
+    def __iter__(self) -> Iterator[TickerUpdate]:
+        while self.running or not self.__queue.empty():
+            try:
+                yield self.__queue.get(timeout=0.5)
+            except Empty:
+                continue
+
+    def __send_if_connected(self, ticker_request: TickerRequest) -> bool:
+        connection_storage = self.__connection_storage
+
+        if not connection_storage.connected.is_set():
+            return False
+
+        try:
+            session_id = connection_storage.session_id
+        except (ConnectionError, TimeoutError):
+            return False
+
+        sent = self.send_request(ticker_request=ticker_request, session_id=session_id)
+
+        if not sent:
+            # THE SUBSCRIPTIONS WILL BE REPLAYED ON THE NEXT `session_id`
+            connection_storage.session_id = ""
+
+        return sent
+
+    def __init__(
+        self,
+        user_token: int,
+        connection_storage: ModelConnection | None = None,
+        logger: logging.Logger | None = None,
+        queue: Queue | None = None,
+        queue_maxsize: int = 1000,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 30.0,
+        session_storage: ModelSession | None = None,
+    ):
+        """
+        Args:
+            user_token (int):
+                User identifier in Degiro's API.
+            connection_storage (ModelConnection, optional):
+                Stores the `session_id`.
+                Defaults to None.
+            logger (logging.Logger, optional):
+                This object will be generated if None.
+                Defaults to None.
+            queue (Queue, optional):
+                Queue receiving the updates, it can be shared between streams.
+                Defaults to None.
+            queue_maxsize (int, optional):
+                Size of the queue created when `queue` is None.
+                Defaults to 1000.
+            retry_delay (float, optional):
+                Initial delay between two failed renewals, in seconds.
+                Defaults to 1.0.
+            max_retry_delay (float, optional):
+                Maximum delay between two failed renewals, in seconds.
+                Defaults to 30.0.
+            session_storage (ModelSession, optional):
+                This object will be generated if None.
+                Defaults to None.
+        """
+
+        self.__user_token = user_token
+        self.__connection_storage = connection_storage or ModelConnection(
+            timeout=self.QUOTECAST_TIMEOUT,
+        )
+        self.__logger = logger or logging.getLogger(self.__module__)
+        self.__queue: Queue = (
+            queue if queue is not None else Queue(maxsize=queue_maxsize)
+        )
+        self.__retry_delay = retry_delay
+        self.__max_retry_delay = max_retry_delay
+        self.__session_storage = session_storage or ModelSession(
+            hooks=self.__connection_storage.build_hooks(),
+        )
+
+        self.__lock = threading.RLock()
+        self.__renewal_count = 0
+        self.__request_map = {}
+        self.__stop_event = threading.Event()
+        self.__thread = None
+        self.__ticker_to_metric_list = TickerToMetricList()
+        self.__seed_reference_map = None
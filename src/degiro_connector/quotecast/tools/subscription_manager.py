@@ -0,0 +1,193 @@
+import logging
+import threading
+
+import requests
+
+from degiro_connector.quotecast.models.metric import MetricType
+from degiro_connector.quotecast.models.ticker import TickerRequest
+from degiro_connector.quotecast.tools.ticker_fetcher import TickerFetcher
+
+
+class SubscriptionManager:
+    """Track the metrics subscribed on each Quotecast `session_id`.
+
+    Changing a watchlist only sends the difference with what is already
+    subscribed : the metrics to add and the metrics to remove. Large
+    differences are sent in several size-bounded POST.
+
+    Example :
+        subscription_manager = SubscriptionManager()
+        subscription_manager.sync(
+            session_id=session_id,
+            request_map={"360015751": ["LastPrice", "LastVolume"]},
+        )
+    """
+
+    @staticmethod
+    def build_metric_set_map(
+        request_map: dict[str, list[MetricType]] | dict[str, list[str]],
+    ) -> dict[str, set[str]]:
+        return {
+            product_id: {
+                (metric.value if isinstance(metric, MetricType) else metric)
+                for metric in metric_list
+            }
+            for product_id, metric_list in request_map.items()
+        }
+
+    @staticmethod
+    def build_diff(
+        current_map: dict[str, set[str]],
+        target_map: dict[str, set[str]],
+    ) -> tuple[TickerRequest, TickerRequest]:
+        """Compute the minimal changes going from `current_map` to `target_map`.
+
+        Returns:
+            tuple[TickerRequest, TickerRequest]:
+                Subscription and unsubscription to send.
+        """
+
+        subscription_map: dict[str, list[str]] = {}
+        unsubscription_map: dict[str, list[str]] = {}
+
+        for product_id, target_set in target_map.items():
+            added_set = target_set - current_map.get(product_id, set())
+            if added_set:
+                subscription_map[product_id] = sorted(added_set)
+
+        for product_id, current_set in current_map.items():
+            removed_set = current_set - target_map.get(product_id, set())
+            if removed_set:
+                unsubscription_map[product_id] = sorted(removed_set)
+
+        return (
+            TickerRequest(request_type="subscription", request_map=subscription_map),
+            TickerRequest(request_type="unsubscription", request_map=unsubscription_map),
+        )
+
+    @staticmethod
+    def apply_request(
+        metric_set_map: dict[str, set[str]],
+        ticker_request: TickerRequest,
+    ):
+        for product_id, metric_list in ticker_request.request_map.items():
+            if ticker_request.request_type == "subscription":
+                metric_set_map.setdefault(product_id, set()).update(metric_list)
+            else:
+                metric_set = metric_set_map.get(product_id, set())
+                metric_set.difference_update(metric_list)
+                if not metric_set:
+                    metric_set_map.pop(product_id, None)
+
+    def get_request_map(self, session_id: str) -> dict[str, list[str]]:
+        with self.__lock:
+            return {
+                product_id: sorted(metric_set)
+                for product_id, metric_set in self.__session_map.get(
+                    session_id, {}
+                ).items()
+            }
+
+    def diff(
+        self,
+        session_id: str,
+        request_map: dict[str, list[MetricType]] | dict[str, list[str]],
+    ) -> tuple[TickerRequest, TickerRequest]:
+        """Changes required for `session_id` to match `request_map`."""
+
+        with self.__lock:
+            current_map = self.__session_map.get(session_id, {})
+
+            return self.build_diff(
+                current_map=current_map,
+                target_map=self.build_metric_set_map(request_map=request_map),
+            )
+
+    def reset(self, session_id: str):
+        """Forget the subscriptions of an expired `session_id`."""
+
+        with self.__lock:
+            self.__session_map.pop(session_id, None)
+
+    def send(
+        self,
+        session_id: str,
+        ticker_request: TickerRequest,
+        session: requests.Session | None = None,
+    ) -> bool:
+        """Send `ticker_request` in size-bounded batches.
+
+        Each batch accepted by the API is recorded right away : after a failed
+        batch, the tracked subscriptions still match what reached the API and
+        the next `sync` only sends what is missing.
+
+        Returns:
+            bool: Whether or not all the batches reached the API.
+        """
+
+        batch_list = TickerFetcher.build_ticker_request_list(
+            ticker_request=ticker_request,
+            max_payload_size=self.__max_payload_size,
+        )
+
+        for batch in batch_list:
+            result = TickerFetcher.subscribe(
+                ticker_request=batch,
+                session_id=session_id,
+                session=session,
+                logger=self.__logger,
+                max_payload_size=None,
+            )
+
+            if result is not True:
+                return False
+
+            with self.__lock:
+                metric_set_map = self.__session_map.setdefault(session_id, {})
+                self.apply_request(
+                    metric_set_map=metric_set_map,
+                    ticker_request=batch,
+                )
+
+        return True
+
+    def sync(
+        self,
+        session_id: str,
+        request_map: dict[str, list[MetricType]] | dict[str, list[str]],
+        session: requests.Session | None = None,
+    ) -> bool:
+        """Make the subscriptions of `session_id` match `request_map`.
+
+        Returns:
+            bool: Whether or not all the changes reached the API.
+        """
+
+        subscription, unsubscription = self.diff(
+            session_id=session_id,
+            request_map=request_map,
+        )
+
+        unsubscribed = self.send(
+            session_id=session_id,
+            ticker_request=unsubscription,
+            session=session,
+        )
+        subscribed = self.send(
+            session_id=session_id,
+            ticker_request=subscription,
+            session=session,
+        )
+
+        return unsubscribed and subscribed
+
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        max_payload_size: int | None = TickerFetcher.MAX_PAYLOAD_SIZE,
+    ):
+        self.__logger = logger or logging.getLogger(self.__module__)
+        self.__lock = threading.Lock()
+        self.__max_payload_size = max_payload_size
+        # {session_id: {product_id: {metric_name}}}
+        self.__session_map: dict[str, dict[str, set[str]]] = {}
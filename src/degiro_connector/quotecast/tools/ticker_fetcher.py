@@ -8,16 +8,15 @@ from typing import Any
 import requests
 from orjson import loads
 
-from degiro_connector.core.constants.urls import (
-    QUOTECAST,
-    QUOTECAST_VERSION,
-)
+from degiro_connector.core.constants import urls
 from degiro_connector.core.constants.headers import HEADERS as HEADER_MAP
 from degiro_connector.quotecast.models.ticker import Ticker, TickerRequest
-from degiro_connector.quotecast.models.metric import MetricType
 
 
 class TickerFetcher:
+    # Size of the POST sent by `subscribe`, in characters.
+    MAX_PAYLOAD_SIZE = 32_768
+
     @staticmethod
     def build_logger() -> logging.Logger:
         return logging.getLogger(__name__)
@@ -86,9 +85,9 @@ class TickerFetcher:
         if session is None:
             session = cls.build_session()
 
-        url = QUOTECAST
+        url = urls.QUOTECAST
         url = f"{url}/request_session"
-        version = QUOTECAST_VERSION
+        version = urls.QUOTECAST_VERSION
         parameters = {"version": version, "userToken": user_token}
         data = '{"referrer":"https://trader.degiro.nl"}'
         request = requests.Request(method="POST", url=url, data=data, params=parameters)
@@ -140,7 +139,7 @@ class TickerFetcher:
         if session is None:
             session = cls.build_session()
 
-        url = f"{QUOTECAST}/{session_id}"
+        url = f"{urls.QUOTECAST}/{session_id}"
         request = requests.Request(method="GET", url=url)
         prepped = session.prepare_request(request=request)
         start_ns = time.perf_counter_ns()
@@ -172,28 +171,135 @@ class TickerFetcher:
         return ticker
 
     @staticmethod
-    def build_ticker_request_payload(ticker_request: TickerRequest) -> str:
-        """Build a payload like the following:
-        '{"controlData":"a_req(360017018.LastDate);a_req(360017018.LastTime);a_req(360017018.LastPrice);"}'
-        """
+    def build_control_tuple_list(
+        ticker_request: TickerRequest,
+    ) -> list[tuple[str, Any, str]]:
+        """Build the list of (product_id, metric_type, control)."""
 
         request_map = ticker_request.request_map
         request_type = ticker_request.request_type
         request_function = "a_req" if (request_type == "subscription") else "a_rel"
 
-        payload = '{"controlData":"'
+        control_tuple_list = []
 
         for product_id, metric_type_list in request_map.items():
             for metric_type in metric_type_list:
-                if isinstance(metric_type, MetricType):
-                    metric_name = metric_type.name
-                else:
-                    metric_name = metric_type
-                payload += f"{request_function}({product_id}.{metric_name});"
+                metric_name = getattr(metric_type, "name", metric_type)
+                control_tuple_list.append(
+                    (
+                        product_id,
+                        metric_type,
+                        f"{request_function}({product_id}.{metric_name});",
+                    )
+                )
+
+        return control_tuple_list
+
+    @classmethod
+    def build_control_list(cls, ticker_request: TickerRequest) -> list[str]:
+        """Build the list of controls like the following:
+        ["a_req(360017018.LastDate);", "a_req(360017018.LastTime);"]
+        """
+
+        return [
+            control
+            for _product_id, _metric_type, control in cls.build_control_tuple_list(
+                ticker_request=ticker_request
+            )
+        ]
+
+    @classmethod
+    def build_ticker_request_payload(cls, ticker_request: TickerRequest) -> str:
+        """Build a payload like the following:
+        '{"controlData":"a_req(360017018.LastDate);a_req(360017018.LastTime);a_req(360017018.LastPrice);"}'
+        """
+
+        control_list = cls.build_control_list(ticker_request=ticker_request)
+
+        return '{"controlData":"' + "".join(control_list) + '"}'
+
+    @classmethod
+    def build_ticker_request_list(
+        cls,
+        ticker_request: TickerRequest,
+        max_payload_size: int | None = None,
+    ) -> list[TickerRequest]:
+        """Split a `TickerRequest` into requests with size-bounded payloads.
+        Args:
+            ticker_request (TickerRequest):
+                Subscriptions or unsubscriptions to send.
+            max_payload_size (int, optional):
+                Maximum size of a payload, in characters.
+                A single control bigger than this limit gets its own request.
+                If None, the request is not split.
+                Defaults to None.
+        Returns:
+            list[TickerRequest]:
+                Requests to send, empty if there is nothing to send.
+        """
+
+        request_type = ticker_request.request_type
+        control_tuple_list = cls.build_control_tuple_list(ticker_request=ticker_request)
 
-        payload += '"}'
+        if not control_tuple_list:
+            return []
 
-        return payload
+        if max_payload_size is None:
+            return [ticker_request]
+
+        budget = max_payload_size - len(
+            cls.build_ticker_request_payload(
+                ticker_request=TickerRequest(request_type=request_type, request_map={}),
+            )
+        )
+        ticker_request_list = []
+        batch_map: dict[str, list] = {}
+        batch_size = 0
+
+        for product_id, metric_type, control in control_tuple_list:
+            control_size = len(control)
+            if batch_map and batch_size + control_size > budget:
+                ticker_request_list.append(
+                    TickerRequest(request_type=request_type, request_map=batch_map)
+                )
+                batch_map = {}
+                batch_size = 0
+            batch_map.setdefault(product_id, []).append(metric_type)
+            batch_size += control_size
+
+        ticker_request_list.append(
+            TickerRequest(request_type=request_type, request_map=batch_map)
+        )
+
+        return ticker_request_list
+
+    @classmethod
+    def build_ticker_request_payload_list(
+        cls,
+        ticker_request: TickerRequest,
+        max_payload_size: int | None = None,
+    ) -> list[str]:
+        """Split the payload of a `TickerRequest` into several payloads.
+        Args:
+            ticker_request (TickerRequest):
+                Subscriptions or unsubscriptions to send.
+            max_payload_size (int, optional):
+                Maximum size of a payload, in characters.
+                A single control bigger than this limit gets its own payload.
+                If None, a single payload is built.
+                Defaults to None.
+        Returns:
+            list[str]:
+                Payloads to send, empty if there is nothing to send.
+        """
+
+        return [
+            cls.build_ticker_request_payload(ticker_request=batch)
+            for batch in cls.build_ticker_request_list(
+                ticker_request=ticker_request,
+                max_payload_size=max_payload_size,
+            )
+        ]
 
     @classmethod
     def subscribe(
@@ -202,6 +308,7 @@ class TickerFetcher:
         session_id: str,
         session: requests.Session | None = None,
         logger: logging.Logger | None = None,
+        max_payload_size: int | None = MAX_PAYLOAD_SIZE,
     ) -> bool | None:
         """Adds/removes metric from the data-stream.
         Args:
@@ -224,6 +331,10 @@ class TickerFetcher:
             logger (logging.Logger, optional):
                 This object will be generated if None.
                 Defaults to None.
+            max_payload_size (int, optional):
+                Large requests are sent in several POST of at most this size.
+                If None, a single POST is sent.
+                Defaults to MAX_PAYLOAD_SIZE.
         Raises:
             BrokenPipeError:
                 A new "session_id" is required.
@@ -237,29 +348,33 @@ class TickerFetcher:
         if session is None:
             session = cls.build_session()
 
-        url = QUOTECAST
+        url = urls.QUOTECAST
         url = f"{url}/{session_id}"
-        data = cls.build_ticker_request_payload(ticker_request=ticker_request)
-
-        logger.info("subscribe:data %s", data[:100])
-
-        session_request = requests.Request(method="POST", url=url, data=data)
-        prepped = session.prepare_request(request=session_request)
-        response = None
-
-        try:
-            response = session.send(request=prepped)
-            response.raise_for_status()
-
-            if response.text == '[{"m":"sr"}]':
-                raise BrokenPipeError('A new "session_id" is required.')
-
-            return True
-        except requests.HTTPError as e:
-            logger.fatal(e)
-            if isinstance(e.response, requests.Response):
-                logger.fatal(e.response.text)
-            return None
-        except Exception as e:
-            logger.fatal(e)
-            return None
+        payload_list = cls.build_ticker_request_payload_list(
+            ticker_request=ticker_request,
+            max_payload_size=max_payload_size,
+        )
+
+        for data in payload_list:
+            logger.info("subscribe:data %s", data[:100])
+
+            session_request = requests.Request(method="POST", url=url, data=data)
+            prepped = session.prepare_request(request=session_request)
+            response = None
+
+            try:
+                response = session.send(request=prepped)
+                response.raise_for_status()
+
+                if response.text == '[{"m":"sr"}]':
+                    raise BrokenPipeError('A new "session_id" is required.')
+            except requests.HTTPError as e:
+                logger.fatal(e)
+                if isinstance(e.response, requests.Response):
+                    logger.fatal(e.response.text)
+                return None
+            except Exception as e:
+                logger.fatal(e)
+                return None
+
+        return True
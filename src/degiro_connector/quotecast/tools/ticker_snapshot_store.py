@@ -0,0 +1,144 @@
+import struct
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+from degiro_connector.quotecast.models.ticker import TickerSnapshot
+
+
+class TickerSnapshotStore:
+    """Read/write a `TickerSnapshot` in a compact binary format.
+
+    LAYOUT (little-endian)
+        * HEADER : magic, version, timestamp, counts.
+        * SESSION_ID : length-prefixed UTF-8.
+        * STRINGS : length-prefixed UTF-8, product ids and metric names
+        are only stored once.
+        * REFERENCES : (reference, product index, metric index).
+        * SUBSCRIPTIONS : (product index, metric index).
+        * CRC32 of all the previous bytes.
+    """
+
+    MAGIC = b"DGQS"
+    VERSION = 1
+
+    HEADER = struct.Struct("<4sHdIII")
+    LENGTH = struct.Struct("<H")
+    REFERENCE = struct.Struct("<qII")
+    SUBSCRIPTION = struct.Struct("<II")
+    CHECKSUM = struct.Struct("<I")
+
+    @classmethod
+    def dumps(cls, ticker_snapshot: TickerSnapshot) -> bytes:
+        string_map: dict[str, int] = {}
+
+        def index(string: str) -> int:
+            return string_map.setdefault(string, len(string_map))
+
+        reference_map = ticker_snapshot.reference_map
+        reference_list = [
+            (reference, index(product_id), index(metric_type))
+            for reference, (product_id, metric_type) in reference_map.items()
+        ]
+        subscription_list = [
+            (index(product_id), index(metric_type))
+            for product_id, metric_list in ticker_snapshot.request_map.items()
+            for metric_type in metric_list
+        ]
+
+        chunk_list = [
+            cls.HEADER.pack(
+                cls.MAGIC,
+                cls.VERSION,
+                ticker_snapshot.snapshot_datetime.timestamp(),
+                len(string_map),
+                len(reference_list),
+                len(subscription_list),
+            ),
+        ]
+
+        for string in [ticker_snapshot.session_id, *string_map]:
+            encoded = string.encode("utf-8")
+            chunk_list.append(cls.LENGTH.pack(len(encoded)))
+            chunk_list.append(encoded)
+
+        chunk_list.extend(cls.REFERENCE.pack(*item) for item in reference_list)
+        chunk_list.extend(cls.SUBSCRIPTION.pack(*item) for item in subscription_list)
+
+        data = b"".join(chunk_list)
+
+        return data + cls.CHECKSUM.pack(zlib.crc32(data))
+
+    @classmethod
+    def loads(cls, data: bytes) -> TickerSnapshot:
+        """Decode the output of `dumps`.
+
+        Raises:
+            AttributeError: Unknown format, unsupported version or corrupted data.
+        """
+
+        if len(data) < cls.HEADER.size + cls.CHECKSUM.size:
+            raise AttributeError("Snapshot is truncated.")
+
+        body = memoryview(data)[: -cls.CHECKSUM.size]
+        (checksum,) = cls.CHECKSUM.unpack_from(data, len(body))
+
+        magic, version, timestamp, string_count, reference_count, subscription_count = (
+            cls.HEADER.unpack_from(body, 0)
+        )
+
+        if magic != cls.MAGIC:
+            raise AttributeError(f"Not a ticker snapshot : {magic!r}")
+        if version != cls.VERSION:
+            raise AttributeError(f"Unsupported snapshot version : {version}")
+        if zlib.crc32(body) != checksum:
+            raise AttributeError("Snapshot is corrupted.")
+
+        offset = cls.HEADER.size
+        string_list = []
+
+        for _ in range(string_count + 1):
+            (length,) = cls.LENGTH.unpack_from(body, offset)
+            offset += cls.LENGTH.size
+            string_list.append(str(body[offset : offset + length], "utf-8"))
+            offset += length
+
+        session_id = string_list.pop(0)
+
+        reference_size = cls.REFERENCE.size * reference_count
+        reference_map = {
+            reference: [string_list[product_index], string_list[metric_index]]
+            for reference, product_index, metric_index in cls.REFERENCE.iter_unpack(
+                body[offset : offset + reference_size]
+            )
+        }
+        offset += reference_size
+
+        subscription_size = cls.SUBSCRIPTION.size * subscription_count
+        request_map: dict[str, list[str]] = {}
+        for product_index, metric_index in cls.SUBSCRIPTION.iter_unpack(
+            body[offset : offset + subscription_size]
+        ):
+            request_map.setdefault(string_list[product_index], []).append(
+                string_list[metric_index]
+            )
+
+        return TickerSnapshot(
+            session_id=session_id,
+            reference_map=reference_map,
+            request_map=request_map,
+            snapshot_datetime=datetime.fromtimestamp(timestamp),
+        )
+
+    @classmethod
+    def save(cls, ticker_snapshot: TickerSnapshot, path: str | Path):
+        """Write the snapshot atomically : a crash never leaves a partial file."""
+
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(cls.dumps(ticker_snapshot=ticker_snapshot))
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> TickerSnapshot:
+        return cls.loads(data=Path(path).read_bytes())
@@ -0,0 +1,306 @@
+from datetime import datetime
+
+import polars as pl
+
+from degiro_connector.quotecast.models.metric import Metric, MetricColumns, MetricType
+from degiro_connector.quotecast.models.ticker import Ticker
+
+
+class TickerState:
+    """Columnar storage of the latest value of each product/metric pair.
+
+    Each metric is a column with a fixed type and each product is a row,
+    located through the `product_id -> row` index. A tick only writes the
+    cells it contains : its cost depends on the size of the tick, not on the
+    number of subscribed products.
+
+    The DataFrame is only built on demand, through `build_df`. Each column is
+    kept as a `pl.Series` between two calls : only the columns written since the
+    previous call are rebuilt.
+    """
+
+    REQUEST_DURATION_COLUMN = "request_duration_s"
+    RESPONSE_DATETIME_COLUMN = "response_datetime"
+
+    @staticmethod
+    def build_dtype(metric_name: str) -> type[pl.DataType]:
+        if metric_name.endswith("Price"):
+            return pl.Float64
+        elif metric_name.endswith("Volume") or metric_name.endswith("Orders"):
+            return pl.Int64
+        else:
+            return pl.Utf8
+
+    @staticmethod
+    def convert_value(
+        value: str | float,
+        dtype: type[pl.DataType],
+    ) -> str | float | int | None:
+        try:
+            if dtype is pl.Float64:
+                return float(value)
+            elif dtype is pl.Int64:
+                return int(float(value))
+            else:
+                return str(value)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def format_last_datetime(df: pl.DataFrame) -> pl.DataFrame:
+        """Replace columns "LastDate" and "LastTime" by "LastDatetimeUTC"."""
+
+        if "LastDate" not in df.columns:
+            return df
+
+        if "LastTime" not in df.columns:
+            df = df.with_columns((pl.lit("00:00:00")).alias("LastTime"))
+
+        df = df.with_columns(
+            (pl.col("LastDate") + " " + pl.col("LastTime")).alias("LastDatetime")
+        )
+        df = df.drop(["LastDate", "LastTime"])
+        df = df.with_columns(
+            pl.col("LastDatetime")
+            .str.strptime(pl.Datetime, format="%Y-%m-%d %H:%M:%S")
+            .alias("LastDatetime")
+        )
+        df = df.with_columns(
+            pl.col("LastDatetime").dt.replace_time_zone("Europe/Paris")
+        )
+
+        df_utc = df.with_columns(
+            pl.col("LastDatetime").dt.convert_time_zone("UTC").alias("LastDatetimeUTC")
+        )
+        df_utc = df_utc.with_columns(
+            pl.col("LastDatetimeUTC").dt.replace_time_zone(None)
+        )
+        df_utc = df_utc.drop("LastDatetime")
+
+        return df_utc
+
+    @staticmethod
+    def format_response_datetime(df: pl.DataFrame) -> pl.DataFrame:
+        """Replace column "response_datetime" by "response_datetime_utc"."""
+
+        df = df.with_columns(
+            pl.col("response_datetime").dt.replace_time_zone("Europe/Paris")
+        )
+        df = df.with_columns(
+            pl.col("response_datetime")
+            .dt.convert_time_zone("UTC")
+            .alias("response_datetime_utc")
+        )
+        df = df.with_columns(pl.col("response_datetime_utc").dt.replace_time_zone(None))
+        df = df.drop("response_datetime")
+
+        return df
+
+    def __init__(self) -> None:
+        self.__row_map: dict[str, int] = {}
+        self.__product_id_list: list[str] = []
+        self.__column_map: dict[str, list] = {}
+        self.__dtype_map: dict[str, type[pl.DataType]] = {}
+        self.__request_duration_list: list[float | None] = []
+        self.__response_datetime_list: list[datetime | None] = []
+
+        # CACHES OF `build_df` AND `build_metric_list`
+        self.__series_map: dict[str, pl.Series] = {}
+        self.__dirty_set: set[str] = set()
+        self.__df: pl.DataFrame | None = None
+        self.__metric_list: list[Metric] | None = None
+
+    @property
+    def product_id_list(self) -> list[str]:
+        return self.__product_id_list
+
+    @property
+    def row_map(self) -> dict[str, int]:
+        return self.__row_map
+
+    @property
+    def metric_name_list(self) -> list[str]:
+        return list(self.__column_map)
+
+    def __len__(self) -> int:
+        return len(self.__product_id_list)
+
+    def add_row(self, product_id: str) -> int:
+        row = len(self.__product_id_list)
+        self.__row_map[product_id] = row
+        self.__product_id_list.append(product_id)
+        self.__request_duration_list.append(None)
+        self.__response_datetime_list.append(None)
+
+        for column in self.__column_map.values():
+            column.append(None)
+
+        # EVERY COLUMN GETS LONGER
+        self.__series_map.clear()
+        self.__df = None
+
+        return row
+
+    def add_column(self, metric_name: str) -> list:
+        column: list = [None] * len(self.__product_id_list)
+        self.__column_map[metric_name] = column
+        self.__dtype_map[metric_name] = self.build_dtype(metric_name=metric_name)
+
+        return column
+
+    def set_value(self, product_id: str, metric_name: str, value: str | float) -> int:
+        """Write one cell, creating its row and its column if needed.
+
+        Returns:
+            int: Row of the product.
+        """
+
+        row = self.__row_map.get(product_id)
+        if row is None:
+            row = self.add_row(product_id=product_id)
+
+        column = self.__column_map.get(metric_name)
+        if column is None:
+            column = self.add_column(metric_name=metric_name)
+
+        column[row] = self.convert_value(
+            value=value,
+            dtype=self.__dtype_map[metric_name],
+        )
+        self.__dirty_set.add(metric_name)
+        self.__metric_list = None
+
+        return row
+
+    def set_metadata(self, row_set: set[int], ticker: Ticker):
+        request_duration_s = ticker.request_duration.total_seconds()
+        response_datetime = ticker.response_datetime
+        request_duration_list = self.__request_duration_list
+        response_datetime_list = self.__response_datetime_list
+
+        for row in row_set:
+            request_duration_list[row] = request_duration_s
+            response_datetime_list[row] = response_datetime
+
+        if row_set:
+            self.__dirty_set.add(self.REQUEST_DURATION_COLUMN)
+            self.__dirty_set.add(self.RESPONSE_DATETIME_COLUMN)
+
+    def update(self, metric_list: list[Metric], ticker: Ticker):
+        """Apply the metrics of one tick in place."""
+
+        row_set = set()
+
+        for metric in metric_list:
+            row = self.set_value(
+                product_id=metric.product_id,
+                metric_name=metric.metric_type.value,
+                value=metric.value,
+            )
+            row_set.add(row)
+
+        self.set_metadata(row_set=row_set, ticker=ticker)
+
+    def update_columns(self, metric_columns: MetricColumns, ticker: Ticker):
+        """Apply the output of `TickerToMetricList.parse_columns` in place."""
+
+        product_id_table = metric_columns.product_id_table
+        metric_name_table = metric_columns.metric_name_table
+        set_value = self.set_value
+        row_set = set()
+
+        for slot, numeric, text in zip(
+            metric_columns.slot_list,
+            metric_columns.numeric_list,
+            metric_columns.text_list,
+        ):
+            row = set_value(
+                product_id=product_id_table[slot],
+                metric_name=metric_name_table[slot],
+                value=numeric if text is None else text,
+            )
+            row_set.add(row)
+
+        self.set_metadata(row_set=row_set, ticker=ticker)
+
+    def build_metric_list(self) -> list[Metric]:
+        """Metrics of the state, cached until the next change."""
+
+        if self.__metric_list is not None:
+            return self.__metric_list
+
+        metric_list = []
+        product_id_list = self.__product_id_list
+
+        for metric_name, column in self.__column_map.items():
+            metric_type = MetricType(metric_name)
+            for row, value in enumerate(column):
+                if value is not None:
+                    metric_list.append(
+                        Metric(
+                            product_id=product_id_list[row],
+                            metric_type=metric_type,
+                            value=value,
+                        )
+                    )
+
+        self.__metric_list = metric_list
+
+        return metric_list
+
+    def build_series(self, name: str) -> pl.Series:
+        """Column `name` as a `pl.Series`, rebuilt only if it changed."""
+
+        series = self.__series_map.get(name)
+
+        if series is not None:
+            return series
+
+        if name == "product_id":
+            series = pl.Series(name, self.__product_id_list, dtype=pl.Utf8)
+        elif name == self.REQUEST_DURATION_COLUMN:
+            series = pl.Series(name, self.__request_duration_list, dtype=pl.Float64)
+        elif name == self.RESPONSE_DATETIME_COLUMN:
+            series = pl.Series(
+                name,
+                self.__response_datetime_list,
+                dtype=pl.Datetime("us"),
+            )
+        else:
+            series = pl.Series(
+                name,
+                self.__column_map[name],
+                dtype=self.__dtype_map[name],
+            )
+
+        self.__series_map[name] = series
+
+        return series
+
+    def build_df(self) -> pl.DataFrame:
+        """Snapshot of the state, with the same layout as `TickerToDF.build_df`.
+
+        The same DataFrame is returned until the state changes.
+        """
+
+        if self.__df is not None and not self.__dirty_set:
+            return self.__df
+
+        for name in self.__dirty_set:
+            self.__series_map.pop(name, None)
+        self.__dirty_set.clear()
+
+        build_series = self.build_series
+        df = pl.DataFrame(
+            [build_series(name="product_id")]
+            + [build_series(name=metric_name) for metric_name in self.__column_map]
+        )
+        df = self.format_last_datetime(df=df)
+        df = df.with_columns(
+            build_series(name=self.REQUEST_DURATION_COLUMN),
+            build_series(name=self.RESPONSE_DATETIME_COLUMN),
+        )
+        df = self.format_response_datetime(df=df)
+        self.__df = df
+
+        return df
@@ -1,18 +1,37 @@
+import warnings
 from copy import deepcopy
+from datetime import datetime
 
 import polars as pl
 
-from degiro_connector.quotecast.models.metric import Metric
+from degiro_connector.quotecast.models.metric import Metric, MetricColumns
 from degiro_connector.quotecast.models.ticker import Ticker
+from degiro_connector.quotecast.tools.ticker_state import TickerState
 from degiro_connector.quotecast.tools.ticker_to_metric_list import TickerToMetricList
 
 
 class TickerToDF:
+    """Keep the latest value of each product/metric as a DataFrame.
+
+    The ticks are applied in place to a `TickerState`, see `update` and
+    `parse`.
+    """
+
+    HEARTBEAT = '[{"m":"h"}]'
+
     @staticmethod
     def merge_metric_list(
         current_data: list[Metric],
         new_data: list[Metric],
     ) -> list[Metric]:
+        """Deprecated : the metrics are merged in place by `TickerState`."""
+
+        warnings.warn(
+            "`merge_metric_list` is deprecated, see `ticker_state`.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
         current_data = deepcopy(current_data)
         metric_map = {
             f"{metric.product_id} {metric.metric_type.value}": metric
@@ -63,53 +82,42 @@ class TickerToDF:
         )
 
         # LASTDATETIMEUTC
-        if "LastDate" in df.columns:
-            if "LastTime" not in df.columns:
-                df = df.with_columns((pl.lit("00:00:00")).alias("LastTime"))
-
-            df = df.with_columns(
-                (pl.col("LastDate") + " " + pl.col("LastTime")).alias("LastDatetime")
-            )
-            df = df.drop(["LastDate", "LastTime"])
-            df = df.with_columns(
-                pl.col("LastDatetime")
-                .str.strptime(pl.Datetime, format="%Y-%m-%d %H:%M:%S")
-                .alias("LastDatetime")
-            )
-            df = df.with_columns(
-                pl.col("LastDatetime").dt.replace_time_zone("Europe/Paris")
-            )
-
-            df_utc = df.with_columns(
-                pl.col("LastDatetime").dt.convert_time_zone("UTC").alias("LastDatetimeUTC")
-            )
-            df_utc = df_utc.with_columns(
-                pl.col("LastDatetimeUTC").dt.replace_time_zone(None)
-            )
-            df_utc = df_utc.drop("LastDatetime")
-            df = df_utc
+        df = TickerState.format_last_datetime(df=df)
 
         return df
 
     def __init__(self) -> None:
-        self.__last_df = None
-        self.__last_metric_list = []
-        self.__stored_request_duration_map = {}
-        self.__stored_response_datetime_map = {}
-        self.__stored_metric_list = []
+        self.__last_df: pl.DataFrame | None = None
+        self.__last_metric_list: list[Metric] | None = []
+        self.__last_metric_columns: MetricColumns | None = None
+        self.__ticker_state = TickerState()
         self.__ticker_to_metric_list = TickerToMetricList()
 
+        # ONLY USED BY THE DEPRECATED `add_*_column` METHODS
+        self.__stored_request_duration_map: dict[str, float] = {}
+        self.__stored_response_datetime_map: dict[str, datetime] = {}
+
     @property
     def last_df(self) -> pl.DataFrame | None:
         return self.__last_df
 
     @property
     def last_metric_list(self) -> list[Metric]:
+        if self.__last_metric_list is None:
+            metric_columns = self.__last_metric_columns
+            self.__last_metric_list = (
+                [] if metric_columns is None else metric_columns.to_metric_list()
+            )
+
         return self.__last_metric_list
 
     @property
     def stored_metric_list(self) -> list[Metric]:
-        return self.__stored_metric_list
+        return self.__ticker_state.build_metric_list()
+
+    @property
+    def ticker_state(self) -> TickerState:
+        return self.__ticker_state
 
     @property
     def ticker_to_metric_list(self) -> TickerToMetricList:
@@ -121,20 +129,30 @@ class TickerToDF:
         last_metric_list: list[Metric],
         ticker: Ticker,
     ) -> pl.DataFrame:
+        """Deprecated : `ticker_state.build_df` already has this column."""
+
+        warnings.warn(
+            "`add_request_duration_column` is deprecated, see `ticker_state`.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
         request_duration_map = {
             metric.product_id: ticker.request_duration.total_seconds()
             for metric in last_metric_list
         }
         self.__stored_request_duration_map.update(request_duration_map)
 
-        request_duration_s_df = pl.DataFrame({
-            "product_id": list(self.__stored_request_duration_map.keys()),
-            "request_duration_s": list(self.__stored_request_duration_map.values())
-        })
-
-        df = df.join(request_duration_s_df, on="product_id", how="left")
+        request_duration_s_df = pl.DataFrame(
+            {
+                "product_id": list(self.__stored_request_duration_map.keys()),
+                TickerState.REQUEST_DURATION_COLUMN: list(
+                    self.__stored_request_duration_map.values()
+                ),
+            }
+        )
 
-        return df
+        return df.join(request_duration_s_df, on="product_id", how="left")
 
     def add_response_datetime_column(
         self,
@@ -142,60 +160,67 @@ class TickerToDF:
         last_metric_list: list[Metric],
         ticker: Ticker,
     ) -> pl.DataFrame:
-        response_datetime = {
+        """Deprecated : `ticker_state.build_df` already has this column."""
+
+        warnings.warn(
+            "`add_response_datetime_column` is deprecated, see `ticker_state`.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        response_datetime_map = {
             metric.product_id: ticker.response_datetime for metric in last_metric_list
         }
-        self.__stored_response_datetime_map.update(response_datetime)
+        self.__stored_response_datetime_map.update(response_datetime_map)
+
+        response_datetime_df = pl.DataFrame(
+            {
+                "product_id": list(self.__stored_response_datetime_map.keys()),
+                TickerState.RESPONSE_DATETIME_COLUMN: list(
+                    self.__stored_response_datetime_map.values()
+                ),
+            }
+        )
+        df = df.join(response_datetime_df, on="product_id", how="left")
 
-        response_datetime_df = pl.DataFrame({
-            "product_id": list(self.__stored_response_datetime_map.keys()),
-            "response_datetime": list(self.__stored_response_datetime_map.values())
-        })
+        return TickerState.format_response_datetime(df=df)
 
-        df = df.join(response_datetime_df, on="product_id", how="left")
+    def update(self, ticker: Ticker) -> MetricColumns | None:
+        """Apply a ticker to the state without building a DataFrame.
 
-        df = df.with_columns(
-            pl.col("response_datetime").dt.replace_time_zone("Europe/Paris")
-        )
+        The ticker is applied through `parse_columns`, like in `parse`. The
+        `Metric` objects are only built on demand, through `last_metric_list`.
 
-        df = df.with_columns(
-            pl.col("response_datetime")
-            .dt.convert_time_zone("UTC")
-            .alias("response_datetime_utc")
-        )
-        df = df.with_columns(pl.col("response_datetime_utc").dt.replace_time_zone(None))
-        df = df.drop("response_datetime")
+        The DataFrame can be built later through : `ticker_state.build_df()`.
 
-        return df
+        Returns:
+            MetricColumns | None: Metrics of the ticker, None for a heartbeat.
+        """
+
+        if ticker.json_text == self.HEARTBEAT:
+            self.__last_metric_list = []
+            self.__last_metric_columns = None
+            return None
+
+        metric_columns = self.__ticker_to_metric_list.parse_columns(ticker=ticker)
+        self.__ticker_state.update_columns(metric_columns=metric_columns, ticker=ticker)
+        self.__last_metric_list = None
+        self.__last_metric_columns = metric_columns
+
+        return metric_columns
 
     def parse(self, ticker: Ticker) -> pl.DataFrame | None:
-        stored_metric_list = self.__stored_metric_list
-        ticker_to_metric_list = self.__ticker_to_metric_list
-
-        if ticker.json_text != '[{"m":"h"}]':
-            last_metric_list = ticker_to_metric_list.parse(ticker=ticker)
-            stored_metric_list = self.merge_metric_list(
-                current_data=stored_metric_list,
-                new_data=last_metric_list,
-            )
+        """Apply a ticker to the state and return the DataFrame of the state.
 
-            df = self.build_df(metric_list=stored_metric_list)
-            df = self.add_request_duration_column(
-                df=df,
-                last_metric_list=last_metric_list,
-                ticker=ticker,
-            )
-            df = self.add_response_datetime_column(
-                df=df,
-                last_metric_list=last_metric_list,
-                ticker=ticker,
-            )
-        else:
-            last_metric_list = []
-            df = None
+        The ticker is applied through `update` and only the columns it changed
+        are rebuilt.
+        """
+
+        if self.update(ticker=ticker) is None:
+            self.__last_df = None
+            return None
 
+        df = self.__ticker_state.build_df()
         self.__last_df = df
-        self.__last_metric_list = last_metric_list
-        self.__stored_metric_list = stored_metric_list
 
         return df
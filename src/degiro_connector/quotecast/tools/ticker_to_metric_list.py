@@ -10,6 +10,7 @@ from degiro_connector.quotecast.models.message import (
 )
 from degiro_connector.quotecast.models.metric import (
     Metric,
+    MetricColumns,
     MetricType,
 )
 from degiro_connector.quotecast.models.ticker import Ticker
@@ -151,6 +152,10 @@ class TickerToMetricList:
         115.85 <=> CODE2
     """
 
+    REJECTED_MESSAGE = (
+        "Subscription rejected, the `vwd_id` or `metric` might not exist."
+    )
+
     @staticmethod
     def from_ticker_to_message_list(ticker: Ticker) -> list[Message]:
         json_text = ticker.json_text
@@ -192,7 +197,7 @@ class TickerToMetricList:
                 pass
             elif message_raw["m"] == "d":
                 raise AttributeError(
-                    f"Subscription rejected, the `vwd_id` or `metric` might not exist. - {message_raw}"
+                    f"{TickerToMetricList.REJECTED_MESSAGE} - {message_raw}"
                 )
             else:
                 raise AttributeError(f"Unknown metric : {message_raw}")
@@ -211,9 +216,92 @@ class TickerToMetricList:
                 Dictionnary storing the references returned by Degiro's Quotecast.
                 Each reference number matches with a specific product/metric_type set.
                 Example : {reference_number: [product_id, metric_type]}
+                These references are "unconfirmed" until the API registers them
+                again, see `validate`.
         """
         # {reference: [product_id, metric_type]}
-        self._reference_map: dict[int, list] = reference_map or {}
+        self._reference_map: dict[int, list] = {}
+
+        # {reference: slot}, the slot being an index in the tables below
+        # A slot always matches the same (product_id, metric_type) : a
+        # `MetricColumns` stays valid after an unregistration, and the tables
+        # only grow with the number of distinct metrics.
+        self._slot_map: dict[int, int] = {}
+        self._pair_slot_map: dict[tuple[str, str], int] = {}
+        self._product_id_table: list[str] = []
+        self._metric_name_table: list[str] = []
+
+        # REFERENCES RESTORED FROM A SNAPSHOT, NOT YET SEEN IN A REGISTRATION
+        self._unconfirmed_set: set[int] = set()
+        self._mismatch_count = 0
+
+        for reference, (product_id, metric_type) in (reference_map or {}).items():
+            self.register(reference=reference, metric_name=f"{product_id}.{metric_type}")
+
+        self._unconfirmed_set.update(self._reference_map)
+
+    @property
+    def reference_map(self) -> dict[int, list]:
+        return self._reference_map
+
+    @property
+    def mismatch_count(self) -> int:
+        """Restored references which the API registered with another metric."""
+
+        return self._mismatch_count
+
+    @property
+    def unconfirmed_set(self) -> set[int]:
+        return self._unconfirmed_set
+
+    def register(self, reference: int, metric_name: str) -> int:
+        """Store the matching between a reference and a "product_id.metric_type".
+
+        Returns:
+            int: Slot of the reference.
+        """
+
+        product_id, metric_type = metric_name.rsplit(sep=".", maxsplit=1)
+
+        if reference in self._unconfirmed_set:
+            self._unconfirmed_set.discard(reference)
+            if self._reference_map[reference] != [product_id, metric_type]:
+                self._mismatch_count += 1
+
+        self._reference_map[reference] = [product_id, metric_type]
+
+        slot = self._pair_slot_map.get((product_id, metric_type))
+
+        if slot is None:
+            slot = len(self._product_id_table)
+            self._product_id_table.append(product_id)
+            self._metric_name_table.append(metric_type)
+            self._pair_slot_map[(product_id, metric_type)] = slot
+
+        self._slot_map[reference] = slot
+
+        return slot
+
+    def unregister(self, reference: int):
+        del self._reference_map[reference]  # crashes on purpose to detect inconsistency
+        del self._slot_map[reference]
+        self._unconfirmed_set.discard(reference)
+
+    def validate(self) -> int:
+        """Drop the restored references missing from the registration burst.
+
+        To call once the first response of a new `session_id` has been parsed.
+
+        Returns:
+            int: Number of dropped references.
+        """
+
+        unconfirmed_list = list(self._unconfirmed_set)
+
+        for reference in unconfirmed_list:
+            self.unregister(reference=reference)
+
+        return len(unconfirmed_list)
 
     def from_message_list_to_metric_list(
         self, message_list: list[Message]
@@ -223,13 +311,12 @@ class TickerToMetricList:
 
         for message in message_list:
             if isinstance(message, MessageRegistration):
-                reference_map[message.reference] = message.metric_name.rsplit(
-                    sep=".", maxsplit=1
+                self.register(
+                    reference=message.reference,
+                    metric_name=message.metric_name,
                 )
             elif isinstance(message, MessageUnregistration):
-                del reference_map[
-                    message.reference
-                ]  # crashes on purpose to detect inconsistency
+                self.unregister(reference=message.reference)
             elif isinstance(message, (MessageNumeric, MessageText)):
                 product_id, metric_type = reference_map[message.reference]
                 metric_list.append(
@@ -246,3 +333,55 @@ class TickerToMetricList:
         message_list = self.from_ticker_to_message_list(ticker=ticker)
         metric_list = self.from_message_list_to_metric_list(message_list=message_list)
         return metric_list
+
+    def parse_columns(self, ticker: Ticker) -> MetricColumns:
+        """Fast version of `parse`.
+
+        Goes from the JSON payload to parallel arrays in a single pass,
+        without building any `Message` or `Metric` object.
+        """
+
+        message_list_raw = json.loads(ticker.json_text)  # pylint: disable=no-member
+        metric_columns = MetricColumns(
+            product_id_table=self._product_id_table,
+            metric_name_table=self._metric_name_table,
+        )
+        slot_map = self._slot_map
+        reference_append = metric_columns.reference_list.append
+        slot_append = metric_columns.slot_list.append
+        numeric_append = metric_columns.numeric_list.append
+        text_append = metric_columns.text_list.append
+        nan = float("nan")
+
+        for message_raw in message_list_raw:
+            message_type = message_raw["m"]
+
+            if message_type == "un":
+                reference, value = message_raw["v"]
+                slot_append(slot_map[reference])
+                reference_append(reference)
+                numeric_append(value)
+                text_append(None)
+            elif message_type == "us":
+                reference, value = message_raw["v"]
+                slot_append(slot_map[reference])
+                reference_append(reference)
+                numeric_append(nan)
+                text_append(value)
+            elif message_type == "a_req":
+                self.register(
+                    reference=message_raw["v"][1],
+                    metric_name=message_raw["v"][0],
+                )
+            elif message_type == "a_rel":
+                self.unregister(reference=message_raw["v"][1])
+            elif message_type == "h" or message_type == "ue":
+                pass
+            elif message_type == "d":
+                raise AttributeError(
+                    f"{TickerToMetricList.REJECTED_MESSAGE} - {message_raw}"
+                )
+            else:
+                raise AttributeError(f"Unknown metric : {message_raw}")
+
+        return metric_columns
@@ -18,6 +18,9 @@ from degiro_connector.core.abstracts.abstract_action import AbstractAction
 
 
 class ActionCheckOrder(AbstractAction):
+    # NO ORDER IS CREATED BY THE CHECKING
+    IDEMPOTENT = True
+
     @staticmethod
     def build_json_map(order: Order) -> dict:
         json_map = order.model_dump(
@@ -81,7 +84,7 @@ class ActionCheckOrder(AbstractAction):
 
         try:
             response = session.send(prepped)
-            duration_ns = time.perf_counter_ns() - start_ns
+            duration_ns = cls.build_duration_ns(start_ns=start_ns, response=response)
             response.raise_for_status()
 
             if raw is True:
@@ -17,6 +17,9 @@ from degiro_connector.core.abstracts.abstract_action import AbstractAction
 
 
 class ActionConfirmOrder(AbstractAction):
+    # SENDING IT TWICE COULD PLACE THE ORDER TWICE
+    IDEMPOTENT = False
+
     @staticmethod
     def build_json_map(order: Order) -> dict[str, float | int | str]:
         json_map = order.model_dump(
@@ -79,7 +82,7 @@ class ActionConfirmOrder(AbstractAction):
 
         try:
             response = session.send(prepped)
-            duration_ns = time.perf_counter_ns() - start_ns
+            duration_ns = cls.build_duration_ns(start_ns=start_ns, response=response)
             response.raise_for_status()
 
             if raw is True:
@@ -1,4 +1,5 @@
 import logging
+import time
 
 from degiro_connector.core.exceptions import CaptchaRequiredError, DeGiroConnectionError, MaintenanceError
 from html.parser import HTMLParser
@@ -7,11 +8,19 @@ import requests
 
 from degiro_connector.core.constants import urls
 from degiro_connector.core.abstracts.abstract_action import AbstractAction
+from degiro_connector.core.helpers.single_flight import SingleFlight
 from degiro_connector.trading.models.credentials import Credentials
 from degiro_connector.trading.models.login import Login, LoginError, LoginSuccess
 
 
 class ActionConnect(AbstractAction):
+    # SECONDS DURING WHICH A LOGIN IS SHARED WITH THE NEXT CALLS
+    REUSE_WINDOW = 1.0
+
+    # CONCURRENT CALLS ON A SAME `connection_storage` SHARE ONE LOGIN
+    # A RESPONSE WITH STATUS 401 OR A CHANGED `session_id` STOPS ITS REUSE
+    SINGLE_FLIGHT = SingleFlight(reuse_window=REUSE_WINDOW)
+
     @classmethod
     def get_session_id(
         cls,
@@ -143,20 +152,70 @@ class ActionConnect(AbstractAction):
 
         return login_sucess.session_id
 
-    def call(self):
+    def get_generation(self) -> tuple[int, str]:
+        """State of `connection_storage` which a shared login must still match."""
+
+        connection_storage = self.connection_storage
+
+        try:
+            session_id = connection_storage.session_id
+        except (ConnectionError, TimeoutError):
+            session_id = ""
+
+        return connection_storage.unauthorized_count, session_id
+
+    def login(self) -> str:
         connection_storage = self.connection_storage
-        session = self.session_storage.session
         credentials = self.credentials
         logger = self.logger
+        session_store = connection_storage.session_store
+
+        if session_store is None:
+            connection_storage.session_id = self.get_session_id(
+                credentials=credentials,
+                logger=logger,
+                session=self.session_storage.session,
+            )
+            return connection_storage.session_id
 
-        connection_storage.session_id = self.get_session_id(
-            credentials=credentials,
-            logger=logger,
-            session=session,
+        key = session_store.build_key(
+            username=credentials.username,
+            int_account=credentials.int_account,
         )
 
+        try:
+            current_session_id = connection_storage.session_id
+        except (ConnectionError, TimeoutError):
+            current_session_id = ""
+
+        with session_store.lock():
+            record = session_store.load(key=key, max_age=connection_storage.timeout)
+
+            # THE CURRENT `session_id` IS THE ONE WHICH FAILED
+            if record is not None and record["session_id"] != current_session_id:
+                logger.info("login: reusing the stored session.")
+                connection_storage.session_id = record["session_id"]
+                connection_storage.last_success = time.monotonic() - (
+                    time.time() - record["updated"]
+                )
+                return connection_storage.session_id
+
+            connection_storage.session_id = self.get_session_id(
+                credentials=credentials,
+                logger=logger,
+                session=self.session_storage.session,
+            )
+            session_store.save(key=key, session_id=connection_storage.session_id)
+
         return connection_storage.session_id
 
+    def call(self):
+        return self.SINGLE_FLIGHT.do(
+            key=id(self.connection_storage),
+            function=self.login,
+            get_generation=self.get_generation,
+        )
+
     @classmethod
     def __get_maintenance_message(cls) -> LoginError:
         response = requests.get(
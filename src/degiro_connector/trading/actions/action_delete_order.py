@@ -8,6 +8,9 @@ from degiro_connector.trading.models.credentials import Credentials
 
 
 class ActionDeleteOrder(AbstractAction):
+    # THE ORDER MAY ALREADY BE CHANGED WHEN THE RESPONSE IS LOST
+    IDEMPOTENT = False
+
     @classmethod
     def delete_order(
         cls,
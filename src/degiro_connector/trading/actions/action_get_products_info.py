@@ -10,6 +10,9 @@ from degiro_connector.trading.models.product import ProductInfo
 
 
 class ActionGetProductsInfo(AbstractAction):
+    # READ ONLY, DESPITE THE POST
+    IDEMPOTENT = True
+
     @staticmethod
     def build_model(response: requests.Response) -> ProductInfo:
         model = ProductInfo.model_validate_json(json_data=response.text)
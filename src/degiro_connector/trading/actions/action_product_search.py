@@ -45,6 +45,19 @@ class ActionProductSearch(AbstractAction):
         StocksRequest: urls.PRODUCT_SEARCH_STOCKS,
         WarrantsRequest: urls.PRODUCT_SEARCH_WARRANTS,
     }
+    # NAMES OF THE CONSTANTS : THE URLS ARE READ AT CALL TIME, SO THAT
+    # `override_urls` IS HONOURED
+    URL_NAME_MATCHING = {
+        BondsRequest: "PRODUCT_SEARCH_BONDS",
+        ETFsRequest: "PRODUCT_SEARCH_ETFS",
+        FundsRequest: "PRODUCT_SEARCH_FUNDS",
+        FuturesRequest: "PRODUCT_SEARCH_FUTURES",
+        LeveragedsRequest: "PRODUCT_SEARCH_LEVERAGEDS",
+        LookupRequest: "PRODUCT_SEARCH_LOOKUP",
+        OptionsRequest: "PRODUCT_SEARCH_OPTIONS",
+        StocksRequest: "PRODUCT_SEARCH_STOCKS",
+        WarrantsRequest: "PRODUCT_SEARCH_WARRANTS",
+    }
 
     @classmethod
     def product_search(
@@ -99,7 +112,7 @@ class ActionProductSearch(AbstractAction):
         if session is None:
             session = cls.build_session()
 
-        url = cls.URL_MATCHING[type(product_request)]
+        url = getattr(urls, cls.URL_NAME_MATCHING[type(product_request)])
 
         params = product_request.model_dump(
             by_alias=True,
@@ -0,0 +1,229 @@
+import logging
+import time
+from datetime import timedelta
+
+import requests
+from orjson import dumps
+
+from degiro_connector.core.constants import urls
+from degiro_connector.trading.actions.action_check_order import ActionCheckOrder
+from degiro_connector.trading.actions.action_confirm_order import ActionConfirmOrder
+from degiro_connector.trading.actions.action_get_update import ActionGetUpdate
+from degiro_connector.trading.models.credentials import Credentials
+from degiro_connector.trading.models.order import Order, SubmissionResponse
+from degiro_connector.core.abstracts.abstract_action import AbstractAction
+
+
+class ActionSubmitOrder(AbstractAction):
+    """Check and confirm an order, with as little work as possible between the
+    two requests.
+
+    * The order is validated and serialized once : the same body is sent to
+    both endpoints.
+    * The confirmation request is a copy of the prepared checking request, only
+    its URL changes.
+    * Both requests go through the same "requests.Session" : the confirmation
+    reuses the keep-alive connection of the checking. `warm_up` opens this
+    connection ahead of time.
+
+    The durations are stored in the response :
+        * `serialization_duration` : validation and serialization,
+        * `checking_response.request_duration` : checking round-trip,
+        * `confirmation_response.request_duration` : confirmation round-trip,
+        * `request_duration` : whole submission.
+
+    A failed checking returns None : nothing was placed. A failed confirmation
+    returns a response without `confirmation_response`, which keeps the
+    `checking_response` and the `confirmation_error`. Its `possibly_placed` is
+    True when the failure does not prove that the order was rejected, like a
+    timeout : the orders have to be checked before submitting it again.
+    """
+
+    # SENDING IT TWICE COULD PLACE THE ORDER TWICE
+    IDEMPOTENT = False
+
+    @staticmethod
+    def build_body(order: Order) -> bytes:
+        json_map = ActionCheckOrder.build_json_map(order=order)
+
+        return dumps(json_map)
+
+    @staticmethod
+    def build_prepped(
+        body: bytes,
+        params: dict,
+        session: requests.Session,
+        url: str,
+    ) -> requests.PreparedRequest:
+        request = requests.Request(
+            method="POST",
+            url=url,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            params=params,
+        )
+
+        return session.prepare_request(request)
+
+    @staticmethod
+    def is_possibly_placed(error: Exception) -> bool:
+        """Whether or not the order may exist despite the confirmation `error`."""
+
+        if isinstance(error, requests.HTTPError):
+            response = error.response
+            # A CLIENT ERROR MEANS THE API REJECTED THE ORDER
+            return response is None or not 400 <= response.status_code < 500
+
+        # THE CONNECTION WAS NOT EVEN OPENED
+        return not isinstance(error, requests.ConnectTimeout)
+
+    @staticmethod
+    def build_error(error: Exception) -> str:
+        text = str(error) or repr(error)
+
+        if isinstance(error, requests.HTTPError) and isinstance(
+            error.response, requests.Response
+        ):
+            text = f"{text} : {error.response.text}"
+
+        return text
+
+    @classmethod
+    def send(
+        cls,
+        prepped: requests.PreparedRequest,
+        session: requests.Session,
+    ) -> tuple[requests.Response, int]:
+        start_ns = time.perf_counter_ns()
+        response = session.send(prepped)
+        duration_ns = cls.build_duration_ns(start_ns=start_ns, response=response)
+        response.raise_for_status()
+
+        return response, duration_ns
+
+    @classmethod
+    def warm_up(
+        cls,
+        credentials: Credentials,
+        session_id: str,
+        logger: logging.Logger | None = None,
+        session: requests.Session | None = None,
+    ) -> bool:
+        """Open the connection to the orders endpoints with a lightweight request.
+
+        Returns:
+            bool: Whether or not the request succeeded.
+        """
+
+        result = ActionGetUpdate.get_update(
+            credentials=credentials,
+            request_list=[],
+            session_id=session_id,
+            logger=logger,
+            raw=True,
+            session=session,
+        )
+
+        return result is not None
+
+    @classmethod
+    def submit_order(
+        cls,
+        credentials: Credentials,
+        order: Order,
+        session_id: str,
+        logger: logging.Logger | None = None,
+        session: requests.Session | None = None,
+    ) -> SubmissionResponse | None:
+        if logger is None:
+            logger = cls.build_logger()
+        if session is None:
+            session = cls.build_session()
+
+        start_ns = time.perf_counter_ns()
+
+        body = cls.build_body(order=order)
+        params = {"intAccount": credentials.int_account, "sessionId": session_id}
+        checking_prepped = cls.build_prepped(
+            body=body,
+            params=params,
+            session=session,
+            url=f"{urls.ORDER_CHECK};jsessionid={session_id}",
+        )
+        serialization_ns = time.perf_counter_ns() - start_ns
+
+        try:
+            response, duration_ns = cls.send(prepped=checking_prepped, session=session)
+            round_trip_ns = duration_ns
+            checking_response = ActionCheckOrder.build_model(
+                response=response,
+                duration_ns=duration_ns,
+            )
+        except requests.HTTPError as e:
+            logger.fatal(e)
+            if isinstance(e.response, requests.Response):
+                logger.fatal(e.response.text)
+            return None
+        except Exception as e:
+            logger.fatal(e)
+            return None
+
+        confirmation_id = checking_response.confirmation_id
+        confirmation_prepped = checking_prepped.copy()
+        confirmation_prepped.prepare_url(
+            url=f"{urls.ORDER_CONFIRM}/{confirmation_id};jsessionid={session_id}",
+            params=params,
+        )
+        confirmation_response = None
+        confirmation_error = None
+        possibly_placed = False
+
+        try:
+            response, duration_ns = cls.send(
+                prepped=confirmation_prepped,
+                session=session,
+            )
+            round_trip_ns += duration_ns
+            confirmation_response = ActionConfirmOrder.build_model(
+                response=response,
+                duration_ns=duration_ns,
+            )
+        except Exception as e:
+            confirmation_error = cls.build_error(error=e)
+            possibly_placed = cls.is_possibly_placed(error=e)
+            logger.fatal(
+                "submit_order: confirmation_id=%s possibly_placed=%s error=%s",
+                confirmation_id,
+                possibly_placed,
+                confirmation_error,
+            )
+
+        return SubmissionResponse(
+            checking_response=checking_response,
+            confirmation_response=confirmation_response,
+            confirmation_error=confirmation_error,
+            possibly_placed=possibly_placed,
+            serialization_duration=timedelta(microseconds=serialization_ns // 1000),
+            request_duration=timedelta(
+                microseconds=max(
+                    time.perf_counter_ns() - start_ns,
+                    serialization_ns + round_trip_ns,
+                )
+                // 1000
+            ),
+        )
+
+    def call(self, order: Order) -> SubmissionResponse | None:
+        connection_storage = self.connection_storage
+        session_id = connection_storage.session_id
+        credentials = self.credentials
+        session = self.session_storage.session
+        logger = self.logger
+
+        return self.submit_order(
+            credentials=credentials,
+            order=order,
+            session_id=session_id,
+            logger=logger,
+            session=session,
+        )
@@ -9,6 +9,9 @@ from degiro_connector.trading.models.order import Order, ORDER_FIELD_MAP
 
 
 class ActionUpdateOrder(AbstractAction):
+    # THE ORDER MAY ALREADY BE CHANGED WHEN THE RESPONSE IS LOST
+    IDEMPOTENT = False
+
     @staticmethod
     def build_json_map(order: Order) -> dict:
         json_map = order.model_dump(
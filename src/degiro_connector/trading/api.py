@@ -5,6 +5,8 @@ from typing import Any, Callable
 
 from degiro_connector.core.abstracts.abstract_action import AbstractAction
 from degiro_connector.core.helpers.lazy_loader import InitArgs, LazyLoader, Pair
+from degiro_connector.core.helpers.request_scheduler import RequestScheduler
+from degiro_connector.core.helpers.retry import RetryPolicy
 from degiro_connector.core.models.model_connection import ModelConnection
 from degiro_connector.core.models.model_session import ModelSession
 from degiro_connector.trading.models.credentials import Credentials
@@ -86,6 +88,8 @@ class API:
         logger: logging.Logger | None = None,
         preload: bool = True,
         session_storage: ModelSession | None = None,
+        request_scheduler: RequestScheduler | None = None,
+        retry_policy: RetryPolicy | None = None,
     ):
         self._credentials = credentials
         self._connection_storage = connection_storage or ModelConnection(
@@ -93,7 +97,9 @@ class API:
         )
         self._logger = logger or logging.getLogger(self.__module__)
         self._session_storage = session_storage or ModelSession(
-            hooks=self._connection_storage.build_hooks()
+            hooks=self._connection_storage.build_hooks(),
+            request_scheduler=request_scheduler,
+            retry_policy=retry_policy,
         )
         self._action_list = self.build_action_list()
 
@@ -0,0 +1,108 @@
+import logging
+from typing import Any, Callable, Coroutine
+
+from degiro_connector.core.models.model_async_session import ModelAsyncSession
+from degiro_connector.core.models.model_connection import ModelConnection
+from degiro_connector.trading.api import API
+from degiro_connector.trading.models.credentials import Credentials
+
+
+class AsyncAPI:
+    """Asynchronous version of `API`.
+
+    Exposes the same actions, with the same parameters and the same models,
+    but each action is a coroutine. All the requests go through a single
+    `httpx.AsyncClient` connection pool, so one event loop can keep hundreds of
+    requests in flight without a thread per request. See `ModelAsyncSession`
+    for the timeout, the throttling and the retries.
+
+    The actions parse responses which were already fetched by the event loop :
+    their `request_duration` is the round-trip measured by the event loop, see
+    `response.elapsed`.
+
+    Example :
+        async with AsyncAPI(credentials=credentials) as trading_api:
+            await trading_api.connect()
+            profile_list = await asyncio.gather(
+                *(
+                    trading_api.get_company_profile(product_isin=isin)
+                    for isin in isin_list
+                )
+            )
+    """
+
+    @property
+    def action_list(self) -> list[str]:
+        return self._api.action_list
+
+    @property
+    def connection_storage(self) -> ModelConnection:
+        return self._api.connection_storage
+
+    @property
+    def credentials(self) -> Credentials:
+        return self._api.credentials
+
+    @property
+    def session_storage(self) -> ModelAsyncSession:
+        return self._session_storage
+
+    def build_coroutine_function(
+        self,
+        action: str,
+    ) -> Callable[..., Coroutine[Any, Any, Any]]:
+        action_instance = getattr(self._api, action)
+        session_storage = self._session_storage
+
+        async def coroutine_function(*args, **kwargs) -> Any:
+            return await session_storage.run(action_instance, *args, **kwargs)
+
+        coroutine_function.__name__ = action
+        coroutine_function.__doc__ = action_instance.call.__doc__
+
+        return coroutine_function
+
+    async def aclose(self):
+        await self._session_storage.aclose()
+
+    def __init__(
+        self,
+        credentials: Credentials,
+        connection_storage: ModelConnection | None = None,
+        logger: logging.Logger | None = None,
+        session_storage: ModelAsyncSession | None = None,
+    ):
+        connection_storage = connection_storage or ModelConnection(
+            timeout=API.TRADING_TIMEOUT,
+        )
+        self._logger = logger or logging.getLogger(self.__module__)
+        self._session_storage = session_storage or ModelAsyncSession(
+            hooks=connection_storage.build_hooks(),
+        )
+        self._api = API(
+            credentials=credentials,
+            connection_storage=connection_storage,
+            logger=self._logger,
+            preload=False,
+            session_storage=self._session_storage,  # type: ignore
+        )
+
+    async def __aenter__(self) -> "AsyncAPI":
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    def __getattr__(self, item) -> Callable[..., Coroutine[Any, Any, Any]]:
+        logger = self._logger
+        logger.debug("CALLING __GETATTR__, on item : %s", item)
+        if item in self._api.action_list:
+            action = item
+            coroutine_function = self.build_coroutine_function(action=action)
+            setattr(self, action, coroutine_function)
+
+            return coroutine_function
+
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{item}'"
+        )
@@ -1,7 +1,7 @@
 from datetime import datetime, date
 from enum import Enum
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 from pydantic.alias_generators import to_camel
 
 
@@ -110,6 +110,139 @@ class AccountUpdate(BaseModel):
     total_portfolio: dict | None = Field(default=None)
     transactions: dict | None = Field(default=None)
 
+
+def flatten_amount(v: object) -> object:
+    """Amounts like "plBase" are maps of one currency : `{"EUR": -12.5}`."""
+
+    if isinstance(v, dict):
+        return next(iter(v.values()), None)
+
+    return v
+
+
+class CashFundRow(BaseModel):
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        extra="allow",
+        validate_by_name=True,
+    )
+
+    id: str
+    currency_code: str | None = Field(default=None)
+    rate: float | None = Field(default=None)
+    value: float | None = Field(default=None)
+    value_base_curr: float | None = Field(default=None)
+
+
+class OrderRow(BaseModel):
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        extra="allow",
+        validate_by_name=True,
+    )
+
+    id: str
+    buysell: str | None = Field(default=None)
+    contract_size: float | None = Field(default=None)
+    contract_type: int | None = Field(default=None)
+    currency: str | None = Field(default=None)
+    # "date" WOULD SHADOW `datetime.date` IN THIS MODULE
+    order_date: str | None = Field(default=None, alias="date")
+    is_deletable: bool | None = Field(default=None)
+    is_modifiable: bool | None = Field(default=None)
+    order_time_type: str | None = Field(default=None)
+    order_time_type_id: int | None = Field(default=None)
+    order_type: str | None = Field(default=None)
+    order_type_id: int | None = Field(default=None)
+    price: float | None = Field(default=None)
+    product: str | None = Field(default=None)
+    product_id: int | None = Field(default=None)
+    quantity: float | None = Field(default=None)
+    size: float | None = Field(default=None)
+    stop_price: float | None = Field(default=None)
+    total_order_value: float | None = Field(default=None)
+
+
+class PortfolioRow(BaseModel):
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        extra="allow",
+        validate_by_name=True,
+    )
+
+    id: str
+    accrued_interest: float | None = Field(default=None)
+    average_fx_rate: float | None = Field(default=None)
+    break_even_price: float | None = Field(default=None)
+    pl_base: float | None = Field(default=None)
+    portfolio_value_correction: float | None = Field(default=None)
+    position_type: str | None = Field(default=None)
+    price: float | None = Field(default=None)
+    realized_fx_pl: float | None = Field(default=None)
+    realized_product_pl: float | None = Field(default=None)
+    size: float | None = Field(default=None)
+    today_pl_base: float | None = Field(default=None)
+    today_realized_fx_pl: float | None = Field(default=None)
+    today_realized_product_pl: float | None = Field(default=None)
+    value: float | None = Field(default=None)
+
+    @field_validator("pl_base", "today_pl_base", mode="before")
+    @classmethod
+    def validate_amount(cls, v: object) -> object:
+        return flatten_amount(v)
+
+
+class TotalPortfolioRow(BaseModel):
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        extra="allow",
+        validate_by_name=True,
+    )
+
+    cash_fund_compensation: float | None = Field(default=None)
+    cash_fund_compensation_currency: str | None = Field(default=None)
+    cash_fund_compensation_pending: float | None = Field(default=None)
+    cash_fund_compensation_withdrawn: float | None = Field(default=None)
+    degiro_cash: float | None = Field(default=None)
+    flatex_cash: float | None = Field(default=None)
+    free_space_new: float | None = Field(default=None)
+    margin_call_status: str | None = Field(default=None)
+    report_cash_bal: float | None = Field(default=None)
+    report_creation_time: str | None = Field(default=None)
+    report_deficit: float | None = Field(default=None)
+    report_margin: float | None = Field(default=None)
+    report_netliq: float | None = Field(default=None)
+    report_overall_margin: float | None = Field(default=None)
+    report_portf_value: float | None = Field(default=None)
+    report_total_long_val: float | None = Field(default=None)
+    today_deposit_withdrawal: float | None = Field(default=None)
+    today_non_product_fees: float | None = Field(default=None)
+    total_cash: float | None = Field(default=None)
+    total_deposit_withdrawal: float | None = Field(default=None)
+    total_non_product_fees: float | None = Field(default=None)
+
+    @field_validator("free_space_new", mode="before")
+    @classmethod
+    def validate_amount(cls, v: object) -> object:
+        return flatten_amount(v)
+
+
+class AccountEventType(str, Enum):
+    ADDED = "added"
+    UPDATED = "updated"
+    REMOVED = "removed"
+
+
+class AccountEvent(BaseModel):
+    """Change of a row of an `UpdateOption`, like a position or an order."""
+
+    option: UpdateOption
+    type: AccountEventType
+    id: str
+    row: dict | None = Field(default=None)
+    change_map: dict = Field(default_factory=dict)
+
+
 class UpcomingPayments(BaseModel):
     model_config = ConfigDict(
         alias_generator=to_camel,
@@ -123,4 +256,4 @@ class UpcomingPayments(BaseModel):
     currency: str
     amount: str
     amount_in_base_curr: str
-    pay_date: str
\ No newline at end of file
+    pay_date: str
@@ -106,6 +106,80 @@ class ConfirmationWrapper(BaseModel):
     data: ConfirmationResponse
 
 
+class SubmissionResponse(BaseModel):
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        validate_by_name=True,
+    )
+
+    checking_response: CheckingResponse
+    # None IF THE CONFIRMATION FAILED, SEE `confirmation_error`
+    confirmation_response: ConfirmationResponse | None = Field(default=None)
+    confirmation_error: str | None = Field(default=None)
+    # THE CONFIRMATION FAILED AFTER IT WAS SENT : THE ORDER MAY EXIST
+    possibly_placed: bool = Field(default=False)
+    serialization_duration: timedelta | None = Field(default=None)
+    request_duration: timedelta | None = Field(default=None)
+
+    @property
+    def confirmed(self) -> bool:
+        return self.confirmation_response is not None
+
+
+class OrderResult(BaseModel):
+    """Outcome of one item of a batch, see `OrderBatch`."""
+
+    index: int
+    item: Order | str  # ORDER OR ORDER ID
+    response: CheckingResponse | SubmissionResponse | bool | None = Field(
+        default=None
+    )
+    error: str | None = Field(default=None)
+    # THE CONFIRMATION FAILED AFTER IT WAS SENT : THE ORDER MAY EXIST
+    possibly_placed: bool = Field(default=False)
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class OrderStatus(str, Enum):
+    PENDING = "pending"  # CONFIRMED, NOT YET SEEN IN THE UPDATES
+    WORKING = "working"
+    PARTIALLY_FILLED = "partially_filled"
+    FILLED = "filled"
+    CANCELLED = "cancelled"
+    CLOSED = "closed"  # GONE FROM THE ORDERS, OUTCOME NOT YET KNOWN
+
+
+class WorkingOrder(BaseModel):
+    """Order tracked by `OrderRegistry`."""
+
+    order_id: str
+    status: OrderStatus
+    row: dict = Field(default_factory=dict)
+    traded_size: float = Field(default=0.0)
+    updated: datetime = Field(default_factory=datetime.now)
+
+    @property
+    def is_open(self) -> bool:
+        return self.status in {
+            OrderStatus.PENDING,
+            OrderStatus.WORKING,
+            OrderStatus.PARTIALLY_FILLED,
+        }
+
+
+class OrderEvent(BaseModel):
+    """Change of a `WorkingOrder`."""
+
+    order_id: str
+    status: OrderStatus
+    previous_status: OrderStatus | None = Field(default=None)
+    change_map: dict = Field(default_factory=dict)
+    working_order: WorkingOrder
+
+
 ORDER_FIELD_MAP = {
     OrderType.LIMIT: {
         "buySell",
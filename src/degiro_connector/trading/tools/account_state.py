@@ -0,0 +1,336 @@
+import logging
+import threading
+from queue import Full, Queue
+from typing import Any
+
+from degiro_connector.trading.models.account import (
+    AccountEvent,
+    AccountEventType,
+    AccountUpdate,
+    UpdateOption,
+    UpdateRequest,
+)
+
+
+class AccountState:
+    """In-memory copy of the account, kept up to date with deltas.
+
+    The Update endpoint returns a `lastUpdated` token for each option. When
+    this token is sent back, only the rows changed since then are returned :
+        * "isAdded" rows : new rows, or the full table for a token of 0.
+        * "isRemoved" rows : rows to delete.
+        * other rows : the changed fields of an existing row.
+
+    `AccountState` remembers these tokens, applies the deltas to tables
+    indexed by row id (product id for the portfolio, order id for the orders)
+    and emits one `AccountEvent` per row which actually changed.
+
+    Example :
+        account_state = AccountState(
+            option_list=[UpdateOption.ORDERS, UpdateOption.PORTFOLIO],
+        )
+        while True:
+            for account_event in account_state.refresh(trading_api=trading_api):
+                print(account_event.type, account_event.id, account_event.change_map)
+            time.sleep(5)
+    """
+
+    DEFAULT_OPTION_LIST = [
+        UpdateOption.CASH_FUNDS,
+        UpdateOption.ORDERS,
+        UpdateOption.PORTFOLIO,
+        UpdateOption.TOTAL_PORTFOLIO,
+    ]
+
+    @staticmethod
+    def build_row(value_list: list[dict]) -> dict[str, Any]:
+        """Convert `[{"name": "size", "value": 10}, ...]` into `{"size": 10, ...}`."""
+
+        return {item["name"]: item.get("value") for item in value_list if "name" in item}
+
+    @property
+    def last_updated_map(self) -> dict[UpdateOption, int]:
+        with self.__lock:
+            return dict(self.__last_updated_map)
+
+    @property
+    def option_list(self) -> list[UpdateOption]:
+        return self.__option_list
+
+    @property
+    def queue(self) -> Queue | None:
+        return self.__queue
+
+    @property
+    def cash_funds(self) -> dict[str, dict]:
+        return self.get_table(option=UpdateOption.CASH_FUNDS)
+
+    @property
+    def orders(self) -> dict[str, dict]:
+        return self.get_table(option=UpdateOption.ORDERS)
+
+    @property
+    def portfolio(self) -> dict[str, dict]:
+        return self.get_table(option=UpdateOption.PORTFOLIO)
+
+    @property
+    def total_portfolio(self) -> dict[str, Any]:
+        return self.get_table(option=UpdateOption.TOTAL_PORTFOLIO).get(
+            UpdateOption.TOTAL_PORTFOLIO.value,
+            {},
+        )
+
+    def get_table(self, option: UpdateOption) -> dict[str, dict]:
+        """Copy of the rows of an option, indexed by row id."""
+
+        with self.__lock:
+            return {
+                row_id: dict(row)
+                for row_id, row in self.__table_map.get(option, {}).items()
+            }
+
+    def build_request_list(
+        self,
+        option_list: list[UpdateOption] | None = None,
+    ) -> list[UpdateRequest]:
+        """Requests with the last known token of each option."""
+
+        option_list = option_list or self.__option_list
+
+        with self.__lock:
+            return [
+                UpdateRequest(
+                    option=option,
+                    last_updated=self.__last_updated_map.get(option, 0),
+                )
+                for option in option_list
+            ]
+
+    def apply(
+        self,
+        option: UpdateOption,
+        update_map: dict,
+        is_full: bool = False,
+    ) -> list[AccountEvent]:
+        """Apply the content of one option of the Update endpoint.
+
+        Args:
+            option (UpdateOption):
+                Option of the content.
+            update_map (dict):
+                Example :
+                    update_map = {
+                        "lastUpdated": 28,
+                        "value": [
+                            {
+                                "id": "1234",
+                                "name": "order",
+                                "isAdded": True,
+                                "value": [{"name": "size", "value": 10}],
+                            },
+                            {"id": "5678", "name": "order", "isRemoved": True},
+                        ],
+                    }
+            is_full (bool, optional):
+                Whether or not `update_map` contains the whole table : the
+                rows missing from it are removed.
+                Defaults to False.
+        Returns:
+            list[AccountEvent]: Rows which changed.
+        """
+
+        value_list = update_map.get("value") or []
+        event_list = []
+
+        # "totalPortfolio" IS A SINGLE ROW OF NAME/VALUE PAIRS
+        if value_list and "id" not in value_list[0]:
+            value_list = [{"id": option.value, "value": value_list}]
+
+        with self.__lock:
+            table = self.__table_map.setdefault(option, {})
+            seen_set = set()
+
+            for item in value_list:
+                row_id = str(item["id"])
+                seen_set.add(row_id)
+                current_row = table.get(row_id)
+
+                if item.get("isRemoved"):
+                    if table.pop(row_id, None) is not None:
+                        event_list.append(
+                            AccountEvent(
+                                option=option,
+                                type=AccountEventType.REMOVED,
+                                id=row_id,
+                                row=current_row,
+                            )
+                        )
+                    continue
+
+                new_row = self.build_row(value_list=item.get("value") or [])
+
+                if current_row is None:
+                    table[row_id] = new_row
+                    event_list.append(
+                        AccountEvent(
+                            option=option,
+                            type=AccountEventType.ADDED,
+                            id=row_id,
+                            row=dict(new_row),
+                            change_map=dict(new_row),
+                        )
+                    )
+                    continue
+
+                change_map = {
+                    name: value
+                    for name, value in new_row.items()
+                    if current_row.get(name, ...) != value
+                }
+                if not change_map:
+                    continue
+
+                current_row.update(change_map)
+                event_list.append(
+                    AccountEvent(
+                        option=option,
+                        type=AccountEventType.UPDATED,
+                        id=row_id,
+                        row=dict(current_row),
+                        change_map=change_map,
+                    )
+                )
+
+            if is_full:
+                for row_id in [row_id for row_id in table if row_id not in seen_set]:
+                    event_list.append(
+                        AccountEvent(
+                            option=option,
+                            type=AccountEventType.REMOVED,
+                            id=row_id,
+                            row=table.pop(row_id),
+                        )
+                    )
+
+            if "lastUpdated" in update_map:
+                self.__last_updated_map[option] = update_map["lastUpdated"]
+
+        return event_list
+
+    def apply_update(
+        self,
+        account_update: AccountUpdate | dict,
+        request_list: list[UpdateRequest] | None = None,
+    ) -> list[AccountEvent]:
+        """Apply a response of the Update endpoint.
+
+        Args:
+            account_update (AccountUpdate | dict):
+                Response, preferably raw : it avoids validating it.
+            request_list (list[UpdateRequest], optional):
+                Requests of this response : a token of 0 means the content is
+                the full table. Considered as deltas if None.
+                Defaults to None.
+        Returns:
+            list[AccountEvent]: Rows which changed.
+        """
+
+        if isinstance(account_update, AccountUpdate):
+            account_update = account_update.model_dump(by_alias=True, exclude_none=True)
+
+        full_set = {
+            update_request.option
+            for update_request in request_list or []
+            if update_request.last_updated == 0
+        }
+        event_list = []
+
+        for option in UpdateOption:
+            update_map = account_update.get(option.value)
+            if not isinstance(update_map, dict):
+                continue
+            event_list.extend(
+                self.apply(
+                    option=option,
+                    update_map=update_map,
+                    is_full=option in full_set,
+                )
+            )
+
+        self.publish(event_list=event_list)
+
+        return event_list
+
+    def publish(self, event_list: list[AccountEvent]):
+        queue = self.__queue
+
+        if queue is None:
+            return
+
+        for account_event in event_list:
+            try:
+                queue.put_nowait(account_event)
+            except Full:
+                self.__logger.warning("publish: queue is full, event dropped.")
+
+    def refresh(
+        self,
+        trading_api,
+        option_list: list[UpdateOption] | None = None,
+    ) -> list[AccountEvent] | None:
+        """Fetch the deltas since the last refresh and apply them.
+
+        Args:
+            trading_api (degiro_connector.trading.api.API):
+                Connected Trading API.
+            option_list (list[UpdateOption], optional):
+                Options to refresh, `option_list` of the state if None.
+                Defaults to None.
+        Returns:
+            list[AccountEvent] | None:
+                Rows which changed, None if the request failed.
+        """
+
+        request_list = self.build_request_list(option_list=option_list)
+        account_update = trading_api.get_update(request_list=request_list, raw=True)
+
+        if account_update is None:
+            return None
+
+        return self.apply_update(
+            account_update=account_update,
+            request_list=request_list,
+        )
+
+    def reset(self):
+        """Forget the tables and the tokens : the next refresh is a full one."""
+
+        with self.__lock:
+            self.__last_updated_map.clear()
+            self.__table_map.clear()
+
+    def __init__(
+        self,
+        option_list: list[UpdateOption] | None = None,
+        queue: Queue | None = None,
+        logger: logging.Logger | None = None,
+    ):
+        """
+        Args:
+            option_list (list[UpdateOption], optional):
+                Options to keep up to date, `DEFAULT_OPTION_LIST` if None.
+                Defaults to None.
+            queue (Queue, optional):
+                Queue receiving the `AccountEvent`, not used if None.
+                Defaults to None.
+            logger (logging.Logger, optional):
+                This object will be generated if None.
+                Defaults to None.
+        """
+
+        self.__option_list = list(option_list or self.DEFAULT_OPTION_LIST)
+        self.__queue = queue
+        self.__logger = logger or logging.getLogger(self.__module__)
+        self.__lock = threading.Lock()
+        self.__last_updated_map: dict[UpdateOption, int] = {}
+        self.__table_map: dict[UpdateOption, dict[str, dict]] = {}
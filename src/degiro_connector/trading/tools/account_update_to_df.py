@@ -0,0 +1,293 @@
+import logging
+import types
+import typing
+
+import polars as pl
+from pydantic import BaseModel
+
+from degiro_connector.trading.models.account import (
+    AccountUpdate,
+    CashFundRow,
+    OrderRow,
+    PortfolioRow,
+    TotalPortfolioRow,
+    UpdateOption,
+)
+
+
+class AccountUpdateToDF:
+    """Convert the sections of the Update endpoint into typed DataFrames.
+
+    Each row of a section is a list of name/value pairs :
+        {"id": "1", "value": [{"name": "size", "value": 10}, ...]}
+
+    The pairs are written straight into the columns of the DataFrame, in a
+    single pass : no intermediate dict nor model is built per row. The
+    columns and their types are the fields of the row models, like
+    `PortfolioRow`, the unknown names are ignored. A value which does not fit
+    the type of its column, like a text in a numeric column, becomes null and
+    is logged.
+
+    Example :
+        account_update = trading_api.get_update(request_list=request_list, raw=True)
+        df_map = AccountUpdateToDF.build_df_map(account_update=account_update)
+        portfolio_df = df_map[UpdateOption.PORTFOLIO]
+    """
+
+    MODEL_MAP: dict[UpdateOption, type[BaseModel]] = {
+        UpdateOption.CASH_FUNDS: CashFundRow,
+        UpdateOption.ORDERS: OrderRow,
+        UpdateOption.PORTFOLIO: PortfolioRow,
+        UpdateOption.TOTAL_PORTFOLIO: TotalPortfolioRow,
+    }
+
+    DTYPE_MAP: dict[type, type[pl.DataType]] = {
+        bool: pl.Boolean,
+        float: pl.Float64,
+        int: pl.Int64,
+        str: pl.Utf8,
+    }
+
+    __schema_cache: dict[type[BaseModel], tuple[dict, dict]] = {}
+
+    @staticmethod
+    def build_logger() -> logging.Logger:
+        return logging.getLogger(__name__)
+
+    @staticmethod
+    def convert_value(value: typing.Any, dtype: type[pl.DataType]) -> typing.Any:
+        """Convert `value` to the Python type of `dtype`.
+
+        Raises:
+            TypeError: The value does not fit the type.
+            ValueError: The value does not fit the type.
+        """
+
+        if value is None:
+            return None
+
+        if dtype is pl.Boolean:
+            if type(value) is not bool:
+                raise TypeError(f"Not a boolean : {value!r}")
+            return value
+
+        if isinstance(value, (bool, dict, list)):
+            raise TypeError(f"Unexpected value : {value!r}")
+
+        if dtype is pl.Float64:
+            return float(value)
+
+        if dtype is pl.Int64:
+            number = float(value)
+            if not number.is_integer():
+                raise ValueError(f"Not an integer : {value!r}")
+            return int(number)
+
+        return str(value)
+
+    @classmethod
+    def build_series(
+        cls,
+        column: str,
+        value_list: list,
+        dtype: type[pl.DataType],
+    ) -> pl.Series:
+        """Typed column, the values which do not fit `dtype` become null."""
+
+        try:
+            return pl.Series(column, value_list, dtype=dtype, strict=True)
+        except TypeError:
+            pass
+
+        converted_list = []
+        error_list = []
+
+        for value in value_list:
+            try:
+                converted_list.append(cls.convert_value(value=value, dtype=dtype))
+            except (TypeError, ValueError):
+                converted_list.append(None)
+                error_list.append(value)
+
+        if error_list:
+            cls.build_logger().warning(
+                "build_series: column=%s dtype=%s invalid=%s first=%r",
+                column,
+                dtype,
+                len(error_list),
+                error_list[0],
+            )
+
+        return pl.Series(column, converted_list, dtype=dtype, strict=True)
+
+    @classmethod
+    def build_df_from_column_map(
+        cls,
+        column_map: dict[str, list],
+        schema: dict[str, type[pl.DataType]],
+    ) -> pl.DataFrame:
+        return pl.DataFrame(
+            [
+                cls.build_series(
+                    column=column,
+                    value_list=value_list,
+                    dtype=schema[column],
+                )
+                for column, value_list in column_map.items()
+            ]
+        )
+
+    @classmethod
+    def build_schema(
+        cls,
+        row_model: type[BaseModel],
+    ) -> tuple[dict[str, str], dict[str, type[pl.DataType]]]:
+        """Columns of a row model.
+
+        Returns:
+            tuple[dict[str, str], dict[str, type[pl.DataType]]]:
+                Column of each API name, like "plBase" => "pl_base".
+                Type of each column.
+        """
+
+        cached = cls.__schema_cache.get(row_model)
+        if cached is not None:
+            return cached
+
+        alias_map = {}
+        schema = {}
+
+        for column, field_info in row_model.model_fields.items():
+            annotation = field_info.annotation
+            if isinstance(annotation, types.UnionType) or (
+                typing.get_origin(annotation) is typing.Union
+            ):
+                annotation = next(
+                    arg for arg in typing.get_args(annotation) if arg is not type(None)
+                )
+            alias_map[field_info.alias or column] = column
+            schema[column] = (
+                cls.DTYPE_MAP.get(annotation, pl.Utf8)
+                if isinstance(annotation, type)
+                else pl.Utf8
+            )
+
+        cls.__schema_cache[row_model] = (alias_map, schema)
+
+        return alias_map, schema
+
+    @classmethod
+    def build_df(cls, option: UpdateOption, value_list: list[dict]) -> pl.DataFrame:
+        """Convert the "value" of a section into a DataFrame.
+
+        Args:
+            option (UpdateOption):
+                Section, one of the keys of `MODEL_MAP`.
+            value_list (list[dict]):
+                Rows of the section, the "isRemoved" rows are skipped.
+        Returns:
+            pl.DataFrame: One row per position, order...
+        """
+
+        alias_map, schema = cls.build_schema(row_model=cls.MODEL_MAP[option])
+
+        # "totalPortfolio" IS A SINGLE ROW OF NAME/VALUE PAIRS
+        if value_list and "name" in value_list[0] and "id" not in value_list[0]:
+            value_list = [{"value": value_list}]
+
+        row_list = [item for item in value_list if not item.get("isRemoved")]
+        row_count = len(row_list)
+        column_map: dict[str, list] = {column: [None] * row_count for column in schema}
+        id_list = column_map.get("id")
+
+        for index, item in enumerate(row_list):
+            if id_list is not None and "id" in item:
+                id_list[index] = str(item["id"])
+
+            for pair in item.get("value") or []:
+                column = alias_map.get(pair.get("name"))
+                if column is None:
+                    continue
+                value = pair.get("value")
+                if type(value) is dict:
+                    # AMOUNTS LIKE "plBase" ARE MAPS OF ONE CURRENCY
+                    value = next(iter(value.values()), None)
+                column_map[column][index] = value
+
+        return cls.build_df_from_column_map(column_map=column_map, schema=schema)
+
+    @classmethod
+    def build_df_map(
+        cls,
+        account_update: AccountUpdate | dict,
+    ) -> dict[UpdateOption, pl.DataFrame]:
+        """Convert each supported section of an Update response.
+
+        Args:
+            account_update (AccountUpdate | dict):
+                Response, preferably raw : it avoids validating it.
+        Returns:
+            dict[UpdateOption, pl.DataFrame]: One DataFrame per section.
+        """
+
+        if isinstance(account_update, AccountUpdate):
+            account_update = account_update.model_dump(by_alias=True, exclude_none=True)
+
+        df_map = {}
+
+        for option in cls.MODEL_MAP:
+            section = account_update.get(option.value)
+            if isinstance(section, dict):
+                df_map[option] = cls.build_df(
+                    option=option,
+                    value_list=section.get("value") or [],
+                )
+
+        return df_map
+
+    @classmethod
+    def build_df_from_table(
+        cls,
+        option: UpdateOption,
+        table: dict[str, dict],
+    ) -> pl.DataFrame:
+        """Convert a table of `AccountState`, like `account_state.portfolio`."""
+
+        alias_map, schema = cls.build_schema(row_model=cls.MODEL_MAP[option])
+        column_map: dict[str, list] = {column: [] for column in schema}
+
+        for row_id, row in table.items():
+            for alias, column in alias_map.items():
+                value = row.get(alias)
+                if type(value) is dict:
+                    value = next(iter(value.values()), None)
+                column_map[column].append(value)
+            if "id" in column_map and column_map["id"][-1] is None:
+                column_map["id"][-1] = row_id
+
+        return cls.build_df_from_column_map(column_map=column_map, schema=schema)
+
+    @classmethod
+    def build_row_list(
+        cls,
+        option: UpdateOption,
+        value_list: list[dict],
+    ) -> list[BaseModel]:
+        """Typed rows of a section, when models are preferred to a DataFrame."""
+
+        row_model = cls.MODEL_MAP[option]
+
+        if value_list and "name" in value_list[0] and "id" not in value_list[0]:
+            value_list = [{"value": value_list}]
+
+        row_list = []
+
+        for item in value_list:
+            if item.get("isRemoved"):
+                continue
+            row = {pair["name"]: pair.get("value") for pair in item.get("value") or []}
+            if "id" in item:
+                row["id"] = str(item["id"])
+            row_list.append(row_model.model_validate(row))
+
+        return row_list
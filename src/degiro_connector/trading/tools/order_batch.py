@@ -0,0 +1,285 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Callable, Sequence
+
+import requests
+
+from degiro_connector.core.helpers.rate_limiter import RateLimiter
+from degiro_connector.core.helpers.retry import RequestTrace, retry_context
+from degiro_connector.trading.actions.action_submit_order import ActionSubmitOrder
+from degiro_connector.trading.models.order import (
+    CheckingResponse,
+    Order,
+    OrderResult,
+    SubmissionResponse,
+)
+
+
+class OrderBatch:
+    """Check, place or delete many orders concurrently.
+
+    At most `max_workers` orders are processed at once and all the requests
+    share a `RateLimiter` : the same limiter can be given to several batches,
+    or to other tools, to honour one global rate limit.
+
+    The results are returned in the order of the input, one `OrderResult` per
+    item : a failed item does not stop the others. Its `error` describes the
+    failure of the request, like the status and the body of the response.
+
+    When the confirmation of a checked order fails, the `response` keeps the
+    `CheckingResponse` and `possibly_placed` tells whether the order may exist
+    anyway, like after a timeout.
+
+    The default `ModelSession` gives each thread its own connection : use one
+    with a `PooledAdapter` to share a bounded pool instead.
+
+    Example :
+        with OrderBatch(trading_api=trading_api, max_workers=8) as order_batch:
+            order_result_list = order_batch.confirm_orders(order_list=order_list)
+
+        for order_result in order_result_list:
+            if not order_result.succeeded:
+                print("FAILED", order_result.item, order_result.error)
+    """
+
+    @property
+    def max_workers(self) -> int:
+        return self.__max_workers
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self.__rate_limiter
+
+    @staticmethod
+    def build_error(request_trace: RequestTrace) -> Exception:
+        """Failure of the last request of `request_trace`."""
+
+        error = request_trace.error
+        response = request_trace.response
+
+        if isinstance(error, Exception):
+            return error
+
+        if response is None:
+            return ConnectionError("Request failed : no request was sent.")
+
+        return requests.HTTPError(
+            f"Request failed : status={response.status_code}",
+            response=response,
+        )
+
+    def request(
+        self,
+        action: Callable[..., Any],
+        is_success: Callable[[Any], bool] | None = None,
+        **kwargs,
+    ) -> Any:
+        """Call an action under the rate limit.
+
+        Args:
+            action (Callable[..., Any]):
+                Action to call with `kwargs`.
+            is_success (Callable[[Any], bool], optional):
+                Whether or not a result is a success, any result except None
+                if None.
+                Defaults to None.
+
+        Raises:
+            Exception:
+                The action failed : the exception of its last request, or a
+                "requests.HTTPError" with its response.
+        """
+
+        self.__rate_limiter.acquire()
+
+        with retry_context() as request_trace:
+            result = action(**kwargs)
+
+        if is_success is None:
+            succeeded = result is not None
+        else:
+            succeeded = is_success(result)
+
+        if not succeeded:
+            raise self.build_error(request_trace=request_trace)
+
+        return result
+
+    def run(
+        self,
+        function: Callable[[int], Any],
+        item_list: Sequence[Order | str],
+    ) -> list[OrderResult]:
+        """Call `function` with the index of each item, concurrently."""
+
+        def process(index: int) -> OrderResult:
+            item = item_list[index]
+            try:
+                response = function(index)
+            except Exception as e:
+                error = ActionSubmitOrder.build_error(error=e)
+                self.__logger.info("run: index=%s error=%s", index, error)
+                return OrderResult(index=index, item=item, error=error)
+
+            if isinstance(response, SubmissionResponse) and not response.confirmed:
+                return OrderResult(
+                    index=index,
+                    item=item,
+                    response=response,
+                    error=response.confirmation_error,
+                    possibly_placed=response.possibly_placed,
+                )
+
+            return OrderResult(index=index, item=item, response=response)
+
+        return list(self.__executor.map(process, range(len(item_list))))
+
+    def check_one(self, order: Order) -> CheckingResponse:
+        return self.request(action=self.__trading_api.check_order, order=order)
+
+    def confirm_one(
+        self,
+        order: Order,
+        confirmation_id: str | None = None,
+    ) -> SubmissionResponse:
+        trading_api = self.__trading_api
+        start_ns = time.perf_counter_ns()
+
+        if confirmation_id is None:
+            checking_response = self.check_one(order=order)
+        else:
+            checking_response = CheckingResponse(confirmation_id=confirmation_id)
+
+        confirmation_response = None
+        confirmation_error = None
+        possibly_placed = False
+
+        try:
+            confirmation_response = self.request(
+                action=trading_api.confirm_order,
+                confirmation_id=checking_response.confirmation_id,
+                order=order,
+            )
+        except Exception as e:
+            confirmation_error = ActionSubmitOrder.build_error(error=e)
+            possibly_placed = ActionSubmitOrder.is_possibly_placed(error=e)
+
+        return SubmissionResponse(
+            checking_response=checking_response,
+            confirmation_response=confirmation_response,
+            confirmation_error=confirmation_error,
+            possibly_placed=possibly_placed,
+            request_duration=timedelta(
+                microseconds=(time.perf_counter_ns() - start_ns) // 1000
+            ),
+        )
+
+    def delete_one(self, order_id: str) -> bool:
+        # `delete_order` RETURNS False FOR A STATUS OTHER THAN 200
+        return self.request(
+            action=self.__trading_api.delete_order,
+            is_success=lambda result: result is True,
+            order_id=order_id,
+        )
+
+    def check_orders(self, order_list: Sequence[Order]) -> list[OrderResult]:
+        """Check the orders, `response` is a `CheckingResponse`."""
+
+        return self.run(
+            function=lambda index: self.check_one(order=order_list[index]),
+            item_list=order_list,
+        )
+
+    def confirm_orders(
+        self,
+        order_list: Sequence[Order],
+        confirmation_id_list: Sequence[str | None] | None = None,
+    ) -> list[OrderResult]:
+        """Check then confirm the orders, `response` is a `SubmissionResponse`.
+
+        A failed checking gives a result without `response`. A failed
+        confirmation gives a `SubmissionResponse` without
+        `confirmation_response`, see `OrderResult.possibly_placed`.
+
+        Args:
+            order_list (Sequence[Order]):
+                Orders to place.
+            confirmation_id_list (Sequence[str], optional):
+                Confirmation ids from a previous `check_orders`, one per order.
+                The checking is skipped if provided.
+                Defaults to None.
+        """
+
+        if confirmation_id_list is None:
+            confirmation_id_list = [None] * len(order_list)
+        elif len(confirmation_id_list) != len(order_list):
+            raise AttributeError("One `confirmation_id` per order is required.")
+
+        return self.run(
+            function=lambda index: self.confirm_one(
+                order=order_list[index],
+                confirmation_id=confirmation_id_list[index],
+            ),
+            item_list=order_list,
+        )
+
+    def delete_orders(self, order_id_list: Sequence[str]) -> list[OrderResult]:
+        """Delete the orders, `response` is True."""
+
+        return self.run(
+            function=lambda index: self.delete_one(order_id=order_id_list[index]),
+            item_list=order_id_list,
+        )
+
+    def close(self):
+        self.__executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "OrderBatch":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __init__(
+        self,
+        trading_api,
+        logger: logging.Logger | None = None,
+        max_workers: int = 8,
+        rate: float = 10.0,
+        burst: int | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ):
+        """
+        Args:
+            trading_api (degiro_connector.trading.api.API):
+                Connected Trading API.
+            logger (logging.Logger, optional):
+                This object will be generated if None.
+                Defaults to None.
+            max_workers (int, optional):
+                Number of orders processed at once.
+                Defaults to 8.
+            rate (float, optional):
+                Maximum number of requests per second, used if `rate_limiter`
+                is None.
+                Defaults to 10.0.
+            burst (int, optional):
+                Number of requests which can be sent at once, used if
+                `rate_limiter` is None, see `RateLimiter`.
+                Defaults to None.
+            rate_limiter (RateLimiter, optional):
+                Limiter shared with other tools, generated if None.
+                Defaults to None.
+        """
+
+        self.__trading_api = trading_api
+        self.__logger = logger or logging.getLogger(self.__module__)
+        self.__max_workers = max_workers
+        self.__rate_limiter = rate_limiter or RateLimiter(rate=rate, burst=burst)
+
+        self.__executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=self.__class__.__name__,
+        )
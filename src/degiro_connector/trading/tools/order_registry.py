@@ -0,0 +1,426 @@
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from queue import Full, Queue
+from typing import Any
+
+from degiro_connector.trading.models.account import (
+    AccountEvent,
+    AccountEventType,
+    UpdateOption,
+)
+from degiro_connector.trading.models.order import (
+    ConfirmationResponse,
+    Order,
+    OrderEvent,
+    OrderStatus,
+    WorkingOrder,
+)
+from degiro_connector.trading.tools.account_state import AccountState
+
+
+class OrderRegistry:
+    """In-memory book of the working orders, indexed by `order_id`.
+
+    * `confirm_order` registers the order as soon as its `order_id` is known,
+    with the status PENDING.
+    * `update_order` and `delete_order` change the registered order once the
+    API accepted the change.
+    * `apply_event_list` reconciles the registry with the deltas of the
+    "orders" and "historicalOrders" options of the Update endpoint :
+        * an order seen in the "orders" is WORKING,
+        * a historical order tells whether it was FILLED, PARTIALLY_FILLED or
+        CANCELLED,
+        * an order gone from the "orders" without historical order is CLOSED,
+        until its historical order arrives.
+
+    The updates can arrive before `confirm_order` returns : the deltas of the
+    unknown orders are kept, up to `UNMATCHED_MAX_COUNT` orders, and applied
+    when the order is registered. Registering never downgrades the status of
+    an order already seen in the updates.
+
+    Each change emits one `OrderEvent`.
+
+    Example :
+        order_registry = OrderRegistry()
+        order_registry.confirm_order(
+            trading_api=trading_api,
+            confirmation_id=checking_response.confirmation_id,
+            order=order,
+        )
+        while order_registry.working_orders:
+            for order_event in order_registry.refresh(trading_api=trading_api):
+                print(order_event.order_id, order_event.status)
+            time.sleep(1)
+    """
+
+    FILLED_STATUS_SET = {"EXECUTED", "FILLED"}
+    CANCELLED_STATUS_SET = {"CANCELLED", "DELETED", "EXPIRED", "REJECTED"}
+    FINAL_STATUS_SET = {OrderStatus.FILLED, OrderStatus.CANCELLED}
+    UNMATCHED_MAX_COUNT = 1000
+
+    @classmethod
+    def build_outcome(cls, row: dict[str, Any]) -> tuple[OrderStatus | None, float]:
+        """Status of an order from its historical order.
+
+        Returns:
+            tuple[OrderStatus | None, float]:
+                Status, None if still unknown, and traded size.
+        """
+
+        status = str(row.get("status") or "").upper()
+        size = row.get("size") or 0
+        traded_size = row.get("totalTradedSize") or 0
+
+        if status in cls.FILLED_STATUS_SET or (size and traded_size >= size):
+            return OrderStatus.FILLED, traded_size
+
+        if status in cls.CANCELLED_STATUS_SET:
+            return OrderStatus.CANCELLED, traded_size
+
+        if traded_size > 0:
+            return OrderStatus.PARTIALLY_FILLED, traded_size
+
+        return None, traded_size
+
+    @property
+    def account_state(self) -> AccountState:
+        return self.__account_state
+
+    @property
+    def queue(self) -> Queue | None:
+        return self.__queue
+
+    @property
+    def order_map(self) -> dict[str, WorkingOrder]:
+        """Copy of all the registered orders, including the closed ones."""
+
+        with self.__lock:
+            return {
+                order_id: working_order.model_copy(deep=True)
+                for order_id, working_order in self.__order_map.items()
+            }
+
+    @property
+    def working_orders(self) -> dict[str, WorkingOrder]:
+        """Copy of the open orders."""
+
+        with self.__lock:
+            return {
+                order_id: working_order.model_copy(deep=True)
+                for order_id, working_order in self.__order_map.items()
+                if working_order.is_open
+            }
+
+    def get(self, order_id: str) -> WorkingOrder | None:
+        with self.__lock:
+            working_order = self.__order_map.get(order_id)
+            return (
+                None if working_order is None else working_order.model_copy(deep=True)
+            )
+
+    def change(
+        self,
+        order_id: str,
+        status: OrderStatus | None = None,
+        change_map: dict | None = None,
+        traded_size: float | None = None,
+    ) -> OrderEvent | None:
+        """Change a registered order, creating it if needed.
+
+        Returns:
+            OrderEvent | None: The change, None if nothing changed.
+        """
+
+        with self.__lock:
+            working_order = self.__order_map.get(order_id)
+            previous_status = None if working_order is None else working_order.status
+
+            if working_order is None:
+                working_order = WorkingOrder(
+                    order_id=order_id,
+                    status=status or OrderStatus.WORKING,
+                )
+                self.__order_map[order_id] = working_order
+
+            change_map = {
+                name: value
+                for name, value in (change_map or {}).items()
+                if working_order.row.get(name, ...) != value
+            }
+            status = status or working_order.status
+
+            if (
+                status == previous_status
+                and not change_map
+                and (traded_size is None or traded_size == working_order.traded_size)
+            ):
+                return None
+
+            working_order.row.update(change_map)
+            working_order.status = status
+            working_order.updated = datetime.now()
+            if traded_size is not None:
+                working_order.traded_size = traded_size
+
+            return OrderEvent(
+                order_id=order_id,
+                status=status,
+                previous_status=previous_status,
+                change_map=change_map,
+                working_order=working_order.model_copy(deep=True),
+            )
+
+    def register(
+        self,
+        order: Order,
+        confirmation_response: ConfirmationResponse,
+    ) -> OrderEvent | None:
+        """Add a confirmed order, then apply its updates received so far.
+
+        Returns:
+            OrderEvent | None:
+                The registration, None if the order was already known with the
+                same fields. The changes from the updates are published too.
+        """
+
+        order_id = confirmation_response.order_id
+        row = order.model_dump(by_alias=True, exclude_none=True, mode="json")
+        row["id"] = order_id
+
+        with self.__lock:
+            working_order = self.__order_map.get(order_id)
+
+            if working_order is None:
+                status = OrderStatus.PENDING
+            else:
+                # THE UPDATES ALREADY SAW THIS ORDER : KEEP THEIR STATUS
+                status = None
+                row = {
+                    name: value
+                    for name, value in row.items()
+                    if name not in working_order.row
+                }
+
+            order_event = self.change(
+                order_id=order_id,
+                status=status,
+                change_map=row,
+            )
+            event_list = [order_event] if order_event else []
+
+            for account_event in self.__unmatched_map.pop(order_id, []):
+                unmatched_event = self.apply(account_event=account_event)
+                if unmatched_event is not None:
+                    event_list.append(unmatched_event)
+
+        self.publish(event_list=event_list)
+
+        return order_event
+
+    def confirm_order(
+        self,
+        trading_api,
+        confirmation_id: str,
+        order: Order,
+    ) -> ConfirmationResponse | None:
+        """Call `trading_api.confirm_order` and register the order."""
+
+        confirmation_response = trading_api.confirm_order(
+            confirmation_id=confirmation_id,
+            order=order,
+        )
+
+        if isinstance(confirmation_response, ConfirmationResponse):
+            self.register(order=order, confirmation_response=confirmation_response)
+
+        return confirmation_response
+
+    def update_order(self, trading_api, order: Order) -> bool | None:
+        """Call `trading_api.update_order` and apply the change."""
+
+        result = trading_api.update_order(order=order)
+
+        if result and order.id is not None:
+            change_map = order.model_dump(by_alias=True, exclude_none=True, mode="json")
+            order_event = self.change(order_id=order.id, change_map=change_map)
+            self.publish(event_list=[order_event] if order_event else [])
+
+        return result
+
+    def delete_order(self, trading_api, order_id: str) -> bool | None:
+        """Call `trading_api.delete_order` and mark the order as CANCELLED."""
+
+        result = trading_api.delete_order(order_id=order_id)
+
+        if result:
+            order_event = self.change(order_id=order_id, status=OrderStatus.CANCELLED)
+            self.publish(event_list=[order_event] if order_event else [])
+
+        return result
+
+    def apply(self, account_event: AccountEvent) -> OrderEvent | None:
+        """Reconcile the registry with one change of the Update endpoint."""
+
+        option = account_event.option
+        row = account_event.row or {}
+
+        if option == UpdateOption.HISTORICAL_ORDERS:
+            if account_event.type == AccountEventType.REMOVED:
+                return None
+
+            order_id = str(row.get("orderId") or account_event.id)
+            status, traded_size = self.build_outcome(row=row)
+
+            with self.__lock:
+                working_order = self.__order_map.get(order_id)
+
+                # NOT YET REGISTERED, OR PLACED BEFORE THE REGISTRY EXISTED
+                if working_order is None:
+                    self.keep_unmatched(order_id=order_id, account_event=account_event)
+                    return None
+
+                # THE HISTORICAL ORDER IS AUTHORITATIVE : A DELETED ORDER CAN
+                # STILL BE FILLED
+                if status is None or working_order.status == OrderStatus.FILLED:
+                    return None
+
+                return self.change(
+                    order_id=order_id,
+                    status=status,
+                    traded_size=traded_size,
+                )
+
+        if option != UpdateOption.ORDERS:
+            return None
+
+        order_id = account_event.id
+
+        with self.__lock:
+            working_order = self.__order_map.get(order_id)
+            status = None if working_order is None else working_order.status
+
+            if account_event.type == AccountEventType.REMOVED:
+                if working_order is None:
+                    self.keep_unmatched(order_id=order_id, account_event=account_event)
+                    return None
+                if not working_order.is_open:
+                    return None
+                return self.change(order_id=order_id, status=OrderStatus.CLOSED)
+
+            if status in self.FINAL_STATUS_SET or status == OrderStatus.CLOSED:
+                # LATE UPDATE OF A CLOSED ORDER
+                return None
+
+            if status in {None, OrderStatus.PENDING}:
+                status = OrderStatus.WORKING
+
+            return self.change(
+                order_id=order_id,
+                status=status,
+                change_map=account_event.change_map,
+            )
+
+    def keep_unmatched(self, order_id: str, account_event: AccountEvent):
+        """Keep the update of an unknown order, for `register`."""
+
+        with self.__lock:
+            unmatched_map = self.__unmatched_map
+            unmatched_map.setdefault(order_id, []).append(account_event)
+            unmatched_map.move_to_end(order_id)
+
+            while len(unmatched_map) > self.UNMATCHED_MAX_COUNT:
+                unmatched_map.popitem(last=False)
+
+    def apply_event_list(self, event_list: list[AccountEvent]) -> list[OrderEvent]:
+        order_event_list = []
+
+        for account_event in event_list:
+            order_event = self.apply(account_event=account_event)
+            if order_event is not None:
+                order_event_list.append(order_event)
+
+        self.publish(event_list=order_event_list)
+
+        return order_event_list
+
+    def publish(self, event_list: list[OrderEvent]):
+        queue = self.__queue
+
+        if queue is None:
+            return
+
+        for order_event in event_list:
+            try:
+                queue.put_nowait(order_event)
+            except Full:
+                self.__logger.warning("publish: queue is full, event dropped.")
+
+    def refresh(self, trading_api) -> list[OrderEvent] | None:
+        """Fetch the deltas of the orders with `account_state` and apply them.
+
+        Returns:
+            list[OrderEvent] | None:
+                Orders which changed, None if the request failed.
+        """
+
+        event_list = self.__account_state.refresh(trading_api=trading_api)
+
+        if event_list is None:
+            return None
+
+        return self.apply_event_list(event_list=event_list)
+
+    def prune(self) -> int:
+        """Forget the FILLED and CANCELLED orders.
+
+        Returns:
+            int: Number of forgotten orders.
+        """
+
+        with self.__lock:
+            order_id_list = [
+                order_id
+                for order_id, working_order in self.__order_map.items()
+                if working_order.status in self.FINAL_STATUS_SET
+            ]
+            for order_id in order_id_list:
+                del self.__order_map[order_id]
+
+        return len(order_id_list)
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self.__order_map
+
+    def __len__(self) -> int:
+        return len(self.__order_map)
+
+    def __init__(
+        self,
+        account_state: AccountState | None = None,
+        queue: Queue | None = None,
+        logger: logging.Logger | None = None,
+    ):
+        """
+        Args:
+            account_state (AccountState, optional):
+                State used by `refresh`, created for the "orders" and the
+                "historicalOrders" if None.
+                Defaults to None.
+            queue (Queue, optional):
+                Queue receiving the `OrderEvent`, not used if None.
+                Defaults to None.
+            logger (logging.Logger, optional):
+                This object will be generated if None.
+                Defaults to None.
+        """
+
+        self.__account_state = account_state or AccountState(
+            option_list=[UpdateOption.HISTORICAL_ORDERS, UpdateOption.ORDERS],
+        )
+        self.__queue = queue
+        self.__logger = logger or logging.getLogger(self.__module__)
+        self.__lock = threading.RLock()
+        self.__order_map: dict[str, WorkingOrder] = {}
+        self.__unmatched_map: OrderedDict[str, list[AccountEvent]] = OrderedDict()
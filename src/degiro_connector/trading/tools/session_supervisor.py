@@ -0,0 +1,263 @@
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+from degiro_connector.core.helpers.retry import retry_context
+from degiro_connector.core.models.model_connection import ModelConnection
+
+
+class SupervisedAction:
+    """Idempotent action retried once after a re-login.
+
+    The action is retried when the session is missing or expired, or when the
+    API answered 401 to one of its own requests. When the re-login fails, the
+    outcome of the first attempt is returned, or its exception raised.
+    """
+
+    def __call__(self, *args, **kwargs) -> Any:
+        supervisor = self.__supervisor
+        generation = supervisor.generation
+        result = None
+
+        with retry_context() as request_trace:
+            try:
+                result = self.__action(*args, **kwargs)
+            except (ConnectionError, TimeoutError) as e:
+                supervisor.logger.info("%s: %s", self.__name, e)
+                error: Exception | None = e
+            else:
+                if not request_trace.unauthorized:
+                    return result
+                error = None
+
+        if not supervisor.relogin(generation=generation):
+            if error is not None:
+                raise error
+            return result
+
+        return self.__action(*args, **kwargs)
+
+    def __getattr__(self, item):
+        return getattr(self.__action, item)
+
+    def __init__(self, action: Callable, name: str, supervisor: "SessionSupervisor"):
+        self.__action = action
+        self.__name = name
+        self.__supervisor = supervisor
+
+
+class SessionSupervisor:
+    """Keep a Trading API session alive, opt-in.
+
+    * When the session has been idle for `timeout - refresh_margin` seconds,
+    a lightweight request is sent to refresh it.
+    * When the session is missing, expired or rejected (401), the credentials
+    are used to log in again, including the TOTP of `totp_secret_key`.
+    * The read actions, like `get_update` or `product_search`, are retried
+    once after such a re-login : their callers do not see the rollover.
+
+    The orders actions are never retried : sending them twice is not safe.
+
+    Example :
+        trading_api = TradingAPI(credentials=credentials)
+        trading_api.connect()
+        session_supervisor = SessionSupervisor(trading_api=trading_api)
+        session_supervisor.start()
+
+        # SURVIVES THE SESSION EXPIRY
+        account_update = trading_api.get_update(request_list=request_list)
+    """
+
+    READ_ACTION_PREFIX_LIST = ["get_"]
+    READ_ACTION_LIST = ["product_search"]
+
+    __thread: threading.Thread | None
+
+    @classmethod
+    def is_read_action(cls, action: str) -> bool:
+        return action in cls.READ_ACTION_LIST or any(
+            action.startswith(prefix) for prefix in cls.READ_ACTION_PREFIX_LIST
+        )
+
+    @property
+    def connection_storage(self) -> ModelConnection:
+        return self.__trading_api.connection_storage
+
+    @property
+    def generation(self) -> int:
+        """Number of successful re-logins."""
+
+        return self.__generation
+
+    @property
+    def logger(self) -> logging.Logger:
+        return self.__logger
+
+    @property
+    def running(self) -> bool:
+        thread = self.__thread
+
+        return thread is not None and thread.is_alive()
+
+    def install(self):
+        """Wrap the read actions of the Trading API with `SupervisedAction`."""
+
+        trading_api = self.__trading_api
+
+        for action in trading_api.action_list:
+            if not self.is_read_action(action=action):
+                continue
+            action_instance = getattr(trading_api, action)
+            if isinstance(action_instance, SupervisedAction):
+                continue
+            setattr(
+                trading_api,
+                action,
+                SupervisedAction(action=action_instance, name=action, supervisor=self),
+            )
+
+    def relogin(self, generation: int | None = None) -> bool:
+        """Log in again.
+
+        Args:
+            generation (int, optional):
+                `generation` seen before the failure : if another thread already
+                logged in again since, nothing is done.
+                Defaults to None.
+        Returns:
+            bool: Whether or not a session is available.
+        """
+
+        logger = self.__logger
+
+        with self.__lock:
+            if generation is not None and generation != self.__generation:
+                return True
+
+            try:
+                self.__trading_api.connect()
+            except Exception as e:
+                logger.fatal(e)
+                return False
+
+            self.__generation += 1
+            logger.info("relogin: generation=%s", self.__generation)
+
+            return True
+
+    def keepalive(self) -> bool:
+        """Send a lightweight request to refresh the session."""
+
+        with retry_context() as request_trace:
+            try:
+                result = self.__action_keepalive(request_list=[], raw=True)
+            except (ConnectionError, TimeoutError):
+                return False
+
+        return result is not None and not request_trace.unauthorized
+
+    def check(self) -> float:
+        """Refresh or renew the session if needed.
+
+        Returns:
+            float: Seconds before the next check.
+        """
+
+        connection_storage = self.connection_storage
+        idle = time.monotonic() - connection_storage.last_success
+        remaining = connection_storage.timeout - idle
+
+        if not connection_storage.connected.is_set() or remaining <= 0:
+            generation = self.__generation
+            if not self.relogin(generation=generation):
+                return self.__retry_delay
+        elif remaining <= self.__refresh_margin:
+            generation = self.__generation
+            if not self.keepalive() and not self.relogin(generation=generation):
+                return self.__retry_delay
+
+        idle = time.monotonic() - connection_storage.last_success
+        remaining = connection_storage.timeout - idle - self.__refresh_margin
+
+        return min(self.__check_interval, max(remaining, self.__retry_delay))
+
+    def run(self):
+        logger = self.__logger
+        stop_event = self.__stop_event
+
+        while not stop_event.is_set():
+            try:
+                delay = self.check()
+            except Exception as e:
+                logger.fatal(e)
+                delay = self.__retry_delay
+
+            stop_event.wait(timeout=delay)
+
+    def start(self):
+        if self.running:
+            return
+
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(
+            target=self.run,
+            name=self.__class__.__name__,
+            daemon=True,
+        )
+        self.__thread.start()
+
+    def stop(self, timeout: float | None = None):
+        self.__stop_event.set()
+        thread = self.__thread
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+
+    def __init__(
+        self,
+        trading_api,
+        check_interval: float = 60.0,
+        install: bool = True,
+        logger: logging.Logger | None = None,
+        refresh_margin: float = 300.0,
+        retry_delay: float = 10.0,
+    ):
+        """
+        Args:
+            trading_api (degiro_connector.trading.api.API):
+                Trading API to supervise.
+            check_interval (float, optional):
+                Longest delay between two checks, in seconds.
+                Defaults to 60.0.
+            install (bool, optional):
+                Whether or not to wrap the read actions, see `install`.
+                Defaults to True.
+            logger (logging.Logger, optional):
+                This object will be generated if None.
+                Defaults to None.
+            refresh_margin (float, optional):
+                The session is refreshed when it would expire within this
+                delay, in seconds.
+                Defaults to 300.0.
+            retry_delay (float, optional):
+                Delay before the next check after a failed re-login, in seconds.
+                Defaults to 10.0.
+        """
+
+        self.__trading_api = trading_api
+        self.__check_interval = check_interval
+        self.__logger = logger or logging.getLogger(self.__module__)
+        self.__refresh_margin = refresh_margin
+        self.__retry_delay = retry_delay
+
+        self.__lock = threading.Lock()
+        self.__stop_event = threading.Event()
+        self.__thread = None
+        self.__generation = 0
+
+        # THE KEEPALIVE IS NOT RETRIED : IT IS RESOLVED BEFORE `install`
+        self.__action_keepalive = trading_api.get_update
+
+        if install:
+            self.install()
@@ -0,0 +1,445 @@
+import logging
+import threading
+import time
+from queue import Full, Queue
+
+from degiro_connector.core.helpers.retry import retry_context
+from degiro_connector.trading.models.account import (
+    AccountEvent,
+    AccountEventType,
+    UpdateOption,
+)
+from degiro_connector.trading.tools.account_state import AccountState
+
+
+class UpdatePoller:
+    """Poll the Update endpoint on a dedicated thread, at an adaptive pace.
+
+    Each `UpdateOption` has its own interval :
+        * it grows by `backoff` after each poll without any change, up to
+        `max_interval`,
+        * it goes back to its base value as soon as something changes,
+        * the orders are polled every `open_order_interval` while some orders
+        are open,
+        * the orders and the portfolio are polled every `fast_interval` during
+        `boost_duration` seconds after a `boost`, which happens when an order
+        appears or when `boost` is called, for instance after `confirm_order`.
+        The orders returned by a full refresh, like the first one, do not
+        trigger it.
+
+    The due options are fetched with a single request, whatever the number of
+    subscribers. Since each request refreshes the `ModelConnection`, the
+    session stays alive as long as `max_interval` is shorter than its timeout.
+    A request rejected with the status 401 triggers `reconnect` right away.
+
+    Example :
+        update_poller = UpdatePoller(trading_api=trading_api)
+        queue = update_poller.subscribe(option_list=[UpdateOption.ORDERS])
+        update_poller.start()
+
+        trading_api.confirm_order(confirmation_id=confirmation_id, order=order)
+        update_poller.boost()
+
+        account_event = queue.get()
+    """
+
+    DEFAULT_INTERVAL_MAP = {
+        UpdateOption.CASH_FUNDS: 60.0,
+        UpdateOption.ORDERS: 5.0,
+        UpdateOption.PORTFOLIO: 10.0,
+        UpdateOption.TOTAL_PORTFOLIO: 30.0,
+    }
+    BOOSTED_OPTION_SET = {UpdateOption.ORDERS, UpdateOption.PORTFOLIO}
+
+    __boost_deadline: float
+    __started_generation: int
+    __subscriber_list: list[tuple[set[UpdateOption] | None, Queue]]
+    __thread: threading.Thread | None
+
+    @property
+    def account_state(self) -> AccountState:
+        return self.__account_state
+
+    @property
+    def interval_map(self) -> dict[UpdateOption, float]:
+        """Current interval of each option."""
+
+        with self.__lock:
+            return dict(self.__interval_map)
+
+    @property
+    def option_list(self) -> list[UpdateOption]:
+        with self.__lock:
+            return list(self.__due_map)
+
+    @property
+    def poll_count(self) -> int:
+        return self.__poll_count
+
+    @property
+    def running(self) -> bool:
+        thread = self.__thread
+
+        return thread is not None and thread.is_alive()
+
+    def subscribe(
+        self,
+        option_list: list[UpdateOption] | None = None,
+        queue: Queue | None = None,
+    ) -> Queue:
+        """Receive the `AccountEvent` of some options.
+
+        Args:
+            option_list (list[UpdateOption], optional):
+                Options to receive, all the polled options if None.
+                The missing options are added to the polled ones.
+                Defaults to None.
+            queue (Queue, optional):
+                Queue receiving the events, created if None.
+                Defaults to None.
+        Returns:
+            Queue: Queue receiving the events.
+        """
+
+        queue = queue if queue is not None else Queue(maxsize=self.__queue_maxsize)
+        option_set = set(option_list) if option_list else None
+
+        with self.__lock:
+            self.__subscriber_list.append((option_set, queue))
+            for option in option_list or []:
+                if option not in self.__due_map:
+                    self.__interval_map[option] = self.__base_interval_map.get(
+                        option,
+                        self.__max_interval,
+                    )
+                    self.__due_map[option] = 0.0
+
+        self.__wake_event.set()
+
+        return queue
+
+    def unsubscribe(self, queue: Queue):
+        with self.__lock:
+            self.__subscriber_list = [
+                (option_set, subscriber_queue)
+                for option_set, subscriber_queue in self.__subscriber_list
+                if subscriber_queue is not queue
+            ]
+
+    def publish(self, event_list: list[AccountEvent]):
+        with self.__lock:
+            subscriber_list = list(self.__subscriber_list)
+
+        for account_event in event_list:
+            for option_set, queue in subscriber_list:
+                if option_set is not None and account_event.option not in option_set:
+                    continue
+                try:
+                    queue.put_nowait(account_event)
+                except Full:
+                    self.__logger.warning("publish: queue is full, event dropped.")
+
+    def boost(self, duration: float | None = None):
+        """Poll the orders and the portfolio quickly for a while."""
+
+        duration = self.__boost_duration if duration is None else duration
+        now = time.monotonic()
+
+        with self.__lock:
+            self.__boost_deadline = max(self.__boost_deadline, now + duration)
+            for option in self.BOOSTED_OPTION_SET:
+                if option in self.__due_map:
+                    self.__due_map[option] = min(self.__due_map[option], now)
+
+        self.__wake_event.set()
+
+    def build_interval(
+        self,
+        option: UpdateOption,
+        changed: bool,
+        now: float,
+    ) -> float:
+        """Next interval of an option which was just polled."""
+
+        base_interval = self.__base_interval_map.get(option, self.__max_interval)
+
+        if changed:
+            interval = base_interval
+        else:
+            interval = min(
+                self.__interval_map.get(option, base_interval) * self.__backoff,
+                max(base_interval, self.__max_interval),
+            )
+
+        if option in self.BOOSTED_OPTION_SET and now < self.__boost_deadline:
+            interval = min(interval, self.__fast_interval)
+
+        if option == UpdateOption.ORDERS and self.__account_state.orders:
+            interval = min(interval, self.__open_order_interval)
+
+        return interval
+
+    def get_due_option_list(self, now: float) -> list[UpdateOption]:
+        """Due options, plus the ones due soon : they share the request."""
+
+        with self.__lock:
+            return [
+                option
+                for option, due in self.__due_map.items()
+                if due <= now + self.__coalesce_window
+            ]
+
+    def poll(
+        self,
+        option_list: list[UpdateOption] | None = None,
+    ) -> list[AccountEvent] | None:
+        """Fetch some options now, all the polled options if None.
+
+        Returns:
+            list[AccountEvent] | None:
+                Rows which changed, None if the request failed. A failure with
+                the status 401 calls `reconnect`.
+        """
+
+        option_list = option_list or self.option_list
+
+        if not option_list:
+            return []
+
+        # A TOKEN OF 0 FETCHES THE FULL TABLE : ITS ROWS ARE NOT NEW
+        full_refresh = (
+            self.__account_state.last_updated_map.get(UpdateOption.ORDERS, 0) == 0
+        )
+
+        with retry_context() as request_trace:
+            event_list = self.__account_state.refresh(
+                trading_api=self.__trading_api,
+                option_list=option_list,
+            )
+        self.__poll_count += 1
+        now = time.monotonic()
+
+        if event_list is None and request_trace.unauthorized:
+            # SESSION EXPIRED
+            self.__logger.info("poll: unauthorized, reconnecting.")
+            self.reconnect(option_list=option_list)
+            return None
+
+        if event_list is None:
+            with self.__lock:
+                for option in option_list:
+                    self.__due_map[option] = now + self.__retry_delay
+            return None
+
+        changed_set = {account_event.option for account_event in event_list}
+
+        if not full_refresh and any(
+            account_event.option == UpdateOption.ORDERS
+            and account_event.type == AccountEventType.ADDED
+            for account_event in event_list
+        ):
+            self.boost()
+
+        with self.__lock:
+            for option in option_list:
+                interval = self.build_interval(
+                    option=option,
+                    changed=option in changed_set,
+                    now=now,
+                )
+                self.__interval_map[option] = interval
+                self.__due_map[option] = now + interval
+
+        self.publish(event_list=event_list)
+
+        return event_list
+
+    def refresh(self, timeout: float | None = None) -> bool:
+        """Wait for a poll of all the options, started after this call.
+
+        The concurrent calls share the same poll.
+
+        Returns:
+            bool: Whether or not the poll happened before the timeout.
+        """
+
+        with self.__condition:
+            target_generation = self.__started_generation + 1
+            self.__refresh_pending = True
+            self.__wake_event.set()
+
+            return self.__condition.wait_for(
+                lambda: self.__completed_generation >= target_generation,
+                timeout=timeout,
+            )
+
+    def run(self):
+        logger = self.__logger
+        stop_event = self.__stop_event
+        wake_event = self.__wake_event
+
+        while not stop_event.is_set():
+            now = time.monotonic()
+
+            with self.__condition:
+                if self.__refresh_pending:
+                    self.__refresh_pending = False
+                    option_list = list(self.__due_map)
+                else:
+                    option_list = self.get_due_option_list(now=now)
+                if option_list:
+                    self.__started_generation += 1
+                    generation = self.__started_generation
+                else:
+                    wake_event.clear()
+                    next_due = min(self.__due_map.values(), default=now + 1.0)
+
+            if not option_list:
+                wake_event.wait(timeout=max(0.0, next_due - now))
+                continue
+
+            try:
+                self.poll(option_list=option_list)
+            except (ConnectionError, TimeoutError) as e:
+                # SESSION MISSING OR EXPIRED
+                logger.info("run: %s", e)
+                self.reconnect(option_list=option_list)
+            except Exception as e:
+                logger.fatal(e)
+                with self.__lock:
+                    for option in option_list:
+                        self.__due_map[option] = time.monotonic() + self.__retry_delay
+
+            with self.__condition:
+                self.__completed_generation = generation
+                self.__condition.notify_all()
+
+    def reconnect(self, option_list: list[UpdateOption]):
+        logger = self.__logger
+        retry_at = time.monotonic() + self.__retry_delay
+
+        if self.__reconnect:
+            try:
+                self.__trading_api.connect()
+                retry_at = time.monotonic()
+            except Exception as e:
+                logger.fatal(e)
+
+        with self.__lock:
+            for option in option_list:
+                self.__due_map[option] = retry_at
+
+    def start(self):
+        if self.running:
+            return
+
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(
+            target=self.run,
+            name=self.__class__.__name__,
+            daemon=True,
+        )
+        self.__thread.start()
+
+    def stop(self, timeout: float | None = None):
+        """Stop the polling thread, after its current request."""
+
+        self.__stop_event.set()
+        self.__wake_event.set()
+        thread = self.__thread
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+
+    def __init__(
+        self,
+        trading_api,
+        account_state: AccountState | None = None,
+        interval_map: dict[UpdateOption, float] | None = None,
+        backoff: float = 1.5,
+        boost_duration: float = 30.0,
+        coalesce_window: float = 1.0,
+        fast_interval: float = 0.5,
+        logger: logging.Logger | None = None,
+        max_interval: float = 120.0,
+        open_order_interval: float = 1.0,
+        queue_maxsize: int = 1000,
+        reconnect: bool = True,
+        retry_delay: float = 5.0,
+    ):
+        """
+        Args:
+            trading_api (degiro_connector.trading.api.API):
+                Trading API, connected or not.
+            account_state (AccountState, optional):
+                State updated by the poller, created if None.
+                Defaults to None.
+            interval_map (dict[UpdateOption, float], optional):
+                Base interval of each option in seconds, `DEFAULT_INTERVAL_MAP`
+                if None. Only these options are polled without subscriber.
+                Defaults to None.
+            backoff (float, optional):
+                Growth of the interval after a poll without change.
+                Defaults to 1.5.
+            boost_duration (float, optional):
+                Duration of a `boost` in seconds.
+                Defaults to 30.0.
+            coalesce_window (float, optional):
+                Options due within this delay share the current request.
+                Defaults to 1.0.
+            fast_interval (float, optional):
+                Interval of the boosted options in seconds.
+                Defaults to 0.5.
+            logger (logging.Logger, optional):
+                This object will be generated if None.
+                Defaults to None.
+            max_interval (float, optional):
+                Longest interval in seconds.
+                Defaults to 120.0.
+            open_order_interval (float, optional):
+                Interval of the orders while some of them are open.
+                Defaults to 1.0.
+            queue_maxsize (int, optional):
+                Size of the queues created by `subscribe`.
+                Defaults to 1000.
+            reconnect (bool, optional):
+                Whether or not to call `trading_api.connect` when the session
+                is missing or expired.
+                Defaults to True.
+            retry_delay (float, optional):
+                Delay before polling again after a failure, in seconds.
+                Defaults to 5.0.
+        """
+
+        interval_map = dict(interval_map or self.DEFAULT_INTERVAL_MAP)
+
+        self.__trading_api = trading_api
+        self.__account_state = account_state or AccountState(
+            option_list=list(interval_map),
+        )
+        self.__backoff = backoff
+        self.__boost_duration = boost_duration
+        self.__coalesce_window = coalesce_window
+        self.__fast_interval = fast_interval
+        self.__logger = logger or logging.getLogger(self.__module__)
+        self.__max_interval = max_interval
+        self.__open_order_interval = open_order_interval
+        self.__queue_maxsize = queue_maxsize
+        self.__reconnect = reconnect
+        self.__retry_delay = retry_delay
+
+        self.__lock = threading.RLock()
+        self.__condition = threading.Condition(self.__lock)
+        self.__stop_event = threading.Event()
+        self.__wake_event = threading.Event()
+        self.__thread = None
+
+        self.__base_interval_map = interval_map
+        self.__interval_map = dict(interval_map)
+        self.__due_map = {option: 0.0 for option in interval_map}
+        self.__boost_deadline = 0.0
+        self.__subscriber_list = []
+        self.__poll_count = 0
+        self.__refresh_pending = False
+        self.__started_generation = 0
+        self.__completed_generation = 0
@@ -0,0 +1,128 @@
+# IMPORTATIONS STANDARD
+import logging
+
+import pytest
+
+from degiro_connector.core.constants import urls
+from degiro_connector.core.helpers.url_override import override_urls
+from degiro_connector.quotecast.models.ticker import TickerRequest
+from degiro_connector.quotecast.tools.quotecast_stream import QuotecastStream
+from degiro_connector.quotecast.tools.ticker_fetcher import TickerFetcher
+from degiro_connector.quotecast.tools.ticker_to_metric_list import TickerToMetricList
+from degiro_connector.trading.api import API as TradingAPI
+from degiro_connector.trading.models.account import UpdateOption, UpdateRequest
+from degiro_connector.trading.models.credentials import Credentials
+from degiro_connector.trading.models.order import Action, Order, OrderType, TimeType
+from degiro_connector.trading.models.product_search import LookupRequest
+
+from fake_server import FakeServer
+
+logging.basicConfig(level=logging.FATAL)
+
+
+# TESTS FEATURES
+@pytest.mark.core
+def test_override_urls():
+    # SETUP
+    original_quotecast = urls.QUOTECAST
+
+    # EXECUTE
+    with override_urls(base_url="http://127.0.0.1:8080/") as url_map:
+        overridden_quotecast = urls.QUOTECAST
+        overridden_login = urls.LOGIN
+
+    # CHECK
+    assert overridden_quotecast == "http://127.0.0.1:8080/quotecast/CORS"
+    assert overridden_login == "http://127.0.0.1:8080/trader/login/secure/login"
+    assert url_map["CHART"].startswith("http://127.0.0.1:8080/charting/")
+    assert urls.QUOTECAST == original_quotecast
+
+
+@pytest.mark.core
+def test_quotecast():
+    # SETUP
+    fake_server = FakeServer(poll_timeout=0.2, seed=0, tick_interval=0.01)
+    ticker_to_metric_list = TickerToMetricList()
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        session_id = TickerFetcher.get_session_id(user_token=123)
+        TickerFetcher.subscribe(
+            ticker_request=TickerRequest(
+                request_type="subscription",
+                request_map={"360015751": ["LastPrice", "LastDate"]},
+            ),
+            session_id=session_id,
+        )
+        metric_list = ticker_to_metric_list.parse(
+            ticker=TickerFetcher.fetch_ticker(session_id=session_id),
+        )
+        fake_server.expire_quotecast_session(session_id=session_id)
+        expired_ticker = TickerFetcher.fetch_ticker(session_id=session_id)
+
+    # CHECK
+    assert sorted(metric.metric_type.value for metric in metric_list) == [
+        "LastDate",
+        "LastPrice",
+    ]
+    assert expired_ticker is None
+    assert fake_server.request_count_map["quotecast:poll"] == 2
+
+
+@pytest.mark.core
+def test_quotecast_stream():
+    # SETUP
+    fake_server = FakeServer(poll_timeout=0.2, seed=0, tick_interval=0.01)
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        stream = QuotecastStream(user_token=123)
+        stream.subscribe(request_map={"360015751": ["LastPrice"]})
+        stream.start()
+        ticker_update = stream.get(timeout=5)
+        stream.stop(timeout=5)
+
+    # CHECK
+    assert ticker_update.metric_list[0].product_id == "360015751"
+    assert stream.renewal_count == 1
+
+
+@pytest.mark.core
+def test_trading():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+    credentials = Credentials(
+        int_account=12345,
+        username="USERNAME",
+        password="PASSWORD",
+    )
+    order = Order(
+        buy_sell=Action.BUY,
+        order_type=OrderType.LIMIT,
+        price=10.0,
+        product_id=331868,
+        size=1,
+        time_type=TimeType.GOOD_TILL_DAY,
+    )
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = TradingAPI(credentials=credentials)
+        trading_api.connect()
+        product_batch = trading_api.product_search(
+            product_request=LookupRequest(search_text="apple", limit=10, offset=0),
+        )
+        checking_response = trading_api.check_order(order=order)
+        confirmation_response = trading_api.confirm_order(
+            confirmation_id=checking_response.confirmation_id,
+            order=order,
+        )
+        account_update = trading_api.get_update(
+            request_list=[UpdateRequest(option=UpdateOption.ORDERS, last_updated=0)],
+        )
+
+    # CHECK
+    assert product_batch.total == 1
+    assert product_batch.products[0]["symbol"] == "AAPL"
+    assert confirmation_response.order_id in fake_server.order_map
+    assert account_update.orders["value"][0]["id"] == confirmation_response.order_id
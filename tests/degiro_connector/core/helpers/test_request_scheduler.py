@@ -0,0 +1,118 @@
+# IMPORTATIONS STANDARD
+import logging
+import threading
+import time
+
+import pytest
+
+from degiro_connector.core.constants import urls
+from degiro_connector.core.helpers.request_scheduler import (
+    RequestBudget,
+    RequestScheduler,
+    ScheduledSession,
+)
+from degiro_connector.core.helpers.url_override import override_urls
+from degiro_connector.trading.api import API as TradingAPI
+from degiro_connector.trading.models.account import UpdateOption, UpdateRequest
+from degiro_connector.trading.models.credentials import Credentials
+
+from fake_server import FakeServer
+
+logging.basicConfig(level=logging.FATAL)
+
+
+# TESTS FEATURES
+@pytest.mark.core
+def test_get_group():
+    # EXECUTE
+    group_list = [
+        RequestScheduler.get_group(url=f"{urls.ORDER_CHECK};jsessionid=ABC?x=1"),
+        RequestScheduler.get_group(url=f"{urls.ORDER_CONFIRM}/CONFIRMATION-ID"),
+        RequestScheduler.get_group(url=f"{urls.UPDATE}/12345;jsessionid=ABC"),
+        RequestScheduler.get_group(url=f"{urls.LOGIN}/totp"),
+        RequestScheduler.get_group(url=urls.LATEST_NEWS),
+        RequestScheduler.get_group(url=urls.CLIENT_DETAILS),
+    ]
+    with override_urls(base_url="http://127.0.0.1:8080"):
+        overridden_group = RequestScheduler.get_group(
+            url=f"{urls.PRODUCT_SEARCH_STOCKS}?searchText=AAPL"
+        )
+
+    # CHECK
+    assert group_list == ["orders", "orders", "update", "login", "news", "other"]
+    assert overridden_group == "product_search"
+
+
+@pytest.mark.core
+def test_priority():
+    # SETUP
+    request_scheduler = RequestScheduler(
+        budget_map={
+            "news": RequestBudget(rate=100.0, burst=100, priority=4),
+            "orders": RequestBudget(rate=100.0, burst=100, priority=0),
+        },
+        global_budget=RequestBudget(rate=10.0, burst=1),
+    )
+    served_list = []
+    lock = threading.Lock()
+
+    def send(url: str, name: str):
+        request_scheduler.acquire(url=url)
+        with lock:
+            served_list.append(name)
+
+    # EXECUTE
+    request_scheduler.acquire(url=urls.LATEST_NEWS)
+    thread_list = [
+        threading.Thread(target=send, args=(urls.LATEST_NEWS, "news"))
+        for _ in range(3)
+    ]
+    for thread in thread_list:
+        thread.start()
+    time.sleep(0.02)
+    thread_list.append(
+        threading.Thread(target=send, args=(urls.ORDER_CHECK, "orders"))
+    )
+    thread_list[-1].start()
+    for thread in thread_list:
+        thread.join()
+    stats_map = request_scheduler.build_stats()
+
+    # CHECK
+    assert served_list[0] == "orders"
+    assert len(served_list) == 4
+    assert stats_map["news"].request_count == 4
+    assert stats_map["news"].queue_max == 3
+    assert stats_map["news"].queue_length == 0
+    assert stats_map["orders"].wait_max < stats_map["news"].wait_max
+
+
+@pytest.mark.trading
+def test_trading_api():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+    request_scheduler = RequestScheduler()
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = TradingAPI(
+            credentials=Credentials(
+                int_account=12345,
+                username="USERNAME",
+                password="PASSWORD",
+            ),
+            request_scheduler=request_scheduler,
+        )
+        trading_api.connect()
+        for _ in range(3):
+            trading_api.get_update(
+                request_list=[UpdateRequest(option=UpdateOption.ORDERS)],
+                raw=True,
+            )
+        stats_map = request_scheduler.build_stats()
+
+    # CHECK
+    assert isinstance(trading_api.session_storage.session, ScheduledSession)
+    assert stats_map["login"].request_count == 1
+    assert stats_map["update"].request_count == 3
+    assert fake_server.request_count_map["trading:update"] == 3
@@ -0,0 +1,189 @@
+# IMPORTATIONS STANDARD
+import logging
+
+import pytest
+
+from degiro_connector.core.helpers.retry import (
+    RetryingSession,
+    RetryPolicy,
+    retry_context,
+)
+from degiro_connector.core.helpers.url_override import override_urls
+from degiro_connector.trading.api import API as TradingAPI
+from degiro_connector.trading.models.account import UpdateOption, UpdateRequest
+from degiro_connector.trading.models.credentials import Credentials
+from degiro_connector.trading.models.order import Action, Order, OrderType, TimeType
+
+from fake_server import FakeServer
+
+logging.basicConfig(level=logging.FATAL)
+
+UPDATE_PATH = "/trader/trading/secure/v5/update/"
+ORDER_CHECK_PATH = "/trader/trading/secure/v5/checkOrder"
+ORDER_CONFIRM_PATH = "/trader/trading/secure/v5/order/"
+
+
+def build_trading_api(retry_policy: RetryPolicy | None = None) -> TradingAPI:
+    return TradingAPI(
+        credentials=Credentials(
+            int_account=12345,
+            username="USERNAME",
+            password="PASSWORD",
+        ),
+        retry_policy=retry_policy,
+    )
+
+
+def build_order() -> Order:
+    return Order(
+        buy_sell=Action.BUY,
+        order_type=OrderType.LIMIT,
+        price=10.0,
+        product_id=331868,
+        size=1,
+        time_type=TimeType.GOOD_TILL_DAY,
+    )
+
+
+def get_update(trading_api: TradingAPI):
+    return trading_api.get_update(
+        request_list=[UpdateRequest(option=UpdateOption.ORDERS)],
+        raw=True,
+    )
+
+
+# TESTS FEATURES
+@pytest.mark.core
+def test_retry_policy():
+    # SETUP
+    retry_policy = RetryPolicy(deadline=1.0)
+
+    # CHECK
+    assert retry_policy.is_idempotent(method="get")
+    assert retry_policy.is_idempotent(method="DELETE")
+    assert not retry_policy.is_idempotent(method="POST")
+    assert retry_policy.should_retry(error=ConnectionError(), attempt=0, elapsed=0.5)
+    assert not retry_policy.should_retry(error=ConnectionError(), attempt=0, elapsed=2)
+
+
+@pytest.mark.trading
+def test_retry_idempotent():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+    retry_policy = RetryPolicy(max_attempts=3, base_delay=0.01)
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api(retry_policy=retry_policy)
+        trading_api.connect()
+
+        fake_server.fail_next(path_prefix=UPDATE_PATH, count=2)
+        account_update = get_update(trading_api=trading_api)
+
+        fake_server.fail_next(path_prefix=ORDER_CHECK_PATH, status=502)
+        checking_response = trading_api.check_order(order=build_order())
+
+        fake_server.fail_next(path_prefix=ORDER_CONFIRM_PATH)
+        confirmation_response = trading_api.confirm_order(
+            confirmation_id=checking_response.confirmation_id,
+            order=build_order(),
+        )
+
+    # CHECK
+    assert isinstance(trading_api.session_storage.session, RetryingSession)
+    assert account_update is not None
+    assert checking_response is not None
+    # POST OF AN ORDER : NEVER SENT TWICE
+    assert confirmation_response is None
+    assert fake_server.request_count_map["failure"] == 4
+    assert fake_server.request_count_map["trading:update"] == 1
+    assert fake_server.request_count_map["trading:check_order"] == 1
+    assert "trading:confirm_order" not in fake_server.request_count_map
+
+
+@pytest.mark.trading
+def test_retry_order_mutations():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+    retry_policy = RetryPolicy(max_attempts=3, base_delay=0.01)
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api(retry_policy=retry_policy)
+        trading_api.connect()
+        checking_response = trading_api.check_order(order=build_order())
+        order = build_order()
+        order.id = trading_api.confirm_order(
+            confirmation_id=checking_response.confirmation_id,
+            order=order,
+        ).order_id
+        order.price = 11.0
+
+        fake_server.fail_next(path_prefix=ORDER_CONFIRM_PATH)
+        update_result = trading_api.update_order(order=order)
+
+        fake_server.fail_next(path_prefix=ORDER_CONFIRM_PATH)
+        delete_result = trading_api.delete_order(order_id=order.id)
+
+    # CHECK
+    # PUT AND DELETE OF AN ORDER : NEVER SENT TWICE
+    assert not update_result
+    assert not delete_result
+    assert fake_server.request_count_map["failure"] == 2
+    assert "trading:update_order" not in fake_server.request_count_map
+    assert "trading:delete_order" not in fake_server.request_count_map
+
+
+@pytest.mark.trading
+def test_retry_per_action():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api()
+        trading_api.connect()
+
+        fake_server.fail_next(path_prefix=UPDATE_PATH)
+        default_result = get_update(trading_api=trading_api)
+
+        trading_api.get_update.retry_policy = RetryPolicy(
+            max_attempts=2,
+            base_delay=0.01,
+        )
+        fake_server.fail_next(path_prefix=UPDATE_PATH)
+        retried_result = get_update(trading_api=trading_api)
+
+        fake_server.fail_next(path_prefix=UPDATE_PATH, count=2)
+        exhausted_result = get_update(trading_api=trading_api)
+
+    # CHECK
+    assert default_result is None
+    assert retried_result is not None
+    assert exhausted_result is None
+    assert fake_server.request_count_map["failure"] == 4
+
+
+@pytest.mark.trading
+def test_request_trace():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api()
+        trading_api.connect()
+
+        fake_server.fail_next(path_prefix=UPDATE_PATH, status=401)
+        with retry_context() as request_trace:
+            result = get_update(trading_api=trading_api)
+        with retry_context() as other_request_trace:
+            pass
+
+    # CHECK
+    assert result is None
+    assert request_trace.request_count == 1
+    assert request_trace.response.status_code == 401
+    assert request_trace.unauthorized
+    assert other_request_trace.request_count == 0
+    assert not other_request_trace.unauthorized
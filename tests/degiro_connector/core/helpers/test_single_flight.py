@@ -0,0 +1,95 @@
+# IMPORTATIONS STANDARD
+import logging
+import threading
+import time
+
+import pytest
+
+from degiro_connector.core.helpers.single_flight import SingleFlight
+
+logging.basicConfig(level=logging.FATAL)
+
+
+# TESTS FEATURES
+@pytest.mark.core
+def test_do_shared():
+    # SETUP
+    single_flight = SingleFlight()
+    call_list = []
+    result_list = []
+
+    def function():
+        call_list.append(None)
+        time.sleep(0.2)
+        return "RESULT"
+
+    # EXECUTE
+    thread_list = [
+        threading.Thread(
+            target=lambda: result_list.append(
+                single_flight.do(key="KEY", function=function)
+            )
+        )
+        for _ in range(8)
+    ]
+    for thread in thread_list:
+        thread.start()
+    for thread in thread_list:
+        thread.join()
+
+    # CHECK
+    assert len(call_list) == 1
+    assert result_list == ["RESULT"] * 8
+    assert single_flight.in_flight_count == 0
+
+
+@pytest.mark.core
+def test_do_error():
+    # SETUP
+    single_flight = SingleFlight()
+
+    def function():
+        raise ConnectionError("FAILED")
+
+    # EXECUTE / CHECK
+    with pytest.raises(ConnectionError):
+        single_flight.do(key="KEY", function=function)
+
+    assert single_flight.do(key="KEY", function=lambda: 1) == 1
+
+
+@pytest.mark.core
+def test_do_reuse_window():
+    # SETUP
+    single_flight = SingleFlight(reuse_window=0.2)
+    call_list = []
+    generation_list = [0]
+
+    def function():
+        call_list.append(None)
+        return len(call_list)
+
+    def get_generation():
+        return generation_list[0]
+
+    # EXECUTE
+    result_a = single_flight.do(
+        key="KEY", function=function, get_generation=get_generation
+    )
+    result_b = single_flight.do(
+        key="KEY", function=function, get_generation=get_generation
+    )
+    generation_list[0] = 1
+    result_c = single_flight.do(
+        key="KEY", function=function, get_generation=get_generation
+    )
+    time.sleep(0.3)
+    result_d = single_flight.do(
+        key="KEY", function=function, get_generation=get_generation
+    )
+
+    # CHECK
+    assert result_a == result_b == 1
+    assert result_c == 2
+    assert result_d == 3
+    assert single_flight.in_flight_count == 0
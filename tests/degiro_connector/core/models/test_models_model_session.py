@@ -1,5 +1,8 @@
 # IMPORTATIONS STANDARD
 import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 import requests
@@ -7,7 +10,7 @@ from urllib3 import poolmanager
 import ssl
 import requests
 
-from degiro_connector.core.models.model_session import ModelSession
+from degiro_connector.core.models.model_session import ModelSession, PooledAdapter
 from degiro_connector.core.constants import urls
 
 
@@ -139,3 +142,112 @@ def test_faulty_adapter():
         errorName = type(e).__name__
     # result: errorName as a string stating the SSL error
     assert errorName is not None
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="function")
+def local_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+# TESTS FEATURES -- test the connection pool shared across threads
+@pytest.mark.core
+def test_pooled_adapter_shared_across_threads(local_url):
+    # SETUP
+    adapter = PooledAdapter(pool_maxsize=4, pool_block=True)
+    session_storage = ModelSession(adapter=adapter)
+
+    def worker():
+        for _ in range(5):
+            session_storage.session.get(local_url).raise_for_status()
+
+    # EXECUTE
+    thread_list = [threading.Thread(target=worker) for _ in range(16)]
+    for thread in thread_list:
+        thread.start()
+    for thread in thread_list:
+        thread.join()
+    pool_stats = session_storage.pool_stats
+
+    # CHECK
+    assert pool_stats.pool_count == 1
+    assert pool_stats.request_count == 80
+    assert pool_stats.connection_count <= 4
+    assert pool_stats.idle_connection_count <= 4
+
+
+@pytest.mark.core
+def test_pooled_adapter_idle_eviction(local_url):
+    # SETUP
+    adapter = PooledAdapter(idle_timeout=0.05)
+    session_storage = ModelSession(adapter=adapter)
+    session_storage.session.get(local_url)
+
+    # EXECUTE
+    time.sleep(0.1)
+    evicted_count = adapter.evict_idle()
+    pool_stats = session_storage.pool_stats
+
+    # CHECK
+    assert evicted_count == 1
+    assert pool_stats.pool_count == 0
+    assert pool_stats.evicted_pool_count == 1
+
+
+@pytest.mark.core
+def test_pooled_adapter_eviction_skips_requests_in_flight(local_url):
+    # SETUP
+    adapter = PooledAdapter(idle_timeout=0.05)
+    session_storage = ModelSession(adapter=adapter)
+    response = session_storage.session.get(local_url, stream=True)
+
+    # EXECUTE
+    time.sleep(0.1)
+    evicted_count_in_flight = adapter.evict_idle(force=True)
+    response.close()
+    evicted_count = adapter.evict_idle(force=True)
+
+    # CHECK
+    assert evicted_count_in_flight == 0
+    assert evicted_count == 1
+    assert session_storage.pool_stats.pool_count == 0
+    assert adapter.poolmanager.last_used_map == {}
+
+
+@pytest.mark.core
+def test_pooled_adapter_closed_with_last_session(local_url):
+    # SETUP
+    adapter = PooledAdapter()
+    session_storage = ModelSession(adapter=adapter)
+    session_a = session_storage.build_session(adapter=adapter)
+    session_b = session_storage.build_session(adapter=adapter)
+    session_a.get(local_url).raise_for_status()
+
+    # EXECUTE
+    session_a.close()
+    pool_count_after_a = session_storage.pool_stats.pool_count
+    session_b.get(local_url).raise_for_status()
+    session_b.close()
+
+    # CHECK
+    assert pool_count_after_a == 1
+    assert adapter.lease_count == 0
+    assert session_storage.pool_stats.pool_count == 0
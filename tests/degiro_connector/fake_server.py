@@ -0,0 +1,627 @@
+import json
+import logging
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+CONTROL_PATTERN = re.compile(r"(a_req|a_rel)\(([^;]+)\.([A-Za-z0-9]+)\);")
+
+UPDATE_OPTION_LIST = [
+    "alerts",
+    "cashFunds",
+    "historicalOrders",
+    "orders",
+    "portfolio",
+    "totalPortfolio",
+    "transactions",
+]
+
+DEFAULT_PRODUCT_LIST = [
+    {"id": "331868", "name": "Apple Inc", "symbol": "AAPL", "vwdId": "AAPL.BATS,E"},
+    {"id": "332111", "name": "Microsoft Corp", "symbol": "MSFT", "vwdId": "MSFT.BATS,E"},
+    {"id": "1153605", "name": "Total SE", "symbol": "TTE", "vwdId": "360015751"},
+]
+
+
+class FakeQuotecastSession:
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.last_seen = time.monotonic()
+        # {(vwd_id, metric_name): reference}
+        self.reference_map: dict[tuple[str, str], int] = {}
+        self.pending_list: list[dict] = []
+        self.expired = False
+
+
+class FakeServer:
+    """Local stand-in for Degiro's Quotecast and Trading APIs.
+
+    It serves plausible payloads, with no network access, for :
+        * Quotecast : "request_session", subscriptions, long-polling
+        with "a_req", "a_rel", "un", "us", "h" and "sr" messages.
+        * Trading : login, update, product search, check/confirm/update/delete
+        order.
+
+    It is meant for integration tests and load tests : combine it with
+    `override_urls` so the connector sends its requests to this server. It
+    lives next to the tests, which import it as `fake_server` : pytest puts
+    the folder of the root `conftest.py` on the path.
+
+    Example :
+        with FakeServer(tick_interval=0.01) as fake_server:
+            with override_urls(base_url=fake_server.url):
+                session_id = TickerFetcher.get_session_id(user_token=123)
+    """
+
+    @property
+    def url(self) -> str:
+        host, port = self.__httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count_map(self) -> dict[str, int]:
+        with self.__lock:
+            return dict(self.__request_count_map)
+
+    @property
+    def order_map(self) -> dict[str, dict]:
+        with self.__lock:
+            return dict(self.__order_map)
+
+    def count(self, route: str):
+        with self.__lock:
+            self.__request_count_map[route] = self.__request_count_map.get(route, 0) + 1
+
+    def expire_quotecast_session(self, session_id: str):
+        """Next poll on this `session_id` will receive `[{"m":"sr"}]`."""
+
+        with self.__condition:
+            quotecast_session = self.__quotecast_session_map.get(session_id)
+            if quotecast_session is not None:
+                quotecast_session.expired = True
+            self.__condition.notify_all()
+
+    def fail_next(self, path_prefix: str, status: int = 503, count: int = 1):
+        """Next `count` requests on a path starting with `path_prefix` will
+        receive `status`, like a transient failure."""
+
+        with self.__lock:
+            self.__failure_list.append([path_prefix, status, count])
+
+    def pop_failure(self, path: str) -> int | None:
+        with self.__lock:
+            for failure in self.__failure_list:
+                path_prefix, status, count = failure
+                if path.startswith(path_prefix) and count > 0:
+                    failure[2] -= 1
+                    return status
+
+        return None
+
+    def expire_trading_session(self, session_id: str):
+        """Next requests on this `session_id` will receive a 401."""
+
+        with self.__lock:
+            self.__trading_session_set.discard(session_id)
+
+    def build_value_message(self, vwd_id: str, metric_name: str, reference: int) -> dict:
+        now = datetime.now()
+
+        if metric_name == "LastDate":
+            return {"m": "us", "v": [reference, now.strftime("%Y-%m-%d")]}
+        elif metric_name == "LastTime":
+            return {"m": "us", "v": [reference, now.strftime("%H:%M:%S")]}
+        elif metric_name.endswith("Volume") or metric_name.endswith("Orders"):
+            return {"m": "un", "v": [reference, self.__random.randint(1, 10_000)]}
+        else:
+            price = self.__price_map.get(vwd_id, 100.0)
+            price = round(max(0.01, price * (1 + self.__random.gauss(0, 0.001))), 4)
+            self.__price_map[vwd_id] = price
+            return {"m": "un", "v": [reference, price]}
+
+    # QUOTECAST
+    def request_quotecast_session(self) -> tuple[int, object]:
+        session_id = str(uuid.uuid4())
+
+        with self.__lock:
+            self.__quotecast_session_map[session_id] = FakeQuotecastSession(
+                session_id=session_id,
+            )
+
+        return 200, {"sessionId": session_id}
+
+    def get_quotecast_session(self, session_id: str) -> FakeQuotecastSession | None:
+        quotecast_session = self.__quotecast_session_map.get(session_id)
+
+        if quotecast_session is None:
+            return None
+
+        if time.monotonic() - quotecast_session.last_seen > self.__session_timeout:
+            quotecast_session.expired = True
+
+        if quotecast_session.expired:
+            self.__quotecast_session_map.pop(session_id, None)
+            return None
+
+        quotecast_session.last_seen = time.monotonic()
+
+        return quotecast_session
+
+    def subscribe(self, session_id: str, body: str) -> tuple[int, object]:
+        control_data = json.loads(body or "{}").get("controlData", "")
+
+        with self.__condition:
+            quotecast_session = self.get_quotecast_session(session_id=session_id)
+            if quotecast_session is None:
+                return 200, [{"m": "sr"}]
+
+            reference_map = quotecast_session.reference_map
+            for function, vwd_id, metric_name in CONTROL_PATTERN.findall(control_data):
+                key = (vwd_id, metric_name)
+                if function == "a_req" and key not in reference_map:
+                    self.__next_reference += 1
+                    reference_map[key] = self.__next_reference
+                    quotecast_session.pending_list.append(
+                        {
+                            "m": "a_req",
+                            "v": [f"{vwd_id}.{metric_name}", self.__next_reference],
+                        }
+                    )
+                elif function == "a_rel" and key in reference_map:
+                    reference = reference_map.pop(key)
+                    quotecast_session.pending_list.append(
+                        {"m": "a_rel", "v": [f"{vwd_id}.{metric_name}", reference]}
+                    )
+            self.__condition.notify_all()
+
+        return 200, []
+
+    def poll(self, session_id: str) -> tuple[int, object]:
+        deadline = time.monotonic() + self.__poll_timeout
+        tick_deadline = time.monotonic() + self.__tick_interval
+
+        with self.__condition:
+            while True:
+                quotecast_session = self.get_quotecast_session(session_id=session_id)
+                if quotecast_session is None:
+                    return 200, [{"m": "sr"}]
+
+                now = time.monotonic()
+                has_tick = quotecast_session.reference_map and now >= tick_deadline
+                if quotecast_session.pending_list or has_tick or now >= deadline:
+                    break
+
+                wait_until = tick_deadline if quotecast_session.reference_map else deadline
+                self.__condition.wait(timeout=max(0.0, min(wait_until, deadline) - now))
+
+            message_list = quotecast_session.pending_list
+            quotecast_session.pending_list = []
+
+            if quotecast_session.reference_map:
+                reference_map = quotecast_session.reference_map
+                for (vwd_id, metric_name), reference in reference_map.items():
+                    message_list.append(
+                        self.build_value_message(
+                            vwd_id=vwd_id,
+                            metric_name=metric_name,
+                            reference=reference,
+                        )
+                    )
+
+        return 200, message_list or [{"m": "h"}]
+
+    # TRADING
+    def login(self, body: str) -> tuple[int, object]:
+        payload = json.loads(body or "{}")
+        password = self.__password
+
+        if password is not None and payload.get("password") != password:
+            return 400, {
+                "loginFailures": 1,
+                "status": 3,
+                "statusText": "badCredentials",
+            }
+
+        session_id = uuid.uuid4().hex.upper()
+
+        with self.__lock:
+            self.__trading_session_set.add(session_id)
+
+        return 200, {
+            "isPassCodeEnabled": False,
+            "sessionId": session_id,
+            "status": 0,
+            "statusText": "success",
+        }
+
+    def is_trading_session(self, session_id: str | None) -> bool:
+        with self.__lock:
+            return session_id in self.__trading_session_set
+
+    def get_update(self, query_map: dict[str, str]) -> tuple[int, object]:
+        """Like the real endpoint : only the rows changed after the given
+        `lastUpdated` token are sent, the full table for a token of 0."""
+
+        update_map: dict[str, object] = {}
+
+        with self.__lock:
+            last_updated = self.__last_updated
+            for option in UPDATE_OPTION_LIST:
+                if option not in query_map:
+                    continue
+                token = int(query_map[option] or 0)
+                if option == "orders":
+                    value = [
+                        {
+                            "id": order_id,
+                            "name": "order",
+                            "isAdded": True,
+                            "value": [
+                                {"name": name, "value": value}
+                                for name, value in order.items()
+                            ],
+                        }
+                        for order_id, order in self.__order_map.items()
+                        if self.__order_token_map[order_id] > token
+                    ]
+                    if token > 0:
+                        for order_id, removed_token in self.__removed_order_list:
+                            if removed_token > token:
+                                value.append(
+                                    {"id": order_id, "name": "order", "isRemoved": True}
+                                )
+                    update_map[option] = {"lastUpdated": last_updated, "value": value}
+                elif option == "historicalOrders":
+                    value = [
+                        {
+                            "id": order_id,
+                            "name": "historicalOrder",
+                            "isAdded": True,
+                            "value": [
+                                {"name": name, "value": value}
+                                for name, value in historical_order.items()
+                            ],
+                        }
+                        for order_id, (
+                            historical_order,
+                            historical_token,
+                        ) in self.__historical_order_map.items()
+                        if historical_token > token
+                    ]
+                    update_map[option] = {"lastUpdated": last_updated, "value": value}
+                else:
+                    update_map[option] = {"lastUpdated": last_updated, "value": []}
+
+        return 200, update_map
+
+    def search_product(self, query_map: dict[str, str]) -> tuple[int, object]:
+        search_text = query_map.get("searchText", "").lower()
+        offset = int(query_map.get("offset", 0))
+        limit = int(query_map.get("limit", 10))
+        product_list = [
+            product
+            for product in self.__product_list
+            if search_text in product["name"].lower()
+            or search_text in product["symbol"].lower()
+        ]
+
+        return 200, {
+            "offset": offset,
+            "products": product_list[offset : offset + limit],
+            "total": len(product_list),
+        }
+
+    def check_order(self, body: str) -> tuple[int, object]:
+        order = json.loads(body or "{}")
+
+        if "productId" not in order or "size" not in order:
+            return 400, {"errors": [{"text": "Invalid order."}]}
+
+        confirmation_id = str(uuid.uuid4())
+
+        with self.__lock:
+            self.__confirmation_map[confirmation_id] = order
+
+        return 200, {
+            "data": {
+                "confirmationId": confirmation_id,
+                "freeSpaceNew": 10_000.0,
+                "transactionFee": 0.5,
+                "showExAnteReportLink": False,
+            }
+        }
+
+    def confirm_order(self, confirmation_id: str) -> tuple[int, object]:
+        with self.__lock:
+            order = self.__confirmation_map.pop(confirmation_id, None)
+            if order is None:
+                return 400, {"errors": [{"text": "Unknown confirmation."}]}
+            order_id = str(uuid.uuid4())
+            self.__last_updated += 1
+            self.__order_map[order_id] = order
+            self.__order_token_map[order_id] = self.__last_updated
+
+        return 200, {"data": {"orderId": order_id}}
+
+    def update_order(self, order_id: str, body: str) -> tuple[int, object]:
+        with self.__lock:
+            order = self.__order_map.get(order_id)
+            if order is None:
+                return 400, {"errors": [{"text": "Unknown order."}]}
+            order.update(json.loads(body or "{}"))
+            self.__last_updated += 1
+            self.__order_token_map[order_id] = self.__last_updated
+
+        return 200, {}
+
+    def close_order(self, order_id: str, status: str, traded_size: float) -> bool:
+        """Move an order from the book to the historical orders.
+
+        The lock must be held by the caller.
+        """
+
+        order = self.__order_map.pop(order_id, None)
+
+        if order is None:
+            return False
+
+        self.__last_updated += 1
+        del self.__order_token_map[order_id]
+        self.__removed_order_list.append((order_id, self.__last_updated))
+        self.__historical_order_map[order_id] = (
+            {
+                "orderId": order_id,
+                "productId": order.get("productId"),
+                "size": order.get("size"),
+                "status": status,
+                "totalTradedSize": traded_size,
+            },
+            self.__last_updated,
+        )
+
+        return True
+
+    def fill_order(self, order_id: str) -> bool:
+        """Execute a working order, like the exchange would."""
+
+        with self.__lock:
+            order = self.__order_map.get(order_id)
+            if order is None:
+                return False
+            return self.close_order(
+                order_id=order_id,
+                status="EXECUTED",
+                traded_size=order.get("size", 0),
+            )
+
+    def delete_order(self, order_id: str) -> tuple[int, object]:
+        with self.__lock:
+            if not self.close_order(order_id=order_id, status="DELETED", traded_size=0):
+                return 400, {"errors": [{"text": "Unknown order."}]}
+
+        return 200, {}
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        query_map: dict[str, str],
+        body: str,
+    ) -> tuple[int, object]:
+        """Route a request.
+
+        Returns:
+            tuple[int, object]: HTTP status and JSON serializable payload.
+        """
+
+        path, _, matrix = path.partition(";")
+        session_id = query_map.get("sessionId") or matrix.partition("jsessionid=")[2] or None
+
+        status = self.pop_failure(path=path)
+        if status is not None:
+            self.count("failure")
+            return status, {"errors": [{"text": "Injected failure."}]}
+
+        if path.startswith("/quotecast/CORS/"):
+            quotecast_session_id = path[len("/quotecast/CORS/") :]
+            if quotecast_session_id == "request_session" and method == "POST":
+                self.count("quotecast:request_session")
+                return self.request_quotecast_session()
+            elif method == "POST":
+                self.count("quotecast:subscribe")
+                return self.subscribe(session_id=quotecast_session_id, body=body)
+            elif method == "GET":
+                self.count("quotecast:poll")
+                return self.poll(session_id=quotecast_session_id)
+
+        if path.startswith("/trader/login/secure/login") and method == "POST":
+            self.count("trading:login")
+            return self.login(body=body)
+
+        if path.startswith("/trader/") and not self.is_trading_session(session_id=session_id):
+            self.count("trading:unauthorized")
+            return 401, {"errors": [{"text": "Unauthorized."}]}
+
+        if path == "/trader/trading/secure/logout":
+            self.count("trading:logout")
+            with self.__lock:
+                self.__trading_session_set.discard(session_id)
+            return 200, {}
+        elif path.startswith("/trader/trading/secure/v5/update/") and method == "GET":
+            self.count("trading:update")
+            return self.get_update(query_map=query_map)
+        elif path.startswith("/trader/trading/secure/v5/checkOrder") and method == "POST":
+            self.count("trading:check_order")
+            return self.check_order(body=body)
+        elif path.startswith("/trader/trading/secure/v5/order/") and method == "POST":
+            self.count("trading:confirm_order")
+            return self.confirm_order(confirmation_id=path.rsplit("/", 1)[1])
+        elif path.startswith("/trader/trading/secure/v5/order/") and method == "PUT":
+            self.count("trading:update_order")
+            return self.update_order(order_id=path.rsplit("/", 1)[1], body=body)
+        elif path.startswith("/trader/trading/secure/v5/order/") and method == "DELETE":
+            self.count("trading:delete_order")
+            return self.delete_order(order_id=path.rsplit("/", 1)[1])
+        elif "product_search/secure" in path or "productsearch/secure" in path:
+            self.count("trading:product_search")
+            return self.search_product(query_map=query_map)
+
+        self.count("not_found")
+        return 404, {"errors": [{"text": f"Unknown route : {method} {path}"}]}
+
+    def start(self):
+        if self.__thread is not None:
+            return
+
+        self.__thread = threading.Thread(
+            target=self.__httpd.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name=self.__class__.__name__,
+            daemon=True,
+        )
+        self.__thread.start()
+
+    def stop(self):
+        with self.__condition:
+            for quotecast_session in self.__quotecast_session_map.values():
+                quotecast_session.expired = True
+            self.__condition.notify_all()
+
+        self.__httpd.shutdown()
+        self.__httpd.server_close()
+
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def __enter__(self) -> "FakeServer":
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        password: str | None = None,
+        poll_timeout: float = 5.0,
+        product_list: list[dict] | None = None,
+        seed: int | None = None,
+        session_timeout: float = 15.0,
+        tick_interval: float = 0.1,
+    ):
+        """
+        Args:
+            host (str, optional):
+                Interface to listen on.
+                Defaults to "127.0.0.1".
+            port (int, optional):
+                Port to listen on, 0 picks a free port.
+                Defaults to 0.
+            latency (float, optional):
+                Delay added to each response, in seconds.
+                Defaults to 0.0.
+            password (str, optional):
+                Password accepted by the login, any password if None.
+                Defaults to None.
+            poll_timeout (float, optional):
+                Duration of a long-polling request without data, in seconds.
+                Defaults to 5.0.
+            product_list (list[dict], optional):
+                Products returned by the product search.
+                Defaults to None.
+            seed (int, optional):
+                Seed of the generated prices and volumes.
+                Defaults to None.
+            session_timeout (float, optional):
+                Idle time after which a Quotecast session expires, in seconds.
+                Defaults to 15.0.
+            tick_interval (float, optional):
+                Delay between two updates of the subscribed metrics, in seconds.
+                Defaults to 0.1.
+        """
+
+        self.__logger = logging.getLogger(self.__module__)
+        self.__lock = threading.Lock()
+        self.__condition = threading.Condition(self.__lock)
+        self.__random = random.Random(seed)
+
+        self.__latency = latency
+        self.__password = password
+        self.__poll_timeout = poll_timeout
+        self.__product_list = product_list or DEFAULT_PRODUCT_LIST
+        self.__session_timeout = session_timeout
+        self.__tick_interval = tick_interval
+
+        self.__request_count_map: dict[str, int] = {}
+        self.__quotecast_session_map: dict[str, FakeQuotecastSession] = {}
+        self.__next_reference = 0
+        self.__price_map: dict[str, float] = {}
+        self.__trading_session_set: set[str] = set()
+        self.__confirmation_map: dict[str, dict] = {}
+        self.__order_map: dict[str, dict] = {}
+        self.__order_token_map: dict[str, int] = {}
+        self.__removed_order_list: list[tuple[str, int]] = []
+        self.__historical_order_map: dict[str, tuple[dict, int]] = {}
+        self.__failure_list: list[list] = []
+        self.__last_updated = 1
+
+        self.__httpd = ThreadingHTTPServer((host, port), self.__build_handler())
+        self.__httpd.daemon_threads = True
+        self.__thread: threading.Thread | None = None
+
+    def __build_handler(self) -> type[BaseHTTPRequestHandler]:
+        fake_server = self
+        latency = self.__latency
+        logger = self.__logger
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def handle_method(self):
+                split = urlsplit(self.path)
+                query_map = {
+                    key: value_list[-1]
+                    for key, value_list in parse_qs(split.query).items()
+                }
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length).decode() if length else ""
+
+                try:
+                    status, payload = fake_server.handle(
+                        method=self.command,
+                        path=split.path,
+                        query_map=query_map,
+                        body=body,
+                    )
+                except Exception as e:
+                    logger.fatal(e)
+                    status, payload = 500, {"errors": [{"text": str(e)}]}
+
+                if latency:
+                    time.sleep(latency)
+
+                data = json.dumps(payload, separators=(",", ":")).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_DELETE = handle_method
+            do_GET = handle_method
+            do_POST = handle_method
+            do_PUT = handle_method
+
+            def log_message(self, format, *args):
+                logger.debug(format, *args)
+
+        return Handler
@@ -0,0 +1,148 @@
+# IMPORTATIONS STANDARD
+import logging
+from datetime import datetime, timedelta
+
+import orjson
+import pytest
+
+from degiro_connector.quotecast.models.chart import ChartRequest, Interval
+from degiro_connector.quotecast.tools.chart_cache import ChartCache
+from degiro_connector.quotecast.tools.chart_fetcher import ChartFetcher
+
+logging.basicConfig(level=logging.FATAL)
+
+TZ = "Europe/Paris"
+
+
+class MockChartFetcher(ChartFetcher):
+    """Serves one point per hour, up to now, for the requested window."""
+
+    def fetch_chart_body(self, chart_request, session=None) -> bytes:
+        self.chart_request_list.append(chart_request)
+        now = ChartCache.build_now(tz=TZ).replace(minute=0, second=0, microsecond=0)
+
+        if "start" in chart_request.override:
+            start = datetime.fromisoformat(chart_request.override["start"])
+        else:
+            start = ChartCache.build_start(chart_request=chart_request).replace(
+                minute=0,
+                second=0,
+                microsecond=0,
+            )
+
+        hour_count = int((now - start) / timedelta(hours=1))
+        expires = now + self.expires_delta
+
+        return orjson.dumps(
+            {
+                "end": now.isoformat(),
+                "requestid": chart_request.requestid,
+                "resolution": "PT1H",
+                "series": [
+                    {
+                        "id": series_id,
+                        "type": "time",
+                        "times": f"{start.isoformat()}/PT1H",
+                        "expires": expires.isoformat(),
+                        "data": [
+                            [index, 100.0 + index] for index in range(hour_count + 1)
+                        ],
+                    }
+                    for series_id in chart_request.series
+                ],
+                "start": start.isoformat(),
+            }
+        )
+
+    def __init__(self, expires_delta: timedelta):
+        super().__init__(user_token=0)
+        self.chart_request_list: list[ChartRequest] = []
+        self.expires_delta = expires_delta
+
+
+def build_chart_request(period: Interval = Interval.P1D) -> ChartRequest:
+    return ChartRequest(
+        culture="fr-FR",
+        period=period,
+        requestid="1",
+        resolution=Interval.PT1H,
+        series=["price:issueid:1"],
+        tz=TZ,
+    )
+
+
+# TESTS FEATURES
+@pytest.mark.quotecast
+def test_fresh_hit(tmp_path):
+    # SETUP
+    chart_fetcher = MockChartFetcher(expires_delta=timedelta(hours=1))
+    chart_cache = ChartCache(path=tmp_path, chart_fetcher=chart_fetcher)
+
+    # EXECUTE
+    first_df_map = chart_cache.get_chart_df_map(chart_request=build_chart_request())
+    second_df_map = chart_cache.get_chart_df_map(chart_request=build_chart_request())
+
+    # CHECK
+    assert chart_cache.fetch_count == 1
+    assert second_df_map["price:issueid:1"].equals(first_df_map["price:issueid:1"])
+    assert sorted(path.suffix for path in tmp_path.iterdir()) == [".arrow", ".json"]
+
+
+@pytest.mark.quotecast
+def test_expired_hit_fetches_tail(tmp_path):
+    # SETUP
+    chart_fetcher = MockChartFetcher(expires_delta=timedelta(hours=-1))
+    chart_cache = ChartCache(path=tmp_path, chart_fetcher=chart_fetcher)
+    chart_cache.get_chart_df_map(chart_request=build_chart_request())
+    chart_cache_entry, cached_df = chart_cache.read(
+        series_id="price:issueid:1",
+        resolution=Interval.PT1H,
+        tz=TZ,
+    )
+
+    # EXECUTE
+    df_map = chart_cache.get_chart_df_map(chart_request=build_chart_request())
+
+    # CHECK
+    tail_request = chart_fetcher.chart_request_list[-1]
+    df = df_map["price:issueid:1"]
+
+    assert chart_cache.fetch_count == 2
+    assert datetime.fromisoformat(tail_request.override["start"]) == (
+        chart_cache_entry.last_timestamp
+    )
+    assert df["timestamp"].is_unique().all()
+    assert df["timestamp"].is_sorted()
+    assert df.height >= cached_df.height - 1
+
+
+@pytest.mark.quotecast
+def test_wider_period_fetches_again(tmp_path):
+    # SETUP
+    chart_fetcher = MockChartFetcher(expires_delta=timedelta(hours=1))
+    chart_cache = ChartCache(path=tmp_path, chart_fetcher=chart_fetcher)
+    narrow_df_map = chart_cache.get_chart_df_map(chart_request=build_chart_request())
+
+    # EXECUTE
+    wide_df_map = chart_cache.get_chart_df_map(
+        chart_request=build_chart_request(period=Interval.P1W)
+    )
+    narrow_again_df_map = chart_cache.get_chart_df_map(
+        chart_request=build_chart_request()
+    )
+
+    # CHECK
+    narrow_df = narrow_df_map["price:issueid:1"]
+    wide_df = wide_df_map["price:issueid:1"]
+    chart_cache_entry, _df = chart_cache.read(
+        series_id="price:issueid:1",
+        resolution=Interval.PT1H,
+        tz=TZ,
+    )
+
+    assert chart_cache.fetch_count == 2
+    assert "start" not in chart_fetcher.chart_request_list[-1].override
+    assert wide_df.height >= 7 * 24
+    assert wide_df["timestamp"].min() < narrow_df["timestamp"].min()
+    assert chart_cache_entry.covered_start < narrow_df["timestamp"].min()
+    assert narrow_again_df_map["price:issueid:1"].height <= 25
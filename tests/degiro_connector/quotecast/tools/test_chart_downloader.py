@@ -0,0 +1,162 @@
+# IMPORTATIONS STANDARD
+import logging
+import threading
+
+import pytest
+import requests
+
+from degiro_connector.core.helpers.retry import RetryPolicy
+from degiro_connector.quotecast.models.chart import Chart, ChartRequest, Interval
+from degiro_connector.quotecast.tools.chart_downloader import ChartDownloader
+
+logging.basicConfig(level=logging.FATAL)
+
+
+class MockChartFetcher:
+    def fetch_chart(self, chart_request: ChartRequest) -> Chart:
+        product = chart_request.series[0]
+
+        with self.lock:
+            attempt = self.attempt_map.get(product, 0)
+            self.attempt_map[product] = attempt + 1
+
+        if attempt < self.failure_map.get(product, 0):
+            response = requests.Response()
+            response.status_code = self.status_map.get(product, 503)
+            raise requests.HTTPError(response=response)
+
+        return Chart.model_validate(
+            obj={
+                "end": "2024-01-02T17:30:00",
+                "requestid": chart_request.requestid,
+                "resolution": "PT1M",
+                "series": [],
+                "start": "2024-01-02T09:00:00",
+            }
+        )
+
+    def __init__(self, failure_map: dict, status_map: dict | None = None):
+        self.failure_map = failure_map
+        self.status_map = status_map or {}
+        self.attempt_map: dict[str, int] = {}
+        self.lock = threading.Lock()
+
+
+def build_chart_request_list(product_list: list[str]) -> list[ChartRequest]:
+    return ChartDownloader.build_chart_request_list(
+        chart_request=ChartRequest(
+            culture="fr-FR",
+            period=Interval.P1D,
+            requestid="0",
+            resolution=Interval.PT1M,
+            series=[],
+            tz="Europe/Paris",
+        ),
+        product_list=product_list,
+    )
+
+
+# TESTS FEATURES
+@pytest.mark.quotecast
+def test_build_chart_request_list():
+    # EXECUTE
+    chart_request_list = ChartDownloader.build_chart_request_list(
+        chart_request=ChartRequest(
+            culture="fr-FR",
+            period=Interval.P1D,
+            requestid="0",
+            resolution=Interval.PT1M,
+            series=[],
+            tz="Europe/Paris",
+        ),
+        product_list=["issueid:1", "vwdkey:AAPL.BATS,E"],
+        series_type_list=["ohlc", "volume"],
+    )
+
+    # CHECK
+    assert [chart_request.series for chart_request in chart_request_list] == [
+        ["ohlc:issueid:1", "volume:issueid:1"],
+        ["ohlc:vwdkey:AAPL.BATS,E", "volume:vwdkey:AAPL.BATS,E"],
+    ]
+    assert [chart_request.requestid for chart_request in chart_request_list] == [
+        "0",
+        "1",
+    ]
+
+
+@pytest.mark.quotecast
+def test_iter_chart():
+    # SETUP
+    product_list = [f"issueid:{index}" for index in range(20)]
+    chart_fetcher = MockChartFetcher(
+        failure_map={"issueid:3": 1, "issueid:7": 5, "issueid:9": 1},
+        status_map={"issueid:9": 404},
+    )
+    chart_downloader = ChartDownloader(
+        chart_fetcher=chart_fetcher,
+        max_workers=4,
+        rate=1_000.0,
+        retry_policy=RetryPolicy(max_attempts=3, base_delay=0.001, seed=0),
+    )
+
+    # EXECUTE
+    with chart_downloader:
+        result_list = chart_downloader.download_all(
+            chart_request_list=build_chart_request_list(product_list=product_list),
+        )
+
+    # CHECK
+    result_map = {
+        chart_request.series[0]: result for chart_request, result in result_list
+    }
+    error_map = {
+        product: result
+        for product, result in result_map.items()
+        if isinstance(result, Exception)
+    }
+
+    assert sorted(result_map) == sorted(product_list)
+    assert sorted(error_map) == ["issueid:7", "issueid:9"]
+    assert isinstance(result_map["issueid:3"], Chart)
+    assert chart_fetcher.attempt_map["issueid:3"] == 2
+    assert chart_fetcher.attempt_map["issueid:7"] == 3
+    assert chart_fetcher.attempt_map["issueid:9"] == 1
+
+
+@pytest.mark.core
+def test_retry_policy_retry_after():
+    # SETUP
+    retry_policy = RetryPolicy(max_attempts=2, max_delay=10.0)
+    response = requests.Response()
+    response.status_code = 429
+    response.headers["Retry-After"] = "4"
+    error = requests.HTTPError(response=response)
+
+    # EXECUTE
+    delay = retry_policy.compute_delay(attempt=0, error=error)
+
+    # CHECK
+    assert delay == 4.0
+    assert retry_policy.should_retry(error=error, attempt=0)
+    assert not retry_policy.should_retry(error=error, attempt=1)
+
+
+@pytest.mark.quotecast
+def test_download_honours_the_deadline():
+    # SETUP
+    chart_fetcher = MockChartFetcher(failure_map={"issueid:1": 5})
+    chart_downloader = ChartDownloader(
+        chart_fetcher=chart_fetcher,
+        max_workers=1,
+        rate=1_000.0,
+        retry_policy=RetryPolicy(max_attempts=5, base_delay=0.0, deadline=-1.0),
+    )
+    chart_request = build_chart_request_list(product_list=["issueid:1"])[0]
+
+    # EXECUTE
+    with chart_downloader:
+        with pytest.raises(requests.HTTPError):
+            chart_downloader.download(chart_request=chart_request)
+
+    # CHECK
+    assert chart_fetcher.attempt_map["issueid:1"] == 1
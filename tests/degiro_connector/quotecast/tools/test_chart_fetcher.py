@@ -0,0 +1,259 @@
+# IMPORTATIONS STANDARD
+import logging
+from datetime import datetime, timedelta
+
+import orjson
+import polars as pl
+import pytest
+
+from degiro_connector.quotecast.models.chart import Chart, ChartRequest, Interval
+from degiro_connector.quotecast.tools.chart_fetcher import (
+    ChartFetcher,
+    ChartPaginator,
+    SeriesFormatter,
+)
+
+logging.basicConfig(level=logging.FATAL)
+
+
+def build_body() -> bytes:
+    return orjson.dumps(
+        {
+            "start": "2024-01-02T09:00:00",
+            "end": "2024-01-02T17:30:00",
+            "requestid": "1",
+            "resolution": "PT1M",
+            "series": [
+                {
+                    "id": "issueid:360148977",
+                    "type": "object",
+                    "expires": "2024-01-02T17:30:00",
+                    "data": {"issueId": 360148977, "name": "MOCKING-NAME"},
+                },
+                {
+                    "id": "ohlc:issueid:360148977",
+                    "type": "ohlc",
+                    "times": "2024-01-02T09:00:00/PT1M",
+                    "expires": "2024-01-02T17:30:00",
+                    "data": [
+                        [0, 10.0, 10.5, 9.5, 10.2],
+                        [1, 10.2, 10.4, None, 10.3],
+                        [5, 10.3, 10.3, 10.1, 10.1],
+                    ],
+                },
+                {
+                    "id": "price:issueid:360148977",
+                    "type": "time",
+                    "times": "2024-01-01T00:00:00/P1M",
+                    "expires": "2024-01-02T17:30:00",
+                    "data": [[0, 10], [2, 11.5]],
+                },
+                {
+                    "id": "volume:issueid:360148977",
+                    "type": "time",
+                    "times": "2024-01-02T09:00:00/PT1M",
+                    "expires": "2024-01-02T17:30:00",
+                    "data": [],
+                },
+            ],
+        }
+    )
+
+
+# TESTS FEATURES
+@pytest.mark.quotecast
+def test_format_chart_matches_format_series():
+    # SETUP
+    body = build_body()
+    chart = Chart.model_validate(obj=orjson.loads(body))
+    series_map = {series.id: series for series in chart.series}
+
+    # EXECUTE
+    df_map = SeriesFormatter.format_chart(body=body)
+
+    # CHECK
+    assert list(df_map) == list(series_map)
+    assert df_map["issueid:360148977"]["name"].to_list() == ["MOCKING-NAME"]
+    assert df_map["ohlc:issueid:360148977"].equals(
+        SeriesFormatter.format_series(series=series_map["ohlc:issueid:360148977"])
+    )
+    assert df_map["ohlc:issueid:360148977"]["timestamp"].to_list() == [
+        datetime(2024, 1, 2, 9, 0),
+        datetime(2024, 1, 2, 9, 1),
+        datetime(2024, 1, 2, 9, 5),
+    ]
+    assert df_map["price:issueid:360148977"]["timestamp"].to_list() == [
+        datetime(2024, 1, 1),
+        datetime(2024, 3, 1),
+    ]
+    assert df_map["volume:issueid:360148977"].columns == ["timestamp", "volume"]
+    assert df_map["volume:issueid:360148977"].height == 0
+
+
+@pytest.mark.quotecast
+def test_split_data():
+    # SETUP
+    body = b'{"series":[{"id":"price","data":[[0,1.5],[1,1.6]]}]}'
+
+    # EXECUTE
+    metadata, data_list = SeriesFormatter.split_data(body=body)
+
+    # CHECK
+    assert metadata == b'{"series":[{"id":"price","data":0}]}'
+    assert data_list == [b"0,1.5],[1,1.6"]
+
+
+@pytest.mark.quotecast
+def test_parse_chart_unexpected_layout():
+    # SETUP
+    nested_body = (
+        b'{"series":['
+        b'{"id":"issueid:1","type":"object",'
+        b'"data":{"name":"MOCKING-NAME","range":{"data":[[1,2]]}}},'
+        b'{"id":"price:issueid:1","type":"time","times":"2024-01-01T00:00:00/PT1M",'
+        b'"data":[[0,1.5],[1,1.6]]}'
+        b"]}"
+    )
+    spaced_body = nested_body.replace(b"[[0,1.5]", b"[[0, 1.5]")
+
+    # EXECUTE
+    with pytest.raises(AttributeError):
+        SeriesFormatter.split_data(body=spaced_body)
+    _chart_map, nested_df_map = SeriesFormatter.parse_chart(body=nested_body)
+    _chart_map, spaced_df_map = SeriesFormatter.parse_chart(body=spaced_body)
+
+    # CHECK
+    for df_map in [nested_df_map, spaced_df_map]:
+        assert df_map["issueid:1"]["range"].to_list() == [{"data": [[1, 2]]}]
+        assert df_map["price:issueid:1"]["price"].to_list() == [1.5, 1.6]
+        assert df_map["price:issueid:1"]["timestamp"].to_list() == [
+            datetime(2024, 1, 1, 0, 0),
+            datetime(2024, 1, 1, 0, 1),
+        ]
+
+
+@pytest.mark.quotecast
+def test_format_timestamp_calendar_days():
+    # SETUP
+    df = pl.DataFrame({"timestamp": [0, 1, 2]})
+    start, resolution = SeriesFormatter.parse_date_and_resolution(
+        times="2024-01-01T00:00:00/P1M15D",
+    )
+
+    # EXECUTE
+    df = SeriesFormatter.format_timestamp(
+        df=df,
+        column="timestamp",
+        start=start,
+        resolution=resolution,
+    )
+
+    # CHECK
+    assert df["timestamp"].to_list() == [
+        datetime(2024, 1, 1),
+        datetime(2024, 2, 16),
+        datetime(2024, 3, 31),
+    ]
+
+
+@pytest.mark.quotecast
+def test_build_window_list():
+    # EXECUTE
+    window_list = ChartPaginator.build_window_list(
+        start=datetime(2024, 1, 1),
+        end=datetime(2024, 1, 3, 12),
+        resolution=Interval.PT1M,
+    )
+
+    # CHECK
+    assert window_list == [
+        (datetime(2024, 1, 1), datetime(2024, 1, 2)),
+        (datetime(2024, 1, 2), datetime(2024, 1, 3)),
+        (datetime(2024, 1, 3), datetime(2024, 1, 3, 12)),
+    ]
+    assert ChartPaginator.build_window_list(
+        start=datetime(2024, 1, 1),
+        end=datetime(2034, 1, 1),
+        resolution=Interval.P1M,
+    ) == [(datetime(2024, 1, 1), datetime(2034, 1, 1))]
+
+
+@pytest.mark.quotecast
+def test_build_params_without_period():
+    # SETUP
+    chart_request = ChartRequest(
+        culture="fr-FR",
+        period=Interval.P1D,
+        requestid="1",
+        resolution=Interval.PT1M,
+        series=["price:issueid:1"],
+        tz="Europe/Paris",
+    )
+    window_request = ChartPaginator.build_chart_request_list(
+        chart_request=chart_request,
+        window_list=[(datetime(2024, 1, 1), datetime(2024, 1, 2))],
+    )[0]
+
+    # EXECUTE
+    params = ChartFetcher.build_params(chart_request=chart_request, user_token=0)
+    window_params = ChartFetcher.build_params(
+        chart_request=window_request,
+        user_token=0,
+    )
+
+    # CHECK
+    assert params["period"] == "P1D"
+    assert "period" not in window_params
+    assert window_params["start"] == "2024-01-01T00:00:00"
+    assert window_params["end"] == "2024-01-02T00:00:00"
+
+
+@pytest.mark.quotecast
+def test_get_chart_history():
+    # SETUP
+    class MockChartFetcher(ChartFetcher):
+        def fetch_chart_df_map(self, chart_request, session=None):
+            start = datetime.fromisoformat(chart_request.override["start"])
+            end = datetime.fromisoformat(chart_request.override["end"])
+            # EACH WINDOW OVERLAPS THE NEXT ONE BY ONE POINT
+            timestamp_list = []
+            timestamp = start
+            while timestamp <= end:
+                timestamp_list.append(timestamp)
+                timestamp += timedelta(hours=6)
+
+            return {
+                "issueid:1": pl.DataFrame({"name": ["MOCKING-NAME"]}),
+                "price:issueid:1": pl.DataFrame(
+                    {
+                        "timestamp": timestamp_list,
+                        "price": [float(t.day) for t in timestamp_list],
+                    }
+                ),
+            }
+
+    chart_fetcher = MockChartFetcher(user_token=0)
+    chart_request = ChartRequest(
+        culture="fr-FR",
+        period=Interval.P1D,
+        requestid="1",
+        resolution=Interval.PT1M,
+        series=["issueid:1", "price:issueid:1"],
+        tz="Europe/Paris",
+    )
+
+    # EXECUTE
+    df_map = chart_fetcher.get_chart_history(
+        chart_request=chart_request,
+        start=datetime(2024, 1, 1),
+        end=datetime(2024, 1, 4),
+    )
+
+    # CHECK
+    df = df_map["price:issueid:1"]
+    assert df_map["issueid:1"]["name"].to_list() == ["MOCKING-NAME"]
+    assert df.height == 12
+    assert df["timestamp"].is_sorted()
+    assert df["timestamp"].is_unique().all()
+    assert df["timestamp"][-1] == datetime(2024, 1, 3, 18)
+    assert chart_request.override == {}
@@ -0,0 +1,70 @@
+# IMPORTATIONS STANDARD
+import logging
+import math
+from datetime import timedelta
+
+import orjson
+import pytest
+
+from degiro_connector.quotecast.models.ticker import Ticker
+from degiro_connector.quotecast.tools.order_book import OrderBookMap
+from degiro_connector.quotecast.tools.ticker_to_metric_list import TickerToMetricList
+
+logging.basicConfig(level=logging.FATAL)
+
+
+def build_ticker(message_list: list[dict]) -> Ticker:
+    return Ticker(
+        json_text=orjson.dumps(message_list).decode(),
+        request_duration=timedelta(milliseconds=5),
+    )
+
+
+# TESTS FEATURES
+@pytest.mark.quotecast
+@pytest.mark.parametrize("use_columns", [False, True])
+def test_order_book_map(use_columns):
+    # SETUP
+    ticker_to_metric_list = TickerToMetricList()
+    order_book_map = OrderBookMap()
+    ticker = build_ticker(
+        message_list=[
+            {"m": "a_req", "v": ["360015751.B1Price", 1]},
+            {"m": "a_req", "v": ["360015751.B1Volume", 2]},
+            {"m": "a_req", "v": ["360015751.B2Volume", 3]},
+            {"m": "a_req", "v": ["360015751.A1Price", 4]},
+            {"m": "a_req", "v": ["360015751.A1Volume", 5]},
+            {"m": "a_req", "v": ["360015751.LastPrice", 6]},
+            {"m": "un", "v": [1, 10.0]},
+            {"m": "un", "v": [2, 100]},
+            {"m": "un", "v": [3, 50]},
+            {"m": "un", "v": [4, 10.5]},
+            {"m": "un", "v": [5, 20]},
+            {"m": "un", "v": [6, 10.2]},
+        ]
+    )
+
+    # EXECUTE
+    if use_columns:
+        updated_set = order_book_map.update_columns(
+            metric_columns=ticker_to_metric_list.parse_columns(ticker=ticker),
+        )
+    else:
+        updated_set = order_book_map.update(
+            metric_list=ticker_to_metric_list.parse(ticker=ticker),
+        )
+    order_book = order_book_map["360015751"]
+
+    # CHECK
+    assert updated_set == {"360015751"}
+    assert order_book.best_bid == (10.0, 100.0)
+    assert order_book.best_ask == (10.5, 20.0)
+    assert order_book.spread == pytest.approx(0.5)
+    assert order_book.mid == pytest.approx(10.25)
+    assert order_book.cumulative_volume(side="bid", level=10) == 150.0
+    assert order_book.update_count == 5
+    assert math.isnan(order_book.get_level(side="bid", level=2)[0])
+
+    order_book.set_value(metric_name="B2Volume", value=10)
+    assert order_book.cumulative_volume(side="bid", level=2) == 110.0
+    assert order_book.set_value(metric_name="LastPrice", value=1.0) is False
@@ -0,0 +1,74 @@
+# IMPORTATIONS STANDARD
+import logging
+from datetime import timedelta
+
+import orjson
+import pytest
+
+from degiro_connector.quotecast.models.ticker import Ticker
+from degiro_connector.quotecast.tools.quotecast_sharded_stream import (
+    QuotecastShardedStream,
+)
+from degiro_connector.quotecast.tools.ticker_fetcher import TickerFetcher
+
+logging.basicConfig(level=logging.FATAL)
+
+
+# TESTS FEATURES
+@pytest.mark.quotecast
+def test_split_request_map_is_balanced_and_stable():
+    # SETUP
+    stream = QuotecastShardedStream(user_token=123, shard_count=4)
+    request_map = {str(product_id): ["LastPrice", "LastVolume"] for product_id in range(100)}
+
+    # EXECUTE
+    stream.subscribe(request_map=request_map)
+    stream.subscribe(request_map={"7": ["LastDate"]})
+    stream.unsubscribe(request_map={"8": ["LastPrice", "LastVolume"]})
+
+    # CHECK
+    shard_size_list = [len(shard.request_map) for shard in stream.stream_list]
+    assert sum(shard_size_list) == 99
+    assert max(shard_size_list) - min(shard_size_list) <= 1
+    assert stream.request_map["7"] == ["LastPrice", "LastVolume", "LastDate"]
+    assert "8" not in stream.shard_map
+
+
+@pytest.mark.quotecast
+def test_shards_merge_into_one_feed(mocker):
+    # SETUP
+    session_counter = iter(range(100))
+    served = set()
+
+    def fetch_ticker(session_id, session=None, logger=None):
+        if session_id in served:
+            return Ticker(json_text='[{"m":"h"}]', request_duration=timedelta(0))
+        served.add(session_id)
+        return Ticker(
+            json_text=orjson.dumps(
+                [
+                    {"m": "a_req", "v": [f"{session_id}.LastPrice", 1]},
+                    {"m": "un", "v": [1, 1.0]},
+                ]
+            ).decode(),
+            request_duration=timedelta(0),
+        )
+
+    mocker.patch.object(
+        TickerFetcher,
+        "get_session_id",
+        side_effect=lambda **kwargs: f"SESSION-{next(session_counter)}",
+    )
+    mocker.patch.object(TickerFetcher, "fetch_ticker", side_effect=fetch_ticker)
+    mocker.patch.object(TickerFetcher, "subscribe", return_value=True)
+    stream = QuotecastShardedStream(user_token=123, shard_count=3)
+    stream.subscribe(request_map={"1": ["LastPrice"], "2": ["LastPrice"], "3": ["LastPrice"]})
+
+    # EXECUTE
+    stream.start()
+    update_list = [stream.get(timeout=2) for _ in range(3)]
+    stream.stop(timeout=2)
+
+    # CHECK
+    assert len({update.session_id for update in update_list}) == 3
+    assert not stream.running
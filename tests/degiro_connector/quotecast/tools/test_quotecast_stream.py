@@ -0,0 +1,154 @@
+# IMPORTATIONS STANDARD
+import logging
+import threading
+from datetime import timedelta
+
+import orjson
+import pytest
+
+from degiro_connector.quotecast.models.ticker import Ticker
+from degiro_connector.quotecast.tools.quotecast_stream import QuotecastStream
+from degiro_connector.quotecast.tools.ticker_fetcher import TickerFetcher
+
+logging.basicConfig(level=logging.FATAL)
+
+
+def build_ticker(message_list: list[dict]) -> Ticker:
+    return Ticker(
+        json_text=orjson.dumps(message_list).decode(),
+        request_duration=timedelta(milliseconds=5),
+    )
+
+
+# TESTS FEATURES
+@pytest.mark.quotecast
+def test_stream_renews_session_and_replays_subscriptions(mocker):
+    # SETUP
+    session_id_list = iter(["SESSION-1", "SESSION-2"])
+    ticker_map = {
+        "SESSION-1": iter(
+            [
+                build_ticker(
+                    message_list=[
+                        {"m": "a_req", "v": ["360015751.LastPrice", 1]},
+                        {"m": "un", "v": [1, 10.5]},
+                    ]
+                ),
+                None,  # SESSION EXPIRED : `[{"m":"sr"}]`
+            ]
+        ),
+        "SESSION-2": iter(
+            [
+                build_ticker(
+                    message_list=[
+                        {"m": "a_req", "v": ["360015751.LastPrice", 7]},
+                        {"m": "un", "v": [7, 11.5]},
+                    ]
+                ),
+            ]
+        ),
+    }
+    subscription_list = []
+    done = threading.Event()
+
+    def fetch_ticker(session_id, session=None, logger=None):
+        ticker = next(ticker_map[session_id], None)
+        if ticker is None and session_id == "SESSION-2":
+            done.wait(1)
+            return build_ticker(message_list=[{"m": "h"}])
+        return ticker
+
+    def subscribe(ticker_request, session_id, session=None, logger=None):
+        subscription_list.append((session_id, ticker_request.request_map))
+        return True
+
+    mocker.patch.object(
+        TickerFetcher,
+        "get_session_id",
+        side_effect=lambda **kwargs: next(session_id_list),
+    )
+    mocker.patch.object(TickerFetcher, "fetch_ticker", side_effect=fetch_ticker)
+    mocker.patch.object(TickerFetcher, "subscribe", side_effect=subscribe)
+    stream = QuotecastStream(user_token=123, retry_delay=0.01)
+    stream.subscribe(request_map={"360015751": ["LastPrice"]})
+
+    # EXECUTE
+    stream.start()
+    first_update = stream.get(timeout=2)
+    second_update = stream.get(timeout=2)
+    done.set()
+    stream.stop(timeout=2)
+
+    # CHECK
+    assert first_update.session_id == "SESSION-1"
+    assert first_update.metric_list[0].value == 10.5
+    assert second_update.session_id == "SESSION-2"
+    assert second_update.metric_list[0].value == 11.5
+    assert stream.renewal_count == 2
+    assert subscription_list == [
+        ("SESSION-1", {"360015751": ["LastPrice"]}),
+        ("SESSION-2", {"360015751": ["LastPrice"]}),
+    ]
+    assert not stream.running
+
+
+@pytest.mark.quotecast
+def test_stream_subscription_set():
+    # SETUP
+    stream = QuotecastStream(user_token=123)
+
+    # EXECUTE
+    sent = stream.subscribe(request_map={"1": ["LastPrice", "LastVolume"], "2": ["LastPrice"]})
+    stream.subscribe(request_map={"1": ["LastPrice"]})
+    stream.unsubscribe(request_map={"2": ["LastPrice"], "1": ["LastVolume"]})
+
+    # CHECK
+    assert sent is False
+    assert stream.request_map == {"1": ["LastPrice"]}
+
+
+@pytest.mark.quotecast
+def test_stream_backs_off_on_failed_renewals_only(mocker):
+    # SETUP
+    session_id_list = iter(["SESSION-1", "", "SESSION-2"])
+    ticker_list = iter(
+        [
+            build_ticker(message_list=[{"m": "a_req", "v": ["1.LastPrice", 1]}]),
+            build_ticker(message_list=[{"m": "un", "v": [1, 10.5]}]),
+            None,  # SESSION EXPIRED : `[{"m":"sr"}]`
+        ]
+    )
+    call_list = []
+    failed = threading.Event()
+
+    def get_session_id(**kwargs):
+        session_id = next(session_id_list, "")
+        call_list.append(("get_session_id", session_id))
+        if not session_id:
+            failed.set()
+        return session_id
+
+    def fetch_ticker(session_id, session=None, logger=None):
+        call_list.append(("fetch_ticker", session_id))
+        return next(ticker_list, None)
+
+    mocker.patch.object(TickerFetcher, "get_session_id", side_effect=get_session_id)
+    mocker.patch.object(TickerFetcher, "fetch_ticker", side_effect=fetch_ticker)
+    mocker.patch.object(TickerFetcher, "subscribe", return_value=True)
+    stream = QuotecastStream(user_token=123, retry_delay=60)
+    stream.subscribe(request_map={"1": ["LastPrice"]})
+
+    # EXECUTE
+    stream.start()
+    stream.get(timeout=2)
+    failed.wait(timeout=2)
+    stream.stop(timeout=2)
+
+    # CHECK
+    # THE "sr" IS FOLLOWED BY AN IMMEDIATE RENEWAL, WHICH FAILS : THE STREAM
+    # THEN WAITS `retry_delay` AND IS STOPPED BEFORE THE NEXT ATTEMPT
+    assert call_list[-2:] == [
+        ("fetch_ticker", "SESSION-1"),
+        ("get_session_id", ""),
+    ]
+    assert not stream.running
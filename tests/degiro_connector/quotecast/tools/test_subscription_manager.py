@@ -0,0 +1,133 @@
+# IMPORTATIONS STANDARD
+import logging
+
+import pytest
+
+from degiro_connector.quotecast.models.ticker import TickerRequest
+from degiro_connector.quotecast.tools.subscription_manager import SubscriptionManager
+from degiro_connector.quotecast.tools.ticker_fetcher import TickerFetcher
+
+logging.basicConfig(level=logging.FATAL)
+
+
+# TESTS FEATURES
+@pytest.mark.quotecast
+def test_build_ticker_request_payload_list():
+    # SETUP
+    ticker_request = TickerRequest(
+        request_type="subscription",
+        request_map={
+            "360015751": ["LastPrice", "LastVolume"],
+            "360017018": ["LastDate"],
+        },
+    )
+
+    # EXECUTE
+    payload = TickerFetcher.build_ticker_request_payload(ticker_request=ticker_request)
+    payload_list = TickerFetcher.build_ticker_request_payload_list(
+        ticker_request=ticker_request,
+        max_payload_size=60,
+    )
+
+    # CHECK
+    assert payload == (
+        '{"controlData":"'
+        "a_req(360015751.LastPrice);"
+        "a_req(360015751.LastVolume);"
+        "a_req(360017018.LastDate);"
+        '"}'
+    )
+    assert payload_list == [
+        '{"controlData":"a_req(360015751.LastPrice);"}',
+        '{"controlData":"a_req(360015751.LastVolume);"}',
+        '{"controlData":"a_req(360017018.LastDate);"}',
+    ]
+    assert all(len(payload) <= 60 for payload in payload_list)
+
+
+@pytest.mark.quotecast
+def test_sync_only_sends_the_difference(mocker):
+    # SETUP
+    ticker_request_list = []
+
+    def subscribe(ticker_request, session_id, **kwargs):
+        ticker_request_list.append((session_id, ticker_request))
+        return True
+
+    mocker.patch.object(TickerFetcher, "subscribe", side_effect=subscribe)
+    subscription_manager = SubscriptionManager()
+
+    # EXECUTE
+    subscription_manager.sync(
+        session_id="SESSION-1",
+        request_map={
+            "360015751": ["LastPrice", "LastVolume"],
+            "360017018": ["LastPrice"],
+        },
+    )
+    ticker_request_list.clear()
+    result = subscription_manager.sync(
+        session_id="SESSION-1",
+        request_map={
+            "360015751": ["LastPrice"],
+            "AAPL.BATS,E": ["LastPrice"],
+        },
+    )
+
+    # CHECK
+    assert result is True
+    assert [
+        (session_id, ticker_request.request_type, ticker_request.request_map)
+        for session_id, ticker_request in ticker_request_list
+    ] == [
+        (
+            "SESSION-1",
+            "unsubscription",
+            {"360015751": ["LastVolume"], "360017018": ["LastPrice"]},
+        ),
+        ("SESSION-1", "subscription", {"AAPL.BATS,E": ["LastPrice"]}),
+    ]
+    assert subscription_manager.get_request_map(session_id="SESSION-1") == {
+        "360015751": ["LastPrice"],
+        "AAPL.BATS,E": ["LastPrice"],
+    }
+
+    subscription_manager.reset(session_id="SESSION-1")
+    assert subscription_manager.get_request_map(session_id="SESSION-1") == {}
+
+
+@pytest.mark.quotecast
+def test_send_keeps_the_batches_applied_before_a_failure(mocker):
+    # SETUP
+    ticker_request_list = []
+
+    def subscribe(ticker_request, session_id, **kwargs):
+        ticker_request_list.append(ticker_request)
+        return len(ticker_request_list) < 3
+
+    mocker.patch.object(TickerFetcher, "subscribe", side_effect=subscribe)
+    subscription_manager = SubscriptionManager(max_payload_size=60)
+    request_map = {
+        "360015751": ["LastPrice", "LastVolume"],
+        "360017018": ["LastDate"],
+    }
+
+    # EXECUTE
+    result = subscription_manager.sync(
+        session_id="SESSION-1",
+        request_map=request_map,
+    )
+
+    # CHECK
+    assert result is False
+    assert len(ticker_request_list) == 3
+    assert subscription_manager.get_request_map(session_id="SESSION-1") == {
+        "360015751": ["LastPrice", "LastVolume"],
+    }
+
+    subscription, unsubscription = subscription_manager.diff(
+        session_id="SESSION-1",
+        request_map=request_map,
+    )
+    assert subscription.request_map == {"360017018": ["LastDate"]}
+    assert unsubscription.request_map == {}
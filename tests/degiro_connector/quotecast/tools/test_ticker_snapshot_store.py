@@ -0,0 +1,80 @@
+# IMPORTATIONS STANDARD
+import logging
+from datetime import timedelta
+
+import orjson
+import pytest
+
+from degiro_connector.quotecast.models.ticker import Ticker, TickerSnapshot
+from degiro_connector.quotecast.tools.ticker_snapshot_store import TickerSnapshotStore
+from degiro_connector.quotecast.tools.ticker_to_metric_list import TickerToMetricList
+
+logging.basicConfig(level=logging.FATAL)
+
+
+# TESTS FEATURES
+@pytest.mark.quotecast
+def test_save_and_load(tmp_path):
+    # SETUP
+    ticker_snapshot = TickerSnapshot(
+        session_id="SESSION-1",
+        reference_map={
+            1: ["360015751", "LastPrice"],
+            2: ["360015751", "LastVolume"],
+            3: ["AAPL.BATS,E", "LastPrice"],
+        },
+        request_map={
+            "360015751": ["LastPrice", "LastVolume"],
+            "AAPL.BATS,E": ["LastPrice"],
+        },
+    )
+    path = tmp_path / "ticker.snapshot"
+
+    # EXECUTE
+    TickerSnapshotStore.save(ticker_snapshot=ticker_snapshot, path=path)
+    loaded_snapshot = TickerSnapshotStore.load(path=path)
+
+    # CHECK
+    assert loaded_snapshot == ticker_snapshot
+
+    data = bytearray(path.read_bytes())
+    data[-5] ^= 0xFF
+    with pytest.raises(AttributeError):
+        TickerSnapshotStore.loads(data=bytes(data))
+    with pytest.raises(AttributeError):
+        TickerSnapshotStore.loads(data=b"NOPE" + bytes(data[4:]))
+
+
+@pytest.mark.quotecast
+def test_validate_restored_references():
+    # SETUP
+    ticker_to_metric_list = TickerToMetricList(
+        reference_map={
+            1: ["360015751", "LastPrice"],
+            2: ["360015751", "LastVolume"],
+            3: ["AAPL.BATS,E", "LastPrice"],
+        },
+    )
+    ticker = Ticker(
+        json_text=orjson.dumps(
+            [
+                {"m": "a_req", "v": ["360015751.LastPrice", 1]},
+                {"m": "a_req", "v": ["AAPL.BATS,E.LastPrice", 2]},
+                {"m": "un", "v": [1, 10.5]},
+            ]
+        ).decode(),
+        request_duration=timedelta(milliseconds=5),
+    )
+
+    # EXECUTE
+    metric_list = ticker_to_metric_list.parse(ticker=ticker)
+    dropped_count = ticker_to_metric_list.validate()
+
+    # CHECK
+    assert metric_list[0].value == 10.5
+    assert dropped_count == 1
+    assert ticker_to_metric_list.mismatch_count == 1
+    assert ticker_to_metric_list.reference_map == {
+        1: ["360015751", "LastPrice"],
+        2: ["AAPL.BATS,E", "LastPrice"],
+    }
@@ -0,0 +1,171 @@
+# IMPORTATIONS STANDARD
+import logging
+from datetime import timedelta
+
+import orjson
+import pytest
+
+from degiro_connector.quotecast.models.ticker import Ticker
+from degiro_connector.quotecast.tools.ticker_to_df import TickerToDF
+
+logging.basicConfig(level=logging.FATAL)
+
+
+def build_ticker(message_list: list[dict]) -> Ticker:
+    return Ticker(
+        json_text=orjson.dumps(message_list).decode(),
+        request_duration=timedelta(milliseconds=500),
+    )
+
+
+# TESTS FEATURES
+@pytest.mark.quotecast
+def test_incremental_state_matches_build_df():
+    # SETUP
+    ticker_to_df = TickerToDF()
+    first_ticker = build_ticker(
+        message_list=[
+            {"m": "a_req", "v": ["360015751.LastDate", 1]},
+            {"m": "a_req", "v": ["360015751.LastTime", 2]},
+            {"m": "a_req", "v": ["360015751.LastPrice", 3]},
+            {"m": "a_req", "v": ["360015751.LastVolume", 4]},
+            {"m": "a_req", "v": ["AAPL.BATS,E.LastPrice", 5]},
+            {"m": "us", "v": [1, "2024-01-02"]},
+            {"m": "us", "v": [2, "10:11:12"]},
+            {"m": "un", "v": [3, 115.85]},
+            {"m": "un", "v": [4, 100]},
+            {"m": "un", "v": [5, 190.5]},
+        ]
+    )
+    second_ticker = build_ticker(message_list=[{"m": "un", "v": [5, 191.5]}])
+
+    # EXECUTE
+    ticker_to_df.parse(ticker=first_ticker)
+    df = ticker_to_df.parse(ticker=second_ticker)
+    expected_df = TickerToDF.build_df(metric_list=ticker_to_df.stored_metric_list)
+
+    # CHECK
+    assert df.drop(["request_duration_s", "response_datetime_utc"]).equals(expected_df)
+    assert df["LastPrice"].to_list() == [115.85, 191.5]
+    assert ticker_to_df.ticker_state.row_map == {"360015751": 0, "AAPL.BATS,E": 1}
+
+
+@pytest.mark.quotecast
+def test_update_without_snapshot():
+    # SETUP
+    ticker_to_df = TickerToDF()
+    ticker = build_ticker(
+        message_list=[
+            {"m": "a_req", "v": ["1.B1Volume", 1]},
+            {"m": "un", "v": [1, 12.0]},
+        ]
+    )
+
+    # EXECUTE
+    metric_columns = ticker_to_df.update(ticker=ticker)
+    heartbeat_df = ticker_to_df.parse(ticker=Ticker(
+        json_text='[{"m":"h"}]',
+        request_duration=timedelta(0),
+    ))
+    df = ticker_to_df.ticker_state.build_df()
+
+    # CHECK
+    assert len(metric_columns) == 1
+    assert heartbeat_df is None
+    assert df["B1Volume"].to_list() == [12]
+
+
+@pytest.mark.quotecast
+def test_build_df_only_rebuilds_the_changed_columns():
+    # SETUP
+    ticker_to_df = TickerToDF()
+    first_ticker = build_ticker(
+        message_list=[
+            {"m": "a_req", "v": ["1.LastPrice", 1]},
+            {"m": "a_req", "v": ["1.LastVolume", 2]},
+            {"m": "a_req", "v": ["2.LastPrice", 3]},
+            {"m": "un", "v": [1, 10.0]},
+            {"m": "un", "v": [2, 100]},
+            {"m": "un", "v": [3, 20.0]},
+        ]
+    )
+    second_ticker = build_ticker(message_list=[{"m": "un", "v": [3, 21.0]}])
+
+    # EXECUTE
+    first_df = ticker_to_df.parse(ticker=first_ticker)
+    metric_list = ticker_to_df.stored_metric_list
+    second_df = ticker_to_df.parse(ticker=second_ticker)
+
+    # CHECK
+    assert first_df["LastPrice"].to_list() == [10.0, 20.0]
+    assert second_df["LastPrice"].to_list() == [10.0, 21.0]
+    assert second_df["LastVolume"].to_list() == [100, None]
+    assert len(ticker_to_df.last_metric_list) == 1
+    assert ticker_to_df.ticker_state.build_df() is second_df
+    assert ticker_to_df.stored_metric_list is not metric_list
+    assert ticker_to_df.stored_metric_list is ticker_to_df.stored_metric_list
+
+
+@pytest.mark.quotecast
+def test_update_builds_metrics_on_demand():
+    # SETUP
+    ticker_to_df = TickerToDF()
+    ticker = build_ticker(
+        message_list=[
+            {"m": "a_req", "v": ["360015751.LastPrice", 1]},
+            {"m": "un", "v": [1, 115.85]},
+        ]
+    )
+
+    # EXECUTE
+    ticker_to_df.update(ticker=ticker)
+    metric_list = ticker_to_df.last_metric_list
+
+    # CHECK
+    assert [(metric.product_id, metric.value) for metric in metric_list] == [
+        ("360015751", 115.85)
+    ]
+
+
+@pytest.mark.quotecast
+def test_deprecated_methods():
+    # SETUP
+    ticker_to_df = TickerToDF()
+    ticker = build_ticker(
+        message_list=[
+            {"m": "a_req", "v": ["360015751.LastPrice", 1]},
+            {"m": "un", "v": [1, 115.85]},
+        ]
+    )
+    ticker_to_df.update(ticker=ticker)
+    metric_list = ticker_to_df.last_metric_list
+
+    # EXECUTE
+    with pytest.warns(DeprecationWarning):
+        merged_metric_list = TickerToDF.merge_metric_list(
+            current_data=metric_list,
+            new_data=metric_list,
+        )
+    df = TickerToDF.build_df(metric_list=merged_metric_list)
+    with pytest.warns(DeprecationWarning):
+        df = ticker_to_df.add_request_duration_column(
+            df=df,
+            last_metric_list=metric_list,
+            ticker=ticker,
+        )
+    with pytest.warns(DeprecationWarning):
+        df = ticker_to_df.add_response_datetime_column(
+            df=df,
+            last_metric_list=metric_list,
+            ticker=ticker,
+        )
+
+    # CHECK
+    assert len(merged_metric_list) == 1
+    assert df.columns == [
+        "product_id",
+        "LastPrice",
+        "request_duration_s",
+        "response_datetime_utc",
+    ]
+    assert df["request_duration_s"].to_list() == [0.5]
@@ -0,0 +1,122 @@
+# IMPORTATIONS STANDARD
+import logging
+import math
+from datetime import timedelta
+
+import orjson
+import pytest
+
+from degiro_connector.quotecast.models.ticker import Ticker
+from degiro_connector.quotecast.tools.ticker_state import TickerState
+from degiro_connector.quotecast.tools.ticker_to_metric_list import TickerToMetricList
+
+logging.basicConfig(level=logging.FATAL)
+
+
+def build_ticker(message_list: list[dict]) -> Ticker:
+    return Ticker(
+        json_text=orjson.dumps(message_list).decode(),
+        request_duration=timedelta(milliseconds=500),
+    )
+
+
+@pytest.fixture(scope="function")
+def ticker() -> Ticker:
+    return build_ticker(
+        message_list=[
+            {"m": "a_req", "v": ["365004197.B1Price", 10]},
+            {"m": "a_req", "v": ["365004197.B1Volume", 11]},
+            {"m": "a_req", "v": ["AAPL.BATS,E.FullName", 12]},
+            {"m": "un", "v": [10, 115.85]},
+            {"m": "un", "v": [11, 300]},
+            {"m": "us", "v": [12, "APPLE INC"]},
+            {"m": "h", "v": []},
+        ]
+    )
+
+
+# TESTS FEATURES
+@pytest.mark.quotecast
+def test_parse_columns(ticker):
+    # EXECUTE
+    metric_columns = TickerToMetricList().parse_columns(ticker=ticker)
+
+    # CHECK
+    assert len(metric_columns) == 3
+    assert list(metric_columns.reference_list) == [10, 11, 12]
+    assert list(metric_columns.numeric_list)[:2] == [115.85, 300.0]
+    assert math.isnan(metric_columns.numeric_list[2])
+    assert metric_columns.text_list == [None, None, "APPLE INC"]
+    assert [metric_columns.product_id_table[slot] for slot in metric_columns.slot_list] == [
+        "365004197",
+        "365004197",
+        "AAPL.BATS,E",
+    ]
+
+
+@pytest.mark.quotecast
+def test_parse_columns_matches_parse(ticker):
+    # EXECUTE
+    metric_list = TickerToMetricList().parse(ticker=ticker)
+    metric_columns = TickerToMetricList().parse_columns(ticker=ticker)
+
+    # CHECK
+    assert metric_columns.to_metric_list() == metric_list
+
+
+@pytest.mark.quotecast
+def test_parse_columns_unregistration(ticker):
+    # SETUP
+    ticker_to_metric_list = TickerToMetricList()
+    ticker_to_metric_list.parse_columns(ticker=ticker)
+    unregistration = build_ticker(message_list=[{"m": "a_rel", "v": ["365004197.B1Price", 10]}])
+
+    # EXECUTE
+    metric_columns = ticker_to_metric_list.parse_columns(ticker=unregistration)
+
+    # CHECK
+    assert len(metric_columns) == 0
+    assert 10 not in ticker_to_metric_list.reference_map
+    with pytest.raises(KeyError):
+        ticker_to_metric_list.parse_columns(
+            ticker=build_ticker(message_list=[{"m": "un", "v": [10, 1.0]}])
+        )
+
+
+@pytest.mark.quotecast
+def test_parse_columns_reuses_slots(ticker):
+    # SETUP
+    ticker_to_metric_list = TickerToMetricList()
+    ticker_to_metric_list.parse_columns(ticker=ticker)
+    renewal = build_ticker(
+        message_list=[
+            {"m": "a_rel", "v": ["365004197.B1Price", 10]},
+            {"m": "a_req", "v": ["365004197.B1Price", 20]},
+            {"m": "un", "v": [20, 116.0]},
+        ]
+    )
+
+    # EXECUTE
+    metric_columns = ticker_to_metric_list.parse_columns(ticker=renewal)
+
+    # CHECK
+    assert list(metric_columns.slot_list) == [0]
+    assert metric_columns.product_id_table == ["365004197", "365004197", "AAPL.BATS,E"]
+    assert metric_columns.metric_name_table == ["B1Price", "B1Volume", "FullName"]
+
+
+@pytest.mark.quotecast
+def test_ticker_state_update_columns(ticker):
+    # SETUP
+    ticker_state = TickerState()
+
+    # EXECUTE
+    metric_columns = TickerToMetricList().parse_columns(ticker=ticker)
+    ticker_state.update_columns(metric_columns=metric_columns, ticker=ticker)
+    df = ticker_state.build_df()
+
+    # CHECK
+    assert df["product_id"].to_list() == ["365004197", "AAPL.BATS,E"]
+    assert df["B1Price"].to_list() == [115.85, None]
+    assert df["B1Volume"].to_list() == [300, None]
+    assert df["FullName"].to_list() == [None, "APPLE INC"]
@@ -0,0 +1,119 @@
+# IMPORTATIONS STANDARD
+import logging
+import threading
+
+import pytest
+
+from degiro_connector.core.helpers.session_store import FileSessionStore
+from degiro_connector.core.helpers.url_override import override_urls
+from degiro_connector.core.models.model_connection import ModelConnection
+from degiro_connector.trading.api import API as TradingAPI
+from degiro_connector.trading.models.account import UpdateOption, UpdateRequest
+from degiro_connector.trading.models.credentials import Credentials
+
+from fake_server import FakeServer
+
+logging.basicConfig(level=logging.FATAL)
+
+
+def build_trading_api(session_store: FileSessionStore | None = None) -> TradingAPI:
+    return TradingAPI(
+        credentials=Credentials(
+            int_account=12345,
+            username="USERNAME",
+            password="PASSWORD",
+        ),
+        connection_storage=ModelConnection(
+            timeout=TradingAPI.TRADING_TIMEOUT,
+            session_store=session_store,
+        ),
+    )
+
+
+# TESTS FEATURES
+@pytest.mark.trading
+def test_connect_single_flight():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD", latency=0.2)
+    session_id_list = []
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api()
+        thread_list = [
+            threading.Thread(
+                target=lambda: session_id_list.append(trading_api.connect())
+            )
+            for _ in range(8)
+        ]
+        for thread in thread_list:
+            thread.start()
+        for thread in thread_list:
+            thread.join()
+
+    # CHECK
+    assert fake_server.request_count_map["trading:login"] == 1
+    assert len(session_id_list) == 8
+    assert len(set(session_id_list)) == 1
+    assert session_id_list[0] == trading_api.connection_storage.session_id
+
+
+@pytest.mark.trading
+def test_connect_reuse_window():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api()
+        session_id_a = trading_api.connect()
+        session_id_b = trading_api.connect()
+        login_count = fake_server.request_count_map["trading:login"]
+
+        # THE SESSION FAILED : A NEW ONE IS CREATED
+        fake_server.expire_trading_session(session_id=session_id_b)
+        trading_api.get_update(
+            request_list=[UpdateRequest(option=UpdateOption.ORDERS, last_updated=0)]
+        )
+        session_id_c = trading_api.connect()
+
+    # CHECK
+    assert login_count == 1
+    assert session_id_a == session_id_b
+    assert session_id_c != session_id_b
+    assert fake_server.request_count_map["trading:login"] == 2
+
+
+@pytest.mark.trading
+def test_connect_session_store(tmp_path):
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+    session_store = FileSessionStore(path=tmp_path / "sessions.json")
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api_a = build_trading_api(session_store=session_store)
+        trading_api_b = build_trading_api(session_store=session_store)
+        trading_api_a.connect()
+        trading_api_b.connect()
+        login_count = fake_server.request_count_map["trading:login"]
+
+        # THE STORED SESSION FAILED : A NEW ONE IS CREATED
+        fake_server.expire_trading_session(
+            session_id=trading_api_b.connection_storage.session_id
+        )
+        trading_api_b.get_update(
+            request_list=[UpdateRequest(option=UpdateOption.ORDERS, last_updated=0)]
+        )
+        trading_api_b.connect()
+
+    # CHECK
+    assert login_count == 1
+    assert fake_server.request_count_map["trading:login"] == 2
+    assert trading_api_a.connection_storage.session_id != (
+        trading_api_b.connection_storage.session_id
+    )
+    assert session_store.load(key="USERNAME:12345")["session_id"] == (
+        trading_api_b.connection_storage.session_id
+    )
+    assert (tmp_path / "sessions.json").stat().st_mode & 0o777 == 0o600
@@ -0,0 +1,116 @@
+# IMPORTATIONS STANDARD
+import logging
+
+import pytest
+
+from degiro_connector.core.helpers.url_override import override_urls
+from degiro_connector.trading.actions.action_submit_order import ActionSubmitOrder
+from degiro_connector.trading.api import API as TradingAPI
+from degiro_connector.trading.models.credentials import Credentials
+from degiro_connector.trading.models.order import (
+    Action,
+    Order,
+    OrderType,
+    SubmissionResponse,
+    TimeType,
+)
+
+from fake_server import FakeServer
+
+logging.basicConfig(level=logging.FATAL)
+
+
+def build_order(order_type: OrderType = OrderType.LIMIT) -> Order:
+    return Order(
+        buy_sell=Action.BUY,
+        order_type=order_type,
+        price=10.0,
+        product_id=331868,
+        size=1,
+        time_type=TimeType.GOOD_TILL_DAY,
+    )
+
+
+# TESTS FEATURES
+@pytest.mark.trading
+def test_submit_order():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+    order = build_order()
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = TradingAPI(
+            credentials=Credentials(
+                int_account=12345,
+                username="USERNAME",
+                password="PASSWORD",
+            )
+        )
+        trading_api.connect()
+        warm = trading_api.submit_order.warm_up(
+            credentials=trading_api.credentials,
+            session_id=trading_api.connection_storage.session_id,
+            session=trading_api.session_storage.session,
+        )
+        submission_response = trading_api.submit_order(order=order)
+
+    # CHECK
+    assert warm is True
+    assert isinstance(submission_response, SubmissionResponse)
+    assert submission_response.confirmation_response.order_id
+    assert submission_response.checking_response.request_duration is not None
+    assert submission_response.confirmation_response.request_duration is not None
+    assert submission_response.request_duration >= (
+        submission_response.checking_response.request_duration
+        + submission_response.confirmation_response.request_duration
+    )
+    assert fake_server.request_count_map["trading:check_order"] == 1
+    assert fake_server.request_count_map["trading:confirm_order"] == 1
+
+
+@pytest.mark.trading
+def test_build_body():
+    # SETUP
+    order = build_order(order_type=OrderType.MARKET)
+
+    # EXECUTE
+    body = ActionSubmitOrder.build_body(order=order)
+
+    # CHECK
+    assert b"price" not in body
+    assert b'"productId":331868' in body
+
+
+@pytest.mark.trading
+@pytest.mark.parametrize(
+    "status, possibly_placed",
+    [(400, False), (503, True)],
+)
+def test_submit_order_confirmation_failure(status, possibly_placed):
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = TradingAPI(
+            credentials=Credentials(
+                int_account=12345,
+                username="USERNAME",
+                password="PASSWORD",
+            )
+        )
+        trading_api.connect()
+        fake_server.fail_next(
+            path_prefix="/trader/trading/secure/v5/order/",
+            status=status,
+        )
+        submission_response = trading_api.submit_order(order=build_order())
+
+    # CHECK
+    assert isinstance(submission_response, SubmissionResponse)
+    assert not submission_response.confirmed
+    assert submission_response.checking_response.confirmation_id
+    assert str(status) in submission_response.confirmation_error
+    assert submission_response.possibly_placed is possibly_placed
+    assert fake_server.request_count_map["trading:check_order"] == 1
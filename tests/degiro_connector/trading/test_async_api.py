@@ -0,0 +1,201 @@
+# IMPORTATIONS STANDARD
+import asyncio
+import logging
+import time
+from datetime import timedelta
+
+import httpx
+import pytest
+
+from degiro_connector.core.helpers.retry import RetryPolicy
+from degiro_connector.core.models.model_async_session import ModelAsyncSession
+from degiro_connector.core.models.model_connection import ModelConnection
+from degiro_connector.trading.async_api import AsyncAPI
+from degiro_connector.trading.models.company import CompanyProfile
+from degiro_connector.trading.models.credentials import Credentials
+from degiro_connector.trading.models.order import (
+    Action,
+    CheckingResponse,
+    Order,
+    OrderType,
+    TimeType,
+)
+
+logging.basicConfig(level=logging.FATAL)
+
+
+def build_async_api(handler, retry_policy: RetryPolicy | None = None) -> AsyncAPI:
+    credentials = Credentials(
+        int_account=12345,
+        username="MOCKING-USERNAME",
+        password="MOCKING-PASSWORD",
+    )
+    connection_storage = ModelConnection(timeout=1800)
+    session_storage = ModelAsyncSession(
+        hooks=connection_storage.build_hooks(),
+        transport=httpx.MockTransport(handler),
+        retry_policy=retry_policy,
+    )
+
+    return AsyncAPI(
+        credentials=credentials,
+        connection_storage=connection_storage,
+        session_storage=session_storage,
+    )
+
+
+# TESTS FEATURES
+@pytest.mark.trading
+def test_connect_and_gather():
+    # SETUP
+    path_list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path_list.append(request.url.path)
+        if request.url.path.endswith("/login"):
+            return httpx.Response(200, json={"sessionId": "MOCKING-SESSION", "status": 0})
+        isin = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"data": {"isin": isin}})
+
+    async def main():
+        async with build_async_api(handler=handler) as async_api:
+            session_id = await async_api.connect()
+            profile_list = await asyncio.gather(
+                *(
+                    async_api.get_company_profile(product_isin=f"ISIN{i}", raw=True)
+                    for i in range(50)
+                )
+            )
+            return session_id, profile_list
+
+    # EXECUTE
+    session_id, profile_list = asyncio.run(main())
+
+    # CHECK
+    assert session_id == "MOCKING-SESSION"
+    assert len(path_list) == 51
+    assert [profile["data"]["isin"] for profile in profile_list] == [
+        f"ISIN{i}" for i in range(50)
+    ]
+
+
+@pytest.mark.trading
+def test_http_error_returns_none():
+    # SETUP
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/login"):
+            return httpx.Response(200, json={"sessionId": "MOCKING-SESSION", "status": 0})
+        return httpx.Response(401, text="Unauthorized")
+
+    async def main():
+        async with build_async_api(handler=handler) as async_api:
+            await async_api.connect()
+            return await async_api.get_company_profile(product_isin="ISIN")
+
+    # EXECUTE
+    company_profile = asyncio.run(main())
+
+    # CHECK
+    assert company_profile is None
+
+
+@pytest.mark.trading
+def test_model_response():
+    # SETUP
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/login"):
+            return httpx.Response(200, json={"sessionId": "MOCKING-SESSION", "status": 0})
+        return httpx.Response(200, json={"data": {"isin": "ISIN"}})
+
+    async def main():
+        async with build_async_api(handler=handler) as async_api:
+            await async_api.connect()
+            return await async_api.get_company_profile(product_isin="ISIN")
+
+    # EXECUTE
+    company_profile = asyncio.run(main())
+
+    # CHECK
+    assert isinstance(company_profile, CompanyProfile)
+
+
+@pytest.mark.trading
+def test_request_duration():
+    # SETUP
+    order = Order(
+        buy_sell=Action.BUY,
+        order_type=OrderType.LIMIT,
+        price=10.0,
+        product_id=331868,
+        size=1,
+        time_type=TimeType.GOOD_TILL_DAY,
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/login"):
+            return httpx.Response(200, json={"sessionId": "MOCKING-SESSION", "status": 0})
+        time.sleep(0.1)
+        return httpx.Response(200, json={"data": {"confirmationId": "CONFIRMATION"}})
+
+    async def main():
+        async with build_async_api(handler=handler) as async_api:
+            await async_api.connect()
+            return await async_api.check_order(order=order)
+
+    # EXECUTE
+    checking_response = asyncio.run(main())
+
+    # CHECK
+    assert isinstance(checking_response, CheckingResponse)
+    assert checking_response.request_duration >= timedelta(seconds=0.1)
+
+
+@pytest.mark.trading
+def test_retry_policy():
+    # SETUP
+    path_list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path_list.append(request.url.path)
+        if request.url.path.endswith("/login"):
+            return httpx.Response(200, json={"sessionId": "MOCKING-SESSION", "status": 0})
+        if len(path_list) == 2:
+            return httpx.Response(503, text="Service Unavailable")
+        return httpx.Response(200, json={"data": {"isin": "ISIN"}})
+
+    async def main():
+        retry_policy = RetryPolicy(base_delay=0.0)
+        async with build_async_api(
+            handler=handler,
+            retry_policy=retry_policy,
+        ) as async_api:
+            await async_api.connect()
+            return await async_api.get_company_profile(product_isin="ISIN")
+
+    # EXECUTE
+    company_profile = asyncio.run(main())
+
+    # CHECK
+    assert isinstance(company_profile, CompanyProfile)
+    assert len(path_list) == 3
+
+
+@pytest.mark.trading
+def test_default_timeout():
+    # SETUP
+    timeout_list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeout_list.append(request.extensions["timeout"])
+        return httpx.Response(200, json={"sessionId": "MOCKING-SESSION", "status": 0})
+
+    async def main():
+        async with build_async_api(handler=handler) as async_api:
+            return await async_api.connect()
+
+    # EXECUTE
+    session_id = asyncio.run(main())
+
+    # CHECK
+    assert session_id == "MOCKING-SESSION"
+    assert timeout_list[0]["read"] == ModelAsyncSession.DEFAULT_TIMEOUT
@@ -0,0 +1,139 @@
+# IMPORTATIONS STANDARD
+import logging
+from queue import Queue
+
+import pytest
+
+from degiro_connector.core.helpers.url_override import override_urls
+from degiro_connector.trading.api import API as TradingAPI
+from degiro_connector.trading.models.account import (
+    AccountEventType,
+    UpdateOption,
+    UpdateRequest,
+)
+from degiro_connector.trading.models.credentials import Credentials
+from degiro_connector.trading.models.order import Action, Order, OrderType, TimeType
+from degiro_connector.trading.tools.account_state import AccountState
+
+from fake_server import FakeServer
+
+logging.basicConfig(level=logging.FATAL)
+
+
+def build_position(product_id: str, size: int, price: float) -> dict:
+    return {
+        "id": product_id,
+        "name": "positionrow",
+        "isAdded": True,
+        "value": [
+            {"name": "id", "value": product_id},
+            {"name": "size", "value": size},
+            {"name": "price", "value": price},
+        ],
+    }
+
+
+# TESTS FEATURES
+@pytest.mark.trading
+def test_apply_update():
+    # SETUP
+    queue: Queue = Queue()
+    account_state = AccountState(queue=queue)
+    full_update = {
+        "portfolio": {
+            "lastUpdated": 10,
+            "value": [
+                build_position(product_id="1", size=10, price=5.0),
+                build_position(product_id="2", size=20, price=6.0),
+            ],
+        },
+        "totalPortfolio": {
+            "lastUpdated": 10,
+            "value": [{"name": "degiroCash", "value": 100.0}],
+        },
+    }
+    delta_update = {
+        "portfolio": {
+            "lastUpdated": 11,
+            "value": [
+                {
+                    "id": "1",
+                    "name": "positionrow",
+                    "value": [{"name": "price", "value": 5.5}],
+                },
+                {"id": "2", "name": "positionrow", "isRemoved": True},
+            ],
+        },
+        "totalPortfolio": {
+            "lastUpdated": 11,
+            "value": [{"name": "degiroCash", "value": 100.0}],
+        },
+    }
+
+    # EXECUTE
+    full_event_list = account_state.apply_update(
+        account_update=full_update,
+        request_list=account_state.build_request_list(),
+    )
+    request_list = account_state.build_request_list()
+    delta_event_list = account_state.apply_update(
+        account_update=delta_update,
+        request_list=request_list,
+    )
+
+    # CHECK
+    assert len(full_event_list) == 3
+    assert queue.qsize() == 5
+    assert UpdateRequest(option=UpdateOption.PORTFOLIO, last_updated=10) in request_list
+    assert [(event.type, event.id) for event in delta_event_list] == [
+        (AccountEventType.UPDATED, "1"),
+        (AccountEventType.REMOVED, "2"),
+    ]
+    assert delta_event_list[0].change_map == {"price": 5.5}
+    assert account_state.portfolio == {"1": {"id": "1", "size": 10, "price": 5.5}}
+    assert account_state.total_portfolio == {"degiroCash": 100.0}
+    assert account_state.last_updated_map[UpdateOption.PORTFOLIO] == 11
+
+
+@pytest.mark.trading
+def test_refresh():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+    credentials = Credentials(
+        int_account=12345,
+        username="USERNAME",
+        password="PASSWORD",
+    )
+    order = Order(
+        buy_sell=Action.BUY,
+        order_type=OrderType.LIMIT,
+        price=10.0,
+        product_id=331868,
+        size=1,
+        time_type=TimeType.GOOD_TILL_DAY,
+    )
+    account_state = AccountState(option_list=[UpdateOption.ORDERS])
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = TradingAPI(credentials=credentials)
+        trading_api.connect()
+        checking_response = trading_api.check_order(order=order)
+        order_id = trading_api.confirm_order(
+            confirmation_id=checking_response.confirmation_id,
+            order=order,
+        ).order_id
+        added_event_list = account_state.refresh(trading_api=trading_api)
+        idle_event_list = account_state.refresh(trading_api=trading_api)
+        trading_api.delete_order(order_id=order_id)
+        removed_event_list = account_state.refresh(trading_api=trading_api)
+
+    # CHECK
+    assert [(event.type, event.id) for event in added_event_list] == [
+        (AccountEventType.ADDED, order_id)
+    ]
+    assert idle_event_list == []
+    assert [(event.type, event.id) for event in removed_event_list] == [
+        (AccountEventType.REMOVED, order_id)
+    ]
+    assert account_state.orders == {}
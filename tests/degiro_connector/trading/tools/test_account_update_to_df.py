@@ -0,0 +1,129 @@
+# IMPORTATIONS STANDARD
+import logging
+
+import polars as pl
+import pytest
+
+from degiro_connector.trading.models.account import PortfolioRow, UpdateOption
+from degiro_connector.trading.tools.account_update_to_df import AccountUpdateToDF
+
+logging.basicConfig(level=logging.FATAL)
+
+
+def build_account_update() -> dict:
+    return {
+        "portfolio": {
+            "lastUpdated": 10,
+            "value": [
+                {
+                    "id": "331868",
+                    "name": "positionrow",
+                    "isAdded": True,
+                    "value": [
+                        {"name": "id", "value": "331868"},
+                        {"name": "positionType", "value": "PRODUCT"},
+                        {"name": "size", "value": 10},
+                        {"name": "price", "value": 180.5},
+                        {"name": "plBase", "value": {"EUR": -1700.0}},
+                        {"name": "unknownField", "value": "ignored"},
+                    ],
+                },
+                {
+                    "id": "FLATEX_EUR",
+                    "name": "positionrow",
+                    "isAdded": True,
+                    "value": [
+                        {"name": "positionType", "value": "CASH"},
+                        {"name": "size", "value": 50.25},
+                    ],
+                },
+                {"id": "332111", "name": "positionrow", "isRemoved": True},
+            ],
+        },
+        "totalPortfolio": {
+            "lastUpdated": 10,
+            "value": [
+                {"name": "degiroCash", "value": 100},
+                {"name": "freeSpaceNew", "value": {"EUR": 2000.0}},
+            ],
+        },
+    }
+
+
+# TESTS FEATURES
+@pytest.mark.trading
+def test_build_df_map():
+    # EXECUTE
+    df_map = AccountUpdateToDF.build_df_map(account_update=build_account_update())
+
+    # CHECK
+    portfolio_df = df_map[UpdateOption.PORTFOLIO]
+    total_portfolio_df = df_map[UpdateOption.TOTAL_PORTFOLIO]
+
+    assert sorted(df_map) == [UpdateOption.PORTFOLIO, UpdateOption.TOTAL_PORTFOLIO]
+    assert portfolio_df["id"].to_list() == ["331868", "FLATEX_EUR"]
+    assert portfolio_df["size"].to_list() == [10.0, 50.25]
+    assert portfolio_df["pl_base"].to_list() == [-1700.0, None]
+    assert portfolio_df.schema["size"] == pl.Float64
+    assert portfolio_df.schema["position_type"] == pl.Utf8
+    assert "unknownField" not in portfolio_df.columns
+    assert total_portfolio_df.height == 1
+    assert total_portfolio_df["degiro_cash"].to_list() == [100.0]
+    assert total_portfolio_df["free_space_new"].to_list() == [2000.0]
+
+
+@pytest.mark.trading
+def test_build_row_list():
+    # SETUP
+    value_list = build_account_update()["portfolio"]["value"]
+
+    # EXECUTE
+    row_list = AccountUpdateToDF.build_row_list(
+        option=UpdateOption.PORTFOLIO,
+        value_list=value_list,
+    )
+
+    # CHECK
+    assert row_list[0] == PortfolioRow.model_validate(row_list[0].model_dump())
+    assert row_list[0].pl_base == -1700.0
+    assert row_list[1].id == "FLATEX_EUR"
+    assert len(row_list) == 2
+    assert AccountUpdateToDF.build_df_from_table(
+        option=UpdateOption.PORTFOLIO,
+        table={"331868": {"id": "331868", "size": 10, "plBase": {"EUR": -1.0}}},
+    )["pl_base"].to_list() == [-1.0]
+
+
+@pytest.mark.trading
+def test_build_df_invalid_values(caplog):
+    # SETUP
+    value_list = [
+        {
+            "id": "1",
+            "value": [
+                {"name": "size", "value": "not a number"},
+                {"name": "price", "value": 12},
+                {"name": "date", "value": "10:11"},
+                {"name": "orderTypeId", "value": 1.5},
+            ],
+        },
+        {
+            "id": "2",
+            "value": [
+                {"name": "size", "value": "3"},
+                {"name": "orderTypeId", "value": 2.0},
+            ],
+        },
+    ]
+
+    # EXECUTE
+    with caplog.at_level(logging.WARNING):
+        df = AccountUpdateToDF.build_df(option=UpdateOption.ORDERS, value_list=value_list)
+
+    # CHECK
+    assert df["size"].to_list() == [None, 3.0]
+    assert df["price"].to_list() == [12.0, None]
+    assert df["order_date"].to_list() == ["10:11", None]
+    assert df["order_type_id"].to_list() == [None, 2]
+    assert "column=size" in caplog.text
+    assert "column=order_type_id" in caplog.text
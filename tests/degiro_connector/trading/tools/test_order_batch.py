@@ -0,0 +1,172 @@
+# IMPORTATIONS STANDARD
+import logging
+import time
+
+import pytest
+
+from degiro_connector.core.helpers.rate_limiter import RateLimiter
+from degiro_connector.core.helpers.url_override import override_urls
+from degiro_connector.trading.api import API as TradingAPI
+from degiro_connector.trading.models.credentials import Credentials
+from degiro_connector.trading.models.order import (
+    Action,
+    Order,
+    OrderType,
+    SubmissionResponse,
+    TimeType,
+)
+from degiro_connector.trading.tools.order_batch import OrderBatch
+
+from fake_server import FakeServer
+
+logging.basicConfig(level=logging.FATAL)
+
+ORDER_CHECK_PATH = "/trader/trading/secure/v5/checkOrder"
+ORDER_CONFIRM_PATH = "/trader/trading/secure/v5/order/"
+
+
+def build_trading_api() -> TradingAPI:
+    return TradingAPI(
+        credentials=Credentials(
+            int_account=12345,
+            username="USERNAME",
+            password="PASSWORD",
+        )
+    )
+
+
+def build_order_list(size: int) -> list[Order]:
+    return [
+        Order(
+            buy_sell=Action.BUY,
+            order_type=OrderType.LIMIT,
+            price=10.0 + index,
+            product_id=331868,
+            size=1,
+            time_type=TimeType.GOOD_TILL_DAY,
+        )
+        for index in range(size)
+    ]
+
+
+# TESTS FEATURES
+@pytest.mark.trading
+def test_confirm_orders():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD", latency=0.1)
+    order_list = build_order_list(size=16)
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api()
+        trading_api.connect()
+        with OrderBatch(trading_api=trading_api, max_workers=8, rate=100) as batch:
+            start = time.monotonic()
+            order_result_list = batch.confirm_orders(order_list=order_list)
+            duration = time.monotonic() - start
+            order_id_list = [
+                order_result.response.confirmation_response.order_id
+                for order_result in order_result_list
+            ]
+            delete_result_list = batch.delete_orders(
+                order_id_list=order_id_list + ["UNKNOWN-ORDER-ID"]
+            )
+
+    # CHECK
+    assert [order_result.index for order_result in order_result_list] == list(
+        range(16)
+    )
+    assert all(order_result.succeeded for order_result in order_result_list)
+    assert all(
+        isinstance(order_result.response, SubmissionResponse)
+        for order_result in order_result_list
+    )
+    assert order_result_list[3].item is order_list[3]
+    assert len(set(order_id_list)) == 16
+    # 2 x 16 REQUESTS OF 0.1s, 8 AT ONCE
+    assert duration < 1.6
+    assert [order_result.succeeded for order_result in delete_result_list] == (
+        [True] * 16 + [False]
+    )
+    assert delete_result_list[-1].error
+    assert fake_server.request_count_map["trading:check_order"] == 16
+    assert fake_server.request_count_map["trading:confirm_order"] == 16
+
+
+@pytest.mark.trading
+def test_rate_limit():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+    order_list = build_order_list(size=6)
+    rate_limiter = RateLimiter(rate=10.0, burst=1)
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api()
+        trading_api.connect()
+        with OrderBatch(
+            trading_api=trading_api,
+            max_workers=6,
+            rate_limiter=rate_limiter,
+        ) as batch:
+            start = time.monotonic()
+            order_result_list = batch.check_orders(order_list=order_list)
+            duration = time.monotonic() - start
+
+    # CHECK
+    assert all(order_result.succeeded for order_result in order_result_list)
+    assert batch.rate_limiter is rate_limiter
+    # 1 REQUEST RIGHT AWAY, THEN 1 EVERY 0.1s
+    assert duration >= 0.45
+
+
+@pytest.mark.trading
+def test_confirmation_failure():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+    order_list = build_order_list(size=2)
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api()
+        trading_api.connect()
+        with OrderBatch(trading_api=trading_api, max_workers=1) as batch:
+            fake_server.fail_next(path_prefix=ORDER_CHECK_PATH, status=400)
+            fake_server.fail_next(path_prefix=ORDER_CONFIRM_PATH, status=503)
+            order_result_list = batch.confirm_orders(order_list=order_list)
+
+    # CHECK
+    checking_result, confirmation_result = order_result_list
+
+    assert not checking_result.succeeded
+    assert checking_result.response is None
+    assert "status=400" in checking_result.error
+    assert not checking_result.possibly_placed
+    assert not confirmation_result.succeeded
+    assert confirmation_result.response.checking_response.confirmation_id
+    assert not confirmation_result.response.confirmed
+    assert "status=503" in confirmation_result.error
+    assert confirmation_result.possibly_placed
+
+
+@pytest.mark.trading
+def test_delete_not_confirmed():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+    order_list = build_order_list(size=1)
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api()
+        trading_api.connect()
+        with OrderBatch(trading_api=trading_api, max_workers=1, rate=100) as batch:
+            order_result_list = batch.confirm_orders(order_list=order_list)
+            order_id = order_result_list[0].response.confirmation_response.order_id
+            # A STATUS 202 IS NOT AN ERROR, BUT NOT A CONFIRMED DELETION EITHER
+            fake_server.fail_next(path_prefix=ORDER_CONFIRM_PATH, status=202)
+            delete_result_list = batch.delete_orders(order_id_list=[order_id])
+
+    # CHECK
+    assert not delete_result_list[0].succeeded
+    assert delete_result_list[0].response is None
+    assert "status=202" in delete_result_list[0].error
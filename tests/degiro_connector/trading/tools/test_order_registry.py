@@ -0,0 +1,189 @@
+# IMPORTATIONS STANDARD
+import logging
+from queue import Queue
+
+import pytest
+
+from degiro_connector.core.helpers.url_override import override_urls
+from degiro_connector.trading.api import API as TradingAPI
+from degiro_connector.trading.models.account import (
+    AccountEvent,
+    AccountEventType,
+    UpdateOption,
+)
+from degiro_connector.trading.models.credentials import Credentials
+from degiro_connector.trading.models.order import (
+    Action,
+    ConfirmationResponse,
+    Order,
+    OrderStatus,
+    OrderType,
+    TimeType,
+)
+from degiro_connector.trading.tools.order_registry import OrderRegistry
+
+from fake_server import FakeServer
+
+logging.basicConfig(level=logging.FATAL)
+
+
+def build_order(price: float = 10.0) -> Order:
+    return Order(
+        buy_sell=Action.BUY,
+        order_type=OrderType.LIMIT,
+        price=price,
+        product_id=331868,
+        size=1,
+        time_type=TimeType.GOOD_TILL_DAY,
+    )
+
+
+# TESTS FEATURES
+@pytest.mark.trading
+def test_lifecycle():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+    queue = Queue()
+    order_registry = OrderRegistry(queue=queue)
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = TradingAPI(
+            credentials=Credentials(
+                int_account=12345,
+                username="USERNAME",
+                password="PASSWORD",
+            )
+        )
+        trading_api.connect()
+
+        order_id_list = []
+        for price in [10.0, 20.0, 30.0]:
+            order = build_order(price=price)
+            checking_response = trading_api.check_order(order=order)
+            confirmation_response = order_registry.confirm_order(
+                trading_api=trading_api,
+                confirmation_id=checking_response.confirmation_id,
+                order=order,
+            )
+            order_id_list.append(confirmation_response.order_id)
+        pending_status_list = [
+            order_registry.get(order_id).status for order_id in order_id_list
+        ]
+
+        working_event_list = order_registry.refresh(trading_api=trading_api)
+
+        updated_order = build_order(price=11.0)
+        updated_order.id = order_id_list[0]
+        order_registry.update_order(trading_api=trading_api, order=updated_order)
+        fake_server.fill_order(order_id=order_id_list[1])
+        order_registry.delete_order(trading_api=trading_api, order_id=order_id_list[2])
+
+        closing_event_list = order_registry.refresh(trading_api=trading_api)
+
+    # CHECK
+    assert pending_status_list == [OrderStatus.PENDING] * 3
+    assert [order_event.status for order_event in working_event_list] == [
+        OrderStatus.WORKING
+    ] * 3
+    assert [
+        (order_event.order_id, order_event.status) for order_event in closing_event_list
+    ] == [(order_id_list[1], OrderStatus.FILLED)]
+    assert list(order_registry.working_orders) == [order_id_list[0]]
+    assert order_registry.get(order_id_list[0]).row["price"] == 11.0
+    assert order_registry.get(order_id_list[1]).traded_size == 1
+    assert order_registry.get(order_id_list[2]).status == OrderStatus.CANCELLED
+    # 3 PENDING, 3 WORKING, 1 UPDATED, 1 CANCELLED, 1 FILLED
+    assert queue.qsize() == 9
+    assert order_registry.prune() == 2
+    assert len(order_registry) == 1
+
+
+@pytest.mark.trading
+def test_reconciliation():
+    # SETUP
+    order_registry = OrderRegistry()
+    order_registry.register(
+        order=build_order(),
+        confirmation_response=ConfirmationResponse(order_id="ORDER-ID"),
+    )
+
+    # EXECUTE
+    removed_event_list = order_registry.apply_event_list(
+        event_list=[
+            AccountEvent(
+                option=UpdateOption.ORDERS,
+                type=AccountEventType.REMOVED,
+                id="ORDER-ID",
+            ),
+        ]
+    )
+    removed_status = order_registry.get("ORDER-ID").status
+    late_event_list = order_registry.apply_event_list(
+        event_list=[
+            AccountEvent(
+                option=UpdateOption.ORDERS,
+                type=AccountEventType.UPDATED,
+                id="ORDER-ID",
+                change_map={"price": 12.0},
+            ),
+            AccountEvent(
+                option=UpdateOption.HISTORICAL_ORDERS,
+                type=AccountEventType.ADDED,
+                id="HISTORY-ID",
+                row={"orderId": "ORDER-ID", "size": 1, "totalTradedSize": 1},
+            ),
+        ]
+    )
+
+    # CHECK
+    assert removed_status == OrderStatus.CLOSED
+    assert removed_event_list[0].previous_status == OrderStatus.PENDING
+    assert [order_event.status for order_event in late_event_list] == [
+        OrderStatus.FILLED
+    ]
+    assert late_event_list[0].previous_status == OrderStatus.CLOSED
+    assert order_registry.get("ORDER-ID").row["price"] == 10.0
+
+
+@pytest.mark.trading
+def test_updates_before_registration():
+    # SETUP
+    order_registry = OrderRegistry()
+
+    # EXECUTE
+    order_registry.apply_event_list(
+        event_list=[
+            AccountEvent(
+                option=UpdateOption.ORDERS,
+                type=AccountEventType.ADDED,
+                id="WORKING-ID",
+                row={"id": "WORKING-ID", "price": 10.0},
+            ),
+            AccountEvent(
+                option=UpdateOption.HISTORICAL_ORDERS,
+                type=AccountEventType.ADDED,
+                id="HISTORY-ID",
+                row={"orderId": "FILLED-ID", "size": 1, "totalTradedSize": 1},
+            ),
+            AccountEvent(
+                option=UpdateOption.ORDERS,
+                type=AccountEventType.REMOVED,
+                id="CLOSED-ID",
+            ),
+        ]
+    )
+    unmatched_count = len(order_registry)
+    for order_id in ["WORKING-ID", "FILLED-ID", "CLOSED-ID"]:
+        order_registry.register(
+            order=build_order(),
+            confirmation_response=ConfirmationResponse(order_id=order_id),
+        )
+
+    # CHECK
+    assert unmatched_count == 1
+    assert order_registry.get("WORKING-ID").status == OrderStatus.WORKING
+    assert order_registry.get("WORKING-ID").row["buySell"] == "BUY"
+    assert order_registry.get("FILLED-ID").status == OrderStatus.FILLED
+    assert order_registry.get("FILLED-ID").traded_size == 1
+    assert order_registry.get("CLOSED-ID").status == OrderStatus.CLOSED
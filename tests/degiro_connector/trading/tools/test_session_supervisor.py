@@ -0,0 +1,155 @@
+# IMPORTATIONS STANDARD
+import logging
+import threading
+import time
+
+import pytest
+import requests
+
+from degiro_connector.core.helpers.url_override import override_urls
+from degiro_connector.core.models.model_connection import ModelConnection
+from degiro_connector.trading.api import API as TradingAPI
+from degiro_connector.trading.models.account import UpdateOption, UpdateRequest
+from degiro_connector.trading.models.credentials import Credentials
+from degiro_connector.trading.tools.session_supervisor import (
+    SessionSupervisor,
+    SupervisedAction,
+)
+
+from fake_server import FakeServer
+
+logging.basicConfig(level=logging.FATAL)
+
+
+def build_trading_api(timeout: int = TradingAPI.TRADING_TIMEOUT) -> TradingAPI:
+    return TradingAPI(
+        credentials=Credentials(
+            int_account=12345,
+            username="USERNAME",
+            password="PASSWORD",
+        ),
+        connection_storage=ModelConnection(timeout=timeout),
+    )
+
+
+# TESTS FEATURES
+@pytest.mark.trading
+def test_replay_after_unauthorized():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+    request_list = [UpdateRequest(option=UpdateOption.ORDERS, last_updated=0)]
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api()
+        session_id = trading_api.connect()
+        session_supervisor = SessionSupervisor(trading_api=trading_api)
+        fake_server.expire_trading_session(session_id=session_id)
+        account_update = trading_api.get_update(request_list=request_list)
+
+    # CHECK
+    assert isinstance(trading_api.get_update, SupervisedAction)
+    assert not isinstance(trading_api.check_order, SupervisedAction)
+    assert account_update is not None
+    assert session_supervisor.generation == 1
+    assert trading_api.connection_storage.unauthorized_count == 1
+    assert fake_server.request_count_map["trading:login"] == 2
+
+
+@pytest.mark.trading
+def test_replay_after_timeout():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+    request_list = [UpdateRequest(option=UpdateOption.ORDERS, last_updated=0)]
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api(timeout=1)
+        trading_api.connect()
+        session_supervisor = SessionSupervisor(trading_api=trading_api)
+        time.sleep(1.1)
+        account_update = trading_api.get_update(request_list=request_list)
+
+    # CHECK
+    assert account_update is not None
+    assert session_supervisor.generation == 1
+
+
+@pytest.mark.trading
+def test_check_keepalive():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api(timeout=2)
+        trading_api.connect()
+        session_supervisor = SessionSupervisor(
+            trading_api=trading_api,
+            refresh_margin=1.9,
+        )
+        time.sleep(0.2)
+        delay = session_supervisor.check()
+
+    # CHECK
+    assert fake_server.request_count_map["trading:update"] == 1
+    assert session_supervisor.generation == 0
+    assert delay > 0
+
+
+@pytest.mark.trading
+def test_unauthorized_on_another_thread():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+    unauthorized_response = requests.Response()
+    unauthorized_response.status_code = 401
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api()
+        trading_api.connect()
+        session_supervisor = SessionSupervisor(trading_api=trading_api, install=False)
+        connection_storage = trading_api.connection_storage
+
+        def action() -> str:
+            thread = threading.Thread(
+                target=connection_storage.response_hook,
+                args=(unauthorized_response,),
+            )
+            thread.start()
+            thread.join()
+            return "RESULT"
+
+        supervised_action = SupervisedAction(
+            action=action,
+            name="get_action",
+            supervisor=session_supervisor,
+        )
+        result = supervised_action()
+
+    # CHECK
+    assert result == "RESULT"
+    assert connection_storage.unauthorized_count == 1
+    assert session_supervisor.generation == 0
+    assert fake_server.request_count_map["trading:login"] == 1
+
+
+@pytest.mark.trading
+def test_no_replay_after_failed_relogin(mocker):
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+    request_list = [UpdateRequest(option=UpdateOption.ORDERS, last_updated=0)]
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api()
+        session_id = trading_api.connect()
+        session_supervisor = SessionSupervisor(trading_api=trading_api)
+        mocker.patch.object(session_supervisor, "relogin", return_value=False)
+        fake_server.expire_trading_session(session_id=session_id)
+        account_update = trading_api.get_update(request_list=request_list)
+
+    # CHECK
+    assert account_update is None
+    assert session_supervisor.relogin.call_count == 1
+    assert fake_server.request_count_map["trading:unauthorized"] == 1
@@ -0,0 +1,197 @@
+# IMPORTATIONS STANDARD
+import logging
+import threading
+import time
+
+import pytest
+
+from degiro_connector.core.helpers.url_override import override_urls
+from degiro_connector.trading.api import API as TradingAPI
+from degiro_connector.trading.models.account import AccountEventType, UpdateOption
+from degiro_connector.trading.models.credentials import Credentials
+from degiro_connector.trading.models.order import Action, Order, OrderType, TimeType
+from degiro_connector.trading.tools.update_poller import UpdatePoller
+
+from fake_server import FakeServer
+
+logging.basicConfig(level=logging.FATAL)
+
+
+def build_trading_api() -> TradingAPI:
+    return TradingAPI(
+        credentials=Credentials(
+            int_account=12345,
+            username="USERNAME",
+            password="PASSWORD",
+        )
+    )
+
+
+def build_order() -> Order:
+    return Order(
+        buy_sell=Action.BUY,
+        order_type=OrderType.LIMIT,
+        price=10.0,
+        product_id=331868,
+        size=1,
+        time_type=TimeType.GOOD_TILL_DAY,
+    )
+
+
+# TESTS FEATURES
+@pytest.mark.trading
+def test_backoff():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api()
+        trading_api.connect()
+        update_poller = UpdatePoller(
+            trading_api=trading_api,
+            interval_map={UpdateOption.ORDERS: 2.0, UpdateOption.PORTFOLIO: 4.0},
+            backoff=2.0,
+            max_interval=10.0,
+        )
+        update_poller.poll()
+        update_poller.poll()
+        update_poller.poll()
+        update_poller.poll()
+
+    # CHECK
+    assert update_poller.interval_map == {
+        UpdateOption.ORDERS: 10.0,
+        UpdateOption.PORTFOLIO: 10.0,
+    }
+    assert update_poller.poll_count == 4
+    assert fake_server.request_count_map["trading:update"] == 4
+
+
+@pytest.mark.trading
+def test_order_detection():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+    order = build_order()
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api()
+        trading_api.connect()
+        update_poller = UpdatePoller(
+            trading_api=trading_api,
+            interval_map={UpdateOption.ORDERS: 60.0},
+            fast_interval=0.05,
+        )
+        queue = update_poller.subscribe(option_list=[UpdateOption.ORDERS])
+        update_poller.start()
+        update_poller.refresh(timeout=5)
+
+        checking_response = trading_api.check_order(order=order)
+        order_id = trading_api.confirm_order(
+            confirmation_id=checking_response.confirmation_id,
+            order=order,
+        ).order_id
+        update_poller.boost()
+        account_event = queue.get(timeout=5)
+        boosted_interval = update_poller.interval_map[UpdateOption.ORDERS]
+        update_poller.stop(timeout=5)
+
+    # CHECK
+    assert account_event.type == AccountEventType.ADDED
+    assert account_event.id == order_id
+    assert boosted_interval <= 0.05
+    assert not update_poller.running
+
+
+@pytest.mark.trading
+def test_initial_refresh_does_not_boost():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+    order = build_order()
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api()
+        trading_api.connect()
+        checking_response = trading_api.check_order(order=order)
+        trading_api.confirm_order(
+            confirmation_id=checking_response.confirmation_id,
+            order=order,
+        )
+        update_poller = UpdatePoller(
+            trading_api=trading_api,
+            interval_map={UpdateOption.ORDERS: 60.0},
+            fast_interval=0.05,
+            open_order_interval=30.0,
+        )
+        event_list = update_poller.poll()
+
+    # CHECK
+    assert [account_event.type for account_event in event_list] == [
+        AccountEventType.ADDED
+    ]
+    assert update_poller.interval_map == {UpdateOption.ORDERS: 30.0}
+
+
+@pytest.mark.trading
+def test_refresh_coalesced():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD", latency=0.2)
+    result_list = []
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api()
+        trading_api.connect()
+        update_poller = UpdatePoller(
+            trading_api=trading_api,
+            interval_map={UpdateOption.ORDERS: 60.0},
+        )
+        update_poller.start()
+        update_poller.refresh(timeout=5)
+        request_count = fake_server.request_count_map["trading:update"]
+
+        thread_list = [
+            threading.Thread(
+                target=lambda: result_list.append(update_poller.refresh(timeout=5))
+            )
+            for _ in range(8)
+        ]
+        for thread in thread_list:
+            thread.start()
+        for thread in thread_list:
+            thread.join()
+        update_poller.stop(timeout=5)
+
+    # CHECK
+    assert result_list == [True] * 8
+    assert fake_server.request_count_map["trading:update"] - request_count <= 2
+
+
+@pytest.mark.trading
+def test_unauthorized_reconnects():
+    # SETUP
+    fake_server = FakeServer(password="PASSWORD")
+
+    # EXECUTE
+    with fake_server, override_urls(base_url=fake_server.url):
+        trading_api = build_trading_api()
+        trading_api.connect()
+        session_id = trading_api.connection_storage.session_id
+        update_poller = UpdatePoller(
+            trading_api=trading_api,
+            interval_map={UpdateOption.ORDERS: 60.0},
+            retry_delay=60.0,
+        )
+        fake_server.expire_trading_session(session_id=session_id)
+        event_list = update_poller.poll()
+        due_option_list = update_poller.get_due_option_list(now=time.monotonic())
+        update_poller.poll()
+
+    # CHECK
+    assert event_list is None
+    assert due_option_list == [UpdateOption.ORDERS]
+    assert trading_api.connection_storage.session_id != session_id
+    assert fake_server.request_count_map["trading:unauthorized"] == 1
+    assert fake_server.request_count_map["trading:update"] == 1